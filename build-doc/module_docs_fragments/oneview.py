@@ -26,6 +26,27 @@ options:
           The configuration file is optional. If the file path is not provided, the configuration will be loaded from
           environment variables.
       required: false
+    resource_cache_dir:
+      description:
+        - Path to a directory used to cache the responses of read-mostly resources, such as enclosure groups, server
+          hardware types, networks, network sets, storage pools, firmware drivers and OS deployment plans. When set,
+          the responses are reused across tasks and forks, and the writes made by the modules discard the cached
+          responses of the collection written. It can also be set through the C(ONEVIEWSDK_RESOURCE_CACHE_DIR)
+          environment variable.
+      required: false
+    resource_cache_ttl:
+      description:
+        - Time, in seconds, a cached response is reused without a request. After that, the response is revalidated
+          with its ETag, or requested again when the appliance did not return an ETag.
+      required: false
+      default: 300
+    session_cache_dir:
+      description:
+        - Path to a directory used to cache the OneView login session. When set, the session is reused across tasks
+          and forks instead of performing a new login on every task, and a new login is performed when the cached
+          session is no longer valid. It can also be set through the C(ONEVIEWSDK_SESSION_CACHE_DIR) environment
+          variable.
+      required: false
 
 notes:
     - "A sample configuration file for the config parameter can be found at:
@@ -55,6 +76,34 @@ options:
             C(start): The first item to return, using 0-based indexing.
             C(count): The number of resources to return.
             C(filter): A general filter/query string to narrow the list of items returned.
-            C(sort): The sort order of the returned data set."
+            C(sort): The sort order of the returned data set.
+            C(page_size): When set, the resources are requested in pages of this size and only the selected ones are
+              kept in memory, instead of loading all the resources at once.
+            C(match): Selects the resources by the value of their attributes, on the client side. Nested attributes
+              are referenced by dotted paths, e.g. C(associatedResource.resourceCategory), and a list of values
+              selects the resources with any of them."
+        required: false
+'''
+
+    FACTSFIELDS = '''
+options:
+    fields:
+        description:
+        - List with the fields to return for each resource, e.g. C(['name', 'uri', 'status']). Nested fields are
+          referenced by dotted paths, e.g. C(bios.manageBios), and are applied to each element of the lists.
+        - The resources returned are pruned to the informed fields, and the first level of the fields is also
+          requested to the API when it supports the C(fields) query parameter.
+        - It applies to the lists of resources returned by the module.
         required: false
 '''
+
+    WAIT = '''
+options:
+    wait:
+        description:
+        - When false, the module does not wait for the completion of the task started on OneView and returns right
+          away with its C(task_uri) and C(resource_uri). The task can be awaited later with the C(oneview_task_wait)
+          module. The steps that depend on the task result are skipped in this mode.
+        default: true
+        type: bool
+'''
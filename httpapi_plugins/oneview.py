@@ -0,0 +1,120 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+###
+# Copyright (2016-2017) Hewlett Packard Enterprise Development LP
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# You may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+###
+
+DOCUMENTATION = '''
+---
+httpapi: oneview
+short_description: HttpApi Plugin for HPE OneView.
+description:
+    - Keeps an authenticated session with the OneView appliance for the lifetime of the persistent connection, so the
+      OneView modules run without a login of their own.
+    - The API version is negotiated once, when the connection is established, and sent in every request.
+version_added: "2.8"
+author: "Priyanka Sood (@soodpr)"
+options:
+  oneview_api_version:
+    type: int
+    description:
+      - API version requested. When it is not set, or it is greater than the current version of the appliance, the
+        current version of the appliance is used.
+    vars:
+      - name: ansible_oneview_api_version
+  oneview_auth_login_domain:
+    type: str
+    description:
+      - Login domain of the user. The local domain is used when it is not set.
+    vars:
+      - name: ansible_oneview_auth_login_domain
+notes:
+    - Set C(ansible_connection=httpapi), C(ansible_network_os=oneview), C(ansible_user) and C(ansible_password) for
+      the appliance host, and set C(httpapi_plugins) in the C(ansible.cfg) with the path of this directory.
+    - The modules that upload or download files must run with a local connection and the C(config) or C(hostname)
+      credentials.
+'''
+
+import json
+
+from ansible.module_utils._text import to_text
+from ansible.module_utils.connection import ConnectionError
+from ansible.plugins.httpapi import HttpApiBase
+
+VERSION_PATH = '/rest/version'
+LOGIN_SESSIONS_PATH = '/rest/login-sessions'
+
+BASE_HEADERS = {'Content-Type': 'application/json', 'Accept': 'application/json'}
+
+
+class HttpApi(HttpApiBase):
+    def __init__(self, connection):
+        super(HttpApi, self).__init__(connection)
+        self._api_version = None
+
+    def login(self, username, password):
+        credentials = dict(userName=username, password=password, loginMsgAck=True)
+        if self.get_option('oneview_auth_login_domain'):
+            credentials['authLoginDomain'] = self.get_option('oneview_auth_login_domain')
+
+        status, headers, body = self.send_request(json.dumps(credentials), LOGIN_SESSIONS_PATH, method='POST')
+        if status >= 400:
+            raise ConnectionError('Failed to log in to OneView: {0}'.format(body), code=status)
+
+        self.connection._auth = {'auth': json.loads(body)['sessionID']}
+
+    def logout(self):
+        if self.connection._auth:
+            self.send_request(None, LOGIN_SESSIONS_PATH, method='DELETE')
+            self.connection._auth = None
+
+    def update_auth(self, response, response_text):
+        # The session ID returned on login is kept for the whole connection
+        return None
+
+    def get_api_version(self):
+        """
+        Gets the API version negotiated with the appliance, which is sent in every request.
+
+        :return: int: The API version.
+        """
+        if self._api_version is None:
+            response, response_data = self.connection.send(VERSION_PATH, None, method='GET', headers=BASE_HEADERS)
+            current_version = json.loads(to_text(response_data.getvalue()))['currentVersion']
+            requested_version = self.get_option('oneview_api_version')
+            self._api_version = min(requested_version, current_version) if requested_version else current_version
+
+        return self._api_version
+
+    def send_request(self, data, path, method='GET', headers=None):
+        """
+        Sends a request to the appliance through the persistent connection.
+
+        The error responses are returned instead of raised, so the caller handles them the same way as the responses
+        sent by the OneView SDK.
+
+        :arg str data: Request body.
+        :arg str path: Request path, e.g. /rest/server-profiles.
+        :arg str method: HTTP method.
+        :arg dict headers: Request headers, besides the headers of the connection.
+        :return: tuple: The response status, headers and body.
+        """
+        request_headers = dict(BASE_HEADERS)
+        request_headers.update(headers or {})
+        request_headers['X-API-Version'] = str(self.get_api_version())
+
+        response, response_data = self.connection.send(path, data, method=method, headers=request_headers)
+
+        return response.getcode(), dict(response.info()), to_text(response_data.getvalue())
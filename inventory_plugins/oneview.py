@@ -0,0 +1,274 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+###
+# Copyright (2016-2017) Hewlett Packard Enterprise Development LP
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# You may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+###
+
+DOCUMENTATION = '''
+---
+name: oneview
+plugin_type: inventory
+short_description: HPE OneView inventory source.
+description:
+    - Builds the inventory from the server hardware, server profiles, enclosures, racks and scopes of a OneView
+      appliance.
+    - Each server hardware is a host, named after its server profile when it has one. The hosts are grouped by
+      enclosure (C(enclosure_<name>)), rack (C(rack_<name>)) and scope (C(scope_<name>)), and the server hardware
+      without a server profile are also grouped in C(unassigned_server_hardware).
+    - With the cache enabled, only the resources modified since the previous run are requested, besides the URIs
+      needed to detect the removed resources.
+    - The configuration file name must end with C(oneview.yml) or C(oneview.yaml).
+version_added: "2.8"
+requirements:
+    - "python >= 2.7.9"
+    - "hpOneView >= 4.0.0"
+author: "Priyanka Sood (@soodpr)"
+extends_documentation_fragment:
+    - constructed
+    - inventory_cache
+options:
+    plugin:
+      description: Token that ensures this is a source file for the C(oneview) plugin.
+      required: true
+      choices: ['oneview']
+    config:
+      description:
+        - Path to a .json configuration file of the OneView SDK. When it is not set, the C(hostname), C(username),
+          C(password) and C(api_version) options are used.
+      type: path
+    hostname:
+      description: IP address or hostname of the appliance.
+      type: str
+      env:
+        - name: ONEVIEWSDK_IP
+    username:
+      description: User name for the appliance.
+      type: str
+      env:
+        - name: ONEVIEWSDK_USERNAME
+    password:
+      description: Password for the appliance.
+      type: str
+      env:
+        - name: ONEVIEWSDK_PASSWORD
+    auth_login_domain:
+      description: Login domain of the user.
+      type: str
+      env:
+        - name: ONEVIEWSDK_AUTH_LOGIN_DOMAIN
+    api_version:
+      description: OneView API version.
+      type: int
+      default: 300
+      env:
+        - name: ONEVIEWSDK_API_VERSION
+    use_profile_names:
+      description:
+        - Names the server hardware with a server profile after the profile instead of the hardware.
+        - When the profile name is the name of another server hardware, the host is named after its hardware.
+      type: bool
+      default: true
+'''
+
+EXAMPLES = '''
+# oneview.yml
+plugin: oneview
+hostname: 172.16.101.48
+username: administrator
+password: my_password
+api_version: 600
+cache: true
+cache_plugin: jsonfile
+cache_connection: ~/.ansible/oneview-inventory
+keyed_groups:
+  - prefix: power
+    key: oneview_server_hardware.powerState
+compose:
+  ansible_host: oneview_server_hardware.mpHostInfo.mpIpAddresses[0].address
+'''
+
+from collections import defaultdict
+
+from ansible.errors import AnsibleError
+from ansible.module_utils.six.moves.urllib.parse import quote
+from ansible.plugins.inventory import BaseInventoryPlugin, Cacheable, Constructable, to_safe_group_name
+
+try:
+    from hpOneView.oneview_client import OneViewClient
+    HAS_HPE_ONEVIEW = True
+except ImportError:
+    HAS_HPE_ONEVIEW = False
+
+
+class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
+    NAME = 'oneview'
+
+    COLLECTIONS = dict(server_hardware='/rest/server-hardware',
+                       server_profiles='/rest/server-profiles',
+                       enclosures='/rest/enclosures',
+                       racks='/rest/racks',
+                       scopes='/rest/scopes')
+
+    # Collections whose scopes group the hosts
+    SCOPED_COLLECTIONS = ['server_hardware', 'server_profiles']
+
+    def verify_file(self, path):
+        return super(InventoryModule, self).verify_file(path) and path.endswith(('oneview.yml', 'oneview.yaml'))
+
+    def parse(self, inventory, loader, path, cache=True):
+        super(InventoryModule, self).parse(inventory, loader, path)
+        self._read_config_data(path)
+
+        if not HAS_HPE_ONEVIEW:
+            raise AnsibleError('HPE OneView Python SDK is required for the oneview inventory plugin.')
+
+        cache_key = self.get_cache_key(path)
+        state = {}
+        if self.get_option('cache') and cache:
+            try:
+                state = self._cache[cache_key]
+            except KeyError:
+                pass
+
+        state = self._sync(state, self._create_client().connection)
+
+        if self.get_option('cache'):
+            self._cache[cache_key] = state
+
+        self._populate(state)
+
+    def _create_client(self):
+        if self.get_option('config'):
+            return OneViewClient.from_json_file(self.get_option('config'))
+
+        credentials = dict(userName=self.get_option('username'), password=self.get_option('password'))
+        if self.get_option('auth_login_domain'):
+            credentials['authLoginDomain'] = self.get_option('auth_login_domain')
+
+        return OneViewClient(dict(ip=self.get_option('hostname'),
+                                  api_version=self.get_option('api_version'),
+                                  credentials=credentials))
+
+    def _sync(self, state, connection):
+        """
+        Brings the resources of the previous run up to date, requesting only the resources modified since then.
+
+        :arg dict state: Resources of the previous run, by collection, and the members of each scope.
+        :arg connection: Connection of the OneViewClient.
+        :return: dict: The resources updated.
+        """
+        collections = dict()
+        for name, path in self.COLLECTIONS.items():
+            previous = state.get('collections', {}).get(name, {})
+            collections[name] = self._sync_collection(connection, path, previous)
+
+        scope_members = dict()
+        for scope_uri in collections['scopes']['members']:
+            scope_members[scope_uri] = [member['uri']
+                                        for name in self.SCOPED_COLLECTIONS
+                                        for member in self._get_members(connection, self.COLLECTIONS[name],
+                                                                        fields='uri', scopeUris=scope_uri)]
+
+        return dict(collections=collections, scope_members=scope_members)
+
+    def _sync_collection(self, connection, path, previous):
+        members = dict(previous.get('members', {}))
+        modified = previous.get('modified')
+
+        if modified:
+            # The members are compared to the current URIs, so the removed resources are dropped as well
+            current_uris = set(member['uri'] for member in self._get_members(connection, path, fields='uri'))
+            members = dict((uri, member) for uri, member in members.items() if uri in current_uris)
+            changed = self._get_members(connection, path, filter="modified >= '{0}'".format(modified))
+        else:
+            changed = self._get_members(connection, path)
+
+        for member in changed:
+            members[member['uri']] = member
+
+        modified_dates = [member['modified'] for member in members.values() if member.get('modified')]
+        return dict(members=members, modified=max(modified_dates) if modified_dates else None)
+
+    @staticmethod
+    def _get_members(connection, path, **query):
+        query_string = '&'.join('{0}={1}'.format(key, quote(value)) for key, value in sorted(query.items()))
+        uri = '{0}?{1}'.format(path, query_string) if query_string else path
+
+        members = []
+        while uri:
+            body = connection.get(uri)
+            members.extend(body.get('members') or [])
+            uri = body.get('nextPageUri')
+
+        return members
+
+    def _populate(self, state):
+        """
+        Adds the hosts and groups, joining the resources through indexes by URI.
+
+        :arg dict state: Resources by collection and the members of each scope.
+        """
+        collections = dict((name, collection['members']) for name, collection in state['collections'].items())
+        enclosures = collections['enclosures']
+
+        profiles_by_hardware_uri = dict((profile['serverHardwareUri'], profile)
+                                        for profile in collections['server_profiles'].values()
+                                        if profile.get('serverHardwareUri'))
+        racks_by_mount_uri = dict((mount['mountUri'], rack)
+                                  for rack in collections['racks'].values()
+                                  for mount in rack.get('rackMounts') or [])
+        scopes_by_member_uri = defaultdict(list)
+        for scope_uri, member_uris in state['scope_members'].items():
+            for member_uri in member_uris:
+                scopes_by_member_uri[member_uri].append(collections['scopes'][scope_uri])
+
+        server_hardware_names = set(server_hardware['name'] for server_hardware in collections['server_hardware'].values())
+        strict = self.get_option('strict')
+
+        for server_hardware in sorted(collections['server_hardware'].values(), key=lambda resource: resource['name']):
+            uri = server_hardware['uri']
+            profile = profiles_by_hardware_uri.get(uri)
+            enclosure = enclosures.get(server_hardware.get('locationUri'))
+            rack = racks_by_mount_uri.get(uri) or (enclosure and racks_by_mount_uri.get(enclosure['uri']))
+
+            host = server_hardware['name']
+            if profile and self.get_option('use_profile_names'):
+                # A profile named after another server hardware would merge both into a single host
+                if profile['name'] == host or profile['name'] not in server_hardware_names:
+                    host = profile['name']
+            self.inventory.add_host(host)
+
+            host_vars = dict(oneview_server_hardware=server_hardware,
+                             oneview_server_profile=profile,
+                             oneview_enclosure=enclosure,
+                             oneview_rack=rack)
+            for name, value in host_vars.items():
+                self.inventory.set_variable(host, name, value)
+
+            groups = [] if profile else ['unassigned_server_hardware']
+            if enclosure:
+                groups.append('enclosure_' + enclosure['name'])
+            if rack:
+                groups.append('rack_' + rack['name'])
+            scopes = scopes_by_member_uri[uri] + (scopes_by_member_uri[profile['uri']] if profile else [])
+            groups.extend('scope_' + scope['name'] for scope in scopes)
+
+            for group in groups:
+                group = self.inventory.add_group(to_safe_group_name(group))
+                self.inventory.add_child(group, host)
+
+            self._set_composite_vars(self.get_option('compose'), host_vars, host, strict=strict)
+            self._add_host_to_composed_groups(self.get_option('groups'), host_vars, host, strict=strict)
+            self._add_host_to_keyed_groups(self.get_option('keyed_groups'), host_vars, host, strict=strict)
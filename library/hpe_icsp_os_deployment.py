@@ -73,6 +73,16 @@ options:
       - Personality Data.
     required: false
     default: null
+  discovery_timeout:
+    description:
+      - Seconds to wait for the server to be found in ICsp.
+    required: false
+    default: 600
+  job_timeout:
+    description:
+      - Seconds to wait for each deployment job to finish. There is no limit when it is not set.
+    required: false
+    default: null
 '''
 
 EXAMPLES = '''
@@ -86,6 +96,7 @@ EXAMPLES = '''
     os_build_plan: "{{ os_build_plan }}"
     custom_attributes: "{{ osbp_custom_attributes }}"
     personality_data: "{{ network_config }}"
+    discovery_timeout: 300
   delegate_to: localhost
 '''
 
@@ -94,16 +105,21 @@ icsp_server:
     description: Has the facts about the server that was provisioned with ICsp.
     returned: When the module runs successfully, but can be null.
     type: dict
+timings:
+    description: Seconds spent waiting in each phase of the deployment, i.e. server_discovery, os_build_plan and
+      personality_data.
+    returned: When the OS is deployed.
+    type: dict
 '''
 
 from future import standard_library
 
 standard_library.install_aliases()
 
-import time
+import functools
 import hpICsp
 from ansible.module_utils.basic import AnsibleModule
-from ansible.module_utils.icsp import ICspHelper
+from ansible.module_utils.icsp import ICspHelper, ICspWaiter
 
 
 def deploy_server(module):
@@ -119,6 +135,8 @@ def deploy_server(module):
     custom_attributes = module.params['custom_attributes']
     personality_data = module.params['personality_data']
     ilo_address = module.params['server_ipAddress']
+    discovery_timeout = module.params.get('discovery_timeout', 600)
+    job_timeout = module.params.get('job_timeout')
 
     if ilo_address is None and server_id is None:
         return module.fail_json(
@@ -126,6 +144,7 @@ def deploy_server(module):
 
     con = hpICsp.connection(icsp_host, icsp_api_version)
     icsphelper = ICspHelper(con)
+    waiter = ICspWaiter()
 
     # Create objects for all necessary resources.
     credential = {'userName': username, 'password': password}
@@ -139,19 +158,15 @@ def deploy_server(module):
     if bp is None:
         return module.fail_json(msg='Cannot find OS Build plan: ' + os_build_plan)
 
-    timeout = 600
-    while True:
-        if ilo_address:
-            server = icsphelper.get_server_by_ilo_address(ilo_address)
-        else:
-            server = icsphelper.get_server_by_serial(server_id)
-        if server:
-            break
-        if timeout < 0:
-            module.fail_json(msg='Cannot find server in ICSP.')
-            return
-        timeout -= 30
-        time.sleep(30)
+    if ilo_address:
+        find_server = functools.partial(icsphelper.get_server_by_ilo_address, ilo_address)
+    else:
+        find_server = functools.partial(icsphelper.get_server_by_serial, server_id)
+
+    server = waiter.wait('server_discovery', {'server': find_server}, timeout=discovery_timeout).get('server')
+    if not server:
+        module.fail_json(msg='Cannot find server in ICSP.')
+        return
 
     server = sv.get_server(server['uri'])
     if server['state'] == 'OK':
@@ -173,17 +188,18 @@ def deploy_server(module):
 
     build_plan_body = {"osbpUris": [bp['uri']], "serverData": [server_data], "stepNo": 1}
 
-    hpICsp.common.monitor_execution(jb.add_job(build_plan_body), jb)
+    icsphelper.wait_for_jobs(waiter, 'os_build_plan', [jb.add_job(build_plan_body)], timeout=job_timeout)
 
     # If the playbook included network personalization, update the server to include it
     if personality_data:
         server_data['personalityData'] = personality_data
         network_config = {"serverData": [server_data]}
         # Monitor the execution of a nework personalization job.
-        hpICsp.common.monitor_execution(jb.add_job(network_config), jb)
+        icsphelper.wait_for_jobs(waiter, 'personality_data', [jb.add_job(network_config)], timeout=job_timeout)
 
     server = sv.get_server(server['uri'])
-    return module.exit_json(changed=True, msg='OS Deployed Successfully.', ansible_facts={'icsp_server': server})
+    return module.exit_json(changed=True, msg='OS Deployed Successfully.', ansible_facts={'icsp_server': server},
+                            timings=waiter.timings)
 
 
 def main():
@@ -197,7 +213,9 @@ def main():
             server_ipAddress=dict(required=False, type='str'),
             os_build_plan=dict(required=True, type='str'),
             custom_attributes=dict(required=False, type='list', default=None),
-            personality_data=dict(required=False, type='dict', default=None)
+            personality_data=dict(required=False, type='dict', default=None),
+            discovery_timeout=dict(required=False, type='int', default=600),
+            job_timeout=dict(required=False, type='int', default=None)
         ))
 
     deploy_server(module)
@@ -130,7 +130,7 @@ import json
 import hpICsp
 from hpICsp.exceptions import HPICspException
 from ansible.module_utils.basic import AnsibleModule
-from ansible.module_utils.icsp import ICspHelper
+from ansible.module_utils.icsp import ICspHelper, ICspWaiter
 
 
 class ICspServerModule(object):
@@ -257,12 +257,10 @@ class ICspServerModule(object):
                     'password': self.module.params['server_password'],
                     'port': self.module.params['server_port']}
 
-        job_monitor = hpICsp.jobs(self.connection)
         servers_service = hpICsp.servers(self.connection)
 
-        # Monitor_execution is a utility method to watch job progress on the command line.
         add_server_job = servers_service.add_server(ilo_body)
-        hpICsp.common.monitor_execution(add_server_job, job_monitor)
+        self.icsphelper.wait_for_jobs(ICspWaiter(), 'add_server', [add_server_job])
 
         # Python bindings throw an Exception when the status != ok
         # So if we got this far, the job execution finished as expected
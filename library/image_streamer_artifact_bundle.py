@@ -42,6 +42,10 @@ options:
           C(downloaded) will download the Artifact Bundle to the file path provided.
           C(archive_downloaded) will download the Artifact Bundle archive to the file path provided.
           C(backup_uploaded) will upload the Backup for the Artifact Bundle from the file path provided.
+          The files are transferred in chunks. An interrupted download is resumed from the bytes already received,
+          and the SHA-256 digest of the file is recorded in a C(<file>.manifest.json) next to it. The download is
+          skipped when the file still matches the manifest of the same Artifact Bundle. An upload fails when the file
+          has a manifest which it does not match.
           C(backup_created) will create a Backup for the Artifact Bundle.
           C(extracted) will extract an Artifact Bundle.
           C(backup_extracted) will extract an Artifact Bundle from the Backup.
@@ -160,7 +164,7 @@ artifact_bundle_deployment_group:
 '''
 
 import os
-from ansible.module_utils.oneview import OneViewModuleBase, compare
+from ansible.module_utils.oneview import OneViewModuleBase, FileTransfer, compare
 
 
 class ArtifactBundleModule(OneViewModuleBase):
@@ -173,10 +177,17 @@ class ArtifactBundleModule(OneViewModuleBase):
     MSG_UPLOADED = 'Artifact Bundle uploaded successfully.'
     MSG_BACKUP_UPLOADED = 'Backup for Artifact Bundle uploaded successfully.'
     MSG_ARCHIVE_DOWNLOADED = 'Archive of Artifact Bundle downloaded successfully.'
+    MSG_ALREADY_DOWNLOADED = 'Artifact Bundle is already downloaded.'
+    MSG_ARCHIVE_ALREADY_DOWNLOADED = 'Archive of Artifact Bundle is already downloaded.'
     MSG_BACKUP_CREATED = 'Backup of Artifact Bundle created successfully.'
     MSG_EXTRACTED = 'Artifact Bundle extracted successfully.'
     MSG_BACKUP_EXTRACTED = 'Artifact Bundle extracted successfully.'
 
+    UPLOAD_PATH = '/rest/artifact-bundles'
+    DOWNLOAD_PATH = '/rest/artifact-bundles/download'
+    BACKUP_ARCHIVE_PATH = '/rest/artifact-bundles/backups/archive'
+    DEPLOYMENT_GROUPS_PATH = '/rest/deployment-groups/'
+
     argument_spec = dict(
         state=dict(
             required=True,
@@ -190,6 +201,7 @@ class ArtifactBundleModule(OneViewModuleBase):
         super(ArtifactBundleModule, self).__init__(additional_arg_spec=self.argument_spec)
         self.i3s_client = self.oneview_client.create_image_streamer_client()
         self.resource_client = self.i3s_client.artifact_bundles
+        self.file_transfer = FileTransfer(self.i3s_client.connection)
 
     def execute_module(self):
         ansible_facts = {}
@@ -254,12 +266,13 @@ class ArtifactBundleModule(OneViewModuleBase):
         return changed, msg, dict(artifact_bundle=resource)
 
     def __download(self, data, resource):
-        self.i3s_client.artifact_bundles.download_artifact_bundle(resource['uri'], data['destinationFilePath'])
-        return False, self.MSG_DOWNLOADED, {}
+        downloaded = self.file_transfer.download_resource(self.DOWNLOAD_PATH, resource, data['destinationFilePath'])
+        return False, self.MSG_DOWNLOADED if downloaded else self.MSG_ALREADY_DOWNLOADED, {}
 
     def __download_archive(self, data, resource):
-        self.i3s_client.artifact_bundles.download_archive_artifact_bundle(resource['uri'], data['destinationFilePath'])
-        return False, self.MSG_ARCHIVE_DOWNLOADED, {}
+        downloaded = self.file_transfer.download_resource(self.BACKUP_ARCHIVE_PATH, resource,
+                                                          data['destinationFilePath'])
+        return False, self.MSG_ARCHIVE_DOWNLOADED if downloaded else self.MSG_ARCHIVE_ALREADY_DOWNLOADED, {}
 
     def __upload(self, data):
         file_name = data['localArtifactBundleFilePath']
@@ -267,7 +280,7 @@ class ArtifactBundleModule(OneViewModuleBase):
         file_name_wo_ext = os.path.splitext(file_name_path)[0]
         artifact_bundle = self.__get_by_name(file_name_wo_ext)
         if artifact_bundle is None:
-            artifact_bundle = self.i3s_client.artifact_bundles.upload_bundle_from_file(file_name)
+            artifact_bundle = self.file_transfer.upload(self.UPLOAD_PATH, file_name)
             changed = True
             msg = self.MSG_UPLOADED
         else:
@@ -276,8 +289,11 @@ class ArtifactBundleModule(OneViewModuleBase):
         return changed, msg, dict(artifact_bundle=artifact_bundle)
 
     def __upload_backup(self, data):
-        deployment_group = self.i3s_client.artifact_bundles.upload_backup_bundle_from_file(
-            data['localBackupArtifactBundleFilePath'], data['deploymentGroupURI'])
+        deployment_group_uri = data['deploymentGroupURI']
+        if self.DEPLOYMENT_GROUPS_PATH not in deployment_group_uri:
+            deployment_group_uri = self.DEPLOYMENT_GROUPS_PATH + deployment_group_uri
+        uri = self.BACKUP_ARCHIVE_PATH + '?deploymentGrpUri=' + deployment_group_uri
+        deployment_group = self.file_transfer.upload(uri, data['localBackupArtifactBundleFilePath'])
         return True, self.MSG_BACKUP_UPLOADED, dict(artifact_bundle_deployment_group=deployment_group)
 
     def __create_backup(self, data):
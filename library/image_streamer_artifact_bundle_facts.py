@@ -47,6 +47,7 @@ options:
 
 extends_documentation_fragment:
     - oneview
+    - oneview.factsfields
     - oneview.factsparams
 '''
 
@@ -117,10 +118,13 @@ from ansible.module_utils.oneview import OneViewModuleBase, OneViewModuleResourc
 
 
 class ArtifactBundleFactsModule(OneViewModuleBase):
+    RESOURCE_LIST_FACTS = ['artifact_bundles', 'artifact_bundle_backups']
+
     argument_spec = dict(
         config=dict(required=False, type='str'),
         name=dict(required=False, type='str'),
         options=dict(required=False, type='list'),
+        fields=dict(required=False, type='list'),
         params=dict(required=False, type='dict')
     )
 
@@ -138,7 +142,7 @@ class ArtifactBundleFactsModule(OneViewModuleBase):
             if self.options and artifact_bundles:
                 ansible_facts = self.__gather_optional_facts(self.options, artifact_bundles[0])
         else:
-            artifact_bundles = self.resource_client.get_all(**self.facts_params)
+            artifact_bundles = self.get_all_resources(self.resource_client)
 
         ansible_facts['artifact_bundles'] = artifact_bundles
 
@@ -40,6 +40,7 @@ options:
 
 extends_documentation_fragment:
     - oneview
+    - oneview.factsfields
     - oneview.factsparams
 '''
 
@@ -89,9 +90,12 @@ from ansible.module_utils.oneview import OneViewModuleBase, OneViewModuleResourc
 
 
 class BuildPlanFactsModule(OneViewModuleBase):
+    RESOURCE_LIST_FACTS = ['build_plans']
+
     argument_spec = dict(
         name=dict(required=False, type='str'),
         options=dict(required=False, type='list'),
+        fields=dict(required=False, type='list'),
         params=dict(required=False, type='dict')
     )
 
@@ -105,7 +109,7 @@ class BuildPlanFactsModule(OneViewModuleBase):
         if name:
             build_plans = self.i3s_client.build_plans.get_by("name", name)
         else:
-            build_plans = self.i3s_client.build_plans.get_all(**self.facts_params)
+            build_plans = self.get_all_resources(self.i3s_client.build_plans)
 
         return dict(changed=False, ansible_facts=dict(build_plans=build_plans))
 
@@ -40,6 +40,7 @@ options:
 
 extends_documentation_fragment:
     - oneview
+    - oneview.factsfields
     - oneview.factsparams
 '''
 
@@ -83,8 +84,11 @@ from ansible.module_utils.oneview import OneViewModuleBase, OneViewModuleResourc
 
 
 class DeploymentGroupFactsModule(OneViewModuleBase):
+    RESOURCE_LIST_FACTS = ['deployment_groups']
+
     argument_spec = dict(
         name=dict(required=False, type='str'),
+        fields=dict(required=False, type='list'),
         params=dict(required=False, type='dict')
     )
 
@@ -98,7 +102,7 @@ class DeploymentGroupFactsModule(OneViewModuleBase):
         if name:
             deployment_groups = self.i3s_client.deployment_groups.get_by('name', name)
         else:
-            deployment_groups = self.i3s_client.deployment_groups.get_all(**self.facts_params)
+            deployment_groups = self.get_all_resources(self.i3s_client.deployment_groups)
 
         return dict(changed=False, ansible_facts=dict(deployment_groups=deployment_groups))
 
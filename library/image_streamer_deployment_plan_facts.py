@@ -40,6 +40,7 @@ options:
 
 extends_documentation_fragment:
     - oneview
+    - oneview.factsfields
     - oneview.factsparams
 '''
 
@@ -111,9 +112,12 @@ from ansible.module_utils.oneview import OneViewModuleBase
 
 
 class DeploymentPlanFactsModule(OneViewModuleBase):
+    RESOURCE_LIST_FACTS = ['deployment_plans']
+
     argument_spec = dict(
         name=dict(required=False, type='str'),
         options=dict(required=False, type='str'),
+        fields=dict(required=False, type='list'),
         params=dict(required=False, type='dict')
     )
 
@@ -136,7 +140,7 @@ class DeploymentPlanFactsModule(OneViewModuleBase):
                 environmental_configuration = self.i3s_client.deployment_plans.get_osdp(deployment_plan['uri'])
                 ansible_facts['deployment_plans'][0]['deployment_plan_osdp'] = environmental_configuration
         else:
-            ansible_facts['deployment_plans'] = self.i3s_client.deployment_plans.get_all(**self.facts_params)
+            ansible_facts['deployment_plans'] = self.get_all_resources(self.i3s_client.deployment_plans)
 
         return dict(changed=False, ansible_facts=ansible_facts)
 
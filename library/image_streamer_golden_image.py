@@ -26,6 +26,9 @@ module: image_streamer_golden_image
 short_description: Manage Image Streamer Golden Image resources.
 description:
     - "Provides an interface to manage Image Streamer Golden Image. Can create, add, update, and remove."
+    - The files are streamed in chunks and the throughput is returned in C(transfer). A download is split in ranges
+      fetched over several connections when the Image Streamer serves ranges, and is skipped when the file was already
+      downloaded from the same Golden Image and its SHA-256 digest still matches the manifest written next to it.
 version_added: "2.3"
 requirements:
     - "python >= 2.7.9"
@@ -45,6 +48,12 @@ options:
         description:
             - List with Golden Image properties and its associated states.
         required: true
+    download_connections:
+        description:
+            - Maximum number of connections downloading ranges of the file at a time. With less than two, the file is
+              downloaded over a single connection. An interrupted download is resumed over a single connection.
+        type: int
+        default: 4
 
 extends_documentation_fragment:
     - oneview
@@ -133,9 +142,16 @@ golden_image:
     description: Has the OneView facts about the Golden Image.
     returned: On state 'present'.
     type: dict
+
+transfer:
+    description: Bytes transferred, seconds spent and throughput of the upload or download, in bytes per second.
+    returned: When the Golden Image is uploaded or downloaded.
+    type: dict
 '''
 
-from ansible.module_utils.oneview import OneViewModuleBase, OneViewModuleValueError, OneViewModuleResourceNotFound, compare
+from ansible.module_utils.six.moves.urllib.parse import quote
+from ansible.module_utils.oneview import (OneViewModuleBase, OneViewModuleValueError, OneViewModuleResourceNotFound,
+                                          FileTransfer, compare)
 
 
 class GoldenImageModule(OneViewModuleBase):
@@ -146,6 +162,8 @@ class GoldenImageModule(OneViewModuleBase):
     MSG_DELETED = 'Golden Image deleted successfully.'
     MSG_DOWNLOADED = 'Golden Image downloaded successfully.'
     MSG_ARCHIVE_DOWNLOADED = 'Golden Image archive downloaded successfully.'
+    MSG_ALREADY_DOWNLOADED = 'Golden Image is already downloaded.'
+    MSG_ARCHIVE_ALREADY_DOWNLOADED = 'Golden Image archive is already downloaded.'
     MSG_ALREADY_ABSENT = 'Golden Image is already absent.'
     MSG_WAS_NOT_FOUND = 'Golden Image was not found.'
     MSG_CANT_CREATE_AND_UPLOAD = "You can use an existent OS Volume or upload an Image, you cannot do both."
@@ -153,18 +171,24 @@ class GoldenImageModule(OneViewModuleBase):
     MSG_OS_VOLUME_WAS_NOT_FOUND = 'OS Volume was not found.'
     MSG_BUILD_PLAN_WAS_NOT_FOUND = 'OS Build Plan was not found.'
 
+    UPLOAD_PATH = '/rest/golden-images'
+    DOWNLOAD_PATH = '/rest/golden-images/download'
+    ARCHIVE_PATH = '/rest/golden-images/archive'
+
     argument_spec = dict(
         state=dict(
             required=True,
             choices=['present', 'absent', 'downloaded', 'archive_downloaded']
         ),
-        data=dict(required=True, type='dict')
+        data=dict(required=True, type='dict'),
+        download_connections=dict(required=False, type='int', default=4)
     )
 
     def __init__(self):
         super(GoldenImageModule, self).__init__(additional_arg_spec=self.argument_spec)
         self.i3s_client = self.oneview_client.create_image_streamer_client()
         self.resource_client = self.i3s_client.golden_images
+        self.file_transfer = FileTransfer(self.i3s_client.connection)
 
     def execute_module(self):
         resource = self.get_by_name(self.data['name'])
@@ -182,9 +206,12 @@ class GoldenImageModule(OneViewModuleBase):
             elif self.state == 'archive_downloaded':
                 changed, msg, ansible_facts = self.__download_archive(self.data, resource)
 
-        return dict(changed=changed,
-                    msg=msg,
-                    ansible_facts=ansible_facts)
+        result = dict(changed=changed,
+                      msg=msg,
+                      ansible_facts=ansible_facts)
+        if self.file_transfer.statistics:
+            result['transfer'] = self.file_transfer.statistics
+        return result
 
     def __check_present_consistency(self, data):
         if data.get('osVolumeURI') and data.get('localImageFilePath'):
@@ -209,7 +236,7 @@ class GoldenImageModule(OneViewModuleBase):
                 msg = self.MSG_CREATED
                 changed = True
             elif file_path:
-                resource = self.i3s_client.golden_images.upload(file_path, data)
+                resource = self.__upload(file_path, data)
                 msg = self.MSG_UPLOADED
                 changed = True
             else:
@@ -249,13 +276,27 @@ class GoldenImageModule(OneViewModuleBase):
         else:
             raise OneViewModuleResourceNotFound(self.MSG_BUILD_PLAN_WAS_NOT_FOUND)
 
+    def __upload(self, file_path, data):
+        uri = '{0}?name={1}&description={2}'.format(self.UPLOAD_PATH,
+                                                    quote(data.get('name', '')),
+                                                    quote(data.get('description', '')))
+        return self.file_transfer.upload(uri, file_path, log=self.module.log)
+
     def __download(self, data, resource):
-        self.i3s_client.golden_images.download(resource['uri'], data['destination_file_path'])
-        return True, self.MSG_DOWNLOADED, {}
+        downloaded = self.__download_file(self.DOWNLOAD_PATH, resource, data['destination_file_path'])
+        if downloaded:
+            return True, self.MSG_DOWNLOADED, {}
+        return False, self.MSG_ALREADY_DOWNLOADED, {}
 
     def __download_archive(self, data, resource):
-        self.i3s_client.golden_images.download_archive(resource['uri'], data['destination_file_path'])
-        return True, self.MSG_ARCHIVE_DOWNLOADED, {}
+        downloaded = self.__download_file(self.ARCHIVE_PATH, resource, data['destination_file_path'])
+        if downloaded:
+            return True, self.MSG_ARCHIVE_DOWNLOADED, {}
+        return False, self.MSG_ARCHIVE_ALREADY_DOWNLOADED, {}
+
+    def __download_file(self, path, resource, file_path):
+        return self.file_transfer.download_resource(path, resource, file_path,
+                                                    connections=self.module.params.get('download_connections'))
 
 
 def main():
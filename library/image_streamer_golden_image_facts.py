@@ -40,6 +40,7 @@ options:
 
 extends_documentation_fragment:
     - oneview
+    - oneview.factsfields
     - oneview.factsparams
 '''
 
@@ -89,8 +90,11 @@ from ansible.module_utils.oneview import OneViewModuleBase
 
 
 class GoldenImageFactsModule(OneViewModuleBase):
+    RESOURCE_LIST_FACTS = ['golden_images']
+
     argument_spec = dict(
         name=dict(required=False, type='str'),
+        fields=dict(required=False, type='list'),
         params=dict(required=False, type='dict')
     )
 
@@ -106,7 +110,7 @@ class GoldenImageFactsModule(OneViewModuleBase):
         if name:
             golden_images = self.i3s_client.golden_images.get_by("name", name)
         else:
-            golden_images = self.i3s_client.golden_images.get_all(**self.facts_params)
+            golden_images = self.get_all_resources(self.i3s_client.golden_images)
 
         ansible_facts['golden_images'] = golden_images
 
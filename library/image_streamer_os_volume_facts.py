@@ -46,6 +46,7 @@ options:
 
 extends_documentation_fragment:
     - oneview
+    - oneview.factsfields
     - oneview.factsparams
 '''
 
@@ -131,8 +132,11 @@ from ansible.module_utils.oneview import OneViewModuleBase
 
 
 class OsVolumeFactsModule(OneViewModuleBase):
+    RESOURCE_LIST_FACTS = ['os_volumes']
+
     argument_spec = dict(
         name=dict(required=False, type='str'),
+        fields=dict(required=False, type='list'),
         params=dict(required=False, type='dict'),
         options=dict(required=False, type='list')
     )
@@ -148,7 +152,7 @@ class OsVolumeFactsModule(OneViewModuleBase):
         if name:
             os_volumes = self.i3s_client.os_volumes.get_by('name', name)
         else:
-            os_volumes = self.i3s_client.os_volumes.get_all(**self.facts_params)
+            os_volumes = self.get_all_resources(self.i3s_client.os_volumes)
 
         ansible_facts["os_volumes"] = os_volumes
 
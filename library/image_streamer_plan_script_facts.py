@@ -40,6 +40,7 @@ options:
 
 extends_documentation_fragment:
     - oneview
+    - oneview.factsfields
     - oneview.factsparams
 '''
 
@@ -92,9 +93,12 @@ from ansible.module_utils.oneview import OneViewModuleBase
 
 
 class PlanScriptFactsModule(OneViewModuleBase):
+    RESOURCE_LIST_FACTS = ['plan_scripts']
+
     argument_spec = dict(
         name=dict(required=False, type='str'),
         options=dict(required=False, type='list'),
+        fields=dict(required=False, type='list'),
         params=dict(required=False, type='dict')
     )
 
@@ -110,7 +114,7 @@ class PlanScriptFactsModule(OneViewModuleBase):
         if name:
             plan_scripts = self.i3s_client.plan_scripts.get_by("name", name)
         else:
-            plan_scripts = self.i3s_client.plan_scripts.get_all(**self.facts_params)
+            plan_scripts = self.get_all_resources(self.i3s_client.plan_scripts)
 
         ansible_facts['plan_scripts'] = plan_scripts
 
@@ -21,13 +21,87 @@ from __future__ import (absolute_import,
                         print_function,
                         unicode_literals)
 
+import functools
+import time
+
 from future import standard_library
+from hpICsp.exceptions import HPICspException
 from six.moves.urllib.parse import quote
 
 standard_library.install_aliases()
 
 
+class ICspWaiter(object):
+    """
+    Waits for ICsp jobs and servers, polling all of them from a single loop.
+
+    The first round of polls is immediate. The following ones wait initial_delay seconds, multiplied by factor after
+    each round up to max_delay, so a resource that is ready early is not held for a fixed interval while the long
+    waits do not flood the appliance. The seconds spent in each phase are recorded in timings.
+
+    Attributes:
+       initial_delay (float): Seconds to wait after the first round of polls.
+       max_delay (float): Maximum seconds to wait between two rounds of polls.
+       factor (float): Multiplier applied to the delay after each round.
+       timings (dict): Seconds waited by phase name.
+    """
+
+    def __init__(self, initial_delay=2, max_delay=30, factor=2):
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.factor = factor
+        self.timings = {}
+
+    def wait(self, phase, checks, timeout=None):
+        """
+        Polls the checks until all of them are done or the timeout expires.
+
+        Args:
+            phase (str): Name under which the seconds waited are recorded.
+            checks (dict): Functions by key, called without arguments, which return None while the key is pending.
+                The exceptions they raise interrupt the wait.
+            timeout (float): Maximum seconds to wait. Unlimited when None.
+
+        Returns:
+            dict: The results of the checks done, by key. The keys still pending when the timeout expires are missing.
+        """
+        started = time.time()
+        deadline = started + timeout if timeout is not None else None
+        pending = dict(checks)
+        results = {}
+        delay = self.initial_delay
+
+        try:
+            while True:
+                for key, check in list(pending.items()):
+                    result = check()
+                    if result is not None:
+                        results[key] = result
+                        del pending[key]
+
+                if not pending:
+                    break
+
+                wait = delay
+                if deadline is not None:
+                    remaining = deadline - time.time()
+                    if remaining <= 0:
+                        break
+                    wait = min(wait, remaining)
+
+                time.sleep(wait)
+                delay = min(delay * self.factor, self.max_delay)
+        finally:
+            self.timings[phase] = round(time.time() - started, 3)
+
+        return results
+
+
 class ICspHelper(object):
+    # Seconds the server URIs found by iLO address are reused before being searched again
+    ILO_URI_CACHE_TTL = 300
+    # Error code of the responses with the 404 status, since the HPICspException does not keep the status
+    RESOURCE_NOT_FOUND = 'RESOURCE_NOT_FOUND'
 
     def __init__(self, connection):
         """
@@ -37,6 +111,7 @@ class ICspHelper(object):
             connection (connection): ICsp connection.
         """
         self.connection = connection
+        self.server_uris_by_ilo = {}
 
     def get_build_plan(self, bp_name):
         search_uri = '/rest/index/resources?filter="name=\'' + quote(bp_name) + '\'"&category=osdbuildplan'
@@ -47,13 +122,79 @@ class ICspHelper(object):
         return None
 
     def get_server_by_ilo_address(self, ilo):
-        servers = self.connection.get("/rest/os-deployment-servers/?count=-1")
-        for srv in servers['members']:
-            if srv['ilo']:
-                if srv['ilo']['ipAddress'] == ilo:
-                    return srv
+        cached_uri = self.server_uris_by_ilo.get(ilo)
+        if cached_uri and cached_uri['expires'] > time.time():
+            server = self.__get_server_with_ilo_address(cached_uri['uri'], ilo)
+            if server:
+                return server
+        self.server_uris_by_ilo.pop(ilo, None)
+
+        # The index search narrows the servers down to the ones mentioning the address, which are then checked
+        search_uri = '/rest/index/resources?category=osdserver&query=\'"' + ilo + '"\''
+        search_result = self.connection.get(search_uri)
+        for member in search_result['members']:
+            server_uri = '/rest/os-deployment-servers/' + member['attributes']['osdServerId']
+            server = self.__get_server_with_ilo_address(server_uri, ilo)
+            if server:
+                self.server_uris_by_ilo[ilo] = dict(uri=server_uri, expires=time.time() + self.ILO_URI_CACHE_TTL)
+                return server
         return None
 
+    def __get_server_with_ilo_address(self, server_uri, ilo):
+        try:
+            server = self.connection.get(server_uri)
+        except HPICspException as exception:
+            if exception.errorCode != self.RESOURCE_NOT_FOUND:
+                raise
+            return None
+
+        if server.get('ilo') and server['ilo']['ipAddress'] == ilo:
+            return server
+        return None
+
+    def wait_for_jobs(self, waiter, phase, jobs, timeout=None):
+        """
+        Waits for the jobs to finish.
+
+        Args:
+            waiter (ICspWaiter): Waiter that polls the jobs and records the time spent.
+            phase (str): Name under which the seconds waited are recorded.
+            jobs (list): Jobs returned when they were added.
+            timeout (float): Maximum seconds to wait. Unlimited when None.
+
+        Returns:
+            list: The final status of each job, in the same order. A job scheduled to run later is returned pending.
+
+        Raises:
+            HPICspException: When a job fails, or when the timeout expires.
+        """
+        for job in jobs:
+            if 'uri' not in job:
+                raise HPICspException(dict(message='Failed to Start Job', details=job, errorCode='JOB_NOT_STARTED'))
+
+        checks = dict((job['uri'], functools.partial(self.__get_finished_job, job['uri'])) for job in jobs)
+        statuses = waiter.wait(phase, checks, timeout=timeout)
+
+        pending_uris = sorted(uri for uri in checks if uri not in statuses)
+        if pending_uris:
+            raise HPICspException(dict(message='Timed out waiting for the jobs: ' + ', '.join(pending_uris),
+                                       details=pending_uris, errorCode='TIMEOUT'))
+
+        return [statuses[job['uri']] for job in jobs]
+
+    def __get_finished_job(self, job_uri):
+        status = self.connection.get(job_uri)
+        if status['running'] == 'true':
+            return None
+
+        if status['state'] == 'STATUS_FAILURE':
+            log = status['jobResult'][0]['jobResultLogDetails']
+            raise HPICspException(dict(message=status['name'] + ' failed to complete', details=log,
+                                       errorCode=status['state']))
+        if status['state'] not in ('STATUS_SUCCESS', 'STATUS_PENDING'):
+            raise HPICspException(dict(message='Unexpected Job Status', details=status, errorCode=status['state']))
+        return status
+
     def get_server_by_serial(self, serial):
         search_uri = '/rest/index/resources?category=osdserver&query=\'osdServerSerialNumber:\"' + serial + '\"\''
         search_result = self.connection.get(search_uri)
@@ -19,14 +19,31 @@
 from __future__ import (absolute_import, division, print_function, unicode_literals)
 
 import abc
+import bisect
 import collections
+import contextlib
+import fcntl
+import functools
+import hashlib
+import inspect
 import json
 import logging
 import os
+import random
+import socket
+import sys
+import tempfile
+import threading
+import time
 import traceback
 
+from multiprocessing.pool import ThreadPool
+
 try:
     from hpOneView.oneview_client import OneViewClient
+    from hpOneView.connection import connection as OneViewConnection
+    from hpOneView.exceptions import HPOneViewException
+    from hpOneView.resources.task_monitor import TaskMonitor
     HAS_HPE_ONEVIEW = True
 except ImportError:
     HAS_HPE_ONEVIEW = False
@@ -38,7 +55,8 @@ except ImportError:
     import six
     to_native = str
 
-from ansible.module_utils.basic import AnsibleModule
+from ansible.module_utils.basic import AnsibleModule, env_fallback
+from ansible.module_utils.connection import Connection
 
 
 # NOTE: VALIDATE IF REQUIRED
@@ -103,6 +121,9 @@ def merge_list_by_key(original_list, updated_list, key, ignore_when_null=None):
 
     3. For all items that are in both lists, overwrites the values from the original item by the updated item.
 
+    The items of the original list are not modified: an original item is copied when it is changed by the
+    updated item, and reused as it is otherwise.
+
     :arg list original_list: original list.
     :arg list updated_list: list with changes.
     :arg str key: unique identifier.
@@ -115,7 +136,7 @@ def merge_list_by_key(original_list, updated_list, key, ignore_when_null=None):
     if not original_list:
         return updated_list
 
-    items_map = collections.OrderedDict([(i[key], i.copy()) for i in original_list])
+    items_map = collections.OrderedDict([(i[key], i) for i in original_list])
 
     merged_items = collections.OrderedDict()
 
@@ -125,8 +146,13 @@ def merge_list_by_key(original_list, updated_list, key, ignore_when_null=None):
             for ignored_key in ignore_when_null:
                 if ignored_key in item and item[ignored_key] is None:
                     item.pop(ignored_key)
-            merged_items[item_key] = items_map[item_key]
-            merged_items[item_key].update(item)
+            merged_item = merged_items.get(item_key, items_map[item_key])
+            # The original item is only copied when the updated item changes it
+            if any(k not in merged_item or merged_item[k] != v for k, v in item.items()):
+                if merged_item is items_map[item_key]:
+                    merged_item = merged_item.copy()
+                merged_item.update(item)
+            merged_items[item_key] = merged_item
         else:
             merged_items[item_key] = item
 
@@ -140,6 +166,16 @@ def _str_sorted(obj):
         return str(obj)
 
 
+def get_name_key(name):
+    """
+    Normalizes a resource name to compare it the way the appliance filters the names, case insensitively.
+
+    :arg str name: Resource name.
+    :return: str: The name normalized.
+    """
+    return to_native(name).lower()
+
+
 def _standardize_value(value):
     """
     Convert value to string to enhance the comparison.
@@ -156,26 +192,72 @@ def _standardize_value(value):
     return str(value)
 
 
+def _log_difference(message, resource1, resource2):
+    # Resources can be large documents, so they are only rendered when the debug logging is enabled
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(message + "resource1 = {0}, resource2 = {1}".format(resource1, resource2))
+
+
+_SCALAR_TYPES = frozenset(six.string_types + six.integer_types + (float, bool, type(None)))
+
+
+def _canonicalize(value, cache):
+    """
+    Builds a hashable canonical representation of the value, following the normalisation rules of the comparison:
+    keys with None values are ignored, empty values of a dictionary are equivalent, the order of the list elements
+    is ignored and the other values are converted to str. Values with the same canonical representation are
+    considered equal by compare.
+
+    :arg value: Any object type.
+    :arg dict cache: Canonical representations of dictionaries and lists already computed, by object id.
+    :return: Canonical representation.
+    """
+    value_type = type(value)
+    if value_type is dict or value_type is list:
+        is_mapping = value_type is dict
+    elif value_type in _SCALAR_TYPES or not isinstance(value, (collections.Mapping, list)):
+        return 'v', _standardize_value(value)
+    else:
+        is_mapping = isinstance(value, collections.Mapping)
+
+    cached = cache.get(id(value))
+    if cached is not None:
+        return cached[1]
+
+    if is_mapping:
+        canonical = 'd', frozenset((key, _canonicalize(item, cache) if item else 'e')
+                                   for key, item in value.items() if item is not None)
+    else:
+        counter = collections.Counter(_canonicalize(item, cache) for item in value)
+        canonical = 'l', frozenset(counter.items())
+
+    # The value is kept in the cache to ensure its id is not reused while the cache is alive
+    cache[id(value)] = (value, canonical)
+    return canonical
+
+
 def compare(first_resource, second_resource):
     """
     Recursively compares dictionary contents equivalence, ignoring types and elements order.
     Particularities of the comparison:
         - Inexistent key = None
         - These values are considered equal: None, empty, False
-        - Lists are compared value by value after a sort, if they have same size.
+        - Lists are compared as multisets, ignoring the order of the elements, if they have same size.
         - Each element is converted to str before the comparison.
     :arg dict first_resource: first dictionary
     :arg dict second_resource: second dictionary
     :return: bool: True when equal, False when different.
     """
-    resource1 = first_resource
-    resource2 = second_resource
+    return _compare(first_resource, second_resource, {})
+
 
-    debug_resources = "resource1 = {0}, resource2 = {1}".format(resource1, resource2)
+def _compare(resource1, resource2, cache):
+    if resource1 is resource2 or _canonicalize(resource1, cache) == _canonicalize(resource2, cache):
+        return True
 
     # The first resource is True / Not Null and the second resource is False / Null
     if resource1 and not resource2:
-        logger.debug("resource1 and not resource2. " + debug_resources)
+        _log_difference("resource1 and not resource2. ", resource1, resource2)
         return False
 
     # Checks all keys in first dict against the second dict
@@ -183,23 +265,23 @@ def compare(first_resource, second_resource):
         if key not in resource2:
             if resource1[key] is not None:
                 # Inexistent key is equivalent to exist with value None
-                logger.debug(OneViewModuleBase.MSG_DIFF_AT_KEY.format(key) + debug_resources)
+                _log_difference(OneViewModuleBase.MSG_DIFF_AT_KEY.format(key), resource1, resource2)
                 return False
         # If both values are null, empty or False it will be considered equal.
         elif not resource1[key] and not resource2[key]:
             continue
         elif isinstance(resource1[key], collections.Mapping):
             # recursive call
-            if not compare(resource1[key], resource2[key]):
-                logger.debug(OneViewModuleBase.MSG_DIFF_AT_KEY.format(key) + debug_resources)
+            if not _compare(resource1[key], resource2[key], cache):
+                _log_difference(OneViewModuleBase.MSG_DIFF_AT_KEY.format(key), resource1, resource2)
                 return False
         elif isinstance(resource1[key], list):
             # change comparison function to compare_list
-            if not compare_list(resource1[key], resource2[key]):
-                logger.debug(OneViewModuleBase.MSG_DIFF_AT_KEY.format(key) + debug_resources)
+            if not _compare_list(resource1[key], resource2[key], cache):
+                _log_difference(OneViewModuleBase.MSG_DIFF_AT_KEY.format(key), resource1, resource2)
                 return False
         elif _standardize_value(resource1[key]) != _standardize_value(resource2[key]):
-            logger.debug(OneViewModuleBase.MSG_DIFF_AT_KEY.format(key) + debug_resources)
+            _log_difference(OneViewModuleBase.MSG_DIFF_AT_KEY.format(key), resource1, resource2)
             return False
 
     # Checks all keys in the second dict, looking for missing elements
@@ -207,7 +289,7 @@ def compare(first_resource, second_resource):
         if key not in resource1:
             if resource2[key] is not None:
                 # Inexistent key is equivalent to exist with value None
-                logger.debug(OneViewModuleBase.MSG_DIFF_AT_KEY.format(key) + debug_resources)
+                _log_difference(OneViewModuleBase.MSG_DIFF_AT_KEY.format(key), resource1, resource2)
                 return False
 
     return True
@@ -216,49 +298,342 @@ def compare(first_resource, second_resource):
 def compare_list(first_resource, second_resource):
     """
     Recursively compares lists contents equivalence, ignoring types and element orders.
-    Lists with same size are compared value by value after a sort,
-    each element is converted to str before the comparison.
+    Lists with same size are compared as multisets of the canonical representations of their elements,
+    the elements left without a match are compared value by value after a sort,
+    each value is converted to str before the comparison.
     :arg list first_resource: first list
     :arg list second_resource: second list
     :return: True when equal; False when different.
     """
+    return _compare_list(first_resource, second_resource, {})
 
-    resource1 = first_resource
-    resource2 = second_resource
-
-    debug_resources = "resource1 = {0}, resource2 = {1}".format(resource1, resource2)
 
+def _compare_list(resource1, resource2, cache):
     # The second list is null / empty  / False
     if not resource2:
-        logger.debug("resource 2 is null. " + debug_resources)
+        _log_difference("resource 2 is null. ", resource1, resource2)
         return False
 
+    if resource1 is resource2:
+        return True
+
     if len(resource1) != len(resource2):
-        logger.debug("resources have different length. " + debug_resources)
+        _log_difference("resources have different length. ", resource1, resource2)
         return False
 
-    resource1 = sorted(resource1, key=_str_sorted)
-    resource2 = sorted(resource2, key=_str_sorted)
+    # The canonical representation of a list counts its elements, so it is computed in linear time
+    # and the comparison does not depend on the order of the elements
+    if _canonicalize(resource1, cache) == _canonicalize(resource2, cache):
+        return True
 
-    for i, val in enumerate(resource1):
+    # A None value and an empty value are equivalent but have different canonical representations,
+    # so the elements left without a match are still compared one by one
+    unmatched1 = _get_unmatched_elements(resource1, resource2, cache)
+    unmatched2 = _get_unmatched_elements(resource2, resource1, cache)
+
+    unmatched2 = sorted(unmatched2, key=_str_sorted)
+    for i, val in enumerate(sorted(unmatched1, key=_str_sorted)):
         if isinstance(val, collections.Mapping):
             # change comparison function to compare dictionaries
-            if not compare(val, resource2[i]):
-                logger.debug("resources are different. " + debug_resources)
+            if not _compare(val, unmatched2[i], cache):
+                _log_difference("resources are different. ", resource1, resource2)
                 return False
         elif isinstance(val, list):
             # recursive call
-            if not compare_list(val, resource2[i]):
-                logger.debug("lists are different. " + debug_resources)
+            if not _compare_list(val, unmatched2[i], cache):
+                _log_difference("lists are different. ", resource1, resource2)
                 return False
-        elif _standardize_value(val) != _standardize_value(resource2[i]):
-            logger.debug("values are different. " + debug_resources)
+        elif _standardize_value(val) != _standardize_value(unmatched2[i]):
+            _log_difference("values are different. ", resource1, resource2)
             return False
 
     # no differences found
     return True
 
 
+def _get_unmatched_elements(resource1, resource2, cache):
+    remaining = collections.Counter(_canonicalize(item, cache) for item in resource2)
+    unmatched = []
+    for item in resource1:
+        canonical = _canonicalize(item, cache)
+        if remaining[canonical]:
+            remaining[canonical] -= 1
+        else:
+            unmatched.append(item)
+    return unmatched
+
+
+def diff(first_resource, second_resource):
+    """
+    Recursively computes the differences between two dictionaries, following the same equivalence rules of compare:
+    inexistent keys are equivalent to keys with value None, null and empty values are equivalent, the order of the list
+    elements is ignored and the values are compared as str.
+
+    Lists are compared as a whole, so any difference inside a list results in the replacement of the entire list.
+
+    :arg dict first_resource: current dictionary
+    :arg dict second_resource: desired dictionary
+    :return: list: RFC 6902 (JSON Patch) operations that transform the first dictionary into the second, sorted by
+        path. The path of each operation is the JSON Pointer of a changed key. An empty list means both are equivalent.
+    """
+    operations = []
+    _diff(first_resource or {}, second_resource or {}, '', operations, {})
+    return operations
+
+
+def get_changed_paths(first_resource, second_resource):
+    """
+    Lists the JSON Pointers of the keys that differ between two dictionaries, according to the diff function.
+
+    :arg dict first_resource: current dictionary
+    :arg dict second_resource: desired dictionary
+    :return: list: JSON Pointers of the changed keys.
+    """
+    return [operation['path'] for operation in diff(first_resource, second_resource)]
+
+
+def _to_json_pointer_token(key):
+    return to_native(key).replace('~', '~0').replace('/', '~1')
+
+
+def _diff(resource1, resource2, path, operations, cache):
+    for key in sorted(set(resource1) | set(resource2), key=to_native):
+        key_path = path + '/' + _to_json_pointer_token(key)
+
+        if key not in resource2:
+            if resource1[key] is not None:
+                operations.append(dict(op='remove', path=key_path))
+            continue
+
+        value1 = resource1.get(key)
+        value2 = resource2[key]
+
+        if key not in resource1:
+            if value2 is not None:
+                operations.append(dict(op='add', path=key_path, value=value2))
+        # If both values are null, empty or False it will be considered equal.
+        elif not value1 and not value2:
+            continue
+        elif isinstance(value1, collections.Mapping) and isinstance(value2, collections.Mapping):
+            _diff(value1, value2, key_path, operations, cache)
+        elif isinstance(value1, list) and isinstance(value2, list):
+            if not _compare_list(value1, value2, cache):
+                operations.append(dict(op='replace', path=key_path, value=value2))
+        elif isinstance(value1, (collections.Mapping, list)) or isinstance(value2, (collections.Mapping, list)) or \
+                _standardize_value(value1) != _standardize_value(value2):
+            operations.append(dict(op='replace', path=key_path, value=value2))
+
+
+def get_value_by_path(resource, path):
+    """
+    Gets the value of an attribute of the resource, nested attributes are referenced by dotted paths.
+
+    :arg dict resource: Resource.
+    :arg str path: Attribute path, e.g. 'associatedResource.resourceCategory'.
+    :return: The attribute value, or None when the attribute does not exist.
+    """
+    value = resource
+    for key in path.split('.'):
+        if not isinstance(value, collections.Mapping) or key not in value:
+            return None
+        value = value[key]
+    return value
+
+
+def build_fields_projection(fields):
+    """
+    Builds a projection that keeps only the informed fields of the resources. Nested fields are referenced by dotted
+    paths, and the paths are applied to each element of the lists. Fields absent from a resource are ignored.
+
+    :arg list fields: Paths of the fields to keep, e.g. ['name', 'uri', 'status', 'bios.manageBios'].
+    :return: function: Projection that receives a resource and returns a new dictionary with the selected fields.
+    """
+    fields_tree = {}
+    for field in fields:
+        subtree = fields_tree
+        keys = field.split('.')
+        for key in keys[:-1]:
+            if key in subtree and not subtree[key]:
+                # The parent field was already selected as a whole
+                break
+            subtree = subtree.setdefault(key, {})
+        else:
+            subtree[keys[-1]] = {}
+
+    def project(value, tree):
+        if isinstance(value, list):
+            return [project(item, tree) for item in value]
+        if not isinstance(value, collections.Mapping):
+            return value
+        return dict((key, project(value[key], subtree) if subtree else value[key])
+                    for key, subtree in tree.items() if key in value)
+
+    return lambda resource: project(resource, fields_tree)
+
+
+def _accepts_argument(function, name):
+    try:
+        if six.PY2:
+            spec = inspect.getargspec(function)
+            return name in spec.args or spec.keywords is not None
+        parameters = inspect.signature(function).parameters
+    except (TypeError, ValueError):
+        return False
+    return name in parameters or any(p.kind == p.VAR_KEYWORD for p in parameters.values())
+
+
+def build_match_predicate(match):
+    """
+    Builds a predicate that selects the resources whose attributes have the expected values. The values are
+    converted to str before the comparison.
+
+    :arg dict match: Expected values by attribute path. A list of values selects the resources with any of them.
+    :return: function: Predicate that receives a resource and returns True when it is selected.
+    """
+    expected_values = {}
+    for path, values in match.items():
+        values = values if isinstance(values, list) else [values]
+        expected_values[path] = set(_standardize_value(value) for value in values)
+
+    def predicate(resource):
+        return all(_standardize_value(get_value_by_path(resource, path)) in values
+                   for path, values in expected_values.items())
+
+    return predicate
+
+
+def iterate_all_resources(resource_client, page_size, predicate=None, projection=None, start=0, count=-1, **params):
+    """
+    Gets the resources page by page, requesting at most page_size resources at a time. Each page is discarded after
+    the predicate and the projection are applied, so only the selected resources are kept in memory.
+
+    :arg resource_client: Client of the resources, it must provide get_all with the start and count arguments.
+    :arg int page_size: Maximum number of resources requested at a time.
+    :arg function predicate: Selects the resources to return, all resources are returned when not informed.
+    :arg function projection: Transforms the selected resources before they are returned.
+    :arg int start: The first resource to request, using 0-based indexing.
+    :arg int count: The number of resources to request. A count of -1 requests all resources.
+    :arg params: Additional arguments for get_all, such as filter, query and sort.
+    :return: generator: Selected resources.
+    """
+    start = int(start)
+    remaining = int(count)
+
+    while remaining != 0:
+        requested = page_size if remaining < 0 else min(page_size, remaining)
+        page = resource_client.get_all(start=start, count=requested, **params) or []
+
+        for resource in page:
+            if predicate is None or predicate(resource):
+                yield projection(resource) if projection else resource
+
+        if len(page) < requested:
+            break
+
+        start += len(page)
+        if remaining > 0:
+            remaining -= len(page)
+
+
+def run_concurrently(functions, max_workers=8, progress=None):
+    """
+    Runs the functions on a bounded pool of threads, e.g. to perform independent GETs against the appliance at once.
+
+    Every function runs to completion, even when others fail. Once all of them have finished, the exception raised by
+    the first function that failed, in the informed order, is raised again.
+
+    :arg list functions: Functions called without arguments.
+    :arg int max_workers: Maximum number of functions running at a time.
+    :arg function progress: Called with the number of functions finished and the total, each time one finishes.
+    :return: list: The values returned by the functions, in the same order.
+    """
+    if progress:
+        functions = _with_progress(functions, progress)
+
+    if len(functions) <= 1:
+        outcomes = [_capture_outcome(function) for function in functions]
+    else:
+        pool = ThreadPool(min(max_workers, len(functions)))
+        try:
+            outcomes = pool.map(_capture_outcome, functions)
+        finally:
+            pool.close()
+            pool.join()
+
+    for result, exc_info in outcomes:
+        if exc_info:
+            six.reraise(*exc_info)
+
+    return [result for result, exc_info in outcomes]
+
+
+def _capture_outcome(function):
+    try:
+        return function(), None
+    except Exception:
+        return None, sys.exc_info()
+
+
+def _with_progress(functions, progress):
+    lock = threading.Lock()
+    finished = [0]
+
+    def track(function):
+        def tracked():
+            try:
+                return function()
+            finally:
+                with lock:
+                    finished[0] += 1
+                    progress(finished[0], len(functions))
+        return tracked
+
+    return [track(function) for function in functions]
+
+
+def get_by_names(resource_client, names, names_per_query=50):
+    """
+    Gets the resources with the names informed, combining the names in filtered queries instead of a query per name.
+
+    :arg resource_client: Client of the resources.
+    :arg list names: Names of the resources.
+    :arg int names_per_query: Maximum number of names combined in a single filter, to keep the query URI within the
+        appliance limits.
+    :return: list: The resources found, in the order of the names.
+    """
+    names = list(OrderedDict.fromkeys(names))
+    resources_by_name = {}
+    for resource in _get_all_by_names(resource_client, names, names_per_query):
+        resources_by_name.setdefault(get_name_key(resource.get('name')), resource)
+
+    resources = [resources_by_name.get(get_name_key(name)) for name in names]
+    return [resource for resource in resources if resource]
+
+
+def _get_all_by_names(resource_client, names, names_per_query, **kwargs):
+    # Yields every resource matching the names, querying them in chunks combined with OR filters
+    for index in range(0, len(names), names_per_query):
+        chunk = names[index:index + names_per_query]
+        name_filter = "\"{0}\"".format(' OR '.join("name='{0}'".format(name) for name in chunk))
+        for resource in resource_client.get_all(filter=name_filter, **kwargs):
+            yield resource
+
+
+def get_file_digest(file_path, chunk_size=1024 * 1024):
+    """
+    Computes the SHA-256 digest of a file, reading it in chunks so the memory used does not grow with the file size.
+
+    :arg str file_path: Path of the file.
+    :arg int chunk_size: Bytes read at a time.
+    :return: str: The hexadecimal digest.
+    """
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as file_object:
+        for chunk in iter(functools.partial(file_object.read, chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
 class OneViewModuleException(Exception):
     """
     OneView base Exception.
@@ -322,6 +697,1055 @@ class OneViewModuleResourceNotFound(OneViewModuleException):
     pass
 
 
+class _OneViewTaskStarted(Exception):
+    """
+    Raised to stop the module execution when a task is started and the module must not wait for its completion.
+
+    Attributes:
+       task (dict): Task started.
+    """
+
+    def __init__(self, task):
+        super(_OneViewTaskStarted, self).__init__(task.get('uri'))
+        self.task = task
+
+
+# Methods of the SDK TaskMonitor that wait for the tasks
+_TASK_WAITS = ('wait_for_task', 'get_completed_task')
+
+
+def _raise_task_started(task_monitor, task, timeout=-1):
+    raise _OneViewTaskStarted(task)
+
+
+def _get_task_monitor(resource_client):
+    # The resources of the SDK 5.x keep the TaskMonitor themselves, while the 4.x wrappers keep it in the
+    # ResourceClient of their _client
+    return getattr(resource_client, '_task_monitor', None) or \
+        getattr(getattr(resource_client, '_client', None), '_task_monitor', None)
+
+
+@contextlib.contextmanager
+def _intercept_started_tasks(resource_clients):
+    # Replaces the task waits of the task monitors of the clients, so the first task started raises
+    # _OneViewTaskStarted instead of being awaited. Only these instances are changed, so the tasks awaited by other
+    # clients, or by other threads, are not affected.
+    task_monitors = []
+    for resource_client in resource_clients:
+        task_monitor = _get_task_monitor(resource_client)
+        if task_monitor is not None and not any(task_monitor is other for other in task_monitors):
+            task_monitors.append(task_monitor)
+
+    previous_waits = []
+    for task_monitor in task_monitors:
+        previous_waits.append(dict((name, vars(task_monitor)[name]) for name in _TASK_WAITS if name in vars(task_monitor)))
+        for name in _TASK_WAITS:
+            setattr(task_monitor, name, functools.partial(_raise_task_started, task_monitor))
+    try:
+        yield
+    finally:
+        for task_monitor, previous in zip(task_monitors, previous_waits):
+            for name in _TASK_WAITS:
+                vars(task_monitor).pop(name, None)
+                if name in previous:
+                    setattr(task_monitor, name, previous[name])
+
+
+class _OneViewHttpApiClient(OneViewClient if HAS_HPE_ONEVIEW else object):
+    # OneViewClient whose SDK connection neither logs in nor sends requests of its own. The connection is changed as
+    # soon as the OneViewClient creates it, before the login, and only this instance is changed, so the clients
+    # created at the same time by other threads still log in.
+
+    def __init__(self, config, do_http):
+        self.__do_http = do_http
+        super(_OneViewHttpApiClient, self).__init__(config)
+
+    @property
+    def _OneViewClient__connection(self):
+        return self.__dict__['_OneViewClient__connection']
+
+    @_OneViewClient__connection.setter
+    def _OneViewClient__connection(self, sdk_connection):
+        sdk_connection.login = lambda credentials, verbose=False: None
+        sdk_connection.do_http = self.__do_http
+        self.__dict__['_OneViewClient__connection'] = sdk_connection
+
+
+class OneViewHttpApi(object):
+    """
+    Sends the requests of a OneViewClient through the persistent connection of the oneview httpapi plugin.
+
+    The persistent connection owns the login session and the API version negotiated with the appliance, so the
+    modules neither log in nor request the appliance version. The requests that stream files (uploads and downloads)
+    are not sent through it.
+
+    Attributes:
+       connection (Connection): Persistent connection of the task.
+    """
+    # Headers set by the persistent connection
+    CONNECTION_HEADERS = ['auth', 'X-API-Version']
+
+    def __init__(self, socket_path):
+        self.connection = Connection(socket_path)
+        self.sdk_connection = None
+
+    def create_client(self):
+        """
+        Creates a OneViewClient that sends its requests through the persistent connection.
+
+        :return: OneViewClient
+        """
+        config = dict(ip=self.connection.get_option('host'),
+                      api_version=self.connection.get_api_version(),
+                      credentials=dict())
+
+        oneview_client = _OneViewHttpApiClient(config, self.do_http)
+        self.sdk_connection = oneview_client.connection
+
+        return oneview_client
+
+    def do_http(self, method, path, body, custom_headers=None):
+        """
+        Sends a request of the SDK connection, returning the response the same way as it does.
+
+        :arg str method: HTTP method.
+        :arg str path: Request path.
+        :arg str body: Request body, serialized.
+        :arg dict custom_headers: Headers of the request, besides the headers of the SDK connection.
+        :return: tuple: The response, with its status and headers, and the response body.
+        """
+        headers = dict(self.sdk_connection._headers)
+        headers.update(custom_headers or {})
+        for name in self.CONNECTION_HEADERS:
+            headers.pop(name, None)
+
+        status, response_headers, response_body = self.connection.send_request(body or None, path=path,
+                                                                               method=method, headers=headers)
+        try:
+            response_body = json.loads(response_body) if response_body else response_body
+        except ValueError:
+            pass
+
+        return _HttpApiResponse(status, response_headers), response_body
+
+
+class _HttpApiResponse(object):
+    def __init__(self, status, headers):
+        self.status = status
+        self.headers = dict((name.lower(), value) for name, value in headers.items())
+
+    def getheader(self, name, default=None):
+        return self.headers.get(name.lower(), default)
+
+
+class OneViewSessionCache(object):
+    """
+    File based cache of OneView login sessions.
+
+    It allows the modules to share an authenticated session across tasks and forks, avoiding a new login to the
+    appliance on every module invocation. Each session is stored in its own file, keyed by hostname, user, login
+    domain and API version. The files are only readable by the owner and are accessed under an exclusive lock.
+
+    Attributes:
+       cache_dir (str): Directory where the session files are stored.
+    """
+    FILE_PREFIX = 'oneview-session-'
+
+    def __init__(self, cache_dir):
+        self.cache_dir = os.path.expanduser(cache_dir)
+
+    def create_client(self, config):
+        """
+        Creates a OneViewClient reusing the cached session when it is still valid.
+
+        The SDK validates the cached session ID against the appliance. When the session is rejected (e.g.: expired or
+        revoked), the cache entry is discarded and a new login is performed with the configured credentials.
+
+        :arg dict config: OneViewClient configuration.
+        :return: OneViewClient
+        """
+        session_id = self.load(config)
+
+        if session_id:
+            cached_config = deepcopy(config)
+            cached_config['credentials']['sessionID'] = session_id
+            try:
+                return OneViewClient(cached_config)
+            except HPOneViewException:
+                logger.debug("Cached OneView session rejected by the appliance. Logging in again.")
+                self.invalidate(config)
+
+        login_config = deepcopy(config)
+        login_config['credentials'].pop('sessionID', None)
+        oneview_client = OneViewClient(login_config)
+        self.store(config, oneview_client.connection.get_session_id())
+
+        return oneview_client
+
+    def load(self, config):
+        """
+        Gets the cached session ID for the configuration.
+
+        :arg dict config: OneViewClient configuration.
+        :return: str: Session ID or None when not cached.
+        """
+        path = self._get_path(config)
+
+        with self._lock(path):
+            return _read_json(path, {}).get('sessionID')
+
+    def store(self, config, session_id):
+        """
+        Stores the session ID for the configuration, replacing the previous entry atomically.
+
+        :arg dict config: OneViewClient configuration.
+        :arg str session_id: Session ID returned by the appliance.
+        """
+        path = self._get_path(config)
+
+        with self._lock(path):
+            _write_json_atomically(path, dict(sessionID=session_id, created=time.time()))
+
+    def invalidate(self, config):
+        """
+        Removes the cached session for the configuration.
+
+        :arg dict config: OneViewClient configuration.
+        """
+        path = self._get_path(config)
+
+        with self._lock(path):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def _get_path(self, config):
+        if not os.path.isdir(self.cache_dir):
+            os.makedirs(self.cache_dir, 0o700)
+
+        credentials = config.get('credentials') or {}
+        key = '|'.join(to_native(value) for value in [config.get('ip'),
+                                                      credentials.get('userName'),
+                                                      credentials.get('authLoginDomain'),
+                                                      config.get('api_version')])
+        digest = hashlib.sha256(key.encode('utf-8')).hexdigest()
+
+        return os.path.join(self.cache_dir, self.FILE_PREFIX + digest + '.json')
+
+    def _lock(self, path):
+        return _FileLock(path + '.lock')
+
+
+class OneViewResourceCache(object):
+    """
+    File based cache of the GET responses of read-mostly OneView resources.
+
+    It allows the modules to reuse the lookups of resources that rarely change (e.g.: enclosure groups, server hardware
+    types and networks) across tasks and forks. Only the collections listed in CACHED_COLLECTIONS are cached. Each
+    response is stored in its own file, keyed by hostname, user, API version and URI, and it is reused without a
+    request for ttl seconds. After that, it is revalidated with an If-None-Match request when the appliance returned an
+    ETag, or requested again otherwise. The writes made through the connection discard the cached responses of the
+    collection written. The files are only readable by the owner, accessed under an exclusive lock per collection, and
+    replaced atomically.
+
+    Attributes:
+       cache_dir (str): Directory where the responses are stored.
+       ttl (int): Seconds a response is reused before it is revalidated.
+    """
+    FILE_PREFIX = 'oneview-resource-'
+    DEFAULT_TTL = 300
+
+    CACHED_COLLECTIONS = ['/rest/enclosure-groups',
+                          '/rest/ethernet-networks',
+                          '/rest/fc-networks',
+                          '/rest/fcoe-networks',
+                          '/rest/firmware-drivers',
+                          '/rest/network-sets',
+                          '/rest/os-deployment-plans',
+                          '/rest/server-hardware-types',
+                          '/rest/storage-pools']
+
+    # Writes to a collection that also change the resources of other collections
+    RELATED_COLLECTIONS = {'/rest/ethernet-networks': ['/rest/network-sets'],
+                           '/rest/firmware-bundles': ['/rest/firmware-drivers']}
+
+    def __init__(self, cache_dir, ttl=DEFAULT_TTL):
+        self.cache_dir = os.path.expanduser(cache_dir)
+        self.ttl = ttl
+
+    def install(self, connection, config):
+        """
+        Caches the GETs made through the connection and discards the cached responses on its writes.
+
+        :arg connection: Connection of the OneViewClient.
+        :arg dict config: OneViewClient configuration.
+        """
+        appliance_key = self._get_appliance_key(config)
+        uncached_get = connection.get
+
+        def get(uri):
+            if self._get_collection(uri) not in self.CACHED_COLLECTIONS:
+                return uncached_get(uri)
+            return self.get(connection, appliance_key, uri, uncached_get)
+
+        def invalidating(write):
+            def write_and_invalidate(uri, *args, **kwargs):
+                try:
+                    return write(uri, *args, **kwargs)
+                finally:
+                    self.invalidate(appliance_key, uri)
+            return write_and_invalidate
+
+        for method_name in ['post', 'put', 'patch', 'delete']:
+            setattr(connection, method_name, invalidating(getattr(connection, method_name)))
+        connection.post_multipart_with_response_handling = invalidating(connection.post_multipart_with_response_handling)
+        connection.get = get
+        # Used by the writes that do not go through the methods above, e.g. the uploads of FileTransfer
+        connection.invalidate_resource_cache = functools.partial(self.invalidate, appliance_key)
+
+    def get(self, connection, appliance_key, uri, uncached_get):
+        """
+        Gets the response of a URI, from the cache when it is still valid.
+
+        :arg connection: Connection of the OneViewClient.
+        :arg str appliance_key: Key of the appliance and user.
+        :arg str uri: URI requested.
+        :arg function uncached_get: Performs the GET when the response cannot be cached.
+        :return: The response body.
+        """
+        collection = self._get_collection(uri)
+        path = self._get_path(appliance_key, collection, uri)
+
+        with self._lock(appliance_key, collection):
+            entry = _read_json(path)
+
+        requested = time.time()
+        if entry and requested < entry['stored'] + self.ttl:
+            return entry['body']
+
+        headers = {'If-None-Match': entry['etag']} if entry and entry.get('etag') else None
+        response, body = connection.do_http('GET', uri, '', custom_headers=headers)
+
+        if response.status == 304 and entry:
+            body = entry['body']
+        elif response.status >= 400:
+            raise HPOneViewException(body)
+        elif response.status != 200:
+            return uncached_get(uri)
+
+        etag = response.getheader('ETag') or (body.get('eTag') if isinstance(body, dict) else None)
+
+        with self._lock(appliance_key, collection):
+            # A response requested before a write to the collection may be outdated already
+            if self._get_invalidated(appliance_key, collection) < requested:
+                _write_json_atomically(path, dict(uri=uri, etag=etag, stored=time.time(), body=body))
+
+        return body
+
+    def invalidate(self, appliance_key, uri):
+        """
+        Discards the cached responses of the collection of the URI and of its related collections.
+
+        :arg str appliance_key: Key of the appliance and user.
+        :arg str uri: URI written.
+        """
+        collection = self._get_collection(uri)
+
+        for written_collection in [collection] + self.RELATED_COLLECTIONS.get(collection, []):
+            if written_collection not in self.CACHED_COLLECTIONS:
+                continue
+
+            with self._lock(appliance_key, written_collection):
+                prefix = self._get_collection_prefix(appliance_key, written_collection)
+                with open(prefix + '.invalidated', 'w') as invalidated_file:
+                    invalidated_file.write(repr(time.time()))
+                for file_name in os.listdir(self.cache_dir):
+                    if os.path.join(self.cache_dir, file_name).startswith(prefix + '-'):
+                        os.remove(os.path.join(self.cache_dir, file_name))
+
+    def _get_appliance_key(self, config):
+        credentials = config.get('credentials') or {}
+        key = '|'.join(to_native(value) for value in [config.get('ip'),
+                                                      credentials.get('userName'),
+                                                      credentials.get('authLoginDomain'),
+                                                      config.get('api_version')])
+        return hashlib.sha256(key.encode('utf-8')).hexdigest()[:16]
+
+    @staticmethod
+    def _get_collection(uri):
+        # e.g.: /rest/ethernet-networks for /rest/ethernet-networks/id and /rest/ethernet-networks?filter=...
+        return '/'.join(uri.split('?')[0].split('/')[:3])
+
+    def _get_collection_prefix(self, appliance_key, collection):
+        if not os.path.isdir(self.cache_dir):
+            os.makedirs(self.cache_dir, 0o700)
+
+        digest = hashlib.sha256(collection.encode('utf-8')).hexdigest()[:16]
+        return os.path.join(self.cache_dir, self.FILE_PREFIX + appliance_key + '-' + digest)
+
+    def _get_path(self, appliance_key, collection, uri):
+        digest = hashlib.sha256(uri.encode('utf-8')).hexdigest()
+        return self._get_collection_prefix(appliance_key, collection) + '-' + digest + '.json'
+
+    def _get_invalidated(self, appliance_key, collection):
+        try:
+            with open(self._get_collection_prefix(appliance_key, collection) + '.invalidated') as invalidated_file:
+                return float(invalidated_file.read())
+        except (IOError, OSError, ValueError):
+            return 0
+
+    def _lock(self, appliance_key, collection):
+        return _FileLock(self._get_collection_prefix(appliance_key, collection) + '.lock')
+
+
+def _read_json(path, default=None):
+    # Reads a JSON file, returning the default when it is missing or is not complete
+    try:
+        with open(path) as json_file:
+            return json.load(json_file)
+    except (IOError, OSError, ValueError):
+        return default
+
+
+def _write_json_atomically(path, data):
+    # Writes a temporary file in the same directory, owner only, and renames it, so the readers never see it partially
+    file_descriptor, temp_path = tempfile.mkstemp(dir=os.path.dirname(path) or '.', prefix=os.path.basename(path))
+    with os.fdopen(file_descriptor, 'w') as json_file:
+        json.dump(data, json_file)
+    os.rename(temp_path, path)
+
+
+class _LockedJsonFile(object):
+    """
+    JSON file shared by the forks running on the same host, read and written under an exclusive lock.
+
+    Attributes:
+       path (str): Path of the file.
+    """
+
+    def __init__(self, path):
+        self.path = os.path.expanduser(path)
+
+    def _lock(self):
+        directory = os.path.dirname(self.path)
+        if directory and not os.path.isdir(directory):
+            os.makedirs(directory, 0o700)
+
+        return _FileLock(self.path + '.lock')
+
+    def _read(self):
+        return _read_json(self.path, {})
+
+    def _store(self, data):
+        _write_json_atomically(self.path, data)
+
+
+class ReservationLedger(_LockedJsonFile):
+    """
+    File based ledger of the resources reserved by the modules running on the same host.
+
+    It lets concurrent forks claim distinct resources (e.g.: the server hardware assigned to new server profiles)
+    before the claims are visible on OneView. Each reservation has an owner and expires after ttl seconds, so the
+    reservations left by failed runs do not block the resources forever. The ledger is read and written under an
+    exclusive lock, and replaced atomically.
+
+    Attributes:
+       path (str): Path of the ledger file.
+       ttl (int): Seconds a reservation lasts.
+    """
+
+    def __init__(self, path, ttl=900):
+        super(ReservationLedger, self).__init__(path)
+        self.ttl = ttl
+
+    def reserve(self, candidates, owner):
+        """
+        Reserves the first candidate not reserved yet.
+
+        :arg list candidates: Resource URIs in order of preference.
+        :arg str owner: Identifies the reservation owner, e.g. the server profile name.
+        :return: str: URI reserved or None when all the candidates are already reserved.
+        """
+        with self._lock():
+            reservations = self._load()
+            for candidate in candidates:
+                if candidate not in reservations:
+                    reservations[candidate] = dict(owner=owner, expires=time.time() + self.ttl)
+                    self._store(reservations)
+                    return candidate
+        return None
+
+    def release(self, owner):
+        """
+        Removes all the reservations of the owner.
+
+        :arg str owner: Identifies the reservation owner.
+        """
+        with self._lock():
+            reservations = self._load()
+            remaining = dict((uri, reservation) for uri, reservation in reservations.items()
+                             if reservation.get('owner') != owner)
+            if len(remaining) != len(reservations):
+                self._store(remaining)
+
+    def _load(self):
+        now = time.time()
+        return dict((uri, reservation) for uri, reservation in self._read().items() if reservation['expires'] > now)
+
+
+class FileDigestCache(_LockedJsonFile):
+    """
+    File based cache of the SHA-256 digests of local files and of the resources uploaded from them.
+
+    A digest is reused while the size and modification time of its file are unchanged, so a multi-GB file is only read
+    again after it is modified. The URI of the resource uploaded from a file is kept by digest, so the same contents
+    are recognized under another file name. The cache is read and written under an exclusive lock, and replaced
+    atomically.
+
+    Attributes:
+       path (str): Path of the cache file.
+    """
+
+    def get_digest(self, file_path):
+        """
+        Gets the SHA-256 digest of the file, computing it only when the file changed since it was cached.
+
+        :arg str file_path: Path of the file.
+        :return: str: The hexadecimal digest.
+        """
+        file_path = os.path.realpath(os.path.expanduser(file_path))
+        stat = os.stat(file_path)
+        signature = dict(size=stat.st_size, mtime=stat.st_mtime)
+
+        with self._lock():
+            entry = self._load()['files'].get(file_path)
+        if entry and entry['size'] == signature['size'] and entry['mtime'] == signature['mtime']:
+            return entry['sha256']
+
+        # The file is read outside the lock, so other forks are not blocked meanwhile
+        digest = get_file_digest(file_path)
+        with self._lock():
+            cache = self._load()
+            cache['files'][file_path] = dict(signature, sha256=digest)
+            self._store(cache)
+        return digest
+
+    def get_uri(self, digest):
+        """
+        Gets the URI of the resource uploaded from the contents with the digest.
+
+        :arg str digest: SHA-256 digest of the contents.
+        :return: str: The resource URI, or None when unknown.
+        """
+        with self._lock():
+            return self._load()['uris'].get(digest)
+
+    def set_uri(self, digest, uri):
+        """
+        Records the URI of the resource uploaded from the contents with the digest.
+
+        :arg str digest: SHA-256 digest of the contents.
+        :arg str uri: The resource URI.
+        """
+        with self._lock():
+            cache = self._load()
+            if cache['uris'].get(digest) != uri:
+                cache['uris'][digest] = uri
+                self._store(cache)
+
+    def _load(self):
+        cache = self._read()
+        cache.setdefault('files', {})
+        cache.setdefault('uris', {})
+        return cache
+
+
+class _FileLock(object):
+    """
+    Exclusive advisory lock held on a file, shared by the forks running on the same host.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.file_descriptor = None
+
+    def __enter__(self):
+        self.file_descriptor = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        fcntl.flock(self.file_descriptor, fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, *args):
+        fcntl.flock(self.file_descriptor, fcntl.LOCK_UN)
+        os.close(self.file_descriptor)
+
+
+class RetryScheduler(object):
+    """
+    Schedules the attempts of an operation, waiting between them with exponential backoff and jitter.
+
+    The first wait lasts initial_delay seconds and each following one is multiplied by factor, up to max_delay. Every
+    wait is shortened by a random fraction of up to jitter, so concurrent modules competing for the same resources do
+    not retry in lockstep. No attempt is made after max_attempts or once the timeout, counted from the first attempt,
+    has expired. The scheduler holds no state between uses and may be shared.
+
+    Attributes:
+       initial_delay (float): Seconds to wait after the first attempt.
+       max_delay (float): Maximum seconds to wait between two attempts.
+       factor (float): Multiplier applied to the delay after each attempt.
+       jitter (float): Maximum fraction, between 0 and 1, removed at random from each delay.
+       max_attempts (int): Maximum number of attempts. Unlimited when None.
+       timeout (float): Maximum seconds from the first attempt to the last one. Unlimited when None.
+    """
+
+    def __init__(self, initial_delay=0.05, max_delay=10, factor=2, jitter=0.5, max_attempts=None, timeout=None):
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.factor = factor
+        self.jitter = jitter
+        self.max_attempts = max_attempts
+        self.timeout = timeout
+
+    def attempts(self):
+        """
+        Generates the attempt numbers, starting at 1, sleeping before each one but the first.
+
+        The generator is exhausted when the attempts are over, so the caller breaks out of the loop, or returns, once
+        an attempt succeeds.
+
+        :return: generator of int
+        """
+        deadline = time.time() + self.timeout if self.timeout is not None else None
+        delay = self.initial_delay
+        attempt = 1
+
+        while True:
+            yield attempt
+
+            if self.max_attempts is not None and attempt >= self.max_attempts:
+                return
+
+            wait = delay * (1 - self.jitter * random.random())
+            if deadline is not None:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    return
+                wait = min(wait, remaining)
+
+            time.sleep(wait)
+            delay = min(delay * self.factor, self.max_delay)
+            attempt += 1
+
+    def call(self, function, retry_if):
+        """
+        Calls the function until it returns, retrying while the exceptions raised are accepted by retry_if.
+
+        :arg function function: Function called without arguments.
+        :arg function retry_if: Receives the exception raised and returns whether a new attempt must be made.
+        :return: The value returned by the function. The last exception is raised when the attempts are over.
+        """
+        for attempt in self.attempts():
+            try:
+                return function()
+            except Exception as exception:
+                if not retry_if(exception):
+                    raise
+                last_exception = exception
+
+        raise last_exception
+
+
+class FileTransfer(object):
+    """
+    Streams files to and from the appliance in chunks, so the memory used does not grow with the file size.
+
+    A download is written to <file>.part and, when the connection drops, resumed from the bytes already received with
+    an HTTP Range request. The request carries an If-Range with the ETag or Last-Modified of the first response, so
+    contents changed meanwhile are sent again from the start. Once complete, the file is renamed to its destination
+    and described by a sidecar manifest, <file>.manifest.json, with its size, SHA-256 digest and source. A download is
+    skipped when the manifest has the same source and the digest of the local file still matches it. An upload is sent
+    as a multipart body read from the file into a fixed buffer, after checking the file against its manifest when it
+    has one.
+
+    A download over several connections first requests a single byte to learn whether the endpoint serves ranges and
+    the size of the contents. When it does, the partial file is preallocated and each connection fetches a range of
+    it, writing the bytes at their offsets. Otherwise, the contents are downloaded over a single connection.
+
+    Attributes:
+       connection: Connection of the OneView or Image Streamer client.
+       chunk_size (int): Bytes read and written at a time.
+       retry_scheduler (RetryScheduler): Schedules the attempts of a download, or of each range of it.
+       statistics (dict): Bytes sent or received, seconds spent and bytes per second of the last transfer, or None
+           when it was skipped.
+    """
+    CHUNK_SIZE = 1024 * 1024
+    # Smallest range fetched by a connection of a parallel download
+    MIN_RANGE_SIZE = 16 * 1024 * 1024
+    PARTIAL_SUFFIX = '.part'
+    MANIFEST_SUFFIX = '.manifest.json'
+    MULTIPART_BOUNDARY = '----------ThIs_Is_tHe_bouNdaRY_$'
+
+    # Errors after which a download is resumed
+    TRANSIENT_ERRORS = (socket.error, six.moves.http_client.HTTPException)
+
+    MSG_DIGEST_MISMATCH = 'The SHA-256 digest of {0} does not match its manifest.'
+    MSG_CONTENTS_CHANGED = 'The contents of {0} changed during the download.'
+    MSG_UPLOAD_PROGRESS = 'Uploaded {0} of {1} bytes.'
+
+    def __init__(self, connection, chunk_size=CHUNK_SIZE, retry_scheduler=None):
+        self.connection = connection
+        self.chunk_size = chunk_size
+        self.retry_scheduler = retry_scheduler or RetryScheduler(initial_delay=1, max_delay=30, max_attempts=5)
+        self.statistics = None
+        self._transferred = 0
+        self._logged_tenths = 0
+        self._transferred_lock = threading.Lock()
+
+    def download(self, uri, file_path, source=None, connections=1):
+        """
+        Downloads the contents of the URI to the file, resuming the partial download left by a previous attempt.
+
+        :arg str uri: URI of the contents.
+        :arg str file_path: Destination file path.
+        :arg source: JSON serializable value that identifies the version of the contents, e.g. the URI and ETag of the
+            resource. The download is skipped when the manifest of the file has the same source and the digest of the
+            file matches it.
+        :arg int connections: Maximum number of connections fetching ranges of the contents at a time. With less than
+            two, or None, the contents are downloaded over a single connection. A partial download left by a previous
+            attempt is always resumed over a single connection.
+        :return: bool: Whether the file was downloaded.
+        """
+        self.statistics = None
+        if source is not None and self.verify(file_path, source=source):
+            return False
+
+        started = time.time()
+        self._transferred = 0
+
+        partial_path = file_path + self.PARTIAL_SUFFIX
+        if self.read_manifest(partial_path).get('uri') != uri:
+            self._remove(partial_path)
+
+        resumable = os.path.exists(partial_path) and self.read_manifest(partial_path).get('validator')
+        if resumable or (connections or 1) <= 1 or not self._download_ranges(uri, partial_path, connections):
+            self.retry_scheduler.call(functools.partial(self._download_partial, uri, partial_path),
+                                      retry_if=self._is_transient)
+
+        manifest = dict(size=os.path.getsize(partial_path), sha256=self.get_digest(partial_path), source=source)
+        os.rename(partial_path, file_path)
+        self._remove(partial_path + self.MANIFEST_SUFFIX)
+        self.write_manifest(file_path, manifest)
+        self._set_statistics(started)
+        return True
+
+    def download_resource(self, path, resource, file_path, connections=1):
+        """
+        Downloads the contents of a resource served at its ID under the path, e.g. /rest/golden-images/download/<id>.
+
+        The download is skipped when the file was downloaded from the same version of the resource, identified by its
+        eTag and modification date.
+
+        :arg str path: Path where the contents of the resources are served.
+        :arg dict resource: The resource.
+        :arg str file_path: Destination file path.
+        :arg int connections: Maximum number of connections fetching ranges of the contents at a time.
+        :return: bool: Whether the file was downloaded.
+        """
+        uri = path + '/' + resource['uri'].split('/')[-1]
+        source = dict(uri=uri, eTag=resource.get('eTag'), modified=resource.get('modified'))
+        return self.download(uri, file_path, source=source, connections=connections)
+
+    def upload(self, uri, file_path, timeout=-1, log=None):
+        """
+        Uploads the file in a multipart request, waiting for the task started by the appliance.
+
+        :arg str uri: URI where the file is posted.
+        :arg str file_path: Path of the file.
+        :arg int timeout: Seconds to wait for the task. Waits for its completion by default.
+        :arg function log: Called with a message of the bytes sent so far, about every tenth of the file, so large
+            files do not flood the log.
+        :return: dict: The resource returned by the appliance or associated with its task.
+        """
+        manifest = self.read_manifest(file_path)
+        if manifest.get('sha256') and self.get_digest(file_path) != manifest['sha256']:
+            raise OneViewModuleValueError(self.MSG_DIGEST_MISMATCH.format(file_path))
+
+        file_name = os.path.basename(file_path)
+        preamble = ('--{0}\r\nContent-Disposition: form-data; name="file"; filename="{1}"\r\n'
+                    'Content-Type: application/octet-stream\r\n\r\n').format(self.MULTIPART_BOUNDARY, file_name)
+        epilogue = '\r\n--{0}--\r\n\r\n'.format(self.MULTIPART_BOUNDARY)
+        preamble, epilogue = preamble.encode('utf-8'), epilogue.encode('utf-8')
+
+        headers = self._get_headers()
+        headers['uploadfilename'] = file_name
+        headers['Content-Type'] = 'multipart/form-data; boundary=' + self.MULTIPART_BOUNDARY
+        file_size = os.path.getsize(file_path)
+        headers['Content-Length'] = str(len(preamble) + file_size + len(epilogue))
+
+        self.statistics = None
+        started = time.time()
+        self._transferred = 0
+        self._logged_tenths = 0
+
+        http_connection = self.connection.get_connection()
+        try:
+            http_connection.putrequest('POST', uri)
+            for name, value in headers.items():
+                http_connection.putheader(name, value)
+            http_connection.endheaders()
+
+            http_connection.send(preamble)
+            buffer = bytearray(self.chunk_size)
+            with open(file_path, 'rb') as file_object:
+                for size in iter(functools.partial(file_object.readinto, buffer), 0):
+                    http_connection.send(memoryview(buffer)[:size])
+                    self._transferred += size
+                    if log:
+                        self._log_upload_progress(log, file_size)
+            http_connection.send(epilogue)
+            self._set_statistics(started)
+
+            response = http_connection.getresponse()
+            body = self._read_body(response)
+        finally:
+            http_connection.close()
+            invalidate_resource_cache = getattr(self.connection, 'invalidate_resource_cache', None)
+            if invalidate_resource_cache:
+                invalidate_resource_cache(uri)
+
+        if response.status >= 400:
+            raise OneViewModuleException(body)
+
+        task = None
+        if response.status == 202 and response.getheader('Location'):
+            task = self.connection.get(response.getheader('Location'))
+        elif isinstance(body, dict) and (body.get('category') == 'tasks' or 'taskState' in body):
+            task = body
+
+        if not task:
+            return body
+        return TaskMonitor(self.connection).wait_for_task(task, timeout)
+
+    def verify(self, file_path, source=None):
+        """
+        Checks the file against its manifest.
+
+        :arg str file_path: Path of the file.
+        :arg source: When set, the source recorded in the manifest must be the same.
+        :return: bool: Whether the file exists and its digest matches the manifest.
+        """
+        manifest = self.read_manifest(file_path)
+        if not manifest.get('sha256') or not os.path.isfile(file_path):
+            return False
+        if source is not None and manifest.get('source') != source:
+            return False
+        return self.get_digest(file_path) == manifest['sha256']
+
+    def get_digest(self, file_path):
+        """
+        Computes the SHA-256 digest of the file, reading it in chunks.
+
+        :arg str file_path: Path of the file.
+        :return: str: The hexadecimal digest.
+        """
+        return get_file_digest(file_path, self.chunk_size)
+
+    def read_manifest(self, file_path):
+        """
+        Reads the sidecar manifest of the file.
+
+        :arg str file_path: Path of the file.
+        :return: dict: The manifest, or an empty dict when the file has none.
+        """
+        return _read_json(file_path + self.MANIFEST_SUFFIX, {})
+
+    def write_manifest(self, file_path, manifest):
+        """
+        Replaces the sidecar manifest of the file.
+
+        :arg str file_path: Path of the file.
+        :arg dict manifest: Contents of the manifest.
+        """
+        _write_json_atomically(file_path + self.MANIFEST_SUFFIX, manifest)
+
+    def _log_upload_progress(self, log, file_size):
+        tenths = self._transferred * 10 // file_size
+        if tenths > self._logged_tenths:
+            self._logged_tenths = tenths
+            log(self.MSG_UPLOAD_PROGRESS.format(self._transferred, file_size))
+
+    def _download_partial(self, uri, partial_path, location=None):
+        # The location is the URI redirected to, while the manifest keeps the URI requested to match the next attempts
+        offset = os.path.getsize(partial_path) if os.path.exists(partial_path) else 0
+        validator = self.read_manifest(partial_path).get('validator')
+
+        headers = self._get_headers()
+        if offset and validator:
+            headers['Range'] = 'bytes={0}-'.format(offset)
+            headers['If-Range'] = validator
+
+        http_connection = self.connection.get_connection()
+        try:
+            http_connection.request('GET', location or uri, None, headers)
+            response = http_connection.getresponse()
+
+            if response.status == 416:
+                # The partial file does not match the contents anymore
+                self._remove(partial_path)
+                return self._download_partial(uri, partial_path, location)
+            if response.status >= 400:
+                raise OneViewModuleException(self._read_body(response))
+            if response.status in (301, 302, 303, 307):
+                return self._download_partial(uri, partial_path, response.getheader('Location'))
+
+            if response.status == 206 and self._get_range_start(response) != offset:
+                self._remove(partial_path)
+                return self._download_partial(uri, partial_path, location)
+            if response.status != 206:
+                offset = 0
+                validator = response.getheader('ETag') or response.getheader('Last-Modified')
+                self.write_manifest(partial_path, dict(uri=uri, validator=validator))
+
+            content_length = response.getheader('Content-Length')
+            expected_size = offset + int(content_length) if content_length else None
+
+            with open(partial_path, 'ab' if offset else 'wb') as partial_file:
+                for chunk in iter(functools.partial(response.read, self.chunk_size), b''):
+                    partial_file.write(chunk)
+                    self._add_transferred(len(chunk))
+        finally:
+            http_connection.close()
+
+        size = os.path.getsize(partial_path)
+        if expected_size is not None and size < expected_size:
+            raise six.moves.http_client.IncompleteRead(b'', expected_size - size)
+
+    def _download_ranges(self, uri, partial_path, connections):
+        """
+        Downloads the contents over several connections, each one fetching a range of them.
+
+        :return: bool: Whether the contents were downloaded, or False when the endpoint does not serve ranges or the
+            contents are too small to be split.
+        """
+        headers = self._get_headers()
+        headers['Range'] = 'bytes=0-0'
+
+        http_connection = self.connection.get_connection()
+        try:
+            http_connection.request('GET', uri, None, headers)
+            response = http_connection.getresponse()
+            if response.status == 206:
+                response.read()
+        finally:
+            # Closing the connection discards the whole contents sent by an endpoint without ranges
+            http_connection.close()
+
+        # e.g.: Content-Range: bytes 0-0/4194304
+        total_size = (response.getheader('Content-Range') or '').split('/')[-1]
+        if response.status != 206 or not total_size.isdigit():
+            return False
+
+        total_size = int(total_size)
+        range_count = min(connections, total_size // self.MIN_RANGE_SIZE)
+        if range_count <= 1:
+            return False
+
+        # Without a validator, the ranges of the partial file cannot be resumed by a later attempt
+        self.write_manifest(partial_path, dict(uri=uri, validator=None))
+        self._allocate(partial_path, total_size)
+
+        validator = response.getheader('ETag') or response.getheader('Last-Modified')
+        range_size = -(-total_size // range_count)
+        run_concurrently([functools.partial(self._download_range, uri, partial_path, start,
+                                            min(start + range_size, total_size) - 1, validator)
+                          for start in range(0, total_size, range_size)], max_workers=connections)
+        return True
+
+    def _download_range(self, uri, partial_path, start, end, validator):
+        position = [start]
+
+        def download_rest():
+            headers = self._get_headers()
+            headers['Range'] = 'bytes={0}-{1}'.format(position[0], end)
+            if validator:
+                headers['If-Range'] = validator
+
+            http_connection = self.connection.get_connection()
+            file_descriptor = os.open(partial_path, os.O_WRONLY)
+            try:
+                http_connection.request('GET', uri, None, headers)
+                response = http_connection.getresponse()
+                if response.status >= 400:
+                    raise OneViewModuleException(self._read_body(response))
+                if response.status != 206 or self._get_range_start(response) != position[0]:
+                    raise OneViewModuleException(self.MSG_CONTENTS_CHANGED.format(uri))
+
+                for chunk in iter(functools.partial(response.read, min(self.chunk_size, end + 1 - position[0])), b''):
+                    self._write_at(file_descriptor, chunk, position[0])
+                    position[0] += len(chunk)
+                    self._add_transferred(len(chunk))
+                    if position[0] > end:
+                        break
+            finally:
+                os.close(file_descriptor)
+                http_connection.close()
+
+            if position[0] <= end:
+                raise six.moves.http_client.IncompleteRead(b'', end + 1 - position[0])
+
+        self.retry_scheduler.call(download_rest, retry_if=self._is_transient)
+
+    def _allocate(self, file_path, size):
+        with open(file_path, 'wb') as partial_file:
+            if hasattr(os, 'posix_fallocate'):
+                os.posix_fallocate(partial_file.fileno(), 0, size)
+            else:
+                partial_file.truncate(size)
+
+    def _write_at(self, file_descriptor, data, offset):
+        while data:
+            if hasattr(os, 'pwrite'):
+                written = os.pwrite(file_descriptor, data, offset)
+            else:
+                # Each range has a file descriptor of its own, so the offset is not moved by the others
+                os.lseek(file_descriptor, offset, os.SEEK_SET)
+                written = os.write(file_descriptor, data)
+            data, offset = data[written:], offset + written
+
+    def _add_transferred(self, size):
+        with self._transferred_lock:
+            self._transferred += size
+
+    def _set_statistics(self, started):
+        seconds = time.time() - started
+        self.statistics = dict(bytes=self._transferred,
+                               seconds=round(seconds, 3),
+                               bytes_per_second=int(self._transferred / seconds) if seconds > 0 else None)
+
+    def _is_transient(self, exception):
+        return isinstance(exception, self.TRANSIENT_ERRORS)
+
+    def _get_range_start(self, response):
+        # e.g.: Content-Range: bytes 1048576-4194303/4194304
+        content_range = response.getheader('Content-Range') or ''
+        try:
+            return int(content_range.split(' ')[-1].split('-')[0])
+        except ValueError:
+            return None
+
+    def _get_headers(self):
+        return dict((name, str(value)) for name, value in self.connection._headers.items())
+
+    def _read_body(self, response):
+        data = response.read()
+        try:
+            return json.loads(data.decode('utf-8'))
+        except ValueError:
+            return data.decode('utf-8', 'replace') or 'Error {0}'.format(response.status)
+
+    def _remove(self, path):
+        if os.path.exists(path):
+            os.remove(path)
+
+
 # @six.add_metaclass(abc.ABCMeta)
 class OneViewModuleBase(object):
     MSG_CREATED = 'Resource created successfully.'
@@ -330,6 +1754,8 @@ class OneViewModuleBase(object):
     MSG_ALREADY_PRESENT = 'Resource is already present.'
     MSG_ALREADY_ABSENT = 'Resource is already absent.'
     MSG_DIFF_AT_KEY = 'Difference found at key \'{0}\'. '
+    MSG_TASK_STARTED = 'Task started, its completion was not awaited.'
+    MSG_FACTS_PROGRESS = 'Gathered {0} of {1} facts.'
     HPE_ONEVIEW_SDK_REQUIRED = 'HPE OneView Python SDK is required for this module.'
 
     ONEVIEW_COMMON_ARGS = dict(
@@ -338,21 +1764,33 @@ class OneViewModuleBase(object):
         hostname=dict(type='str'),
         image_streamer_hostname=dict(type='str'),
         password=dict(type='str', no_log=True),
+        resource_cache_dir=dict(type='path', fallback=(env_fallback, ['ONEVIEWSDK_RESOURCE_CACHE_DIR'])),
+        resource_cache_ttl=dict(type='int', default=OneViewResourceCache.DEFAULT_TTL),
+        session_cache_dir=dict(type='path', fallback=(env_fallback, ['ONEVIEWSDK_SESSION_CACHE_DIR'])),
         username=dict(type='str')
     )
 
     ONEVIEW_VALIDATE_ETAG_ARGS = dict(validate_etag=dict(type='bool', default=True))
 
+    ONEVIEW_WAIT_ARGS = dict(wait=dict(type='bool', default=True))
+
+    # Maximum number of facts requested at a time by gather_facts_by_name
+    FACTS_MAX_WORKERS = 8
+
+    # Facts with the lists of resources projected by the fields param, named by each facts module
+    RESOURCE_LIST_FACTS = []
+
     resource_client = None
 
-    def __init__(self, additional_arg_spec=None, validate_etag_support=False):
+    def __init__(self, additional_arg_spec=None, validate_etag_support=False, wait_support=False):
         """
         OneViewModuleBase constructor.
 
         :arg dict additional_arg_spec: Additional argument spec definition.
         :arg bool validate_etag_support: Enables support to eTag validation.
+        :arg bool wait_support: Enables support to return the started tasks without waiting for their completion.
         """
-        argument_spec = self._build_argument_spec(additional_arg_spec, validate_etag_support)
+        argument_spec = self._build_argument_spec(additional_arg_spec, validate_etag_support, wait_support)
 
         self.module = AnsibleModule(argument_spec=argument_spec, supports_check_mode=False)
 
@@ -363,14 +1801,20 @@ class OneViewModuleBase(object):
         self.data = self.module.params.get('data')
 
         # Preload params for get_all - used by facts
-        self.facts_params = self.module.params.get('params') or {}
+        self.facts_params = dict(self.module.params.get('params') or {})
+        self.facts_page_size = self.facts_params.pop('page_size', None)
+        self.facts_match = self.facts_params.pop('match', None)
 
         # Preload options as dict - used by facts
         self.options = transform_list_to_dict(self.module.params.get('options'))
 
+        # Preload the projection of the resources - used by facts
+        self.fields = self.module.params.get('fields')
+        self.fields_projection = build_fields_projection(self.fields) if self.fields else None
+
         self.validate_etag_support = validate_etag_support
 
-    def _build_argument_spec(self, additional_arg_spec, validate_etag_support):
+    def _build_argument_spec(self, additional_arg_spec, validate_etag_support, wait_support=False):
 
         merged_arg_spec = dict()
         merged_arg_spec.update(self.ONEVIEW_COMMON_ARGS)
@@ -378,6 +1822,9 @@ class OneViewModuleBase(object):
         if validate_etag_support:
             merged_arg_spec.update(self.ONEVIEW_VALIDATE_ETAG_ARGS)
 
+        if wait_support:
+            merged_arg_spec.update(self.ONEVIEW_WAIT_ARGS)
+
         if additional_arg_spec:
             merged_arg_spec.update(additional_arg_spec)
 
@@ -388,17 +1835,53 @@ class OneViewModuleBase(object):
             self.module.fail_json(msg=self.HPE_ONEVIEW_SDK_REQUIRED)
 
     def _create_oneview_client(self):
-        if self.module.params.get('hostname'):
-            config = dict(ip=self.module.params['hostname'],
-                          credentials=dict(userName=self.module.params['username'], password=self.module.params['password']),
-                          api_version=self.module.params['api_version'],
-                          image_streamer_ip=self.module.params['image_streamer_hostname'])
-            self.oneview_client = OneViewClient(config)
+        if self.module._socket_path:
+            self.oneview_client = OneViewHttpApi(self.module._socket_path).create_client()
+        elif self.module.params.get('session_cache_dir'):
+            session_cache = OneViewSessionCache(self.module.params['session_cache_dir'])
+            self.oneview_client = session_cache.create_client(self._get_oneview_config())
+        elif self.module.params.get('hostname'):
+            self.oneview_client = OneViewClient(self._get_oneview_config())
         elif not self.module.params['config']:
             self.oneview_client = OneViewClient.from_environment_variables()
         else:
             self.oneview_client = OneViewClient.from_json_file(self.module.params['config'])
 
+        if self.module.params.get('resource_cache_dir'):
+            resource_cache = OneViewResourceCache(self.module.params['resource_cache_dir'],
+                                                  self.module.params.get('resource_cache_ttl', OneViewResourceCache.DEFAULT_TTL))
+            resource_cache.install(self.oneview_client.connection, self._get_oneview_config())
+
+    def _get_oneview_config(self):
+        if self.module.params.get('hostname'):
+            return dict(ip=self.module.params['hostname'],
+                        credentials=dict(userName=self.module.params['username'], password=self.module.params['password']),
+                        api_version=self.module.params['api_version'],
+                        image_streamer_ip=self.module.params['image_streamer_hostname'])
+        elif not self.module.params['config']:
+            return self._get_oneview_config_from_environment_variables()
+        else:
+            with open(self.module.params['config']) as config_file:
+                return json.load(config_file)
+
+    @staticmethod
+    def _get_oneview_config_from_environment_variables():
+        # Same variables read by OneViewClient.from_environment_variables
+        config = dict(ip=os.environ.get('ONEVIEWSDK_IP', ''),
+                      image_streamer_ip=os.environ.get('ONEVIEWSDK_IMAGE_STREAMER_IP', ''),
+                      api_version=int(os.environ.get('ONEVIEWSDK_API_VERSION', OneViewClient.DEFAULT_API_VERSION)),
+                      ssl_certificate=os.environ.get('ONEVIEWSDK_SSL_CERTIFICATE', ''),
+                      credentials=dict(userName=os.environ.get('ONEVIEWSDK_USERNAME', ''),
+                                       authLoginDomain=os.environ.get('ONEVIEWSDK_AUTH_LOGIN_DOMAIN', ''),
+                                       password=os.environ.get('ONEVIEWSDK_PASSWORD', '')),
+                      proxy=os.environ.get('ONEVIEWSDK_PROXY', ''))
+
+        timeout = os.environ.get('ONEVIEWSDK_CONNECTION_TIMEOUT')
+        if timeout:
+            config['timeout'] = timeout
+
+        return config
+
     @abc.abstractmethod
     def execute_module(self):
         """
@@ -430,15 +1913,62 @@ class OneViewModuleBase(object):
             if not result:
                 result = {}
 
+            if self.fields_projection and result.get('ansible_facts'):
+                result['ansible_facts'] = self._project_facts(result['ansible_facts'])
+
             if "changed" not in result:
                 result['changed'] = False
 
             self.module.exit_json(**result)
 
+        except _OneViewTaskStarted as task_started:
+            task = task_started.task
+            associated_resource = task.get('associatedResource') or {}
+            self.module.exit_json(changed=True,
+                                  msg=self.MSG_TASK_STARTED,
+                                  task_uri=task.get('uri'),
+                                  resource_uri=associated_resource.get('resourceUri'))
+
         except OneViewModuleException as exception:
             error_msg = '; '.join(to_native(e) for e in exception.args)
             self.module.fail_json(msg=error_msg, exception=traceback.format_exc())
 
+    @contextlib.contextmanager
+    def asynchronous_tasks(self, *resource_clients):
+        """
+        Context manager for the long running operations of the modules with wait support.
+
+        When the wait argument is false, the first task started inside the block by the given clients is not awaited:
+        the module exits right away, returning the task URI and the URI of its associated resource. Otherwise, the
+        tasks are awaited as usual.
+
+        :arg resource_clients: SDK clients that start the tasks. Defaults to the resource client of the module.
+        """
+        if self.module.params.get('wait', True):
+            yield
+            return
+
+        with _intercept_started_tasks(resource_clients or [self.resource_client]):
+            yield
+
+    def start_task(self, function, *args, **kwargs):
+        """
+        Calls a SDK function that starts a task on OneView, returning the task without waiting for its completion.
+
+        It allows a module to start many tasks and track them together, e.g. polling them with
+        oneview_client.connection.get.
+
+        :arg function function: Method of a SDK client, e.g. oneview_client.server_profiles.create. The tasks are
+            intercepted on the client of the method, or on the resource_client when it is not a bound method.
+        :return: dict: Task started, or None when the function completed without starting a task.
+        """
+        try:
+            with _intercept_started_tasks([getattr(function, '__self__', self.resource_client)]):
+                function(*args, **kwargs)
+        except _OneViewTaskStarted as task_started:
+            return task_started.task
+        return None
+
     def resource_absent(self, resource, method='delete'):
         """
         Generic implementation of the absent state for the OneView resources.
@@ -468,6 +1998,87 @@ class OneViewModuleBase(object):
         result = self.resource_client.get_by('name', name)
         return result[0] if result else None
 
+    def get_all_resources(self, resource_client):
+        """
+        Generic get all implementation for the facts modules, using the params of the task.
+
+        When the page_size param is informed, the resources are requested page by page and only the ones selected by
+        the match param are kept, so the memory used is bounded by the page size.
+
+        When the fields argument is informed and the API supports it, only the first level of the fields is requested,
+        along with the first level of the attributes selected by the match param.
+
+        :arg resource_client: Client of the resources.
+
+        :return: list: The resources found.
+        """
+        predicate = build_match_predicate(self.facts_match) if self.facts_match else None
+        params = self.facts_params
+
+        if self.fields and 'fields' not in params and _accepts_argument(resource_client.get_all, 'fields'):
+            # Only the first level of the fields is requested to the API, the nested ones are selected by the projection
+            first_level_fields = set(field.split('.')[0] for field in self.fields)
+            # The match param is applied to the resources returned, so the attributes it selects must be requested
+            first_level_fields.update(key.split('.')[0] for key in self.facts_match or {})
+            params = dict(params, fields=','.join(sorted(first_level_fields | set(['name', 'uri']))))
+
+        if self.facts_page_size:
+            return list(iterate_all_resources(resource_client, self.facts_page_size, predicate, self.fields_projection,
+                                              **params))
+
+        resources = resource_client.get_all(**params)
+        if predicate:
+            resources = [resource for resource in resources if predicate(resource)]
+        return resources
+
+    def gather_facts_by_name(self, resources, build_requests, resource_fact_name):
+        """
+        Gathers the facts of many resources at once, returning them keyed by the resource name.
+
+        The requests of all the resources run on the same bounded pool of threads, sharing the session of the module
+        client. The progress is logged as the requests finish. A failed request does not stop the others: its message
+        is kept in the C(errors) of the resource, by fact name.
+
+        :arg list resources: Resources to gather facts about.
+        :arg function build_requests: Receives a resource and returns a list of tuples with a fact name and a
+            function, called without arguments, that requests the fact.
+        :arg str resource_fact_name: Fact name of the resource itself, e.g. server_hardware.
+
+        :return: dict: The facts of each resource, by name.
+        """
+        facts_by_name = OrderedDict()
+        requests = []
+        for resource in resources:
+            facts = facts_by_name[resource['name']] = {resource_fact_name: resource}
+            requests.extend((facts, fact_name, request) for fact_name, request in build_requests(resource))
+
+        outcomes = run_concurrently([functools.partial(_capture_outcome, request) for facts, fact_name, request in requests],
+                                    self.FACTS_MAX_WORKERS, self._log_facts_progress)
+
+        for (facts, fact_name, request), (result, exc_info) in zip(requests, outcomes):
+            if exc_info:
+                error_msg = '; '.join(to_native(e) for e in exc_info[1].args)
+                facts.setdefault('errors', {})[fact_name] = error_msg
+            else:
+                facts[fact_name] = result
+
+        return facts_by_name
+
+    def _log_facts_progress(self, finished, total):
+        # Logs about every tenth of the requests, so large fleets do not flood the log
+        if finished == total or finished % max(1, total // 10) == 0:
+            self.module.log(msg=self.MSG_FACTS_PROGRESS.format(finished, total))
+
+    def _project_facts(self, ansible_facts):
+        projected_facts = {}
+        for fact_name, value in ansible_facts.items():
+            # Only the lists of resources are projected, the results of the options are kept as they are
+            if fact_name in self.RESOURCE_LIST_FACTS and isinstance(value, list):
+                value = [self.fields_projection(item) if isinstance(item, collections.Mapping) else item
+                         for item in value]
+            projected_facts[fact_name] = value
+        return projected_facts
+
     def resource_present(self, resource, fact_name, create_method='create'):
         """
         Generic implementation of the present state for the OneView resources.
@@ -497,6 +2108,8 @@ class OneViewModuleBase(object):
             if compare(resource, merged_data):
                 msg = self.MSG_ALREADY_PRESENT
             else:
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Changed paths: {0}".format(get_changed_paths(resource, merged_data)))
                 resource = self.resource_client.update(merged_data)
                 changed = True
                 msg = self.MSG_UPDATED
@@ -566,9 +2179,60 @@ class SPKeys(object):
     LUN = 'lun'
 
 
+def remove_server_profile_inconsistent_data(data):
+    """
+    Removes from the Server Profile data the values that the appliance generates by itself, e.g. the MACs of the
+    connections with a Virtual or Physical MAC type, which must not be sent on the profile creation.
+
+    :arg dict data: Server Profile data, changed in place.
+    """
+    def is_virtual_or_physical(defined_type):
+        return defined_type == 'Virtual' or defined_type == 'Physical'
+
+    # Remove the MAC from connections when MAC type is Virtual or Physical
+    mac_type = data.get(SPKeys.MAC_TYPE, None)
+    if mac_type and is_virtual_or_physical(mac_type):
+        for conn in data.get(SPKeys.CONNECTIONS) or []:
+            conn.pop(SPKeys.MAC, None)
+
+    # Remove the UUID when Serial Number Type is Virtual or Physical
+    serial_number_type = data.get(SPKeys.SERIAL_NUMBER_TYPE, None)
+    if serial_number_type and is_virtual_or_physical(serial_number_type):
+        data.pop(SPKeys.UUID, None)
+        data.pop(SPKeys.SERIAL_NUMBER, None)
+
+    # Remove the WWPN and WWNN when WWPN Type is Virtual or Physical
+    for conn in data.get(SPKeys.CONNECTIONS) or []:
+        wwpn_type = conn.get(SPKeys.WWPN_TYPE, None)
+        if is_virtual_or_physical(wwpn_type):
+            conn.pop(SPKeys.WWNN, None)
+            conn.pop(SPKeys.WWPN, None)
+
+    # Remove the driveNumber from the Controllers Drives
+    if SPKeys.LOCAL_STORAGE in data and data[SPKeys.LOCAL_STORAGE]:
+        for controller in data[SPKeys.LOCAL_STORAGE].get(SPKeys.CONTROLLERS) or []:
+            for drive in controller.get(SPKeys.LOGICAL_DRIVES) or []:
+                drive.pop(SPKeys.DRIVE_NUMBER, None)
+
+    # Remove the Lun when Lun Type from SAN Storage Volume is Auto
+    if SPKeys.SAN in data and data[SPKeys.SAN]:
+        if SPKeys.VOLUMES in data[SPKeys.SAN]:
+            for volume in data[SPKeys.SAN].get(SPKeys.VOLUMES) or []:
+                if volume.get(SPKeys.LUN_TYPE) == 'Auto':
+                    volume.pop(SPKeys.LUN, None)
+
+
 class ServerProfileMerger(object):
     def merge_data(self, resource, data):
-        merged_data = deepcopy(resource)
+        """
+        Merges the data into the Server Profile resource, copy-on-write: only the dictionaries and lists changed by
+        the merge are copied, the unchanged values are shared with the resource and the data.
+
+        :arg dict resource: Server Profile, it is not modified.
+        :arg dict data: Server Profile changes.
+        :return: dict: Server Profile merged.
+        """
+        merged_data = resource.copy()
         merged_data.update(data)
 
         merged_data = self._merge_bios_and_boot(merged_data, resource, data)
@@ -598,14 +2262,15 @@ class ServerProfileMerger(object):
         return merged_data
 
     def _merge_connections_boot(self, merged_data, resource):
-        existing_connection_map = {x[SPKeys.ID]: x.copy() for x in resource[SPKeys.CONNECTIONS]}
+        existing_connection_map = {x[SPKeys.ID]: x for x in resource[SPKeys.CONNECTIONS]}
         for merged_connection in merged_data[SPKeys.CONNECTIONS]:
             conn_id = merged_connection[SPKeys.ID]
             existing_conn_has_boot = conn_id in existing_connection_map and SPKeys.BOOT in existing_connection_map[
                 conn_id]
-            if existing_conn_has_boot and SPKeys.BOOT in merged_connection:
+            if existing_conn_has_boot and SPKeys.BOOT in merged_connection and \
+                    merged_connection is not existing_connection_map[conn_id]:
                 current_connection = existing_connection_map[conn_id]
-                boot_settings_merged = deepcopy(current_connection[SPKeys.BOOT])
+                boot_settings_merged = current_connection[SPKeys.BOOT].copy()
                 boot_settings_merged.update(merged_connection[SPKeys.BOOT])
                 merged_connection[SPKeys.BOOT] = boot_settings_merged
         return merged_data
@@ -635,7 +2300,7 @@ class ServerProfileMerger(object):
         merged_volumes = merged_data[SPKeys.SAN][SPKeys.VOLUMES]
         for merged_volume in merged_volumes:
             volume_id = merged_volume[SPKeys.ID]
-            if volume_id in existing_volumes_map:
+            if volume_id in existing_volumes_map and merged_volume is not existing_volumes_map[volume_id]:
                 if SPKeys.PATHS in merged_volume and SPKeys.PATHS in existing_volumes_map[volume_id]:
                     existent_paths = existing_volumes_map[volume_id][SPKeys.PATHS]
 
@@ -674,6 +2339,7 @@ class ServerProfileMerger(object):
         if self._removed_data(data, resource, key=SPKeys.LOCAL_STORAGE):
             merged_data[SPKeys.LOCAL_STORAGE] = dict(sasLogicalJBODs=[], controllers=[])
         elif self._should_merge(data, resource, key=SPKeys.LOCAL_STORAGE):
+            merged_data[SPKeys.LOCAL_STORAGE] = merged_data[SPKeys.LOCAL_STORAGE].copy()
             merged_data = self._merge_sas_logical_jbods(merged_data, resource, data)
             merged_data = self._merge_controllers(merged_data, resource, data)
         return merged_data
@@ -701,7 +2367,8 @@ class ServerProfileMerger(object):
             for existing_controller in resource[SPKeys.LOCAL_STORAGE][SPKeys.CONTROLLERS][:]:
                 same_slot = current_controller.get(SPKeys.DEVICE_SLOT) == existing_controller.get(SPKeys.DEVICE_SLOT)
                 same_mode = existing_controller.get(SPKeys.MODE) == existing_controller.get(SPKeys.MODE)
-                if same_slot and same_mode and current_controller[SPKeys.LOGICAL_DRIVES]:
+                is_changed = current_controller is not existing_controller
+                if same_slot and same_mode and is_changed and current_controller[SPKeys.LOGICAL_DRIVES]:
 
                     key_merge = self._define_key_to_merge_drives(current_controller)
 
@@ -737,12 +2404,192 @@ class ServerProfileMerger(object):
 
     def _merge_dict(self, merged_data, resource, data, key):
         if resource[key]:
-            merged_dict = deepcopy(resource[key])
-            merged_dict.update(deepcopy(data[key]))
+            merged_dict = resource[key].copy()
+            merged_dict.update(data[key])
         merged_data[key] = merged_dict
         return merged_data
 
 
+class NetworkIndex(object):
+    """
+    Index of the networks by name, across the Ethernet, FC and FCoE network types.
+
+    The names are searched on the appliance index resources with a single query for all the network types, and the
+    URIs found are kept in memory, so each name is queried only once.
+    """
+    ETHERNET_NETWORKS = 'ethernet-networks'
+    FC_NETWORKS = 'fc-networks'
+    FCOE_NETWORKS = 'fcoe-networks'
+    CATEGORIES = [ETHERNET_NETWORKS, FC_NETWORKS, FCOE_NETWORKS]
+
+    # Maximum number of names combined in a single filter, to keep the query URI within the appliance limits
+    NAMES_PER_QUERY = 50
+
+    def __init__(self, oneview_client):
+        self.oneview_client = oneview_client
+        # Network URIs by name and category
+        self._uris_by_name = {}
+        self._loaded_names = set()
+
+    def load(self, names):
+        """
+        Loads the networks with the given names into the index. Names already loaded are not queried again.
+
+        :arg list names: Network names.
+        """
+        names_to_load = OrderedDict()
+        for name in names:
+            if get_name_key(name) not in self._loaded_names:
+                names_to_load.setdefault(get_name_key(name), name)
+        names_to_load = list(names_to_load.values())
+
+        # The same name may be found once for each network type, so all the networks matching are kept
+        networks = _get_all_by_names(self.oneview_client.index_resources, names_to_load, self.NAMES_PER_QUERY,
+                                     category=self.CATEGORIES)
+        for network in networks:
+            uris_by_category = self._uris_by_name.setdefault(get_name_key(network.get('name')), {})
+            uris_by_category.setdefault(network.get('category'), network['uri'])
+
+        self._loaded_names.update(get_name_key(name) for name in names_to_load)
+
+    def get_uri(self, name, categories=None):
+        """
+        Gets the URI of a network by name.
+
+        :arg str name: Network name.
+        :arg list categories: Network types to search, in order of precedence. Defaults to all types.
+        :return: str: The network URI or None when not found.
+        """
+        self.load([name])
+
+        uris_by_category = self._uris_by_name.get(get_name_key(name), {})
+        for category in categories or self.CATEGORIES:
+            if category in uris_by_category:
+                return uris_by_category[category]
+        return None
+
+
+class VlanIdSet(object):
+    """
+    Set of VLAN IDs kept as sorted, disjoint intervals, so large ranges are handled without expanding them.
+
+    It is parsed from and written to the vlanIdRange notation of the appliance, e.g. '1-10,15,17'. As on the
+    appliance, a single value without a hyphen, e.g. '5', stands for the range from 1 to it.
+
+    Attributes:
+       intervals (list): Tuples with the first and the last VLAN ID of each interval, in ascending order.
+    """
+
+    def __init__(self, intervals=()):
+        merged = []
+        for start, end in sorted(intervals):
+            if merged and start <= merged[-1][1] + 1:
+                merged[-1][1] = max(merged[-1][1], end)
+            else:
+                merged.append([start, end])
+        self.intervals = [tuple(interval) for interval in merged]
+        self._starts = [start for start, end in self.intervals]
+
+    @classmethod
+    def parse(cls, vlan_id_range):
+        """
+        Builds the set from a combination of values and ranges.
+
+        :arg str vlan_id_range: Values and ranges, e.g. '1-10,50,51,500-700'.
+        :return: VlanIdSet
+        """
+        values_or_ranges = [value.strip() for value in str(vlan_id_range).split(',') if value.strip()]
+        if len(values_or_ranges) == 1 and '-' not in values_or_ranges[0]:
+            return cls([(1, int(values_or_ranges[0]))])
+
+        intervals = []
+        for value_or_range in values_or_ranges:
+            start, _, end = value_or_range.partition('-')
+            intervals.append((int(start), int(end or start)))
+        return cls(intervals)
+
+    @classmethod
+    def from_ids(cls, vlan_ids):
+        """
+        Builds the set from single VLAN IDs.
+
+        :arg vlan_ids: Iterable of VLAN IDs.
+        :return: VlanIdSet
+        """
+        return cls((vlan_id, vlan_id) for vlan_id in vlan_ids)
+
+    def __contains__(self, vlan_id):
+        index = bisect.bisect_right(self._starts, vlan_id) - 1
+        return index >= 0 and vlan_id <= self.intervals[index][1]
+
+    def __len__(self):
+        return sum(end - start + 1 for start, end in self.intervals)
+
+    def __iter__(self):
+        for start, end in self.intervals:
+            for vlan_id in range(start, end + 1):
+                yield vlan_id
+
+    def __eq__(self, other):
+        return isinstance(other, VlanIdSet) and self.intervals == other.intervals
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __sub__(self, other):
+        """
+        Gets the VLAN IDs that are not in the other set, walking both lists of intervals once.
+        """
+        intervals = []
+        other_intervals = other.intervals
+        index = 0
+        for start, end in self.intervals:
+            while index < len(other_intervals) and other_intervals[index][1] < start:
+                index += 1
+            position = index
+            while position < len(other_intervals) and other_intervals[position][0] <= end:
+                other_start, other_end = other_intervals[position]
+                if other_start > start:
+                    intervals.append((start, other_start - 1))
+                start = max(start, other_end + 1)
+                position += 1
+            if start <= end:
+                intervals.append((start, end))
+        return VlanIdSet(intervals)
+
+    def split(self, size):
+        """
+        Splits the set into sets with up to the given number of VLAN IDs each, in ascending order.
+
+        :arg int size: Maximum number of VLAN IDs in each set.
+        :return: list of VlanIdSet
+        """
+        chunks, intervals, count = [], [], 0
+        for start, end in self.intervals:
+            while start <= end:
+                taken = min(end - start + 1, size - count)
+                intervals.append((start, start + taken - 1))
+                start += taken
+                count += taken
+                if count == size:
+                    chunks.append(VlanIdSet(intervals))
+                    intervals, count = [], 0
+        if intervals:
+            chunks.append(VlanIdSet(intervals))
+        return chunks
+
+    def to_range(self):
+        """
+        Writes the set in the vlanIdRange notation, with the fewest values and ranges.
+
+        :return: str: The values and ranges, e.g. '1-10,15,17'.
+        """
+        if len(self.intervals) == 1:
+            # A single value would stand for the range from 1 to it
+            return '{0}-{1}'.format(*self.intervals[0])
+        return ','.join(str(start) if start == end else '{0}-{1}'.format(start, end) for start, end in self.intervals)
+
+
 class ServerProfileReplaceNamesByUris(object):
     SERVER_PROFILE_OS_DEPLOYMENT_NOT_FOUND = 'OS Deployment Plan not found: '
     SERVER_PROFILE_ENCLOSURE_GROUP_NOT_FOUND = 'Enclosure Group not found: '
@@ -756,8 +2603,37 @@ class ServerProfileReplaceNamesByUris(object):
     SAS_LOGICAL_JBOD_NOT_FOUND = 'SAS logical JBOD not found: '
     ENCLOSURE_NOT_FOUND = 'Enclosure not found: '
 
+    # Maximum number of names combined in a single filter, to keep the query URI within the appliance limits
+    NAMES_PER_QUERY = 50
+
+    # Precedence of the network types when the same name is used by more than one type
+    NETWORK_CATEGORIES = ['fc-networks', 'fcoe-networks', 'ethernet-networks']
+
+    def __init__(self):
+        # Resources already fetched by resource client and name, kept for the instance lifetime.
+        # A None value means the name was queried and not found.
+        self._resources_by_name = {}
+        self._references = []
+        self._network_references = []
+        self._network_index = None
+
     def replace(self, oneview_client, data):
+        """
+        Replaces the resource names in the server profile data by the respective URIs.
+
+        All the name references are collected first and then resolved with a single filtered query for each resource
+        type. The resources found are memoized, so the names are not queried again on subsequent calls.
+
+        :arg OneViewClient oneview_client: OneView client.
+        :arg dict data: Server profile data. It is updated in place.
+        """
         self.oneview_client = oneview_client
+        self._references = []
+        self._network_references = []
+
+        if not self._network_index or self._network_index.oneview_client is not oneview_client:
+            self._network_index = NetworkIndex(oneview_client)
+
         self._replace_os_deployment_name_by_uri(data)
         self._replace_enclosure_group_name_by_uri(data)
         self._replace_networks_name_by_uri(data)
@@ -768,14 +2644,76 @@ class ServerProfileReplaceNamesByUris(object):
         self._replace_firmware_baseline_name_by_uri(data)
         self._replace_sas_logical_jbod_name_by_uri(data)
 
+        self._resolve_references()
+
     def _replace_name_by_uri(self, data, attr_name, message, resource_client):
         attr_uri = attr_name.replace("Name", "Uri")
         if attr_name in data:
             name = data.pop(attr_name)
-            resource_by_name = resource_client.get_by('name', name)
-            if not resource_by_name:
-                raise OneViewModuleResourceNotFound(message + name)
-            data[attr_uri] = resource_by_name[0]['uri']
+            self._add_reference(data, attr_uri, name, message, [resource_client])
+
+    def _add_reference(self, data, attr_uri, name, message, resource_clients):
+        """
+        Registers a name to be replaced. The resource clients are searched in order, until the name is found.
+        """
+        self._references.append((data, attr_uri, name, message, resource_clients))
+
+    def _resolve_references(self):
+        # Each pass queries every resource client at most once, with all the names still missing for it.
+        while True:
+            names_by_client = OrderedDict()
+            for data, attr_uri, name, message, resource_clients in self._references:
+                for resource_client in resource_clients:
+                    resources = self._resources_by_name.setdefault(resource_client, {})
+                    key = get_name_key(name)
+                    if key not in resources:
+                        names = names_by_client.setdefault(resource_client, [])
+                        if name not in names:
+                            names.append(name)
+                        break
+                    if resources[key]:
+                        break
+
+            if not names_by_client:
+                break
+
+            for resource_client, names in names_by_client.items():
+                self._fetch_by_names(resource_client, names)
+
+        self._network_index.load([name for connection, name in self._network_references])
+
+        for connection, name in self._network_references:
+            network_uri = self._network_index.get_uri(name, self.NETWORK_CATEGORIES)
+            if not network_uri:
+                raise OneViewModuleResourceNotFound(self.SERVER_PROFILE_NETWORK_NOT_FOUND + to_native(name))
+            connection['networkUri'] = network_uri
+
+        for data, attr_uri, name, message, resource_clients in self._references:
+            resource = self._find_resource(name, resource_clients)
+            if not resource:
+                raise OneViewModuleResourceNotFound(message + to_native(name))
+            data[attr_uri] = resource['uri']
+
+    def _fetch_by_names(self, resource_client, names):
+        resources = self._resources_by_name[resource_client]
+
+        if len(names) == 1:
+            resources_found = resource_client.get_by('name', names[0])
+            resources[get_name_key(names[0])] = resources_found[0] if resources_found else None
+            return
+
+        for resource in get_by_names(resource_client, names, self.NAMES_PER_QUERY):
+            resources.setdefault(get_name_key(resource.get('name')), resource)
+
+        for name in names:
+            resources.setdefault(get_name_key(name), None)
+
+    def _find_resource(self, name, resource_clients):
+        for resource_client in resource_clients:
+            resource = self._resources_by_name.get(resource_client, {}).get(get_name_key(name))
+            if resource:
+                return resource
+        return None
 
     def _replace_os_deployment_name_by_uri(self, data):
         if SPKeys.OS_DEPLOYMENT in data and data[SPKeys.OS_DEPLOYMENT]:
@@ -792,7 +2730,7 @@ class ServerProfileReplaceNamesByUris(object):
             for connection in data[SPKeys.CONNECTIONS]:
                 if 'networkName' in connection:
                     name = connection.pop('networkName', None)
-                    connection['networkUri'] = self._get_network_by_name(name)['uri']
+                    self._network_references.append((connection, name))
 
     def _replace_server_hardware_type_name_by_uri(self, data):
         self._replace_name_by_uri(data, 'serverHardwareTypeName', self.SERVER_HARDWARE_TYPE_NOT_FOUND,
@@ -835,17 +2773,3 @@ class ServerProfileReplaceNamesByUris(object):
             for jbod in sas_logical_jbods:
                 self._replace_name_by_uri(jbod, 'sasLogicalJBODName', self.SAS_LOGICAL_JBOD_NOT_FOUND,
                                           self.oneview_client.sas_logical_jbods)
-
-    def _get_network_by_name(self, name):
-        fc_networks = self.oneview_client.fc_networks.get_by('name', name)
-        if fc_networks:
-            return fc_networks[0]
-
-        fcoe_networks = self.oneview_client.fcoe_networks.get_by('name', name)
-        if fcoe_networks:
-            return fcoe_networks[0]
-
-        ethernet_networks = self.oneview_client.ethernet_networks.get_by('name', name)
-        if not ethernet_networks:
-            raise OneViewModuleResourceNotFound(self.SERVER_PROFILE_NETWORK_NOT_FOUND + name)
-        return ethernet_networks[0]
@@ -35,10 +35,14 @@ options:
       description:
         - "List with parameters to help filter the alerts.
           Params allowed: C(count), C(fields), C(filter), C(query), C(sort), C(start), and C(view)."
+        - "C(page_size) requests the alerts in pages of this size, keeping only the selected ones in memory.
+          C(match) selects the alerts by the value of their attributes, nested attributes are referenced by dotted
+          paths."
       required: false
 
 extends_documentation_fragment:
     - oneview
+    - oneview.factsfields
 '''
 
 EXAMPLES = '''
@@ -89,14 +93,17 @@ from ansible.module_utils.oneview import OneViewModuleBase
 
 
 class AlertFactsModule(OneViewModuleBase):
+    RESOURCE_LIST_FACTS = ['alerts']
+
     def __init__(self):
         argument_spec = dict(
+            fields=dict(required=False, type='list'),
             params=dict(required=False, type='dict')
         )
         super(AlertFactsModule, self).__init__(additional_arg_spec=argument_spec)
 
     def execute_module(self):
-        facts = self.oneview_client.alerts.get_all(**self.facts_params)
+        facts = self.get_all_resources(self.oneview_client.alerts)
 
         return dict(changed=False, ansible_facts=dict(alerts=facts))
 
@@ -43,6 +43,7 @@ options:
 
 extends_documentation_fragment:
     - oneview
+    - oneview.factsfields
     - oneview.factsparams
 '''
 
@@ -109,10 +110,13 @@ from ansible.module_utils.oneview import OneViewModuleBase
 
 
 class ConnectionTemplateFactsModule(OneViewModuleBase):
+    RESOURCE_LIST_FACTS = ['connection_templates']
+
     def __init__(self):
         argument_spec = dict(
             name=dict(required=False, type='str'),
             options=dict(required=False, type='list'),
+            fields=dict(required=False, type='list'),
             params=dict(required=False, type='dict')
         )
         super(ConnectionTemplateFactsModule, self).__init__(additional_arg_spec=argument_spec)
@@ -126,7 +130,7 @@ class ConnectionTemplateFactsModule(OneViewModuleBase):
         elif self.module.params.get('name'):
             ansible_facts['connection_templates'] = client.get_by('name', self.module.params['name'])
         else:
-            ansible_facts['connection_templates'] = client.get_all(**self.facts_params)
+            ansible_facts['connection_templates'] = self.get_all_resources(client)
 
         return dict(changed=False,
                     ansible_facts=ansible_facts)
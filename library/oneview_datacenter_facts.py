@@ -43,6 +43,7 @@ options:
 
 extends_documentation_fragment:
     - oneview
+    - oneview.factsfields
     - oneview.factsparams
 '''
 
@@ -97,9 +98,12 @@ from ansible.module_utils.oneview import OneViewModuleBase
 
 
 class DatacenterFactsModule(OneViewModuleBase):
+    RESOURCE_LIST_FACTS = ['datacenters']
+
     argument_spec = dict(
         name=dict(required=False, type='str'),
         options=dict(required=False, type='list'),
+        fields=dict(required=False, type='list'),
         params=dict(required=False, type='dict')
     )
 
@@ -122,7 +126,7 @@ class DatacenterFactsModule(OneViewModuleBase):
 
             ansible_facts['datacenters'] = datacenters
         else:
-            ansible_facts['datacenters'] = client.get_all(**self.facts_params)
+            ansible_facts['datacenters'] = self.get_all_resources(client)
 
         return dict(changed=False,
                     ansible_facts=ansible_facts)
@@ -47,6 +47,7 @@ notes:
 
 extends_documentation_fragment:
     - oneview
+    - oneview.factsfields
     - oneview.factsparams
 '''
 
@@ -102,9 +103,12 @@ from ansible.module_utils.oneview import OneViewModuleBase
 
 
 class DriveEnclosureFactsModule(OneViewModuleBase):
+    RESOURCE_LIST_FACTS = ['drive_enclosures']
+
     argument_spec = dict(
         name=dict(required=False, type='str'),
         options=dict(required=False, type='list'),
+        fields=dict(required=False, type='list'),
         params=dict(required=False, type='dict')
     )
 
@@ -124,7 +128,7 @@ class DriveEnclosureFactsModule(OneViewModuleBase):
                     if self.options.get('portMap'):
                         facts['drive_enclosure_port_map'] = self.resource_client.get_port_map(drive_enclosures_uri)
         else:
-            drive_enclosures = self.resource_client.get_all(**self.facts_params)
+            drive_enclosures = self.get_all_resources(self.resource_client)
 
         facts['drive_enclosures'] = drive_enclosures
 
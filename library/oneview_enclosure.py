@@ -85,6 +85,7 @@ notes:
 
 extends_documentation_fragment:
     - oneview
+    - oneview.wait
 '''
 
 EXAMPLES = '''
@@ -379,6 +380,14 @@ enclosure:
     description: Has all the facts about the enclosure.
     returned: On states 'present', 'reconfigured', and 'refreshed'. Can be null.
     type: dict
+task_uri:
+    description: URI of the task started when C(wait) is false.
+    returned: When C(wait) is false and a task was started.
+    type: str
+resource_uri:
+    description: URI of the resource associated with the task started when C(wait) is false.
+    returned: When C(wait) is false and a task was started. Can be null.
+    type: str
 '''
 
 from ansible.module_utils.oneview import OneViewModuleBase, OneViewModuleResourceNotFound
@@ -493,7 +502,7 @@ class EnclosureModule(OneViewModuleBase):
     )
 
     def __init__(self):
-        super(EnclosureModule, self).__init__(additional_arg_spec=self.argument_spec)
+        super(EnclosureModule, self).__init__(additional_arg_spec=self.argument_spec, wait_support=True)
         self.resource_client = self.oneview_client.enclosures
 
     def execute_module(self):
@@ -580,7 +589,8 @@ class EnclosureModule(OneViewModuleBase):
         refresh_config = data.copy()
         refresh_config.pop('name', None)
 
-        self.oneview_client.enclosures.refresh_state(resource['uri'], refresh_config)
+        with self.asynchronous_tasks(self.oneview_client.enclosures):
+            self.oneview_client.enclosures.refresh_state(resource['uri'], refresh_config)
         enclosure = self.oneview_client.enclosures.get(resource['uri'])
 
         return True, self.MSG_REFRESHED, enclosure
@@ -48,6 +48,7 @@ options:
 
 extends_documentation_fragment:
     - oneview
+    - oneview.factsfields
     - oneview.factsparams
 '''
 
@@ -154,7 +155,10 @@ from ansible.module_utils.oneview import OneViewModuleBase
 
 
 class EnclosureFactsModule(OneViewModuleBase):
-    argument_spec = dict(name=dict(type='str'), options=dict(type='list'), params=dict(type='dict'))
+    RESOURCE_LIST_FACTS = ['enclosures']
+
+    argument_spec = dict(name=dict(type='str'), options=dict(type='list'), params=dict(type='dict'),
+                         fields=dict(type='list'))
 
     def __init__(self):
         super(EnclosureFactsModule, self).__init__(additional_arg_spec=self.argument_spec)
@@ -169,7 +173,7 @@ class EnclosureFactsModule(OneViewModuleBase):
             if self.options and enclosures:
                 ansible_facts = self._gather_optional_facts(self.options, enclosures[0])
         else:
-            enclosures = self.oneview_client.enclosures.get_all(**self.facts_params)
+            enclosures = self.get_all_resources(self.oneview_client.enclosures)
 
         ansible_facts['enclosures'] = enclosures
 
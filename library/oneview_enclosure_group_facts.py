@@ -47,6 +47,7 @@ options:
 
 extends_documentation_fragment:
     - oneview
+    - oneview.factsfields
     - oneview.factsparams
 '''
 
@@ -107,9 +108,12 @@ from ansible.module_utils.oneview import OneViewModuleBase
 
 
 class EnclosureGroupFactsModule(OneViewModuleBase):
+    RESOURCE_LIST_FACTS = ['enclosure_groups']
+
     argument_spec = dict(
         name=dict(required=False, type='str'),
         options=dict(required=False, type='list'),
+        fields=dict(required=False, type='list'),
         params=dict(required=False, type='dict')
     )
 
@@ -126,7 +130,7 @@ class EnclosureGroupFactsModule(OneViewModuleBase):
             if enclosure_groups and "configuration_script" in self.options:
                 facts["enclosure_group_script"] = self.__get_script(enclosure_groups)
         else:
-            enclosure_groups = self.oneview_client.enclosure_groups.get_all(**self.facts_params)
+            enclosure_groups = self.get_all_resources(self.oneview_client.enclosure_groups)
 
         facts["enclosure_groups"] = enclosure_groups
         return dict(changed=False, ansible_facts=facts)
@@ -26,6 +26,14 @@ module: oneview_ethernet_network
 short_description: Manage OneView Ethernet Network resources.
 description:
     - Provides an interface to manage Ethernet Network resources. Can create, update, or delete.
+    - With C(namePrefix) and C(vlanIdRange) in C(data), manages the Ethernet Networks of a whole VLAN range, named
+      C(<namePrefix>_<vlanId>). Only the missing networks are created, and only the existing ones are deleted, in
+      requests of up to 1000 networks each.
+    - The bulk deletion requires the API version 1600 or later. With earlier API versions, the networks of the range
+      are deleted one by one, several at a time.
+    - On state C(present), the networks of the range, or the networks selected by a C(filter) in C(data), are also
+      updated with the other properties, C(bandwidth) and C(scopeUris) in C(data). The networks and their connection
+      templates are retrieved at once and compared locally, and only the updates needed are sent, several at a time.
 version_added: "2.3"
 requirements:
     - "python >= 2.7.9"
@@ -98,6 +106,35 @@ EXAMPLES = '''
         maximumBandwidth: 10000
         typicalBandwidth: 2000
 
+- name: Update the bandwidth and scopes of the Ethernet networks of a VLAN range
+  oneview_ethernet_network:
+    config: "{{ config_file_path }}"
+    state: present
+    data:
+      vlanIdRange: '1-1000'
+      namePrefix: TestNetwork
+      bandwidth:
+        maximumBandwidth: 10000
+        typicalBandwidth: 2000
+      scopeUris:
+        - '/rest/scopes/00SC123456'
+
+- name: Update the Ethernet networks selected by a filter
+  oneview_ethernet_network:
+    config: "{{ config_file_path }}"
+    state: present
+    data:
+      filter: "purpose='General'"
+      smartLink: true
+
+- name: Ensure that the Ethernet networks of a VLAN range are absent
+  oneview_ethernet_network:
+    config: "{{ config_file_path }}"
+    state: absent
+    data:
+      vlanIdRange: '1-10,15,17'
+      namePrefix: TestNetwork
+
 - name: Reset to the default network connection template
   oneview_ethernet_network:
     config: "{{ config_file_path }}"
@@ -126,7 +163,7 @@ ethernet_network:
 
 ethernet_network_bulk:
     description: Has the facts about the Ethernet Networks affected by the bulk insert.
-    returned: When 'vlanIdRange' attribute is in data argument. Can be null.
+    returned: On state 'present', when 'vlanIdRange' or 'filter' attribute is in data argument. Can be null.
     type: dict
 
 ethernet_network_connection_template:
@@ -135,7 +172,10 @@ ethernet_network_connection_template:
     type: dict
 '''
 
-from ansible.module_utils.oneview import OneViewModuleBase, OneViewModuleResourceNotFound, compare
+import functools
+
+from ansible.module_utils.oneview import (OneViewModuleBase, OneViewModuleResourceNotFound, VlanIdSet, compare,
+                                          run_concurrently)
 
 
 class EthernetNetworkModule(OneViewModuleBase):
@@ -148,11 +188,23 @@ class EthernetNetworkModule(OneViewModuleBase):
     MSG_BULK_CREATED = 'Ethernet Networks created successfully.'
     MSG_MISSING_BULK_CREATED = 'Some missing Ethernet Networks were created successfully.'
     MSG_BULK_ALREADY_EXIST = 'The specified Ethernet Networks already exist.'
+    MSG_BULK_UPDATED = 'Ethernet Networks updated successfully.'
+    MSG_BULK_DELETED = 'Ethernet Networks deleted successfully.'
+    MSG_BULK_ALREADY_ABSENT = 'The specified Ethernet Networks are already absent.'
     MSG_CONNECTION_TEMPLATE_RESET = 'Ethernet Network connection template was reset to the default.'
     MSG_ETHERNET_NETWORK_NOT_FOUND = 'Ethernet Network was not found.'
 
     RESOURCE_FACT_NAME = 'ethernet_network'
 
+    # Maximum number of networks created or deleted by a single bulk request
+    BULK_MAX_NETWORKS = 1000
+    # Maximum number of networks updated, or deleted one by one, at a time
+    UPDATE_MAX_WORKERS = 8
+    # First API version with the bulk deletion of ethernet networks
+    BULK_DELETE_API_VERSION = 1600
+    # Keys of the data that select the networks or are not compared as network properties
+    BULK_KEYS = ['name', 'namePrefix', 'vlanIdRange', 'filter', 'type', 'bandwidth', 'scopeUris']
+
     def __init__(self):
 
         argument_spec = dict(
@@ -177,10 +229,15 @@ class EthernetNetworkModule(OneViewModuleBase):
         if self.state == 'present':
             if self.data.get('vlanIdRange'):
                 changed, msg, ansible_facts = self.__bulk_present()
+            elif self.data.get('filter'):
+                changed, msg, ansible_facts = self.__bulk_update()
             else:
                 return self.__present(resource)
         elif self.state == 'absent':
-            return self.resource_absent(resource)
+            if self.data.get('vlanIdRange'):
+                changed, msg, ansible_facts = self.__bulk_absent()
+            else:
+                return self.resource_absent(resource)
         elif self.state == 'default_bandwidth_reset':
             changed, msg, ansible_facts = self.__default_bandwidth_reset(resource)
 
@@ -204,35 +261,119 @@ class EthernetNetworkModule(OneViewModuleBase):
         return result
 
     def __bulk_present(self):
-        vlan_id_range = self.data['vlanIdRange']
+        vlan_ids = VlanIdSet.parse(self.data['vlanIdRange'])
+        ethernet_networks = self.__get_range(self.data['namePrefix'], vlan_ids)
+
+        missing_vlan_ids = vlan_ids - VlanIdSet.from_ids(int(net['vlanId']) for net in ethernet_networks)
+        if missing_vlan_ids:
+            msg = self.MSG_MISSING_BULK_CREATED if ethernet_networks else self.MSG_BULK_CREATED
+
+            # The networks returned by each bulk creation are gathered, instead of querying the whole range again
+            networks_by_vlan_id = dict((int(net['vlanId']), net) for net in ethernet_networks)
+            for chunk in missing_vlan_ids.split(self.BULK_MAX_NETWORKS):
+                data = dict((key, value) for key, value in self.data.items() if key != 'scopeUris')
+                data['vlanIdRange'] = chunk.to_range()
+                for net in self.resource_client.create_bulk(data) or []:
+                    if int(net['vlanId']) in chunk:
+                        networks_by_vlan_id[int(net['vlanId'])] = net
+
+            ethernet_networks = [networks_by_vlan_id[vlan_id] for vlan_id in sorted(networks_by_vlan_id)]
 
-        ethernet_networks = self.resource_client.get_range(self.data['namePrefix'], vlan_id_range)
+        updated, ethernet_networks = self.__update_networks(ethernet_networks)
 
+        if missing_vlan_ids:
+            return True, msg, dict(ethernet_network_bulk=ethernet_networks)
+        if updated:
+            return True, self.MSG_BULK_UPDATED, dict(ethernet_network_bulk=ethernet_networks)
+        return False, self.MSG_BULK_ALREADY_EXIST, dict(ethernet_network_bulk=ethernet_networks)
+
+    def __bulk_update(self):
+        ethernet_networks = self.resource_client.get_all(filter=self.data['filter'], sort='vlanId:ascending')
+
+        updated, ethernet_networks = self.__update_networks(ethernet_networks)
+
+        msg = self.MSG_BULK_UPDATED if updated else self.MSG_BULK_ALREADY_EXIST
+        return bool(updated), msg, dict(ethernet_network_bulk=ethernet_networks)
+
+    def __update_networks(self, ethernet_networks):
+        """
+        Updates the networks whose properties, bandwidth or scopes differ from the data.
+
+        :return: tuple: The number of networks updated and the list of networks, with the updated ones replaced.
+        """
+        properties = dict((key, value) for key, value in self.data.items() if key not in self.BULK_KEYS)
+        bandwidth = self.data.get('bandwidth')
+        scope_uris = self.data.get('scopeUris')
+
+        connection_templates = {}
+        if bandwidth:
+            connection_templates = dict((template['uri'], template)
+                                        for template in self.oneview_client.connection_templates.get_all())
+
+        indexes, updates = [], []
+        for index, net in enumerate(ethernet_networks):
+            merged_data = net.copy()
+            merged_data.update(properties)
+            update_properties = not compare(net, merged_data)
+
+            merged_template = None
+            connection_template = connection_templates.get(net.get('connectionTemplateUri'))
+            if connection_template is not None:
+                merged_template = connection_template.copy()
+                merged_template.update({'bandwidth': bandwidth})
+                if compare(connection_template, merged_template):
+                    merged_template = None
+
+            update_scopes = scope_uris is not None and set(net.get('scopeUris') or []) != set(scope_uris)
+
+            if update_properties or merged_template is not None or update_scopes:
+                indexes.append(index)
+                updates.append(functools.partial(self.__update_network,
+                                                 net,
+                                                 merged_data if update_properties else None,
+                                                 merged_template,
+                                                 scope_uris if update_scopes else None))
+
+        ethernet_networks = list(ethernet_networks)
+        for index, net in zip(indexes, run_concurrently(updates, self.UPDATE_MAX_WORKERS)):
+            ethernet_networks[index] = net
+
+        return len(updates), ethernet_networks
+
+    def __update_network(self, net, merged_data, merged_template, scope_uris):
+        if merged_data is not None:
+            net = self.resource_client.update(merged_data)
+        if merged_template is not None:
+            self.oneview_client.connection_templates.update(merged_template)
+        if scope_uris is not None:
+            net = self.resource_client.patch(net['uri'], operation='replace', path='/scopeUris', value=scope_uris)
+        return net
+
+    def __bulk_absent(self):
+        ethernet_networks = self.__get_range(self.data['namePrefix'], VlanIdSet.parse(self.data['vlanIdRange']))
         if not ethernet_networks:
-            ethernet_networks = self.resource_client.create_bulk(self.data)
-            changed = True
-            msg = self.MSG_BULK_CREATED
+            return False, self.MSG_BULK_ALREADY_ABSENT, {}
 
+        if self.__supports_bulk_delete():
+            network_uris = [net['uri'] for net in ethernet_networks]
+            for index in range(0, len(network_uris), self.BULK_MAX_NETWORKS):
+                self.resource_client.delete_bulk(dict(networkUris=network_uris[index:index + self.BULK_MAX_NETWORKS]))
         else:
-            vlan_ids = self.resource_client.dissociate_values_or_ranges(vlan_id_range)
-            for net in ethernet_networks[:]:
-                vlan_ids.remove(net['vlanId'])
+            run_concurrently([functools.partial(self.resource_client.delete, net) for net in ethernet_networks],
+                             self.UPDATE_MAX_WORKERS)
 
-            if len(vlan_ids) == 0:
-                msg = self.MSG_BULK_ALREADY_EXIST
-                changed = False
-            else:
-                if len(vlan_ids) == 1:
-                    self.data['vlanIdRange'] = '{0}-{1}'.format(vlan_ids[0], vlan_ids[0])
-                else:
-                    self.data['vlanIdRange'] = ','.join(map(str, vlan_ids))
+        return True, self.MSG_BULK_DELETED, {}
 
-                self.resource_client.create_bulk(self.data)
-                ethernet_networks = self.resource_client.get_range(self.data['namePrefix'], vlan_id_range)
-                changed = True
-                msg = self.MSG_MISSING_BULK_CREATED
+    def __supports_bulk_delete(self):
+        # The SDK versions before the bulk deletion do not have delete_bulk
+        if not hasattr(self.resource_client, 'delete_bulk'):
+            return False
+        return self.oneview_client.api_version >= self.BULK_DELETE_API_VERSION
 
-        return changed, msg, dict(ethernet_network_bulk=ethernet_networks)
+    def __get_range(self, name_prefix, vlan_ids):
+        name_filter = "\"'name' matches '{0}\\_%'\"".format(name_prefix)
+        ethernet_networks = self.resource_client.get_all(filter=name_filter, sort='vlanId:ascending')
+        return [net for net in ethernet_networks if int(net['vlanId']) in vlan_ids]
 
     def __update_connection_template(self, ethernet_network, bandwidth):
 
@@ -45,6 +45,7 @@ options:
       required: false
 extends_documentation_fragment:
     - oneview
+    - oneview.factsfields
     - oneview.factsparams
 '''
 
@@ -107,9 +108,12 @@ from ansible.module_utils.oneview import OneViewModuleBase
 
 
 class EthernetNetworkFactsModule(OneViewModuleBase):
+    RESOURCE_LIST_FACTS = ['ethernet_networks']
+
     argument_spec = dict(
         name=dict(required=False, type='str'),
         options=dict(required=False, type='list'),
+        fields=dict(required=False, type='list'),
         params=dict(required=False, type='dict')
     )
 
@@ -126,7 +130,7 @@ class EthernetNetworkFactsModule(OneViewModuleBase):
             if self.module.params.get('options') and ethernet_networks:
                 ansible_facts = self.__gather_optional_facts(ethernet_networks[0])
         else:
-            ethernet_networks = self.resource_client.get_all(**self.facts_params)
+            ethernet_networks = self.get_all_resources(self.resource_client)
 
         ansible_facts['ethernet_networks'] = ethernet_networks
 
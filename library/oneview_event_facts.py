@@ -40,6 +40,7 @@ options:
 
 extends_documentation_fragment:
     - oneview
+    - oneview.factsfields
     - oneview.factsparams
 '''
 
@@ -73,10 +74,13 @@ from ansible.module_utils.oneview import OneViewModuleBase
 
 
 class EventFactsModule(OneViewModuleBase):
+    RESOURCE_LIST_FACTS = ['events']
+
     def __init__(self):
 
         argument_spec = dict(
             name=dict(required=False, type='str'),
+            fields=dict(required=False, type='list'),
             params=dict(required=False, type='dict')
         )
 
@@ -84,7 +88,7 @@ class EventFactsModule(OneViewModuleBase):
 
     def execute_module(self):
 
-        events = self.oneview_client.events.get_all(**self.facts_params)
+        events = self.get_all_resources(self.oneview_client.events)
 
         return dict(changed=False, ansible_facts=dict(events=events))
 
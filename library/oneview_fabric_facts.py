@@ -43,6 +43,7 @@ options:
       required: false
 extends_documentation_fragment:
     - oneview
+    - oneview.factsfields
     - oneview.factsparams
 '''
 
@@ -96,9 +97,12 @@ from ansible.module_utils.oneview import OneViewModuleBase
 
 
 class FabricFactsModule(OneViewModuleBase):
+    RESOURCE_LIST_FACTS = ['fabrics']
+
     argument_spec = dict(
         name=dict(required=False, type='str'),
         options=dict(required=False, type='list'),
+        fields=dict(required=False, type='list'),
         params=dict(required=False, type='dict')
     )
 
@@ -115,7 +119,7 @@ class FabricFactsModule(OneViewModuleBase):
             if self.options and fabrics:
                 ansible_facts = self.__gather_optional_facts(fabrics[0])
         else:
-            fabrics = self.oneview_client.fabrics.get_all(**self.facts_params)
+            fabrics = self.get_all_resources(self.oneview_client.fabrics)
 
         ansible_facts['fabrics'] = fabrics
 
@@ -40,6 +40,7 @@ options:
 
 extends_documentation_fragment:
     - oneview
+    - oneview.factsfields
     - oneview.factsparams
 '''
 
@@ -91,10 +92,13 @@ from ansible.module_utils.oneview import OneViewModuleBase
 
 
 class FcNetworkFactsModule(OneViewModuleBase):
+    RESOURCE_LIST_FACTS = ['fc_networks']
+
     def __init__(self):
 
         argument_spec = dict(
             name=dict(required=False, type='str'),
+            fields=dict(required=False, type='list'),
             params=dict(required=False, type='dict')
         )
 
@@ -105,7 +109,7 @@ class FcNetworkFactsModule(OneViewModuleBase):
         if self.module.params['name']:
             fc_networks = self.oneview_client.fc_networks.get_by('name', self.module.params['name'])
         else:
-            fc_networks = self.oneview_client.fc_networks.get_all(**self.facts_params)
+            fc_networks = self.get_all_resources(self.oneview_client.fc_networks)
 
         return dict(changed=False, ansible_facts=dict(fc_networks=fc_networks))
 
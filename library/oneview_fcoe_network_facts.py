@@ -42,6 +42,7 @@ options:
         - FCoE Network name.
 extends_documentation_fragment:
     - oneview
+    - oneview.factsfields
     - oneview.factsparams
 '''
 
@@ -94,9 +95,12 @@ from ansible.module_utils.oneview import OneViewModuleBase
 
 
 class FcoeNetworkFactsModule(OneViewModuleBase):
+    RESOURCE_LIST_FACTS = ['fcoe_networks']
+
     def __init__(self):
         argument_spec = dict(
             name=dict(type='str'),
+            fields=dict(required=False, type='list'),
             params=dict(type='dict'),
         )
 
@@ -107,7 +111,7 @@ class FcoeNetworkFactsModule(OneViewModuleBase):
         if self.module.params['name']:
             fcoe_networks = self.oneview_client.fcoe_networks.get_by('name', self.module.params['name'])
         else:
-            fcoe_networks = self.oneview_client.fcoe_networks.get_all(**self.facts_params)
+            fcoe_networks = self.get_all_resources(self.oneview_client.fcoe_networks)
 
         return dict(changed=False,
                     ansible_facts=dict(fcoe_networks=fcoe_networks))
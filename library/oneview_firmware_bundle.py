@@ -26,8 +26,9 @@ module: oneview_firmware_bundle
 short_description: Upload OneView Firmware Bundle resources.
 description:
     - Upload an SPP ISO image file or a hotfix file to the appliance.
-notes:
-   - "This module is non-idempotent"
+    - The upload is skipped when a firmware driver with the same file name and size is already on the appliance, or
+      when the contents of the file were already uploaded under another name, according to the C(digest_cache).
+    - The file is streamed in chunks, logging the progress, and the throughput is returned in C(transfer).
 version_added: "2.3"
 requirements:
     - "python >= 2.7.9"
@@ -43,6 +44,11 @@ options:
       description:
         - The full path of a local file to be loaded.
       required: true
+    digest_cache:
+      description:
+        - Path of a file where the SHA-256 digests of the uploaded files, and the firmware drivers created from them,
+          are kept. A digest is computed again only when the size or modification time of the file changes.
+      required: false
 
 extends_documentation_fragment:
     - oneview
@@ -55,6 +61,13 @@ EXAMPLES = '''
     state: present
     file_path: "/home/user/Downloads/hp-firmware-hdd-a1b08f8a6b-HPGH-1.1.x86_64.rpm"
 
+- name: Ensure that the SPP is present, recognizing it when it was uploaded under another name
+  oneview_firmware_bundle:
+    config: "{{ config_file_path }}"
+    state: present
+    file_path: "/home/user/Downloads/SPP2017.iso"
+    digest_cache: "~/.ansible/oneview-firmware-digests.json"
+
 '''
 
 RETURN = '''
@@ -62,17 +75,28 @@ firmware_bundle:
     description: Has the facts about the OneView Firmware Bundle.
     returned: Always. Can be null.
     type: dict
+
+transfer:
+    description: Bytes uploaded, seconds spent and throughput of the upload, in bytes per second.
+    returned: When the firmware bundle is uploaded.
+    type: dict
 '''
 
-from ansible.module_utils.oneview import OneViewModuleBase
+import os
+
+from ansible.module_utils.oneview import OneViewModuleBase, FileDigestCache, FileTransfer
 
 
 class FirmwareBundleModule(OneViewModuleBase):
     MSG_FIRMWARE_BUNDLE_UPLOADED = 'Firmware Bundle uploaded sucessfully.'
+    MSG_FIRMWARE_BUNDLE_ALREADY_PRESENT = 'Firmware Bundle is already present.'
+
+    UPLOAD_PATH = '/rest/firmware-bundles'
 
     argument_spec = dict(
         state=dict(required=True, choices=['present']),
-        file_path=dict(required=True, type='str')
+        file_path=dict(required=True, type='str'),
+        digest_cache=dict(required=False, type='path')
     )
 
     def __init__(self):
@@ -80,11 +104,49 @@ class FirmwareBundleModule(OneViewModuleBase):
 
     def execute_module(self):
         file_path = self.module.params['file_path']
+        file_size = os.path.getsize(file_path)
+
+        digest = None
+        digest_cache = None
+        if self.module.params.get('digest_cache'):
+            digest_cache = FileDigestCache(self.module.params['digest_cache'])
+            digest = digest_cache.get_digest(file_path)
+
+        firmware = self.__get_uploaded_firmware(file_path, file_size, digest, digest_cache)
+        if firmware:
+            if digest_cache:
+                digest_cache.set_uri(digest, firmware['uri'])
+            return dict(changed=False,
+                        msg=self.MSG_FIRMWARE_BUNDLE_ALREADY_PRESENT,
+                        ansible_facts=dict(firmware_bundle=firmware))
+
+        file_transfer = FileTransfer(self.oneview_client.connection)
+        new_firmware = file_transfer.upload(self.UPLOAD_PATH, file_path, log=self.module.log)
+
+        if digest_cache and new_firmware and new_firmware.get('uri'):
+            digest_cache.set_uri(digest, new_firmware['uri'])
 
-        new_firmware = self.oneview_client.firmware_bundles.upload(file_path)
         return dict(changed=True,
                     msg=self.MSG_FIRMWARE_BUNDLE_UPLOADED,
-                    ansible_facts=dict(firmware_bundle=new_firmware))
+                    ansible_facts=dict(firmware_bundle=new_firmware),
+                    transfer=file_transfer.statistics)
+
+    def __get_uploaded_firmware(self, file_path, file_size, digest, digest_cache):
+        firmware_drivers = self.oneview_client.firmware_drivers.get_all()
+
+        # The same contents uploaded before, possibly from a file with another name
+        uploaded_uri = digest_cache.get_uri(digest) if digest_cache else None
+        for firmware in firmware_drivers:
+            if uploaded_uri and firmware.get('uri') == uploaded_uri:
+                return firmware
+
+        file_name = os.path.basename(file_path)
+        for firmware in firmware_drivers:
+            components = firmware.get('fwComponents') or []
+            file_names = [firmware.get('isoFileName')] + [component.get('fileName') for component in components]
+            if file_name in file_names and str(firmware.get('bundleSize')) == str(file_size):
+                return firmware
+        return None
 
 
 def main():
@@ -46,6 +46,7 @@ options:
       required: false
 extends_documentation_fragment:
     - oneview
+    - oneview.factsfields
 '''
 
 EXAMPLES = '''
@@ -84,10 +85,13 @@ from ansible.module_utils.oneview import OneViewModuleBase
 
 
 class FirmwareDriverFactsModule(OneViewModuleBase):
+    RESOURCE_LIST_FACTS = ['firmware_drivers']
+
     def __init__(self):
 
         argument_spec = dict(
             name=dict(required=False, type='str'),
+            fields=dict(required=False, type='list'),
             params=dict(required=False, type='dict')
 
         )
@@ -101,7 +105,7 @@ class FirmwareDriverFactsModule(OneViewModuleBase):
         if name:
             result = self.resource_client.get_by('name', name)
         else:
-            result = self.resource_client.get_all(**self.facts_params)
+            result = self.get_all_resources(self.resource_client)
 
         return dict(
             changed=False,
@@ -51,6 +51,7 @@ options:
 
 extends_documentation_fragment:
     - oneview
+    - oneview.factsfields
     - oneview.factsparams
 '''
 
@@ -121,12 +122,15 @@ from ansible.module_utils.oneview import OneViewModuleBase
 
 
 class IdPoolsIpv4RangeFactsModule(OneViewModuleBase):
+    RESOURCE_LIST_FACTS = ['id_pools_ipv4_ranges']
+
     def __init__(self):
         argument_spec = dict(
             name=dict(required=False, type='str'),
             uri=dict(required=False, type='str'),
             subnetUri=dict(required=False, type='str'),
             options=dict(required=False, type='list'),
+            fields=dict(required=False, type='list'),
             params=dict(required=False, type='dict')
         )
         super(IdPoolsIpv4RangeFactsModule, self).__init__(additional_arg_spec=argument_spec)
@@ -44,6 +44,7 @@ options:
 
 extends_documentation_fragment:
     - oneview
+    - oneview.factsfields
     - oneview.factsparams
 '''
 
@@ -82,10 +83,13 @@ from ansible.module_utils.oneview import OneViewModuleBase
 
 
 class IdPoolsIpv4SubnetFactsModule(OneViewModuleBase):
+    RESOURCE_LIST_FACTS = ['id_pools_ipv4_subnets']
+
     def __init__(self):
         argument_spec = dict(
             name=dict(required=False, type='str'),
             uri=dict(required=False, type='str'),
+            fields=dict(required=False, type='list'),
             params=dict(required=False, type='dict')
         )
         super(IdPoolsIpv4SubnetFactsModule, self).__init__(additional_arg_spec=argument_spec)
@@ -98,7 +102,7 @@ class IdPoolsIpv4SubnetFactsModule(OneViewModuleBase):
         elif self.module.params.get('uri'):
             id_pools_ipv4_subnets = [self.resource_client.get(self.module.params['uri'])]
         else:
-            id_pools_ipv4_subnets = self.oneview_client.id_pools_ipv4_subnets.get_all(**self.facts_params)
+            id_pools_ipv4_subnets = self.get_all_resources(self.oneview_client.id_pools_ipv4_subnets)
 
         return dict(changed=False, ansible_facts=dict(id_pools_ipv4_subnets=id_pools_ipv4_subnets))
 
@@ -35,6 +35,12 @@ options:
       description:
         - Interconnect name.
       required: false
+    names:
+      description:
+        - List of Interconnect names. The Interconnects are retrieved in a few filtered queries and the C(options) are
+          gathered for all of them in parallel, through the same session.
+        - The C(options) are also gathered for each Interconnect matched by the C(filter) of the C(params).
+      required: false
     options:
       description:
         - "List with options to gather additional facts about Interconnect.
@@ -46,12 +52,16 @@ options:
           C(ports) gets all interconnect ports.
           C(port) gets a specific interconnect port.
           C(pluggableModuleInformation) gets all the SFP information."
-        - "To gather additional facts it is required inform the Interconnect name. Otherwise, these options will be
-          ignored."
+        - "To gather additional facts it is required inform the Interconnect name, the names, or a filter. Otherwise,
+          these options will be ignored."
       required: false
+notes:
+    - When gathering facts about many Interconnects, a failure to gather an option does not fail the module. The
+      error message is returned in the C(errors) of the Interconnect, by fact name.
 
 extends_documentation_fragment:
     - oneview
+    - oneview.factsfields
     - oneview.factsparams
 '''
 
@@ -183,6 +193,19 @@ EXAMPLES = '''
 - debug: var=interconnects
 - debug: var=interconnect_pluggable_module_information
 
+- name: Gather the statistics of the interconnects of an enclosure at once
+  oneview_interconnect_facts:
+    hostname: 172.16.101.48
+    username: administrator
+    password: my_password
+    api_version: 600
+    params:
+      filter: "enclosureName='0000A66102'"
+    options:
+        - statistics
+
+- debug: var=interconnects_by_name
+
 '''
 
 RETURN = '''
@@ -225,17 +248,26 @@ interconnect_pluggable_module_information:
     description: The plugged SFPs information.
     returned: When requested, but can be null.
     type: list
+interconnects_by_name:
+    description: Has the facts about each Interconnect, by name. Each entry has the Interconnect, in
+      C(interconnect), the facts about the options requested, and the C(errors) of the options that failed.
+    returned: When names are informed, or when options are requested with a filter.
+    type: dict
 '''
 
-from ansible.module_utils.oneview import OneViewModuleBase
+from ansible.module_utils.oneview import OneViewModuleBase, get_by_names
 from hpOneView.resources.resource import extract_id_from_uri
 
 
 class InterconnectFactsModule(OneViewModuleBase):
+    RESOURCE_LIST_FACTS = ['interconnects']
+
     def __init__(self):
         argument_spec = dict(
             name=dict(required=False, type='str'),
+            names=dict(required=False, type='list'),
             options=dict(required=False, type='list'),
+            fields=dict(required=False, type='list'),
             params=dict(required=False, type='dict'),
         )
         super(InterconnectFactsModule, self).__init__(additional_arg_spec=argument_spec)
@@ -250,8 +282,15 @@ class InterconnectFactsModule(OneViewModuleBase):
 
             if interconnects and self.module.params.get('options'):
                 self.__get_options(interconnects, facts)
+        elif self.module.params.get('names'):
+            interconnects = get_by_names(self.oneview_client.interconnects, self.module.params['names'])
+            facts['interconnects'] = interconnects
+            facts['interconnects_by_name'] = self.__gather_facts_by_name(interconnects)
         else:
-            facts['interconnects'] = self.oneview_client.interconnects.get_all(**self.facts_params)
+            facts['interconnects'] = self.get_all_resources(self.oneview_client.interconnects)
+
+            if self.module.params.get('options') and (self.module.params.get('params') or {}).get('filter'):
+                facts['interconnects_by_name'] = self.__gather_facts_by_name(facts['interconnects'])
 
         return dict(
             changed=False,
@@ -259,40 +298,48 @@ class InterconnectFactsModule(OneViewModuleBase):
         )
 
     def __get_options(self, interconnects, facts):
-        interconnect_uri = interconnects[0]['uri']
+        for fact_name, request in self.__build_option_requests(interconnects[0]):
+            facts[fact_name] = request()
+
+    def __gather_facts_by_name(self, interconnects):
+        return self.gather_facts_by_name(interconnects, self.__build_option_requests, 'interconnect')
+
+    def __build_option_requests(self, interconnect):
+        interconnect_uri = interconnect['uri']
+        interconnects_client = self.oneview_client.interconnects
+        requests = []
 
         if self.options.get('nameServers'):
-            name_servers = self.oneview_client.interconnects.get_name_servers(interconnect_uri)
-            facts['interconnect_name_servers'] = name_servers
+            requests.append(('interconnect_name_servers', lambda: interconnects_client.get_name_servers(interconnect_uri)))
 
         if self.options.get('statistics'):
-            facts['interconnect_statistics'] = self.oneview_client.interconnects.get_statistics(interconnect_uri)
+            requests.append(('interconnect_statistics', lambda: interconnects_client.get_statistics(interconnect_uri)))
 
         if self.options.get('portStatistics'):
             port_name = self.options['portStatistics']
-            port_statistics = self.oneview_client.interconnects.get_statistics(interconnect_uri, port_name)
-            facts['interconnect_port_statistics'] = port_statistics
+            requests.append(('interconnect_port_statistics',
+                             lambda: interconnects_client.get_statistics(interconnect_uri, port_name)))
 
         if self.options.get('subPortStatistics'):
-            facts['interconnect_subport_statistics'] = None
             sub_options = self.options['subPortStatistics']
             if isinstance(sub_options, dict) and sub_options.get('portName') and sub_options.get('subportNumber'):
-                facts['interconnect_subport_statistics'] = self.oneview_client.interconnects.get_subport_statistics(
-                    interconnect_uri, sub_options['portName'], sub_options['subportNumber'])
+                requests.append(('interconnect_subport_statistics', lambda: interconnects_client.get_subport_statistics(
+                    interconnect_uri, sub_options['portName'], sub_options['subportNumber'])))
+            else:
+                requests.append(('interconnect_subport_statistics', lambda: None))
 
         if self.options.get('ports'):
-            ports = self.oneview_client.interconnects.get_ports(interconnect_uri)
-            facts['interconnect_ports'] = ports
+            requests.append(('interconnect_ports', lambda: interconnects_client.get_ports(interconnect_uri)))
 
         if self.options.get('port'):
-            port_name = self.options.get('port')
-            port_id = "{}:{}".format(extract_id_from_uri(interconnect_uri), port_name)
-            port = self.oneview_client.interconnects.get_port(interconnect_uri, port_id)
-            facts['interconnect_port'] = port
+            port_id = "{}:{}".format(extract_id_from_uri(interconnect_uri), self.options.get('port'))
+            requests.append(('interconnect_port', lambda: interconnects_client.get_port(interconnect_uri, port_id)))
 
         if self.options.get('pluggableModuleInformation'):
-            sfp_info = self.oneview_client.interconnects.get_pluggable_module_information(interconnect_uri)
-            facts['interconnect_pluggable_module_information'] = sfp_info
+            requests.append(('interconnect_pluggable_module_information',
+                             lambda: interconnects_client.get_pluggable_module_information(interconnect_uri)))
+
+        return requests
 
 
 def main():
@@ -39,6 +39,7 @@ notes:
     - This resource is only available on HPE Synergy.
 extends_documentation_fragment:
     - oneview
+    - oneview.factsfields
     - oneview.factsparams
 '''
 
@@ -79,9 +80,12 @@ from ansible.module_utils.oneview import OneViewModuleBase
 
 
 class InterconnectLinkTopologyFactsModule(OneViewModuleBase):
+    RESOURCE_LIST_FACTS = ['interconnect_link_topologies']
+
     def __init__(self):
         argument_spec = dict(
             name=dict(required=False, type='str'),
+            fields=dict(required=False, type='list'),
             params=dict(required=False, type='dict'),
         )
         super(InterconnectLinkTopologyFactsModule, self).__init__(additional_arg_spec=argument_spec)
@@ -91,7 +95,7 @@ class InterconnectLinkTopologyFactsModule(OneViewModuleBase):
         if name:
             interconnect_link_topologies = self.oneview_client.interconnect_link_topologies.get_by('name', name)
         else:
-            interconnect_link_topologies = self.oneview_client.interconnect_link_topologies.get_all(**self.facts_params)
+            interconnect_link_topologies = self.get_all_resources(self.oneview_client.interconnect_link_topologies)
 
         return dict(changed=False,
                     ansible_facts=dict(interconnect_link_topologies=interconnect_link_topologies))
@@ -38,6 +38,7 @@ options:
       required: false
 extends_documentation_fragment:
     - oneview
+    - oneview.factsfields
     - oneview.factsparams
 '''
 
@@ -87,8 +88,11 @@ from ansible.module_utils.oneview import OneViewModuleBase
 
 
 class InterconnectTypeFactsModule(OneViewModuleBase):
+    RESOURCE_LIST_FACTS = ['interconnect_types']
+
     argument_spec = dict(
         name=dict(required=False, type='str'),
+        fields=dict(required=False, type='list'),
         params=dict(required=False, type='dict'),
     )
 
@@ -101,7 +105,7 @@ class InterconnectTypeFactsModule(OneViewModuleBase):
         if self.module.params.get('name'):
             interconnect_types = self.oneview_client.interconnect_types.get_by('name', self.module.params['name'])
         else:
-            interconnect_types = self.oneview_client.interconnect_types.get_all(**self.facts_params)
+            interconnect_types = self.get_all_resources(self.oneview_client.interconnect_types)
 
         return dict(changed=False, ansible_facts=dict(interconnect_types=interconnect_types))
 
@@ -54,6 +54,7 @@ notes:
     - This resource is available for API version 300 or later
 extends_documentation_fragment:
     - oneview
+    - oneview.factsfields
 '''
 
 EXAMPLES = '''
@@ -101,8 +102,11 @@ from ansible.module_utils.oneview import OneViewModuleBase
 
 
 class InternalLinkSetFactsModule(OneViewModuleBase):
+    RESOURCE_LIST_FACTS = ['internal_link_sets']
+
     argument_spec = dict(
         name=dict(required=False, type='str'),
+        fields=dict(required=False, type='list'),
         params=dict(required=False, type='dict')
 
     )
@@ -115,7 +119,7 @@ class InternalLinkSetFactsModule(OneViewModuleBase):
         if name:
             internal_links = self.oneview_client.internal_link_sets.get_by('name', name)
         else:
-            internal_links = self.oneview_client.internal_link_sets.get_all(**self.facts_params)
+            internal_links = self.get_all_resources(self.oneview_client.internal_link_sets)
 
         return dict(changed=False, ansible_facts=dict(internal_link_sets=internal_links))
 
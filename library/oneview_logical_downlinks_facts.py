@@ -42,6 +42,7 @@ options:
 
 extends_documentation_fragment:
     - oneview
+    - oneview.factsfields
     - oneview.factsparams
 '''
 
@@ -93,10 +94,13 @@ from ansible.module_utils.oneview import OneViewModuleBase
 
 
 class LogicalDownlinksFactsModule(OneViewModuleBase):
+    RESOURCE_LIST_FACTS = ['logical_downlinks']
+
     def __init__(self):
         argument_spec = dict(
             name=dict(required=False, type='str'),
             excludeEthernet=dict(type='bool', default=False),
+            fields=dict(required=False, type='list'),
             params=dict(required=False, type='dict'),
         )
         super(LogicalDownlinksFactsModule, self).__init__(additional_arg_spec=argument_spec)
@@ -120,7 +124,7 @@ class LogicalDownlinksFactsModule(OneViewModuleBase):
         elif exclude_ethernet:
             logical_downlinks = self.resource_client.get_all_without_ethernet()
         else:
-            logical_downlinks = self.resource_client.get_all(**self.facts_params)
+            logical_downlinks = self.get_all_resources(self.resource_client)
 
         return dict(changed=False, ansible_facts=dict(logical_downlinks=logical_downlinks))
 
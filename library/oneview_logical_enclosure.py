@@ -59,6 +59,7 @@ notes:
 
 extends_documentation_fragment:
     - oneview
+    - oneview.wait
 '''
 
 EXAMPLES = '''
@@ -204,6 +205,14 @@ generated_dump_uri:
     description: Has the facts about the Logical Enclosure generated support dump URI.
     returned: On state 'dumped'. Can be null.
     type: dict
+task_uri:
+    description: URI of the task started when C(wait) is false.
+    returned: When C(wait) is false and a task was started.
+    type: str
+resource_uri:
+    description: URI of the resource associated with the task started when C(wait) is false.
+    returned: When C(wait) is false and a task was started. Can be null.
+    type: str
 '''
 
 from ansible.module_utils.oneview import OneViewModuleBase, OneViewModuleResourceNotFound, compare
@@ -232,7 +241,7 @@ class LogicalEnclosureModule(OneViewModuleBase):
     )
 
     def __init__(self):
-        super(LogicalEnclosureModule, self).__init__(additional_arg_spec=self.argument_spec)
+        super(LogicalEnclosureModule, self).__init__(additional_arg_spec=self.argument_spec, wait_support=True)
 
     def execute_module(self):
         changed, msg, ansible_facts = False, '', {}
@@ -325,7 +334,8 @@ class LogicalEnclosureModule(OneViewModuleBase):
         return True, self.MSG_RECONFIGURED, dict(logical_enclosure=logical_enclosure)
 
     def __update_from_group(self, logical_enclosure):
-        logical_enclosure = self.oneview_client.logical_enclosures.update_from_group(logical_enclosure['uri'])
+        with self.asynchronous_tasks(self.oneview_client.logical_enclosures):
+            logical_enclosure = self.oneview_client.logical_enclosures.update_from_group(logical_enclosure['uri'])
 
         return True, self.MSG_UPDATED_FROM_GROUP, dict(logical_enclosure=logical_enclosure)
 
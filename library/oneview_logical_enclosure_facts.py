@@ -46,6 +46,7 @@ options:
 
 extends_documentation_fragment:
     - oneview
+    - oneview.factsfields
     - oneview.factsparams
 '''
 
@@ -117,9 +118,12 @@ from ansible.module_utils.oneview import OneViewModuleBase
 
 
 class LogicalEnclosureFactsModule(OneViewModuleBase):
+    RESOURCE_LIST_FACTS = ['logical_enclosures']
+
     argument_spec = dict(
         name=dict(required=False, type='str'),
         options=dict(required=False, type='list'),
+        fields=dict(required=False, type='list'),
         params=dict(required=False, type='dict'),
     )
 
@@ -136,7 +140,7 @@ class LogicalEnclosureFactsModule(OneViewModuleBase):
             if self.options and logical_enclosures:
                 ansible_facts = self.__gather_optional_facts(self.options, logical_enclosures[0])
         else:
-            logical_enclosures = self.oneview_client.logical_enclosures.get_all(**self.facts_params)
+            logical_enclosures = self.get_all_resources(self.oneview_client.logical_enclosures)
 
         ansible_facts['logical_enclosures'] = logical_enclosures
 
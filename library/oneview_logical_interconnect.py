@@ -66,6 +66,7 @@ options:
 extends_documentation_fragment:
     - oneview
     - oneview.validateetag
+    - oneview.wait
 '''
 
 EXAMPLES = '''
@@ -192,6 +193,30 @@ EXAMPLES = '''
         command: Stage
         spp: "filename"  # could also be sppUri: '/rest/firmware-drivers/<filename>'
 
+- name: Start the firmware activation on the logical interconnect without waiting for its completion
+  oneview_logical_interconnect:
+    hostname: 172.16.101.48
+    username: administrator
+    password: my_password
+    api_version: 600
+    state: firmware_installed
+    wait: false
+    data:
+      name: "Name of the Logical Interconnect"
+      firmware:
+        command: Activate
+        spp: "filename"
+  register: li_firmware_task
+
+- name: Wait for the firmware activation to finish
+  oneview_task_wait:
+    hostname: 172.16.101.48
+    username: administrator
+    password: my_password
+    api_version: 600
+    task_uris:
+      - "{{ li_firmware_task.task_uri }}"
+
 - name: Updates the telemetry configuration of a logical interconnect.
   oneview_logical_interconnect:
     hostname: 172.16.101.48
@@ -264,6 +289,14 @@ scope_uris:
     description: Has the scope URIs the specified logical interconnect is inserted into.
     returned: On 'scopes_updated' state, but can be null.
     type: dict
+task_uri:
+    description: URI of the task started when C(wait) is false.
+    returned: When C(wait) is false and a task was started.
+    type: str
+resource_uri:
+    description: URI of the resource associated with the task started when C(wait) is false.
+    returned: When C(wait) is false and a task was started. Can be null.
+    type: str
 '''
 
 from ansible.module_utils.oneview import OneViewModuleBase, OneViewModuleResourceNotFound, OneViewModuleValueError, compare
@@ -299,7 +332,8 @@ class LogicalInterconnectModule(OneViewModuleBase):
 
     def __init__(self):
         super(LogicalInterconnectModule, self).__init__(additional_arg_spec=self.argument_spec,
-                                                        validate_etag_support=True)
+                                                        validate_etag_support=True,
+                                                        wait_support=True)
         self.resource_client = self.oneview_client.logical_interconnects
 
     def execute_module(self):
@@ -451,7 +485,8 @@ class LogicalInterconnectModule(OneViewModuleBase):
         if 'spp' in options:
             options['sppUri'] = self.__build_firmware_uri(options.pop('spp'))
 
-        firmware = self.oneview_client.logical_interconnects.install_firmware(options, uri)
+        with self.asynchronous_tasks(self.oneview_client.logical_interconnects):
+            firmware = self.oneview_client.logical_interconnects.install_firmware(options, uri)
 
         return True, self.MSG_FIRMWARE_INSTALLED, dict(li_firmware=firmware)
 
@@ -58,6 +58,7 @@ options:
 
 extends_documentation_fragment:
     - oneview
+    - oneview.factsfields
     - oneview.factsparams
 '''
 
@@ -184,11 +185,14 @@ from ansible.module_utils.oneview import OneViewModuleBase, OneViewModuleResourc
 
 
 class LogicalInterconnectFactsModule(OneViewModuleBase):
+    RESOURCE_LIST_FACTS = ['logical_interconnects']
+
     MSG_NOT_FOUND = 'Logical Interconnect not found.'
 
     argument_spec = dict(
         name=dict(required=False, type='str'),
         options=dict(required=False, type='list'),
+        fields=dict(required=False, type='list'),
         params=dict(required=False, type='dict'),
     )
 
@@ -214,7 +218,7 @@ class LogicalInterconnectFactsModule(OneViewModuleBase):
         if name:
             facts = self.__get_by_name(name)
         else:
-            logical_interconnects = self.resource_client.get_all(**self.facts_params)
+            logical_interconnects = self.get_all_resources(self.resource_client)
             facts = dict(logical_interconnects=logical_interconnects)
 
         return dict(changed=False, ansible_facts=facts)
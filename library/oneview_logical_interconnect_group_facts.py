@@ -44,6 +44,7 @@ options:
         - Logical Interconnect Group name.
 extends_documentation_fragment:
     - oneview
+    - oneview.factsfields
     - oneview.factsparams
 '''
 
@@ -112,10 +113,13 @@ from ansible.module_utils.oneview import OneViewModuleBase
 
 
 class LogicalInterconnectGroupFactsModule(OneViewModuleBase):
+    RESOURCE_LIST_FACTS = ['logical_interconnect_groups']
+
     def __init__(self):
 
         argument_spec = dict(
             name=dict(type='str'),
+            fields=dict(required=False, type='list'),
             params=dict(type='dict'),
         )
 
@@ -125,7 +129,7 @@ class LogicalInterconnectGroupFactsModule(OneViewModuleBase):
         if self.module.params.get('name'):
             ligs = self.oneview_client.logical_interconnect_groups.get_by('name', self.module.params['name'])
         else:
-            ligs = self.oneview_client.logical_interconnect_groups.get_all(**self.facts_params)
+            ligs = self.get_all_resources(self.oneview_client.logical_interconnect_groups)
 
         return dict(changed=False, ansible_facts=dict(logical_interconnect_groups=ligs))
 
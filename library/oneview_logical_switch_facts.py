@@ -41,6 +41,7 @@ notes:
 
 extends_documentation_fragment:
     - oneview
+    - oneview.factsfields
     - oneview.factsparams
 '''
 
@@ -89,10 +90,12 @@ from ansible.module_utils.oneview import OneViewModuleBase
 
 
 class LogicalSwitchFactsModule(OneViewModuleBase):
+    RESOURCE_LIST_FACTS = ['logical_switches']
 
     def __init__(self):
         argument_spec = dict(
             name=dict(required=False, type='str'),
+            fields=dict(required=False, type='list'),
             params=dict(required=False, type='dict'),
         )
 
@@ -103,7 +106,7 @@ class LogicalSwitchFactsModule(OneViewModuleBase):
         if name:
             logical_switches = self.oneview_client.logical_switches.get_by('name', name)
         else:
-            logical_switches = self.oneview_client.logical_switches.get_all(**self.facts_params)
+            logical_switches = self.get_all_resources(self.oneview_client.logical_switches)
 
         return dict(changed=False, ansible_facts=dict(logical_switches=logical_switches))
 
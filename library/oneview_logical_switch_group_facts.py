@@ -41,6 +41,7 @@ notes:
 
 extends_documentation_fragment:
     - oneview
+    - oneview.factsfields
     - oneview.factsparams
 '''
 
@@ -92,8 +93,11 @@ from ansible.module_utils.oneview import OneViewModuleBase
 
 
 class LogicalSwitchGroupFactsModule(OneViewModuleBase):
+    RESOURCE_LIST_FACTS = ['logical_switch_groups']
+
     argument_spec = dict(
         name=dict(required=False, type='str'),
+        fields=dict(required=False, type='list'),
         params=dict(required=False, type='dict'),
     )
 
@@ -106,7 +110,7 @@ class LogicalSwitchGroupFactsModule(OneViewModuleBase):
         if self.module.params.get('name'):
             logical_switch_groups = self.resource_client.get_by('name', self.module.params['name'])
         else:
-            logical_switch_groups = self.resource_client.get_all(**self.facts_params)
+            logical_switch_groups = self.get_all_resources(self.resource_client)
 
         return dict(changed=False,
                     ansible_facts=dict(logical_switch_groups=logical_switch_groups))
@@ -56,6 +56,7 @@ options:
 
 extends_documentation_fragment:
     - oneview
+    - oneview.factsfields
 '''
 
 EXAMPLES = '''
@@ -144,9 +145,12 @@ from ansible.module_utils.oneview import OneViewModuleBase
 
 
 class ManagedSanFactsModule(OneViewModuleBase):
+    RESOURCE_LIST_FACTS = ['managed_sans']
+
     argument_spec = dict(
         name=dict(required=False, type='str'),
         options=dict(required=False, type='list'),
+        fields=dict(required=False, type='list'),
         params=dict(required=False, type='dict')
     )
 
@@ -170,7 +174,7 @@ class ManagedSanFactsModule(OneViewModuleBase):
                     facts['managed_san_endpoints'] = environmental_configuration
 
         else:
-            facts['managed_sans'] = self.resource_client.get_all(**self.facts_params)
+            facts['managed_sans'] = self.get_all_resources(self.resource_client)
 
         if self.options:
             if self.options.get('wwn'):
@@ -49,6 +49,7 @@ options:
 
 extends_documentation_fragment:
     - oneview
+    - oneview.factsfields
     - oneview.factsparams
 '''
 
@@ -133,9 +134,12 @@ from ansible.module_utils.oneview import OneViewModuleBase
 
 
 class NetworkSetFactsModule(OneViewModuleBase):
+    RESOURCE_LIST_FACTS = ['network_sets']
+
     argument_spec = dict(
         name=dict(type='str'),
         options=dict(type='list'),
+        fields=dict(required=False, type='list'),
         params=dict(type='dict'),
     )
 
@@ -152,7 +156,7 @@ class NetworkSetFactsModule(OneViewModuleBase):
         elif name:
             network_sets = self.oneview_client.network_sets.get_by('name', name)
         else:
-            network_sets = self.oneview_client.network_sets.get_all(**self.facts_params)
+            network_sets = self.get_all_resources(self.oneview_client.network_sets)
 
         return dict(changed=False,
                     ansible_facts=dict(network_sets=network_sets))
@@ -48,6 +48,7 @@ options:
 
 extends_documentation_fragment:
     - oneview
+    - oneview.factsfields
     - oneview.factsparams
 '''
 
@@ -117,9 +118,12 @@ from six import iteritems
 
 
 class OsDeploymentPlanFactsModule(OneViewModuleBase):
+    RESOURCE_LIST_FACTS = ['os_deployment_plans']
+
     argument_spec = {
         "name": {"required": False, "type": 'str'},
         "options": {"required": False, "type": 'list'},
+        "fields": {"required": False, "type": 'list'},
         "params": {"required": False, "type": 'dict'},
     }
 
@@ -136,7 +140,7 @@ class OsDeploymentPlanFactsModule(OneViewModuleBase):
                 ansible_facts.update(option_facts)
 
         else:
-            os_deployment_plans = self.oneview_client.os_deployment_plans.get_all(**self.facts_params)
+            os_deployment_plans = self.get_all_resources(self.oneview_client.os_deployment_plans)
 
         ansible_facts['os_deployment_plans'] = os_deployment_plans
 
@@ -88,7 +88,7 @@ os_deployment_server:
     type: dict
 '''
 
-from ansible.module_utils.oneview import OneViewModuleBase, OneViewModuleResourceNotFound, compare
+from ansible.module_utils.oneview import OneViewModuleBase, OneViewModuleResourceNotFound, NetworkIndex, compare
 
 
 class OsDeploymentServerModule(OneViewModuleBase):
@@ -163,19 +163,12 @@ class OsDeploymentServerModule(OneViewModuleBase):
             data['applianceUri'] = self.__get_appliance_by_name(appliance_name)
 
     def __get_network_uri_by_name(self, name):
-        ethernet_networks = self.oneview_client.ethernet_networks.get_by('name', name)
-        if ethernet_networks:
-            return ethernet_networks[0]['uri']
-
-        fc_networks = self.oneview_client.fc_networks.get_by('name', name)
-        if fc_networks:
-            return fc_networks[0]['uri']
-
-        fcoe_networks = self.oneview_client.fcoe_networks.get_by('name', name)
-        if not fcoe_networks:
+        categories = [NetworkIndex.ETHERNET_NETWORKS, NetworkIndex.FC_NETWORKS, NetworkIndex.FCOE_NETWORKS]
+        network_uri = NetworkIndex(self.oneview_client).get_uri(name, categories)
+        if not network_uri:
             raise OneViewModuleResourceNotFound(self.MSG_NETWORK_NOT_FOUND.format(name))
 
-        return fcoe_networks[0]['uri']
+        return network_uri
 
     def __get_appliance_by_name(self, name):
         appliance = self.oneview_client.os_deployment_servers.get_appliance_by_name(name)
@@ -59,6 +59,7 @@ notes:
 
 extends_documentation_fragment:
     - oneview
+    - oneview.factsfields
 '''
 
 EXAMPLES = '''
@@ -118,9 +119,12 @@ from ansible.module_utils.oneview import OneViewModuleBase
 
 
 class OsDeploymentServerFactsModule(OneViewModuleBase):
+    RESOURCE_LIST_FACTS = ['os_deployment_servers']
+
     argument_spec = dict(
         name=dict(required=False, type='str'),
         options=dict(required=False, type='list'),
+        fields=dict(required=False, type='list'),
         params=dict(required=False, type='dict'),
     )
 
@@ -134,7 +138,7 @@ class OsDeploymentServerFactsModule(OneViewModuleBase):
             os_deployment_servers = self.oneview_client.os_deployment_servers.get_by('name',
                                                                                      self.module.params['name'])
         else:
-            os_deployment_servers = self.oneview_client.os_deployment_servers.get_all(**self.facts_params)
+            os_deployment_servers = self.get_all_resources(self.oneview_client.os_deployment_servers)
 
         if self.options:
             ansible_facts = self.__gather_optional_facts(self.options)
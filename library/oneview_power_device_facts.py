@@ -54,6 +54,7 @@ options:
 
 extends_documentation_fragment:
     - oneview
+    - oneview.factsfields
 '''
 
 EXAMPLES = '''
@@ -137,9 +138,12 @@ from ansible.module_utils.oneview import OneViewModuleBase
 
 
 class PowerDeviceFactsModule(OneViewModuleBase):
+    RESOURCE_LIST_FACTS = ['power_devices']
+
     argument_spec = dict(
         name=dict(required=False, type='str'),
         options=dict(required=False, type='list'),
+        fields=dict(required=False, type='list'),
         params=dict(required=False, type='dict')
     )
 
@@ -156,7 +160,7 @@ class PowerDeviceFactsModule(OneViewModuleBase):
             if self.options and power_devices:
                 ansible_facts = self.gather_option_facts(self.options, power_devices[0])
         else:
-            power_devices = self.oneview_client.power_devices.get_all(**self.facts_params)
+            power_devices = self.get_all_resources(self.oneview_client.power_devices)
 
         ansible_facts["power_devices"] = power_devices
 
@@ -44,6 +44,7 @@ options:
 
 extends_documentation_fragment:
     - oneview
+    - oneview.factsfields
     - oneview.factsparams
 '''
 
@@ -97,9 +98,12 @@ from ansible.module_utils.oneview import OneViewModuleBase
 
 
 class RackFactsModule(OneViewModuleBase):
+    RESOURCE_LIST_FACTS = ['racks']
+
     argument_spec = dict(
         name=dict(required=False, type='str'),
         options=dict(required=False, type='list'),
+        fields=dict(required=False, type='list'),
         params=dict(required=False, type='dict')
     )
 
@@ -50,6 +50,7 @@ options:
            - C(sort): The sort order of the returned data set."
 extends_documentation_fragment:
     - oneview
+    - oneview.factsfields
 '''
 
 EXAMPLES = '''
@@ -92,8 +93,11 @@ from ansible.module_utils.oneview import OneViewModuleBase
 
 
 class SanManagerFactsModule(OneViewModuleBase):
+    RESOURCE_LIST_FACTS = ['san_managers']
+
     argument_spec = dict(
         provider_display_name=dict(type='str'),
+        fields=dict(required=False, type='list'),
         params=dict(type='dict')
     )
 
@@ -110,7 +114,7 @@ class SanManagerFactsModule(OneViewModuleBase):
             else:
                 resources = []
         else:
-            resources = self.oneview_client.san_managers.get_all(**self.facts_params)
+            resources = self.get_all_resources(self.oneview_client.san_managers)
 
         return dict(changed=False, ansible_facts=dict(san_managers=resources))
 
@@ -39,6 +39,7 @@ notes:
     - This resource is only available on HPE Synergy
 extends_documentation_fragment:
     - oneview
+    - oneview.factsfields
     - oneview.factsparams
 '''
 
@@ -82,8 +83,11 @@ from ansible.module_utils.oneview import OneViewModuleBase
 
 
 class SasInterconnectFactsModule(OneViewModuleBase):
+    RESOURCE_LIST_FACTS = ['sas_interconnects']
+
     argument_spec = dict(
         name=dict(required=False, type='str'),
+        fields=dict(required=False, type='list'),
         params=dict(required=False, type='dict'),
     )
 
@@ -98,7 +102,7 @@ class SasInterconnectFactsModule(OneViewModuleBase):
         if name:
             facts['sas_interconnects'] = self.resource_client.get_by('name', name)
         else:
-            facts['sas_interconnects'] = self.resource_client.get_all(**self.facts_params)
+            facts['sas_interconnects'] = self.get_all_resources(self.resource_client)
 
         return dict(ansible_facts=facts)
 
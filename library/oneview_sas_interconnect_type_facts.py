@@ -41,6 +41,7 @@ notes:
 
 extends_documentation_fragment:
     - oneview
+    - oneview.factsfields
     - oneview.factsparams
 '''
 
@@ -87,8 +88,11 @@ from ansible.module_utils.oneview import OneViewModuleBase
 
 
 class SasInterconnectTypeFactsModule(OneViewModuleBase):
+    RESOURCE_LIST_FACTS = ['sas_interconnect_types']
+
     argument_spec = dict(
         name=dict(required=False, type='str'),
+        fields=dict(required=False, type='list'),
         params=dict(required=False, type='dict'),
     )
 
@@ -99,7 +103,7 @@ class SasInterconnectTypeFactsModule(OneViewModuleBase):
         if self.module.params.get('name'):
             types = self.oneview_client.sas_interconnect_types.get_by('name', self.module.params.get('name'))
         else:
-            types = self.oneview_client.sas_interconnect_types.get_all(**self.facts_params)
+            types = self.get_all_resources(self.oneview_client.sas_interconnect_types)
 
         return dict(changed=False,
                     ansible_facts=dict(sas_interconnect_types=types))
@@ -50,6 +50,7 @@ notes:
 
 extends_documentation_fragment:
     - oneview
+    - oneview.factsfields
     - oneview.factsparams
 '''
 
@@ -115,10 +116,13 @@ from ansible.module_utils.oneview import OneViewModuleBase
 
 
 class SasLogicalInterconnectFactsModule(OneViewModuleBase):
+    RESOURCE_LIST_FACTS = ['sas_logical_interconnects']
+
     def __init__(self):
         argument_spec = dict(
             name=dict(required=False, type='str'),
             options=dict(required=False, type='list'),
+            fields=dict(required=False, type='list'),
             params=dict(required=False, type='dict')
         )
 
@@ -136,7 +140,7 @@ class SasLogicalInterconnectFactsModule(OneViewModuleBase):
                 options_facts = self.__gather_option_facts(sas_logical_interconnects[0])
                 ansible_facts.update(options_facts)
         else:
-            sas_logical_interconnects = self.resource_client.get_all(**self.facts_params)
+            sas_logical_interconnects = self.get_all_resources(self.resource_client)
 
         ansible_facts['sas_logical_interconnects'] = sas_logical_interconnects
 
@@ -41,6 +41,7 @@ notes:
 
 extends_documentation_fragment:
     - oneview
+    - oneview.factsfields
     - oneview.factsparams
 '''
 
@@ -97,8 +98,11 @@ from ansible.module_utils.oneview import OneViewModuleBase
 
 
 class SasLogicalInterconnectGroupFactsModule(OneViewModuleBase):
+    RESOURCE_LIST_FACTS = ['sas_logical_interconnect_groups']
+
     argument_spec = dict(
         name=dict(required=False, type='str'),
+        fields=dict(required=False, type='list'),
         params=dict(required=False, type='dict')
     )
 
@@ -110,7 +114,7 @@ class SasLogicalInterconnectGroupFactsModule(OneViewModuleBase):
             name = self.module.params['name']
             resources = self.oneview_client.sas_logical_interconnect_groups.get_by('name', name)
         else:
-            resources = self.oneview_client.sas_logical_interconnect_groups.get_all(**self.facts_params)
+            resources = self.get_all_resources(self.oneview_client.sas_logical_interconnect_groups)
 
         return dict(changed=False,
                     ansible_facts=dict(sas_logical_interconnect_groups=resources))
@@ -40,6 +40,7 @@ notes:
 
 extends_documentation_fragment:
     - oneview
+    - oneview.factsfields
     - oneview.factsparams
 '''
 
@@ -82,9 +83,12 @@ from ansible.module_utils.oneview import OneViewModuleBase
 
 
 class SasLogicalJbodAttachmentFactsModule(OneViewModuleBase):
+    RESOURCE_LIST_FACTS = ['sas_logical_jbod_attachments']
+
     def __init__(self):
         argument_spec = dict(
             name=dict(required=False, type='str'),
+            fields=dict(required=False, type='list'),
             params=dict(required=False, type='dict'),
         )
         super(SasLogicalJbodAttachmentFactsModule, self).__init__(additional_arg_spec=argument_spec)
@@ -94,7 +98,7 @@ class SasLogicalJbodAttachmentFactsModule(OneViewModuleBase):
             name = self.module.params['name']
             resources = self.oneview_client.sas_logical_jbod_attachments.get_by('name', name)
         else:
-            resources = self.oneview_client.sas_logical_jbod_attachments.get_all(**self.facts_params)
+            resources = self.get_all_resources(self.oneview_client.sas_logical_jbod_attachments)
 
         return dict(changed=False,
                     ansible_facts=dict(sas_logical_jbod_attachments=resources))
@@ -45,6 +45,7 @@ notes:
 
 extends_documentation_fragment:
     - oneview
+    - oneview.factsfields
     - oneview.factsparams
 '''
 
@@ -101,10 +102,13 @@ from ansible.module_utils.oneview import OneViewModuleBase
 
 
 class SasLogicalJbodFactsModule(OneViewModuleBase):
+    RESOURCE_LIST_FACTS = ['sas_logical_jbods']
+
     def __init__(self):
         argument_spec = dict(
             name=dict(required=False, type='str'),
             options=dict(required=False, type='list'),
+            fields=dict(required=False, type='list'),
             params=dict(required=False, type='dict'),
         )
         super(SasLogicalJbodFactsModule, self).__init__(additional_arg_spec=argument_spec)
@@ -119,7 +123,7 @@ class SasLogicalJbodFactsModule(OneViewModuleBase):
             if self.module.params.get('options') and sas_logical_jbods:
                 ansible_facts = self.__gather_optional_facts(self.module.params['options'], sas_logical_jbods[0])
         else:
-            sas_logical_jbods = self.oneview_client.sas_logical_jbods.get_all(**self.facts_params)
+            sas_logical_jbods = self.get_all_resources(self.oneview_client.sas_logical_jbods)
 
         ansible_facts['sas_logical_jbods'] = sas_logical_jbods
 
@@ -57,6 +57,7 @@ notes:
     - This resource is available for API version 300 or later.
 extends_documentation_fragment:
     - oneview
+    - oneview.factsfields
 '''
 
 EXAMPLES = '''
@@ -97,8 +98,11 @@ from ansible.module_utils.oneview import OneViewModuleBase
 
 
 class ScopeFactsModule(OneViewModuleBase):
+    RESOURCE_LIST_FACTS = ['scopes']
+
     argument_spec = dict(
         name=dict(required=False, type='str'),
+        fields=dict(required=False, type='list'),
         params=dict(required=False, type='dict')
     )
 
@@ -112,7 +116,7 @@ class ScopeFactsModule(OneViewModuleBase):
             scope = self.oneview_client.scopes.get_by_name(name)
             scopes = [scope] if scope else []
         else:
-            scopes = self.oneview_client.scopes.get_all(**self.facts_params)
+            scopes = self.get_all_resources(self.oneview_client.scopes)
 
         return dict(changed=False, ansible_facts=dict(scopes=scopes))
 
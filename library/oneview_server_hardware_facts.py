@@ -36,6 +36,12 @@ options:
       description:
         - Server Hardware name.
       required: false
+    names:
+      description:
+        - List of Server Hardware names. The resources are retrieved in a few filtered queries and the C(options) are
+          gathered for all of them in parallel, through the same session.
+        - The C(options) are also gathered for each Server Hardware matched by the C(filter) of the C(params).
+      required: false
     options:
       description:
         - "List with options to gather additional facts about Server Hardware related resources.
@@ -45,8 +51,11 @@ options:
 notes:
     - The options C(firmware) and C(firmwares) are only available for API version 300 or later.
     - The option C(physicalServerHardware) is only available for API version 500 or later on SDX enclosures.
+    - When gathering facts about many Server Hardware, a failure to gather an option does not fail the module. The
+      error message is returned in the C(errors) of the Server Hardware, by fact name.
 extends_documentation_fragment:
     - oneview
+    - oneview.factsfields
     - oneview.factsparams
 '''
 
@@ -72,6 +81,19 @@ EXAMPLES = '''
 - debug: msg="{{server_hardwares | map(attribute='name') | list }}"
 
 
+- name: Gather only the name, URI, status and power state of all Server Hardware
+  oneview_server_hardware_facts:
+    config: "{{ config }}"
+    fields:
+      - name
+      - uri
+      - status
+      - powerState
+  delegate_to: localhost
+
+- debug: var=server_hardwares
+
+
 - name: Gather facts about a Server Hardware by name
   oneview_server_hardware_facts:
     config: "{{ config }}"
@@ -130,6 +152,20 @@ EXAMPLES = '''
   delegate_to: localhost
 
 - debug: var=server_hardware_firmware
+
+- name: Gather the BIOS and firmware facts about many Server Hardware at once
+  oneview_server_hardware_facts:
+   config: "{{ config }}"
+   names:
+       - "0000A66102, bay 3"
+       - "0000A66102, bay 4"
+       - "0000A66102, bay 12"
+   options:
+       - bios
+       - firmware
+  delegate_to: localhost
+
+- debug: var=server_hardwares_by_name["0000A66102, bay 3"].server_hardware_firmware
 '''
 
 RETURN = '''
@@ -182,16 +218,29 @@ server_hardware_physical_server_hardware:
     description: Has all the facts describing an 'SDX' partition. Used with SDX enclosures only.
     returned: When requested, but can be null.
     type: dict
+
+server_hardwares_by_name:
+    description: Has the facts about each Server Hardware, by name. Each entry has the Server Hardware, in
+      C(server_hardware), the facts about the options requested, and the C(errors) of the options that failed.
+    returned: When names are informed, or when options are requested with a filter.
+    type: dict
 '''
 
-from ansible.module_utils.oneview import OneViewModuleBase
+from ansible.module_utils.oneview import OneViewModuleBase, get_by_names, run_concurrently
 
 
 class ServerHardwareFactsModule(OneViewModuleBase):
+    RESOURCE_LIST_FACTS = ['server_hardwares']
+
+    # Maximum number of options requested at a time
+    OPTIONS_MAX_WORKERS = 8
+
     def __init__(self):
         argument_spec = dict(
             name=dict(required=False, type='str'),
+            names=dict(required=False, type='list'),
             options=dict(required=False, type='list'),
+            fields=dict(required=False, type='list'),
             params=dict(required=False, type='dict')
         )
         super(ServerHardwareFactsModule, self).__init__(additional_arg_spec=argument_spec)
@@ -206,8 +255,15 @@ class ServerHardwareFactsModule(OneViewModuleBase):
             if self.options and server_hardwares:
                 ansible_facts = self.gather_option_facts(self.options, server_hardwares[0])
 
+        elif self.module.params.get('names'):
+            server_hardwares = get_by_names(self.oneview_client.server_hardware, self.module.params['names'])
+            ansible_facts['server_hardwares_by_name'] = self.__gather_facts_by_name(server_hardwares)
+
         else:
-            server_hardwares = self.oneview_client.server_hardware.get_all(**self.facts_params)
+            server_hardwares = self.get_all_resources(self.oneview_client.server_hardware)
+
+            if self.options and (self.module.params.get('params') or {}).get('filter'):
+                ansible_facts['server_hardwares_by_name'] = self.__gather_facts_by_name(server_hardwares)
 
         if self.options and self.options.get('firmwares'):
             ansible_facts['server_hardware_firmwares'] = self.get_all_firmwares(self.options)
@@ -217,32 +273,38 @@ class ServerHardwareFactsModule(OneViewModuleBase):
         return dict(changed=False, ansible_facts=ansible_facts)
 
     def gather_option_facts(self, options, server_hardware):
-        srv_hw_client = self.oneview_client.server_hardware
-        ansible_facts = {}
+        requested = self.__build_option_requests(options, server_hardware)
 
-        if options.get('bios'):
-            ansible_facts['server_hardware_bios'] = srv_hw_client.get_bios(server_hardware['uri'])
-        if options.get('environmentalConfig'):
-            ansible_facts['server_hardware_env_config'] = srv_hw_client.get_environmental_configuration(
-                server_hardware['uri'])
-        if options.get('javaRemoteConsoleUrl'):
-            ansible_facts['server_hardware_java_remote_console_url'] = srv_hw_client.get_java_remote_console_url(
-                server_hardware['uri'])
-        if options.get('iloSsoUrl'):
-            ansible_facts['server_hardware_ilo_sso_url'] = srv_hw_client.get_ilo_sso_url(server_hardware['uri'])
-        if options.get('physicalServerHardware'):
-            ansible_facts['server_hardware_physical_server_hardware'] = srv_hw_client.get_physical_server_hardware(
-                server_hardware['uri'])
-        if options.get('remoteConsoleUrl'):
-            ansible_facts['server_hardware_remote_console_url'] = srv_hw_client.get_remote_console_url(
-                server_hardware['uri'])
-        if options.get('utilization'):
-            ansible_facts['server_hardware_utilization'] = self.get_utilization(server_hardware,
-                                                                                options['utilization'])
-        if options.get('firmware'):
-            ansible_facts['server_hardware_firmware'] = srv_hw_client.get_firmware(server_hardware["uri"])
-
-        return ansible_facts
+        results = run_concurrently([request for fact_name, request in requested], self.OPTIONS_MAX_WORKERS)
+
+        return dict((fact_name, result) for (fact_name, request), result in zip(requested, results))
+
+    def __build_option_requests(self, options, server_hardware):
+        srv_hw_client = self.oneview_client.server_hardware
+        uri = server_hardware['uri']
+
+        # Each option is an independent GET on the server hardware, so they are requested at once
+        option_requests = [
+            ('bios', 'server_hardware_bios', lambda: srv_hw_client.get_bios(uri)),
+            ('environmentalConfig', 'server_hardware_env_config',
+             lambda: srv_hw_client.get_environmental_configuration(uri)),
+            ('javaRemoteConsoleUrl', 'server_hardware_java_remote_console_url',
+             lambda: srv_hw_client.get_java_remote_console_url(uri)),
+            ('iloSsoUrl', 'server_hardware_ilo_sso_url', lambda: srv_hw_client.get_ilo_sso_url(uri)),
+            ('physicalServerHardware', 'server_hardware_physical_server_hardware',
+             lambda: srv_hw_client.get_physical_server_hardware(uri)),
+            ('remoteConsoleUrl', 'server_hardware_remote_console_url',
+             lambda: srv_hw_client.get_remote_console_url(uri)),
+            ('utilization', 'server_hardware_utilization',
+             lambda: self.get_utilization(server_hardware, options['utilization'])),
+            ('firmware', 'server_hardware_firmware', lambda: srv_hw_client.get_firmware(uri)),
+        ]
+        return [(fact_name, request) for option, fact_name, request in option_requests if options.get(option)]
+
+    def __gather_facts_by_name(self, server_hardwares):
+        return self.gather_facts_by_name(server_hardwares,
+                                         lambda server_hardware: self.__build_option_requests(self.options, server_hardware),
+                                         'server_hardware')
 
     def get_all_firmwares(self, options):
         if isinstance(options['firmwares'], bool):
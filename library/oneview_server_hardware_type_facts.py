@@ -39,6 +39,7 @@ options:
 
 extends_documentation_fragment:
     - oneview
+    - oneview.factsfields
     - oneview.factsparams
 '''
 
@@ -79,9 +80,12 @@ from ansible.module_utils.oneview import OneViewModuleBase
 
 
 class ServerHardwareTypeFactsModule(OneViewModuleBase):
+    RESOURCE_LIST_FACTS = ['server_hardware_types']
+
     def __init__(self):
         argument_spec = dict(
             name=dict(required=False, type='str'),
+            fields=dict(required=False, type='list'),
             params=dict(required=False, type='dict')
         )
         super(ServerHardwareTypeFactsModule, self).__init__(additional_arg_spec=argument_spec)
@@ -93,7 +97,7 @@ class ServerHardwareTypeFactsModule(OneViewModuleBase):
         if name:
             server_hardware_types = self.oneview_client.server_hardware_types.get_by('name', name)
         else:
-            server_hardware_types = self.oneview_client.server_hardware_types.get_all(**self.facts_params)
+            server_hardware_types = self.get_all_resources(self.oneview_client.server_hardware_types)
 
         return dict(changed=False, ansible_facts=dict(server_hardware_types=server_hardware_types))
 
@@ -61,6 +61,19 @@ options:
         the Server Profile will have its Server Hardware unassigned.
     default: True
     choices: [True, False]
+  server_hardware_allocation:
+    description:
+      - Strategy used to pick the Server Hardware automatically assigned to the Server Profile, among the available
+        targets. C(spread) picks a Server Hardware based on a hash of the Server Profile name, so that profiles created
+        concurrently from the same template pick distinct Server Hardware. C(first) picks the first available one.
+    default: spread
+    choices: ['spread', 'first']
+  reservation_ledger:
+    description:
+      - Path to a ledger file used to reserve the Server Hardware automatically assigned by the module runs on the
+        same host. When set, concurrent runs do not pick a Server Hardware already reserved by another run. The
+        reservations are released when the Server Profile is created, or expire after 15 minutes.
+    required: False
   params:
     description:
       - Dict with query parameters.
@@ -82,6 +95,7 @@ notes:
 extends_documentation_fragment:
     - oneview
     - oneview.validateetag
+    - oneview.wait
 '''
 
 EXAMPLES = '''
@@ -138,6 +152,19 @@ EXAMPLES = '''
 - debug: var=compliance_preview
 - debug: var=created
 
+- name: Create Server Profiles from a template in parallel, reserving distinct Server Hardware on the delegate host
+  oneview_server_profile:
+    hostname: 172.16.101.48
+    username: administrator
+    password: my_password
+    api_version: 600
+    state: present
+    reservation_ledger: /tmp/oneview-server-hardware-reservations.json
+    data:
+        name: "{{ inventory_hostname }}"
+        server_template: Compute-node-template
+  delegate_to: localhost
+
 - name: Create a Server Profile with connections
   oneview_server_profile:
     hostname: 172.16.101.48
@@ -216,9 +243,17 @@ created:
     description: Indicates if the Server Profile was created.
     returned: On states 'present' and 'compliant'.
     type: bool
+task_uri:
+    description: URI of the task started when C(wait) is false.
+    returned: When C(wait) is false and a task was started.
+    type: str
+resource_uri:
+    description: URI of the resource associated with the task started when C(wait) is false.
+    returned: When C(wait) is false and a task was started. Can be null.
+    type: str
 '''
 
-import time
+import hashlib
 
 from copy import deepcopy
 
@@ -227,9 +262,11 @@ from ansible.module_utils.oneview import (OneViewModuleBase,
                                           OneViewModuleValueError,
                                           ServerProfileMerger,
                                           OneViewModuleTaskError,
-                                          SPKeys,
                                           OneViewModuleException,
-                                          compare)
+                                          ReservationLedger,
+                                          RetryScheduler,
+                                          compare,
+                                          remove_server_profile_inconsistent_data)
 
 
 class ServerProfileModule(OneViewModuleBase):
@@ -251,18 +288,31 @@ class ServerProfileModule(OneViewModuleBase):
     MSG_MAKE_COMPLIANT_NOT_SUPPORTED = "Update from template is not supported for server profile '{}' because it is" \
                                        " not associated with a server profile template."
 
+    MSG_POWERED_ON_UPDATE_ERROR = 'Some server profile attributes cannot be changed while the server hardware is powered on.'
+
     CONCURRENCY_FAILOVER_RETRIES = 25
 
+    # Collisions while assigning the server hardware are retried quickly at first, backing off under contention.
+    # At worst the 24 waits add up to about 173 seconds (0.05s doubling up to the 10s cap), below the 240 seconds
+    # of the former fixed 10s waits, and no attempt starts later than 180 seconds after the first one.
+    CONCURRENCY_FAILOVER_SCHEDULER = RetryScheduler(max_attempts=CONCURRENCY_FAILOVER_RETRIES, timeout=180)
+
+    # The update is retried while the server hardware is still reported as powered on after the power off
+    POWERED_OFF_UPDATE_SCHEDULER = RetryScheduler(max_attempts=10, timeout=60)
+
     argument_spec = dict(
         state=dict(choices=['present', 'absent', 'compliant'], default='present'),
         data=dict(type='dict', required=True),
         params=dict(type='dict', required=False),
-        auto_assign_server_hardware=dict(type='bool', default=True)
+        auto_assign_server_hardware=dict(type='bool', default=True),
+        server_hardware_allocation=dict(choices=['spread', 'first'], default='spread'),
+        reservation_ledger=dict(type='path', required=False)
     )
 
     def __init__(self):
         super(ServerProfileModule, self).__init__(additional_arg_spec=self.argument_spec,
-                                                  validate_etag_support=True)
+                                                  validate_etag_support=True,
+                                                  wait_support=True)
 
     def execute_module(self):
         self.auto_assign_server_hardware = self.module.params.get('auto_assign_server_hardware')
@@ -404,21 +454,21 @@ class ServerProfileModule(OneViewModuleBase):
         # the update, and in case of failure mentioning powering off the SH, a Power off on
         # the SH is attempted, followed by the update operation again and a Power On.
         try:
-            resource = self.oneview_client.server_profiles.update(profile_with_updates, profile_with_updates['uri'])
+            with self.asynchronous_tasks(self.oneview_client.server_profiles):
+                resource = self.oneview_client.server_profiles.update(profile_with_updates, profile_with_updates['uri'])
         except OneViewModuleException as exception:
             error_msg = '; '.join(str(e) for e in exception.args)
-            power_on_msg = 'Some server profile attributes cannot be changed while the server hardware is powered on.'
-            if power_on_msg in error_msg:
+            if self.MSG_POWERED_ON_UPDATE_ERROR in error_msg:
                 self.module.log("Update failed due to powered on Server Hardware. Powering off before retrying.")
-                time.sleep(10)  # sleep timer to avoid timing issues after update operation failed
 
                 # When reassigning Server Hardwares, both the original and the new SH should be set to OFF
                 self.__set_server_hardware_power_state(original_profile['serverHardwareUri'], 'Off')
                 self.__set_server_hardware_power_state(profile_with_updates['serverHardwareUri'], 'Off')
 
                 self.module.log("Retrying update operation after server power off")
-                resource = self.oneview_client.server_profiles.update(profile_with_updates,
-                                                                      profile_with_updates['uri'])
+                resource = self.POWERED_OFF_UPDATE_SCHEDULER.call(
+                    lambda: self.oneview_client.server_profiles.update(profile_with_updates, profile_with_updates['uri']),
+                    retry_if=self.__is_powered_on_error)
 
                 self.module.log("Powering on the server hardware after update")
                 self.__set_server_hardware_power_state(profile_with_updates['serverHardwareUri'], 'On')
@@ -426,13 +476,14 @@ class ServerProfileModule(OneViewModuleBase):
                 raise OneViewModuleException(error_msg)
         return resource
 
+    def __is_powered_on_error(self, exception):
+        return isinstance(exception, OneViewModuleException) and \
+            self.MSG_POWERED_ON_UPDATE_ERROR in '; '.join(str(e) for e in exception.args)
+
     def __create_profile(self, data, server_profile_template):
-        tries = 0
-        self.__remove_inconsistent_data(data)
-        while tries < self.CONCURRENCY_FAILOVER_RETRIES:
+        remove_server_profile_inconsistent_data(data)
+        for attempt in self.CONCURRENCY_FAILOVER_SCHEDULER.attempts():
             try:
-                tries += 1
-
                 server_hardware_uri = self._auto_assign_server_profile(data, server_profile_template)
 
                 if server_hardware_uri:
@@ -443,17 +494,18 @@ class ServerProfileModule(OneViewModuleBase):
                 server_profile = self.__build_new_profile_data(data, server_profile_template, server_hardware_uri)
 
                 self.module.log(msg="Request Server Profile creation")
-                return self.oneview_client.server_profiles.create(server_profile, **self.params)
+                with self.asynchronous_tasks(self.oneview_client.server_profiles):
+                    created_profile = self.oneview_client.server_profiles.create(server_profile, **self.params)
+
+                self.__release_server_hardware(data.get('name'))
+                return created_profile
 
             except OneViewModuleTaskError as task_error:
                 self.module.log("Error code: {} Message: {}".format(str(task_error.error_code), str(task_error.msg)))
-                if task_error.error_code in self.ASSIGN_HARDWARE_ERROR_CODES:
-                    # if this is because the server is already assigned, someone grabbed it before we assigned,
-                    # ignore and try again
-                    # This waiting time was chosen empirically and it could differ according to the hardware.
-                    time.sleep(10)
-                else:
+                if task_error.error_code not in self.ASSIGN_HARDWARE_ERROR_CODES:
                     raise task_error
+                # if this is because the server is already assigned, someone grabbed it before we assigned,
+                # ignore and try again after the scheduled backoff
 
         raise OneViewModuleException(self.MSG_ERROR_ALLOCATE_SERVER_HARDWARE)
 
@@ -475,42 +527,6 @@ class ServerProfileModule(OneViewModuleBase):
 
         return server_profile_data
 
-    def __remove_inconsistent_data(self, data):
-        def is_virtual_or_physical(defined_type):
-            return defined_type == 'Virtual' or defined_type == 'Physical'
-
-        # Remove the MAC from connections when MAC type is Virtual or Physical
-        mac_type = data.get(SPKeys.MAC_TYPE, None)
-        if mac_type and is_virtual_or_physical(mac_type):
-            for conn in data.get(SPKeys.CONNECTIONS) or []:
-                conn.pop(SPKeys.MAC, None)
-
-        # Remove the UUID when Serial Number Type is Virtual or Physical
-        serial_number_type = data.get(SPKeys.SERIAL_NUMBER_TYPE, None)
-        if serial_number_type and is_virtual_or_physical(serial_number_type):
-            data.pop(SPKeys.UUID, None)
-            data.pop(SPKeys.SERIAL_NUMBER, None)
-
-        # Remove the WWPN and WWNN when WWPN Type is Virtual or Physical
-        for conn in data.get(SPKeys.CONNECTIONS) or []:
-            wwpn_type = conn.get(SPKeys.WWPN_TYPE, None)
-            if is_virtual_or_physical(wwpn_type):
-                conn.pop(SPKeys.WWNN, None)
-                conn.pop(SPKeys.WWPN, None)
-
-        # Remove the driveNumber from the Controllers Drives
-        if SPKeys.LOCAL_STORAGE in data and data[SPKeys.LOCAL_STORAGE]:
-            for controller in data[SPKeys.LOCAL_STORAGE].get(SPKeys.CONTROLLERS) or []:
-                for drive in controller.get(SPKeys.LOGICAL_DRIVES) or []:
-                    drive.pop(SPKeys.DRIVE_NUMBER, None)
-
-        # Remove the Lun when Lun Type from SAN Storage Volume is Auto
-        if SPKeys.SAN in data and data[SPKeys.SAN]:
-            if SPKeys.VOLUMES in data[SPKeys.SAN]:
-                for volume in data[SPKeys.SAN].get(SPKeys.VOLUMES) or []:
-                    if volume.get(SPKeys.LUN_TYPE) == 'Auto':
-                        volume.pop(SPKeys.LUN, None)
-
     def __get_available_server_hardware_uri(self, server_profile, server_template):
 
         if server_template:
@@ -526,15 +542,39 @@ class ServerProfileModule(OneViewModuleBase):
             serverHardwareTypeUri=server_hardware_type)
 
         # targets will list empty bays. We need to pick one that has a server
-        index = 0
-        server_hardware_uri = None
-        while not server_hardware_uri and index < len(available_server_hardware['targets']):
-            server_hardware_uri = available_server_hardware['targets'][index]['serverHardwareUri']
-            index = index + 1
+        candidates = [target['serverHardwareUri'] for target in available_server_hardware['targets']
+                      if target['serverHardwareUri']]
+        server_hardware_uri = self.__select_server_hardware(candidates, server_profile.get('name'))
 
         self.module.log(msg="Found available server hardware: '{}'".format(server_hardware_uri))
         return server_hardware_uri
 
+    def __select_server_hardware(self, candidates, server_profile_name):
+        if not candidates:
+            return None
+
+        # Every run sees the same ring of candidates and starts from the position given by the profile name, so
+        # profiles created concurrently from the same template do not all compete for the first server hardware
+        if self.module.params.get('server_hardware_allocation') != 'first':
+            candidates = sorted(candidates)
+            digest = hashlib.sha256((server_profile_name or '').encode('utf-8')).hexdigest()
+            start = int(digest, 16) % len(candidates)
+            candidates = candidates[start:] + candidates[:start]
+
+        ledger_path = self.module.params.get('reservation_ledger')
+        if ledger_path:
+            reserved = ReservationLedger(ledger_path).reserve(candidates, server_profile_name)
+            if reserved:
+                return reserved
+            self.module.log(msg="All the available server hardware are reserved")
+
+        return candidates[0]
+
+    def __release_server_hardware(self, server_profile_name):
+        ledger_path = self.module.params.get('reservation_ledger')
+        if ledger_path:
+            ReservationLedger(ledger_path).release(server_profile_name)
+
     def __delete_profile(self, server_profile):
         if not server_profile:
             return False, self.MSG_ALREADY_ABSENT
@@ -0,0 +1,372 @@
+#!/usr/bin/python
+###
+# Copyright (2016-2017) Hewlett Packard Enterprise Development LP
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# You may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+###
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+ANSIBLE_METADATA = {'metadata_version': '1.1',
+                    'status': ['preview'],
+                    'supported_by': 'community'}
+
+DOCUMENTATION = '''
+---
+module: oneview_server_profile_bulk
+short_description: Manage many OneView Server Profile resources at once
+description:
+    - Creates, updates or removes a list of Server Profiles sharing a Server Profile Template in a single invocation.
+      The template, the Server Hardware available and the names referenced by the profiles are resolved once for
+      all of them, and the tasks started on OneView are tracked together, with a limit of tasks running at a time.
+version_added: "2.5"
+requirements:
+    - hpOneView >= 4.5.0
+author:
+    - "Priyanka Sood (@soodpr)"
+options:
+  state:
+    description:
+      - Indicates the desired state for the Server Profiles by the end of the playbook execution.
+        C(present) will ensure data properties are compliant with OneView. The Server Hardware assigned to new Server
+        Profiles is powered off before their creation.
+        C(absent) will remove the Server Profiles from OneView, if they exist.
+    default: present
+    choices: ['present', 'absent']
+  server_template:
+    description:
+      - Name of the Server Profile Template the new Server Profiles are created from.
+    required: False
+  profiles:
+    description:
+      - List with the properties of each Server Profile, as the data of the C(oneview_server_profile) module. The
+        C(name) is required.
+    required: true
+  auto_assign_server_hardware:
+    description:
+      - Bool indicating whether or not a distinct available Server Hardware should be assigned to each new Server
+        Profile without a serverHardwareName or serverHardwareUri.
+      - The new Server Profiles left without an available Server Hardware are reported as failed, and are not
+        created.
+    default: True
+    choices: [True, False]
+  max_concurrency:
+    description:
+      - Maximum number of tasks running on OneView at a time.
+    default: 10
+  timeout:
+    description:
+      - Maximum time, in seconds, to wait for the completion of all the tasks.
+    default: 3600
+  poll_interval:
+    description:
+      - Maximum time, in seconds, between the rounds of polling of the running tasks.
+    default: 5
+notes:
+    - "The names of the resources referenced by the profiles can be provided as in the C(oneview_server_profile)
+       module, e.g. enclosureGroupName, networkName (on the connections list) and serverHardwareName."
+    - "The module fails when any of the Server Profiles fails, after all of them were processed. The results of
+       every Server Profile are returned in both cases."
+
+extends_documentation_fragment:
+    - oneview
+'''
+
+EXAMPLES = '''
+- name: Create the Server Profiles of the compute nodes from a template
+  oneview_server_profile_bulk:
+    hostname: 172.16.101.48
+    username: administrator
+    password: my_password
+    api_version: 600
+    state: present
+    server_template: Compute-node-template
+    max_concurrency: 16
+    profiles:
+      - name: compute-node-01
+      - name: compute-node-02
+      - name: compute-node-03
+        serverHardwareName: "0000A66101, bay 3"
+  delegate_to: localhost
+- debug: var=server_profiles
+
+- name: Remove the Server Profiles of the compute nodes
+  oneview_server_profile_bulk:
+    hostname: 172.16.101.48
+    username: administrator
+    password: my_password
+    api_version: 600
+    state: absent
+    profiles:
+      - name: compute-node-01
+      - name: compute-node-02
+      - name: compute-node-03
+  delegate_to: localhost
+'''
+
+RETURN = '''
+server_profiles:
+    description: List with the result of each Server Profile, in the same order as the informed profiles. Each result
+      has the C(name), whether it C(changed), a C(msg), and the C(uri) of the Server Profile, plus the C(task_uri) and
+      C(task_state) of the task started for it, if any.
+    returned: Always.
+    type: list
+'''
+
+from collections import OrderedDict
+from copy import deepcopy
+
+from ansible.module_utils.oneview import (OneViewModuleBase,
+                                          OneViewModuleException,
+                                          OneViewModuleResourceNotFound,
+                                          RetryScheduler,
+                                          ServerProfileMerger,
+                                          ServerProfileReplaceNamesByUris,
+                                          compare,
+                                          get_by_names,
+                                          get_name_key,
+                                          remove_server_profile_inconsistent_data)
+
+
+class ServerProfileBulkModule(OneViewModuleBase):
+    MSG_CREATED = 'Server Profile created.'
+    MSG_UPDATED = 'Server profile updated'
+    MSG_ALREADY_PRESENT = 'Server Profile is already present.'
+    MSG_DELETED = 'Deleted profile'
+    MSG_ALREADY_ABSENT = 'Nothing do.'
+    MSG_TASK_FAILED = 'Task finished with state {0}: {1}'
+    MSG_TIMEOUT = 'Timed out waiting for the task.'
+    MSG_NOT_STARTED = 'Timed out before the task was started.'
+    MSG_NAME_REQUIRED = 'The name is required for all the profiles.'
+    MSG_TEMPLATE_NOT_FOUND = "Informed Server Profile Template '{}' not found"
+    MSG_HARDWARE_NOT_FOUND = "Informed Server Hardware '{}' not found"
+    MSG_NO_HARDWARE_AVAILABLE = 'No available Server Hardware left to assign to the Server Profile.'
+    MSG_COMPLETED = 'All the Server Profiles were processed.'
+    MSG_FAILED = 'The following Server Profiles failed: {0}'
+
+    TASK_PENDING_STATES = ['New', 'Starting', 'Pending', 'Running', 'Suspended', 'Stopping']
+    TASK_ERROR_STATES = ['Error', 'Terminated', 'Killed']
+
+    argument_spec = dict(
+        state=dict(choices=['present', 'absent'], default='present'),
+        server_template=dict(type='str', required=False),
+        profiles=dict(type='list', required=True),
+        auto_assign_server_hardware=dict(type='bool', default=True),
+        max_concurrency=dict(type='int', default=10),
+        timeout=dict(type='int', default=3600),
+        poll_interval=dict(type='int', default=5)
+    )
+
+    def __init__(self):
+        super(ServerProfileBulkModule, self).__init__(additional_arg_spec=self.argument_spec)
+        self.resource_client = self.oneview_client.server_profiles
+
+    def execute_module(self):
+        profiles = [deepcopy(profile) for profile in self.module.params['profiles']]
+        if not all(profile.get('name') for profile in profiles):
+            raise OneViewModuleException(self.MSG_NAME_REQUIRED)
+
+        existing_profiles = self.__get_by_names(self.oneview_client.server_profiles,
+                                                [profile['name'] for profile in profiles])
+
+        results = OrderedDict((profile['name'], dict(name=profile['name'], changed=False)) for profile in profiles)
+
+        if self.state == 'present':
+            jobs = self.__present(profiles, existing_profiles, results)
+        else:
+            jobs = self.__absent(profiles, existing_profiles, results)
+
+        self.__run_jobs(jobs, results)
+
+        results = list(results.values())
+        failed = [result['name'] for result in results if result.get('failed')]
+
+        return dict(changed=any(result['changed'] for result in results),
+                    failed=bool(failed),
+                    msg=self.MSG_FAILED.format(', '.join(failed)) if failed else self.MSG_COMPLETED,
+                    ansible_facts=dict(server_profiles=results))
+
+    def __present(self, profiles, existing_profiles, results):
+        replacer = ServerProfileReplaceNamesByUris()
+        server_template = self.__get_server_template()
+        self.__replace_server_hardware_names_by_uris(profiles)
+
+        jobs = []
+        new_profiles = []
+        for profile in profiles:
+            resource = existing_profiles.get(get_name_key(profile['name']))
+            replacer.replace(self.oneview_client, profile)
+
+            if not resource:
+                new_profiles.append(profile)
+                continue
+
+            merged_data = ServerProfileMerger().merge_data(resource, profile)
+            results[profile['name']]['uri'] = resource['uri']
+            if compare(resource, merged_data):
+                results[profile['name']]['msg'] = self.MSG_ALREADY_PRESENT
+            else:
+                jobs.append((profile['name'], self.MSG_UPDATED, self.oneview_client.server_profiles.update,
+                             (merged_data, resource['uri'])))
+
+        if new_profiles:
+            self.__assign_server_hardware(new_profiles, server_template, results)
+            self.__power_off_server_hardware(new_profiles, results)
+
+            new_profile_template = None
+            if server_template:
+                new_profile_template = self.oneview_client.server_profile_templates.get_new_profile(
+                    server_template['uri'])
+
+            for profile in new_profiles:
+                if results[profile['name']].get('failed'):
+                    continue
+                remove_server_profile_inconsistent_data(profile)
+                server_profile = deepcopy(new_profile_template) if new_profile_template else {}
+                server_profile.update(profile)
+                jobs.append((profile['name'], self.MSG_CREATED, self.oneview_client.server_profiles.create,
+                             (server_profile,)))
+
+        return jobs
+
+    def __absent(self, profiles, existing_profiles, results):
+        jobs = []
+        for profile in profiles:
+            resource = existing_profiles.get(get_name_key(profile['name']))
+            if not resource:
+                results[profile['name']]['msg'] = self.MSG_ALREADY_ABSENT
+            else:
+                results[profile['name']]['uri'] = resource['uri']
+                jobs.append((profile['name'], self.MSG_DELETED, self.oneview_client.server_profiles.delete,
+                             (resource,)))
+        return jobs
+
+    def __get_server_template(self):
+        server_template_name = self.module.params.get('server_template')
+        if not server_template_name:
+            return None
+
+        server_template = self.oneview_client.server_profile_templates.get_by_name(server_template_name)
+        if not server_template:
+            raise OneViewModuleResourceNotFound(self.MSG_TEMPLATE_NOT_FOUND.format(server_template_name))
+        return server_template
+
+    def __replace_server_hardware_names_by_uris(self, profiles):
+        names = [profile['serverHardwareName'] for profile in profiles if profile.get('serverHardwareName')]
+        server_hardware = self.__get_by_names(self.oneview_client.server_hardware, names)
+
+        for profile in profiles:
+            name = profile.pop('serverHardwareName', None)
+            if name:
+                if get_name_key(name) not in server_hardware:
+                    raise OneViewModuleResourceNotFound(self.MSG_HARDWARE_NOT_FOUND.format(name))
+                profile['serverHardwareUri'] = server_hardware[get_name_key(name)]['uri']
+
+    def __assign_server_hardware(self, profiles, server_template, results):
+        unassigned = [profile for profile in profiles if not profile.get('serverHardwareUri')]
+        if not unassigned or not self.module.params.get('auto_assign_server_hardware'):
+            return
+
+        source = server_template or unassigned[0]
+        available_targets = self.oneview_client.server_profiles.get_available_targets(
+            enclosureGroupUri=source.get('enclosureGroupUri', ''),
+            serverHardwareTypeUri=source.get('serverHardwareTypeUri', ''))
+
+        # Each new profile gets its own server hardware, so the creations do not collide with each other
+        taken = set(profile.get('serverHardwareUri') for profile in profiles)
+        candidates = [target['serverHardwareUri'] for target in available_targets['targets']
+                      if target['serverHardwareUri'] and target['serverHardwareUri'] not in taken]
+
+        for profile, server_hardware_uri in zip(unassigned, candidates):
+            profile['serverHardwareUri'] = server_hardware_uri
+        for profile in unassigned[len(candidates):]:
+            results[profile['name']].update(failed=True, msg=self.MSG_NO_HARDWARE_AVAILABLE)
+
+    def __power_off_server_hardware(self, profiles, results):
+        jobs = [(profile['name'], None, self.oneview_client.server_hardware.update_power_state,
+                 (dict(powerState='Off', powerControl='PressAndHold'), profile['serverHardwareUri']))
+                for profile in profiles if profile.get('serverHardwareUri')]
+
+        power_results = OrderedDict((name, dict(name=name, changed=False)) for name, msg, function, args in jobs)
+        self.__run_jobs(jobs, power_results)
+
+        for name, power_result in power_results.items():
+            if power_result.get('failed'):
+                results[name].update(failed=True, msg=power_result['msg'])
+
+    def __run_jobs(self, jobs, results):
+        """
+        Starts the tasks of the jobs, keeping at most max_concurrency running, and polls the running ones together
+        until all of them finish or the timeout expires.
+        """
+        pending_jobs = list(jobs)
+        running = OrderedDict()
+
+        scheduler = RetryScheduler(initial_delay=1,
+                                   max_delay=self.module.params['poll_interval'],
+                                   timeout=self.module.params['timeout'])
+
+        for attempt in scheduler.attempts():
+            while pending_jobs and len(running) < self.module.params['max_concurrency']:
+                name, msg, function, args = pending_jobs.pop(0)
+                self.__start_job(name, msg, function, args, running, results)
+
+            for name, (msg, task) in list(running.items()):
+                task = self.oneview_client.connection.get(task['uri'])
+                if task.get('taskState') not in self.TASK_PENDING_STATES:
+                    del running[name]
+                    self.__set_task_result(results[name], msg, task)
+
+            if not running and not pending_jobs:
+                return
+
+        for name in running:
+            results[name].update(failed=True, msg=self.MSG_TIMEOUT)
+        for name, msg, function, args in pending_jobs:
+            results[name].update(failed=True, msg=self.MSG_NOT_STARTED)
+
+    def __start_job(self, name, msg, function, args, running, results):
+        try:
+            task = self.start_task(function, *args)
+        except Exception as exception:
+            results[name].update(failed=True, msg='; '.join(str(e) for e in exception.args))
+            return
+
+        if task:
+            running[name] = (msg, task)
+        else:
+            results[name].update(changed=True, msg=msg)
+
+    def __set_task_result(self, result, msg, task):
+        result.update(task_uri=task.get('uri'), task_state=task.get('taskState'))
+
+        if task.get('taskState') in self.TASK_ERROR_STATES:
+            errors = [error.get('message') for error in task.get('taskErrors') or [] if error.get('message')]
+            result.update(failed=True, msg=self.MSG_TASK_FAILED.format(task.get('taskState'), '; '.join(errors)))
+        else:
+            result.update(changed=True, msg=msg)
+            associated_resource = task.get('associatedResource') or {}
+            if associated_resource.get('resourceUri'):
+                result['uri'] = associated_resource['resourceUri']
+
+    def __get_by_names(self, resource_client, names):
+        return dict((get_name_key(resource['name']), resource) for resource in get_by_names(resource_client, names))
+
+
+def main():
+    ServerProfileBulkModule().run()
+
+
+if __name__ == '__main__':
+    main()
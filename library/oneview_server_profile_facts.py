@@ -35,6 +35,12 @@ options:
     name:
       description:
         - Server Profile name.
+    names:
+      description:
+        - List of Server Profile names. The Server Profiles are retrieved in a few filtered queries and the C(options)
+          about each profile are gathered for all of them in parallel, through the same session.
+        - The C(options) about each profile are also gathered for each Server Profile matched by the C(filter) of the
+          C(params).
     uri:
       description:
         - Server Profile uri.
@@ -45,10 +51,14 @@ options:
           C(available_networks), C(available_servers), C(available_storage_system), C(available_storage_systems),
           C(available_targets), C(newProfileTemplate),"
         - "To gather facts about C(compliancePreview), C(messages), C(newProfileTemplate) and C(transformation)
-           a Server Profile name is required. Otherwise, these options will be ignored."
+           a Server Profile name, uri, names, or filter is required. Otherwise, these options will be ignored."
+notes:
+    - When gathering facts about many Server Profiles, a failure to gather an option does not fail the module. The
+      error message is returned in the C(errors) of the Server Profile, by fact name.
 
 extends_documentation_fragment:
     - oneview
+    - oneview.factsfields
     - oneview.factsparams
 '''
 
@@ -162,6 +172,21 @@ EXAMPLES = '''
 - debug: var=server_profile_available_storage_system
 - debug: var=server_profile_available_storage_systems
 - debug: var=server_profile_available_targets
+
+- name: Gather the compliance preview of many Server Profiles at once
+  oneview_server_profile_facts:
+    hostname: 172.16.101.48
+    username: administrator
+    password: my_password
+    api_version: 500
+    names:
+      - web-server-1
+      - web-server-2
+    options:
+      - compliancePreview
+  delegate_to: localhost
+
+- debug: var=server_profiles_by_name['web-server-1'].server_profile_compliance_preview
 '''
 
 RETURN = '''
@@ -237,16 +262,27 @@ server_profile_available_targets:
         the server profile.
     returned: When requested, but can be null.
     type: dict
+
+server_profiles_by_name:
+    description:
+        Has the facts about each Server Profile, by name. Each entry has the Server Profile, in C(server_profile),
+        the facts about the options requested for it, and the C(errors) of the options that failed.
+    returned: When names are informed, or when options are requested with a filter.
+    type: dict
 '''
 
-from ansible.module_utils.oneview import OneViewModuleBase
+from ansible.module_utils.oneview import OneViewModuleBase, get_by_names
 
 
 class ServerProfileFactsModule(OneViewModuleBase):
+    RESOURCE_LIST_FACTS = ['server_profiles']
+
     argument_spec = dict(
         name=dict(type='str'),
+        names=dict(type='list'),
         uri=dict(type='str'),
         options=dict(type='list'),
+        fields=dict(required=False, type='list'),
         params=dict(type='dict')
     )
 
@@ -268,11 +304,19 @@ class ServerProfileFactsModule(OneViewModuleBase):
             if server_profile:
                 server_profile_uri = server_profile['uri']
                 server_profiles.append(server_profile)
+        elif self.module.params.get('names'):
+            server_profiles = get_by_names(self.oneview_client.server_profiles, self.module.params['names'])
+            ansible_facts['server_profiles_by_name'] = self.gather_facts_by_name(
+                server_profiles, self.__build_profile_option_requests, 'server_profile')
         else:
-            server_profiles = self.oneview_client.server_profiles.get_all(**self.facts_params)
+            server_profiles = self.get_all_resources(self.oneview_client.server_profiles)
+
+            if self.options and (self.module.params.get('params') or {}).get('filter'):
+                ansible_facts['server_profiles_by_name'] = self.gather_facts_by_name(
+                    server_profiles, self.__build_profile_option_requests, 'server_profile')
 
         if self.options:
-            ansible_facts = self.__gather_option_facts(self.options, server_profile_uri)
+            ansible_facts.update(self.__gather_option_facts(self.options, server_profile_uri))
 
         ansible_facts["server_profiles"] = server_profiles
 
@@ -285,18 +329,8 @@ class ServerProfileFactsModule(OneViewModuleBase):
         facts = {}
 
         if profile_uri:
-            if options.get('messages'):  # Supported only for API version <= 500
-                facts['server_profile_messages'] = client.get_messages(profile_uri)
-
-            if options.get('transformation'):
-                transform_options = self.__get_sub_options(options['transformation'])
-                facts['server_profile_transformation'] = client.get_transformation(profile_uri, **transform_options)
-
-            if options.get('compliancePreview'):
-                facts['server_profile_compliance_preview'] = client.get_compliance_preview(profile_uri)
-
-            if options.get('newProfileTemplate'):
-                facts['server_profile_new_profile_template'] = client.get_new_profile_template(profile_uri)
+            for fact_name, request in self.__build_profile_option_requests(dict(uri=profile_uri)):
+                facts[fact_name] = request()
 
         if options.get('schema'):
             facts['server_profile_schema'] = client.get_schema()
@@ -327,6 +361,28 @@ class ServerProfileFactsModule(OneViewModuleBase):
 
         return facts
 
+    def __build_profile_option_requests(self, server_profile):
+        client = self.oneview_client.server_profiles
+        options = self.options
+        profile_uri = server_profile['uri']
+        requests = []
+
+        if options.get('messages'):  # Supported only for API version <= 500
+            requests.append(('server_profile_messages', lambda: client.get_messages(profile_uri)))
+
+        if options.get('transformation'):
+            transform_options = self.__get_sub_options(options['transformation'])
+            requests.append(('server_profile_transformation',
+                             lambda: client.get_transformation(profile_uri, **transform_options)))
+
+        if options.get('compliancePreview'):
+            requests.append(('server_profile_compliance_preview', lambda: client.get_compliance_preview(profile_uri)))
+
+        if options.get('newProfileTemplate'):
+            requests.append(('server_profile_new_profile_template', lambda: client.get_new_profile_template(profile_uri)))
+
+        return requests
+
     def __get_sub_options(self, option):
         return option if isinstance(option, dict) else {}
 
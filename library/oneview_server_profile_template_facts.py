@@ -47,6 +47,7 @@ notes:
     - The option C(available_networks) is only available for API version 600 or later.
 extends_documentation_fragment:
     - oneview
+    - oneview.factsfields
     - oneview.factsparams
 '''
 
@@ -136,9 +137,12 @@ from ansible.module_utils.oneview import OneViewModuleBase
 
 
 class ServerProfileTemplateFactsModule(OneViewModuleBase):
+    RESOURCE_LIST_FACTS = ['server_profile_templates']
+
     argument_spec = dict(
         name=dict(type='str'),
         options=dict(type='list'),
+        fields=dict(required=False, type='list'),
         params=dict(type='dict'),
         uri=dict(type='str')
     )
@@ -189,7 +193,7 @@ class ServerProfileTemplateFactsModule(OneViewModuleBase):
         return facts
 
     def __get_all(self):
-        templates = self.resource_client.get_all(**self.facts_params)
+        templates = self.get_all_resources(self.resource_client)
         return dict(server_profile_templates=templates)
 
 
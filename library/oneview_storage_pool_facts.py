@@ -46,6 +46,7 @@ options:
       required: false
 extends_documentation_fragment:
     - oneview
+    - oneview.factsfields
     - oneview.factsparams
 '''
 
@@ -123,9 +124,12 @@ from ansible.module_utils.oneview import OneViewModuleBase
 
 
 class StoragePoolFactsModule(OneViewModuleBase):
+    RESOURCE_LIST_FACTS = ['storage_pools']
+
     def __init__(self):
         argument_spec = dict(
             name=dict(required=False, type='str'),
+            fields=dict(required=False, type='list'),
             params=dict(required=False, type='dict'),
             options=dict(required=False, type='list')
         )
@@ -137,7 +141,7 @@ class StoragePoolFactsModule(OneViewModuleBase):
         if self.module.params.get('name'):
             storage_pool = self.oneview_client.storage_pools.get_by('name', self.module.params['name'])
         else:
-            storage_pool = self.oneview_client.storage_pools.get_all(**self.facts_params)
+            storage_pool = self.get_all_resources(self.oneview_client.storage_pools)
 
         facts['storage_pools'] = storage_pool
         self.__get_options(facts)
@@ -50,6 +50,7 @@ options:
             either the argument C(name), C(ip_hostname), or C(hostname). Otherwise, this option will be ignored."
 extends_documentation_fragment:
     - oneview
+    - oneview.factsfields
     - oneview.factsparams
 '''
 
@@ -191,10 +192,13 @@ from ansible.module_utils.oneview import OneViewModuleBase
 
 
 class StorageSystemFactsModule(OneViewModuleBase):
+    RESOURCE_LIST_FACTS = ['storage_systems']
+
     def __init__(self):
         argument_spec = dict(
             name=dict(type='str'),
             options=dict(type='list'),
+            fields=dict(required=False, type='list'),
             params=dict(type='dict'),
             storage_hostname=dict(type='str')
         )
@@ -216,7 +220,7 @@ class StorageSystemFactsModule(OneViewModuleBase):
         elif self.module.params.get('name'):
             storage_systems = self.oneview_client.storage_systems.get_by_name(self.module.params['name'])
         else:
-            storage_systems = self.oneview_client.storage_systems.get_all(**self.facts_params)
+            storage_systems = self.get_all_resources(self.oneview_client.storage_systems)
             is_specific_storage_system = False
 
         self.__get_options(facts, storage_systems, is_specific_storage_system)
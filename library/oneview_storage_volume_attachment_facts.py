@@ -60,6 +60,7 @@ options:
       required: false
 extends_documentation_fragment:
     - oneview
+    - oneview.factsfields
     - oneview.factsparams
 '''
 
@@ -159,6 +160,8 @@ SPECIFIC_ATTACHMENT_OPTIONS = ['storageVolumeAttachmentUri', 'storageVolumeUri',
 
 
 class StorageVolumeAttachmentFactsModule(OneViewModuleBase):
+    RESOURCE_LIST_FACTS = ['storage_volume_attachments']
+
     ATTACHMENT_KEY_REQUIRED = "Server Profile Name and Volume Name or Volume Uri are required."
 
     def __init__(self):
@@ -168,6 +171,7 @@ class StorageVolumeAttachmentFactsModule(OneViewModuleBase):
             storageVolumeUri=dict(required=False, type='str'),
             storageVolumeName=dict(required=False, type='str'),
             options=dict(required=False, type='list'),
+            fields=dict(required=False, type='list'),
             params=dict(required=False, type='dict'),
         )
         super(StorageVolumeAttachmentFactsModule, self).__init__(additional_arg_spec=argument_spec)
@@ -187,7 +191,7 @@ class StorageVolumeAttachmentFactsModule(OneViewModuleBase):
             attachments = self.__get_specific_attachment(params)
             self.__get_paths(attachments, self.options, facts)
         else:
-            attachments = client.get_all(**self.facts_params)
+            attachments = self.get_all_resources(client)
 
         facts['storage_volume_attachments'] = attachments
 
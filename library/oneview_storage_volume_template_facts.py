@@ -43,6 +43,7 @@ options:
       required: false
 extends_documentation_fragment:
     - oneview
+    - oneview.factsfields
     - oneview.factsparams
 '''
 
@@ -145,10 +146,13 @@ from ansible.module_utils.oneview import OneViewModuleBase
 
 
 class StorageVolumeTemplateFactsModule(OneViewModuleBase):
+    RESOURCE_LIST_FACTS = ['storage_volume_templates']
+
     def __init__(self):
         argument_spec = dict(
             name=dict(required=False, type='str'),
             options=dict(required=False, type='list'),
+            fields=dict(required=False, type='list'),
             params=dict(required=False, type='dict'),
         )
         super(StorageVolumeTemplateFactsModule, self).__init__(additional_arg_spec=argument_spec)
@@ -164,7 +168,7 @@ class StorageVolumeTemplateFactsModule(OneViewModuleBase):
                 ansible_facts['compatible_systems'] = self.resource_client.get_compatible_systems(
                     storage_volume_templates[0]['uri'])
         else:
-            storage_volume_templates = self.resource_client.get_all(**self.facts_params)
+            storage_volume_templates = self.get_all_resources(self.resource_client)
 
         ansible_facts['storage_volume_templates'] = storage_volume_templates
 
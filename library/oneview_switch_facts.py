@@ -47,6 +47,7 @@ notes:
 
 extends_documentation_fragment:
     - oneview
+    - oneview.factsfields
     - oneview.factsparams
 '''
 
@@ -105,11 +106,13 @@ from ansible.module_utils.oneview import OneViewModuleBase
 
 
 class SwitchFactsModule(OneViewModuleBase):
+    RESOURCE_LIST_FACTS = ['switches']
 
     def __init__(self):
         argument_spec = dict(
             name=dict(required=False, type='str'),
             options=dict(required=False, type='list'),
+            fields=dict(required=False, type='list'),
             params=dict(required=False, type='dict'),
         )
 
@@ -128,7 +131,7 @@ class SwitchFactsModule(OneViewModuleBase):
                 environmental_configuration = self.resource_client.get_environmental_configuration(id_or_uri=uri)
                 facts['switch_environmental_configuration'] = environmental_configuration
         else:
-            facts['switches'] = self.resource_client.get_all(**self.facts_params)
+            facts['switches'] = self.get_all_resources(self.resource_client)
 
         return dict(changed=False, ansible_facts=facts)
 
@@ -39,6 +39,7 @@ options:
 
 extends_documentation_fragment:
     - oneview
+    - oneview.factsfields
     - oneview.factsparams
 '''
 
@@ -88,9 +89,12 @@ from ansible.module_utils.oneview import OneViewModuleBase
 
 
 class SwitchTypeFactsModule(OneViewModuleBase):
+    RESOURCE_LIST_FACTS = ['switch_types']
+
     def __init__(self):
         argument_spec = dict(
             name=dict(required=False, type='str'),
+            fields=dict(required=False, type='list'),
             params=dict(required=False, type='dict'),
         )
         super(SwitchTypeFactsModule, self).__init__(additional_arg_spec=argument_spec)
@@ -99,7 +103,7 @@ class SwitchTypeFactsModule(OneViewModuleBase):
         if self.module.params['name']:
             switch_types = self.oneview_client.switch_types.get_by('name', self.module.params['name'])
         else:
-            switch_types = self.oneview_client.switch_types.get_all(**self.facts_params)
+            switch_types = self.get_all_resources(self.oneview_client.switch_types)
 
         return dict(changed=False, ansible_facts=dict(switch_types=switch_types))
 
@@ -34,10 +34,14 @@ options:
       description:
         - "List with parameters to help filter the tasks.
           Params allowed: C(count), C(fields), C(filter), C(query), C(sort), C(start), and C(view)."
+        - "C(page_size) requests the tasks in pages of this size, keeping only the selected ones in memory.
+          C(match) selects the tasks by the value of their attributes, nested attributes are referenced by dotted
+          paths."
       required: false
 
 extends_documentation_fragment:
     - oneview
+    - oneview.factsfields
 '''
 
 EXAMPLES = '''
@@ -62,6 +66,20 @@ EXAMPLES = '''
       count: 2
       filter: "associatedResource.resourceCategory='server-profile-templates'"
 
+- debug: var=tasks
+
+- name: Gather facts about the failed tasks of Server Hardware, requesting 500 tasks at a time
+  oneview_task_facts:
+    hostname: 172.16.101.48
+    username: administrator
+    password: my_password
+    api_version: 600
+    params:
+      page_size: 500
+      filter: "taskState='Error'"
+      match:
+        associatedResource.resourceCategory: server-hardware
+
 - debug: var=tasks
 '''
 
@@ -76,8 +94,11 @@ from ansible.module_utils.oneview import OneViewModuleBase
 
 
 class TaskFactsModule(OneViewModuleBase):
+    RESOURCE_LIST_FACTS = ['tasks']
+
     def __init__(self):
         argument_spec = dict(
+            fields=dict(required=False, type='list'),
             params=dict(required=False, type='dict')
         )
         super(TaskFactsModule, self).__init__(additional_arg_spec=argument_spec)
@@ -85,7 +106,7 @@ class TaskFactsModule(OneViewModuleBase):
         self.resource_client = self.oneview_client.tasks
 
     def execute_module(self):
-        facts = self.resource_client.get_all(**self.facts_params)
+        facts = self.get_all_resources(self.resource_client)
 
         return dict(changed=False, ansible_facts=dict(tasks=facts))
 
@@ -0,0 +1,159 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+###
+# Copyright (2016-2017) Hewlett Packard Enterprise Development LP
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# You may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+###
+ANSIBLE_METADATA = {'status': ['stableinterface'],
+                    'supported_by': 'community',
+                    'metadata_version': '1.1'}
+
+DOCUMENTATION = '''
+module: oneview_task_wait
+short_description: Wait for the completion of OneView Tasks.
+description:
+    - Wait for the completion of a list of OneView Tasks, usually started by modules executed with C(wait) false.
+      The pending tasks are polled together until all of them finish or the timeout expires.
+version_added: "2.5"
+requirements:
+    - "python >= 2.7.9"
+    - "hpOneView >= 2.0.1"
+author: "Priyanka Sood (@soodpr)"
+options:
+    task_uris:
+      description:
+        - List with the URIs of the tasks to wait for.
+      required: true
+    timeout:
+      description:
+        - Maximum time, in seconds, to wait for the completion of all the tasks.
+      default: 3600
+    poll_interval:
+      description:
+        - Time, in seconds, between the rounds of polling of the pending tasks.
+      default: 5
+    fail_on_error:
+      description:
+        - When true, the module fails if any of the tasks finishes in the C(Error), C(Terminated), or C(Killed)
+          states.
+      default: true
+      type: bool
+
+extends_documentation_fragment:
+    - oneview
+'''
+
+EXAMPLES = '''
+- name: Start the refresh of two enclosures without waiting for their completion
+  oneview_enclosure:
+    hostname: 172.16.101.48
+    username: administrator
+    password: my_password
+    api_version: 600
+    state: refreshed
+    wait: false
+    data:
+      name: "{{ item }}"
+      refreshState: Refreshing
+  with_items:
+    - Encl1
+    - Encl2
+  register: enclosure_refresh
+
+- name: Wait for the refresh of the enclosures
+  oneview_task_wait:
+    hostname: 172.16.101.48
+    username: administrator
+    password: my_password
+    api_version: 600
+    task_uris: "{{ enclosure_refresh.results | map(attribute='task_uri') | list }}"
+    timeout: 1800
+  delegate_to: localhost
+
+- debug: var=tasks
+'''
+
+RETURN = '''
+tasks:
+    description: Has all the OneView facts about the Tasks, in the same order as the informed URIs.
+    returned: Always.
+    type: list
+'''
+
+import time
+
+from ansible.module_utils.oneview import OneViewModuleBase, OneViewModuleException
+
+
+class TaskWaitModule(OneViewModuleBase):
+    MSG_COMPLETED = 'All the tasks finished.'
+    MSG_TIMEOUT = 'Timed out waiting for the tasks: {0}'
+    MSG_TASK_ERROR = 'The tasks finished with errors: {0}'
+
+    TASK_PENDING_STATES = ['New', 'Starting', 'Pending', 'Running', 'Suspended', 'Stopping']
+    TASK_ERROR_STATES = ['Error', 'Terminated', 'Killed']
+
+    def __init__(self):
+        argument_spec = dict(
+            task_uris=dict(required=True, type='list'),
+            timeout=dict(type='int', default=3600),
+            poll_interval=dict(type='int', default=5),
+            fail_on_error=dict(type='bool', default=True)
+        )
+        super(TaskWaitModule, self).__init__(additional_arg_spec=argument_spec)
+
+    def execute_module(self):
+        task_uris = self.module.params['task_uris']
+        poll_interval = self.module.params['poll_interval']
+        deadline = time.time() + self.module.params['timeout']
+
+        tasks = dict()
+        pending = list(task_uris)
+        while True:
+            pending = self.__poll(pending, tasks)
+            remaining = deadline - time.time()
+            if not pending or remaining <= 0:
+                break
+            time.sleep(min(poll_interval, remaining))
+
+        if pending:
+            raise OneViewModuleException(self.MSG_TIMEOUT.format(', '.join(pending)))
+
+        failed = [uri for uri in task_uris if tasks[uri].get('taskState') in self.TASK_ERROR_STATES]
+        if failed and self.module.params['fail_on_error']:
+            raise OneViewModuleException(self.MSG_TASK_ERROR.format(', '.join(failed)))
+
+        return dict(changed=False,
+                    msg=self.MSG_COMPLETED,
+                    ansible_facts=dict(tasks=[tasks[uri] for uri in task_uris]))
+
+    def __poll(self, task_uris, tasks):
+        pending = []
+        for task_uri in task_uris:
+            if task_uri in tasks:
+                continue
+            task = self.oneview_client.connection.get(task_uri)
+            if task.get('taskState') in self.TASK_PENDING_STATES:
+                pending.append(task_uri)
+            else:
+                tasks[task_uri] = task
+        return pending
+
+
+def main():
+    TaskWaitModule().run()
+
+
+if __name__ == '__main__':
+    main()
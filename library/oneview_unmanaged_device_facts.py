@@ -44,6 +44,7 @@ options:
 
 extends_documentation_fragment:
     - oneview
+    - oneview.factsfields
     - oneview.factsparams
 '''
 
@@ -98,9 +99,12 @@ from ansible.module_utils.oneview import OneViewModuleBase
 
 
 class UnmanagedDeviceFactsModule(OneViewModuleBase):
+    RESOURCE_LIST_FACTS = ['unmanaged_devices']
+
     argument_spec = dict(
         name=dict(required=False, type='str'),
         options=dict(required=False, type="list"),
+        fields=dict(required=False, type='list'),
         params=dict(required=False, type='dict'),
     )
 
@@ -119,7 +123,7 @@ class UnmanagedDeviceFactsModule(OneViewModuleBase):
             if environmental_configuration is not None:
                 facts["unmanaged_device_environmental_configuration"] = environmental_configuration
         else:
-            unmanaged_devices = self.resource_client.get_all(**self.facts_params)
+            unmanaged_devices = self.get_all_resources(self.resource_client)
 
         facts["unmanaged_devices"] = unmanaged_devices
         return dict(ansible_facts=facts)
@@ -38,6 +38,7 @@ options:
 
 extends_documentation_fragment:
     - oneview
+    - oneview.factsfields
     - oneview.factsparams
 '''
 
@@ -86,9 +87,12 @@ from ansible.module_utils.oneview import OneViewModuleBase, OneViewModuleResourc
 
 
 class UplinkSetFactsModule(OneViewModuleBase):
+    RESOURCE_LIST_FACTS = ['uplink_sets']
+
     def __init__(self):
         argument_spec = dict(
             name=dict(required=False, type='str'),
+            fields=dict(required=False, type='list'),
             params=dict(required=False, type='dict'),
         )
         super(UplinkSetFactsModule, self).__init__(additional_arg_spec=argument_spec)
@@ -97,7 +101,7 @@ class UplinkSetFactsModule(OneViewModuleBase):
         if self.module.params['name']:
             resources = self.oneview_client.uplink_sets.get_by('name', self.module.params['name'])
         else:
-            resources = self.oneview_client.uplink_sets.get_all(**self.facts_params)
+            resources = self.get_all_resources(self.oneview_client.uplink_sets)
 
         return dict(changed=False,
                     ansible_facts=dict(uplink_sets=resources))
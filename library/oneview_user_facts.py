@@ -40,6 +40,7 @@ options:
 
 extends_documentation_fragment:
     - oneview
+    - oneview.factsfields
     - oneview.factsparams
 '''
 
@@ -80,10 +81,13 @@ from ansible.module_utils.oneview import OneViewModuleBase
 
 
 class UserFactsModule(OneViewModuleBase):
+    RESOURCE_LIST_FACTS = ['users']
+
     def __init__(self):
 
         argument_spec = dict(
             name=dict(required=False, type='str'),
+            fields=dict(required=False, type='list'),
             params=dict(required=False, type='dict')
         )
 
@@ -94,7 +98,7 @@ class UserFactsModule(OneViewModuleBase):
         if self.module.params['name']:
             users = self.oneview_client.users.get_by('name', self.module.params['name'])
         else:
-            users = self.oneview_client.users.get_all(**self.facts_params)
+            users = self.get_all_resources(self.oneview_client.users)
 
         return dict(changed=False, ansible_facts=dict(users=users))
 
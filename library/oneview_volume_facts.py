@@ -46,6 +46,7 @@ options:
       required: false
 extends_documentation_fragment:
     - oneview
+    - oneview.factsfields
     - oneview.factsparams
 '''
 
@@ -134,8 +135,11 @@ from ansible.module_utils.oneview import OneViewModuleBase
 
 
 class VolumeFactsModule(OneViewModuleBase):
+    RESOURCE_LIST_FACTS = ['storage_volumes']
+
     def __init__(self):
-        argument_spec = dict(name=dict(type='str'), options=dict(type='list'), params=dict(type='dict'))
+        argument_spec = dict(name=dict(type='str'), options=dict(type='list'), params=dict(type='dict'),
+                             fields=dict(type='list'))
         super(VolumeFactsModule, self).__init__(additional_arg_spec=argument_spec)
         self.resource_client = self.oneview_client.volumes
 
@@ -146,7 +150,7 @@ class VolumeFactsModule(OneViewModuleBase):
             ansible_facts['storage_volumes'] = self.resource_client.get_by('name', self.module.params['name'])
             ansible_facts.update(self._gather_facts_about_one_volume(ansible_facts['storage_volumes']))
         else:
-            ansible_facts['storage_volumes'] = self.resource_client.get_all(**self.facts_params)
+            ansible_facts['storage_volumes'] = self.get_all_resources(self.resource_client)
 
         if networks:
             self.facts_params['networks'] = networks
@@ -0,0 +1,64 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+###
+# Copyright (2016-2017) Hewlett Packard Enterprise Development LP
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# You may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+###
+
+"""
+Microbenchmark of the resource comparison used by the idempotency checks.
+
+Run from the repository root:
+    PYTHONPATH=test:library python test/benchmark_compare.py
+"""
+
+from __future__ import print_function
+
+import json
+import timeit
+
+from copy import deepcopy
+from hpe_test_utils import build_enclosure, build_server_profile
+from oneview_module_loader import compare
+
+
+def _measure(first_resource, second_resource, repeat=5, number=10):
+    timer = timeit.Timer(lambda: compare(first_resource, second_resource))
+    return min(timer.repeat(repeat=repeat, number=number)) / number * 1000
+
+
+def main():
+    scenarios = []
+
+    profile = build_server_profile(connections=250, volumes=100, custom_attributes=200)
+    scenarios.append(('server profile, same object', profile, profile))
+    scenarios.append(('server profile, equal copy', profile, deepcopy(profile)))
+    changed_profile = deepcopy(profile)
+    changed_profile['connections'][-1]['requestedMbps'] = 5000
+    scenarios.append(('server profile, one change', profile, changed_profile))
+
+    enclosure = build_enclosure(device_bays=12, interconnect_bays=6)
+    scenarios.append(('enclosure, equal copy', enclosure, deepcopy(enclosure)))
+    changed_enclosure = deepcopy(enclosure)
+    changed_enclosure['deviceBays'][-1]['powerAllocationWatts'] = 400
+    scenarios.append(('enclosure, one change', enclosure, changed_enclosure))
+
+    print('{0:<32} {1:>10} {2:>12}'.format('scenario', 'size (KB)', 'time (ms)'))
+    for description, first_resource, second_resource in scenarios:
+        size = len(json.dumps(first_resource)) / 1024.0
+        print('{0:<32} {1:>10.0f} {2:>12.3f}'.format(description, size, _measure(first_resource, second_resource)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+###
+# Copyright (2016-2017) Hewlett Packard Enterprise Development LP
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# You may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+###
+
+"""
+Microbenchmark of the output of the facts modules with and without the fields projection.
+
+Run from the repository root:
+    PYTHONPATH=test:library python test/benchmark_fields.py
+"""
+
+from __future__ import print_function
+
+import json
+import timeit
+
+from hpe_test_utils import build_enclosure, build_server_profile
+from oneview_module_loader import build_fields_projection
+
+
+def _measure(resources, fields, repeat=5, number=3):
+    projection = build_fields_projection(fields) if fields else None
+
+    def serialize():
+        facts = [projection(resource) for resource in resources] if projection else resources
+        return json.dumps(dict(ansible_facts=dict(resources=facts)))
+
+    timer = timeit.Timer(serialize)
+    elapsed = min(timer.repeat(repeat=repeat, number=number)) / number * 1000
+    return len(serialize()) / 1024.0, elapsed
+
+
+def main():
+    profiles = [build_server_profile(connections=16, volumes=8, custom_attributes=20) for _ in range(500)]
+    enclosures = [build_enclosure() for _ in range(100)]
+
+    scenarios = [
+        ('500 server profiles', profiles, None),
+        ('500 server profiles, 3 fields', profiles, ['name', 'uri', 'status']),
+        ('500 server profiles, nested fields', profiles, ['name', 'uri', 'connections.id', 'connections.mac']),
+        ('100 enclosures', enclosures, None),
+        ('100 enclosures, 3 fields', enclosures, ['name', 'uri', 'status']),
+    ]
+
+    print('{0:<38} {1:>12} {2:>12}'.format('scenario', 'output (KB)', 'time (ms)'))
+    for description, resources, fields in scenarios:
+        size, elapsed = _measure(resources, fields)
+        print('{0:<38} {1:>12.0f} {2:>12.3f}'.format(description, size, elapsed))
+
+
+if __name__ == '__main__':
+    main()
@@ -33,5 +33,6 @@ def mock_ansible_module():
     patcher_ansible = patch(ONEVIEW_MODULE_UTILS_PATH + '.AnsibleModule')
     patcher_ansible = patcher_ansible.start()
     ansible_module = Mock()
+    ansible_module._socket_path = None
     patcher_ansible.return_value = ansible_module
     return ansible_module
@@ -16,11 +16,15 @@
 # limitations under the License.
 ###
 
+import hashlib
 import importlib
+import json
 import pytest
 import re
+import threading
 import yaml
 
+from ansible.module_utils.six.moves import BaseHTTPServer, http_client, socketserver
 from mock import mock
 
 
@@ -113,3 +117,254 @@ class ImageStreamerBaseTest(OneViewBaseTest):
 
 class ImageStreamerBaseFactsTest(ImageStreamerBaseTest, OneViewBaseFactsTest):
     pass
+
+
+class LocalHttpServer(object):
+    """
+    HTTP stand-in for the appliance, served by a thread on the loopback interface, to exercise the file transfers.
+
+    The GET requests are answered with the contents in files, by path, honoring the Range and If-Range headers unless
+    serve_ranges is False. Each count in drops cuts the body of the next response after that many bytes, or does not
+    when it is None. The paths in redirects are answered with a redirect to their location. The files posted in
+    multipart requests are kept in uploads, by path, and answered with upload_response. The requests received are
+    kept in requests.
+    """
+
+    def __init__(self):
+        self.files = {}
+        self.drops = []
+        self.serve_ranges = True
+        self.redirects = {}
+        self.uploads = {}
+        self.upload_response = (200, {}, {})
+        self.requests = []
+
+    def __enter__(self):
+        server = self
+
+        class Handler(BaseHTTPServer.BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                server._get(self)
+
+            def do_POST(self):
+                server._post(self)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = _ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        thread = threading.Thread(target=self.httpd.serve_forever, kwargs=dict(poll_interval=0.01))
+        thread.daemon = True
+        thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def connection(self):
+        return LocalConnection(self.httpd.server_address[1])
+
+    def etag(self, path):
+        return '"{0}"'.format(hashlib.sha256(self.files[path]).hexdigest()[:16])
+
+    def _get(self, handler):
+        self.requests.append(('GET', handler.path, dict(handler.headers.items())))
+
+        if handler.path in self.redirects:
+            return self._respond(handler, 302, {'Location': self.redirects[handler.path]}, b'')
+
+        body = self.files.get(handler.path)
+        if body is None:
+            return self._respond(handler, 404, {}, b'{"message": "Not found"}')
+
+        status, headers = 200, {'ETag': self.etag(handler.path)}
+        range_header = handler.headers.get('Range')
+        if range_header and self.serve_ranges and handler.headers.get('If-Range', headers['ETag']) == headers['ETag']:
+            first, last = range_header.split('=')[1].split('-')
+            start, end = int(first), min(int(last or len(body) - 1), len(body) - 1)
+            if start >= len(body):
+                return self._respond(handler, 416, {'Content-Range': 'bytes */{0}'.format(len(body))}, b'')
+            headers['Content-Range'] = 'bytes {0}-{1}/{2}'.format(start, end, len(body))
+            status, body = 206, body[start:end + 1]
+
+        self._respond(handler, status, headers, body, drop=self.drops.pop(0) if self.drops else None)
+
+    def _post(self, handler):
+        self.requests.append(('POST', handler.path, dict(handler.headers.items())))
+
+        remaining = int(handler.headers.get('Content-Length'))
+        chunks = []
+        while remaining:
+            chunk = handler.rfile.read(min(remaining, 65536))
+            chunks.append(chunk)
+            remaining -= len(chunk)
+
+        boundary = handler.headers.get('Content-Type').split('boundary=')[1].encode('utf-8')
+        content = b''.join(chunks).split(b'\r\n\r\n', 1)[1].rsplit(b'\r\n--' + boundary, 1)[0]
+        self.uploads[handler.path] = content
+
+        status, headers, body = self.upload_response
+        self._respond(handler, status, headers, json.dumps(body).encode('utf-8'))
+
+    def _respond(self, handler, status, headers, body, drop=None):
+        handler.send_response(status)
+        for name, value in headers.items():
+            handler.send_header(name, value)
+        handler.send_header('Content-Length', str(len(body)))
+        handler.end_headers()
+
+        if drop is None:
+            handler.wfile.write(body)
+        else:
+            handler.wfile.write(body[:drop])
+            handler.close_connection = True
+
+
+class _ThreadingHTTPServer(socketserver.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+    daemon_threads = True
+
+
+class LocalConnection(object):
+    """
+    Stands in for the connection of the OneView SDK, sending the requests to a LocalHttpServer.
+    """
+
+    def __init__(self, port):
+        self.port = port
+        self._headers = {'auth': 'session-id', 'X-API-Version': 600,
+                         'Accept': 'application/json', 'Content-Type': 'application/json'}
+
+    def get_connection(self):
+        return http_client.HTTPConnection('127.0.0.1', self.port, timeout=10)
+
+    def get(self, uri):
+        http_connection = self.get_connection()
+        http_connection.request('GET', uri, None, self._headers)
+        body = http_connection.getresponse().read()
+        http_connection.close()
+        return json.loads(body.decode('utf-8'))
+
+
+def build_server_profile(connections=8, volumes=4, custom_attributes=20):
+    """
+    Builds a synthetic Server Profile document, used to measure the comparison and merge of large resources.
+    """
+    return {
+        'type': 'ServerProfileV8',
+        'name': 'Profile-{0}-{1}'.format(connections, volumes),
+        'uri': '/rest/server-profiles/94B55683-173F-4B36-8FA6-EC250BA2328B',
+        'serverHardwareUri': '/rest/server-hardware/31393736-3831-4753-567h-30335837524E',
+        'serverHardwareTypeUri': '/rest/server-hardware-types/94B55683-173F-4B36-8FA6-EC250BA2328B',
+        'enclosureGroupUri': '/rest/enclosure-groups/ad5e9e88-b858-4935-ba58-017d60a17c89',
+        'enclosureBay': 3,
+        'affinity': 'Bay',
+        'macType': 'Virtual',
+        'wwnType': 'Virtual',
+        'serialNumberType': 'Virtual',
+        'bios': {
+            'manageBios': True,
+            'overriddenSettings': [{'id': 'Setting{0}'.format(i), 'value': 'Value{0}'.format(i)} for i in range(150)]
+        },
+        'boot': {'manageBoot': True, 'order': ['HardDisk', 'PXE', 'CD', 'USB']},
+        'bootMode': {'manageMode': True, 'mode': 'UEFIOptimized', 'pxeBootPolicy': 'Auto'},
+        'firmware': {'manageFirmware': False, 'forceInstallFirmware': False, 'firmwareBaselineUri': None},
+        'connectionSettings': {'manageConnections': True},
+        'connections': [{
+            'id': i + 1,
+            'name': 'connection-{0}'.format(i + 1),
+            'functionType': 'Ethernet' if i % 2 else 'FibreChannel',
+            'networkUri': '/rest/ethernet-networks/{0:08d}-bc12-4757-ac72-e4cd0ef20535'.format(i),
+            'portId': 'Mezz 3:{0}-a'.format(i % 2 + 1),
+            'requestedMbps': 2500,
+            'allocatedMbps': 2500,
+            'maximumMbps': 20000,
+            'mac': '56:2A:5B:70:{0:02X}:{1:02X}'.format(i // 256, i % 256),
+            'macType': 'Virtual',
+            'wwpnType': 'Virtual',
+            'wwnn': None,
+            'wwpn': None,
+            'lagName': None,
+            'state': 'Deployed',
+            'status': 'OK',
+            'boot': {'priority': 'Primary' if i == 0 else 'NotBootable',
+                     'bootVolumeSource': 'AdapterBIOS',
+                     'targets': [{'arrayWwpn': '20000002AC012E47', 'lun': str(i)}]}
+        } for i in range(connections)],
+        'sanStorage': {
+            'hostOSType': 'Windows 2012 / WS2012 R2',
+            'manageSanStorage': True,
+            'volumeAttachments': [{
+                'id': i + 1,
+                'volumeUri': '/rest/storage-volumes/{0:08d}-DA2E-450D-B053-0A9AE7E5114C'.format(i),
+                'volumeStoragePoolUri': '/rest/storage-pools/30303437-3933-4753-4831-30335835524E',
+                'volumeStorageSystemUri': '/rest/storage-systems/TXQ1000307',
+                'lunType': 'Manual',
+                'lun': str(i),
+                'state': 'Attached',
+                'status': 'OK',
+                'storagePaths': [{'connectionId': c + 1,
+                                  'isEnabled': True,
+                                  'storageTargetType': 'Auto',
+                                  'storageTargets': ['20:00:00:02:AC:01:2E:47']} for c in range(2)]
+            } for i in range(volumes)]
+        },
+        'localStorage': {
+            'sasLogicalJBODs': [],
+            'controllers': [{
+                'deviceSlot': 'Embedded',
+                'mode': 'RAID',
+                'initialize': False,
+                'logicalDrives': [{'name': 'Drive{0}'.format(i), 'raidLevel': 'RAID1', 'bootable': i == 0,
+                                   'numPhysicalDrives': 2, 'driveTechnology': 'SasHdd'} for i in range(4)]
+            }]
+        },
+        'osDeploymentSettings': {
+            'osDeploymentPlanUri': '/rest/os-deployment-plans/81decf85-0dff-4a5e-8a95-52994eeb6493',
+            'osCustomAttributes': [{'name': 'Attribute{0}'.format(i), 'value': 'Value{0}'.format(i)}
+                                   for i in range(custom_attributes)]
+        }
+    }
+
+
+def build_enclosure(device_bays=12, interconnect_bays=6):
+    """
+    Builds a synthetic Enclosure document, used to measure the comparison of large resources.
+    """
+    return {
+        'type': 'EnclosureV400',
+        'name': 'Encl1',
+        'uri': '/rest/enclosures/09SGH100X6J1',
+        'enclosureType': 'SY12000',
+        'serialNumber': '0000A66101',
+        'state': 'Configured',
+        'status': 'OK',
+        'deviceBays': [{
+            'bayNumber': i + 1,
+            'devicePresence': 'Present',
+            'deviceUri': '/rest/server-hardware/{0:08d}-3831-4753-567h-30335837524E'.format(i),
+            'model': 'Synergy 480 Gen9',
+            'powerAllocationWatts': 350,
+            'availableForFullHeightProfile': False,
+            'availableForHalfHeightProfile': True,
+            'coveredByDevice': None,
+            'ipv4Setting': {'ipAddress': '10.0.0.{0}'.format(i), 'mode': 'Managed'},
+            'deviceBayPorts': [{'portNumber': p, 'portStatus': 'Linked'} for p in range(8)]
+        } for i in range(device_bays)],
+        'interconnectBays': [{
+            'bayNumber': i + 1,
+            'interconnectUri': '/rest/interconnects/{0:08d}-0dff-4a5e-8a95-52994eeb6493'.format(i),
+            'logicalInterconnectUri': '/rest/logical-interconnects/d0432852-28a7-4060-ba49-57ca973ef6c2',
+            'interconnectModel': 'Virtual Connect SE 40Gb F8 Module for Synergy',
+            'powerAllocationWatts': 130,
+            'ports': [{'portName': 'Q{0}'.format(p), 'portStatus': 'Unlinked', 'speed': 40000} for p in range(12)]
+        } for i in range(interconnect_bays)],
+        'fanBays': [{'bayNumber': i + 1, 'devicePresence': 'Present', 'status': 'OK'} for i in range(10)],
+        'powerSupplyBays': [{'bayNumber': i + 1, 'devicePresence': 'Present', 'outputCapacityWatts': 2650}
+                            for i in range(6)],
+        'managerBays': [{'bayNumber': i + 1, 'role': 'active' if i == 0 else 'standby', 'fwVersion': '2.00'}
+                        for i in range(2)],
+        'applianceBays': [{'bayNumber': i + 1, 'devicePresence': 'Present'} for i in range(2)]
+    }
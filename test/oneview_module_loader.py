@@ -36,15 +36,20 @@ from module_utils.oneview import (OneViewModuleBase,
                                   OneViewModuleTaskError,
                                   OneViewModuleValueError,
                                   OneViewModuleResourceNotFound,
+                                  FileTransfer,
+                                  ReservationLedger,
+                                  RetryScheduler,
                                   SPKeys,
                                   ServerProfileMerger,
                                   ServerProfileReplaceNamesByUris,
+                                  VlanIdSet,
                                   _str_sorted,
                                   merge_list_by_key,
                                   transform_list_to_dict,
                                   compare,
+                                  build_fields_projection,
                                   get_logger)
-from module_utils.icsp import ICspHelper
+from module_utils.icsp import ICspHelper, ICspWaiter
 from image_streamer_artifact_bundle import ArtifactBundleModule
 from image_streamer_artifact_bundle_facts import ArtifactBundleFactsModule
 from image_streamer_build_plan import BuildPlanModule
@@ -133,6 +138,7 @@ from oneview_server_hardware_facts import ServerHardwareFactsModule
 from oneview_server_hardware_type import ServerHardwareTypeModule
 from oneview_server_hardware_type_facts import ServerHardwareTypeFactsModule
 from oneview_server_profile import ServerProfileModule
+from oneview_server_profile_bulk import ServerProfileBulkModule
 from oneview_server_profile_facts import ServerProfileFactsModule
 from oneview_server_profile_template import ServerProfileTemplateModule
 from oneview_server_profile_template_facts import ServerProfileTemplateFactsModule
@@ -148,6 +154,7 @@ from oneview_switch import SwitchModule
 from oneview_switch_facts import SwitchFactsModule
 from oneview_switch_type_facts import SwitchTypeFactsModule
 from oneview_task_facts import TaskFactsModule
+from oneview_task_wait import TaskWaitModule
 from oneview_unmanaged_device import UnmanagedDeviceModule
 from oneview_unmanaged_device_facts import UnmanagedDeviceFactsModule
 from oneview_uplink_set import UplinkSetModule
@@ -20,6 +20,7 @@ import mock
 import pytest
 
 from copy import deepcopy
+from hpICsp.exceptions import HPICspException
 from oneview_module_loader import ICspHelper
 
 import hpe_icsp_os_deployment
@@ -57,6 +58,11 @@ DEFAULT_SERVER_UPDATED = {"name": "SP-01",
 
 DEFAULT_BUILD_PLAN = {"name": "RHEL 7.2 x64", "uri": "/rest/os-deployment-build-plans/222"}
 
+JOB_RESOURCE = {"uri": "/rest/os-deployment-jobs/123456"}
+
+JOB_FINISHED = {"uri": "/rest/os-deployment-jobs/123456", "name": "Run OS Build Plans", "running": "false",
+                "state": "STATUS_SUCCESS"}
+
 
 class TestIcspOsDeployment():
     @pytest.fixture(autouse=True)
@@ -70,7 +76,12 @@ class TestIcspOsDeployment():
         self.patcher_icsp_service = mock.patch(MODULE_NAME + '.hpICsp')
         self.mock_icsp = self.patcher_icsp_service.start()
 
-        self.patcher_time_sleep = mock.patch('time.sleep', return_value=None)
+        # The clock only moves forward when the module sleeps
+        self.clock = [1000.0]
+        self.patcher_time_time = mock.patch('time.time', side_effect=lambda: self.clock[0])
+        self.patcher_time_time.start()
+
+        self.patcher_time_sleep = mock.patch('time.sleep', side_effect=self.sleep)
         self.mock_time_sleep = self.patcher_time_sleep.start()
 
         self.mock_connection = mock.Mock()
@@ -81,6 +92,7 @@ class TestIcspOsDeployment():
         self.mock_icsp.common.return_value = self.mock_icsp_common
 
         self.mock_icsp_jobs = mock.Mock()
+        self.mock_icsp_jobs.add_job.return_value = JOB_RESOURCE
         self.mock_icsp.jobs.return_value = self.mock_icsp_jobs
 
         self.mock_server_service = mock.Mock()
@@ -93,6 +105,20 @@ class TestIcspOsDeployment():
         self.patcher_ansible_module.stop()
         self.patcher_icsp_service.stop()
         self.patcher_time_sleep.stop()
+        self.patcher_time_time.stop()
+
+    def sleep(self, seconds):
+        self.clock[0] += seconds
+
+    def respond_with_finished_jobs(self, responses):
+        responses = iter(responses)
+
+        def get(uri):
+            if uri.startswith('/rest/os-deployment-jobs/'):
+                return JOB_FINISHED
+            return next(responses)
+
+        return get
 
     def get_as_rest_collection(self, server):
         return {
@@ -103,8 +129,9 @@ class TestIcspOsDeployment():
     def test_should_not_add_server_when_already_present(self):
         server_already_deployed = dict(DEFAULT_SERVER, state="OK")
 
-        self.mock_connection.get.side_effect = [self.get_as_rest_collection([DEFAULT_BUILD_PLAN]),
-                                                self.get_as_rest_collection([DEFAULT_SERVER])]
+        self.mock_connection.get.side_effect = self.respond_with_finished_jobs([
+            self.get_as_rest_collection([DEFAULT_BUILD_PLAN]),
+            self.get_as_rest_collection([DEFAULT_SERVER])])
 
         self.mock_server_service.get_server.return_value = server_already_deployed
 
@@ -118,8 +145,9 @@ class TestIcspOsDeployment():
             changed=False, msg="Server already deployed.", ansible_facts={'icsp_server': server_already_deployed}
         )
 
-    def test_should_fail_after_try_get_server_by_serial_21_times(self):
-        self.mock_connection.get.side_effect = [self.get_as_rest_collection([DEFAULT_BUILD_PLAN])]
+    def test_should_fail_after_try_get_server_by_serial_until_the_timeout(self):
+        self.mock_connection.get.side_effect = self.respond_with_finished_jobs([
+            self.get_as_rest_collection([DEFAULT_BUILD_PLAN])])
 
         self.mock_server_service.get_server.return_value = DEFAULT_SERVER
 
@@ -130,14 +158,16 @@ class TestIcspOsDeployment():
             hpe_icsp_os_deployment.main()
 
         times_sleep_called = self.mock_time_sleep.call_count
-        assert 21 == times_sleep_called
+        assert 23 == times_sleep_called
+        assert self.clock[0] == 1600.0
 
         self.mock_ansible_instance.fail_json.assert_called_once_with(msg='Cannot find server in ICSP.')
 
-    def test_should_fail_after_try_get_server_by_ilo_address_21_times(self):
+    def test_should_fail_after_try_get_server_by_ilo_address_until_the_timeout(self):
         task_os_deployment = dict(TASK_OS_DEPLOYMENT, server_id=None, server_ipAddress="16.124.135.239")
 
-        self.mock_connection.get.side_effect = [self.get_as_rest_collection([DEFAULT_BUILD_PLAN])]
+        self.mock_connection.get.side_effect = self.respond_with_finished_jobs([
+            self.get_as_rest_collection([DEFAULT_BUILD_PLAN])])
 
         self.mock_server_service.get_server.return_value = DEFAULT_SERVER
 
@@ -148,13 +178,15 @@ class TestIcspOsDeployment():
             hpe_icsp_os_deployment.main()
 
         times_sleep_called = self.mock_time_sleep.call_count
-        assert 21 == times_sleep_called
+        assert 23 == times_sleep_called
+        assert self.clock[0] == 1600.0
 
         self.mock_ansible_instance.fail_json.assert_called_once_with(msg='Cannot find server in ICSP.')
 
     def test_should_deploy_server_with_server_id(self):
-        self.mock_connection.get.side_effect = [self.get_as_rest_collection([DEFAULT_BUILD_PLAN]),
-                                                self.get_as_rest_collection([DEFAULT_SERVER])]
+        self.mock_connection.get.side_effect = self.respond_with_finished_jobs([
+            self.get_as_rest_collection([DEFAULT_BUILD_PLAN]),
+            self.get_as_rest_collection([DEFAULT_SERVER])])
 
         self.mock_server_service.get_server.side_effect = [DEFAULT_SERVER, DEFAULT_SERVER_UPDATED]
 
@@ -167,13 +199,16 @@ class TestIcspOsDeployment():
 
         self.mock_ansible_instance.exit_json.assert_called_once_with(changed=True, msg='OS Deployed Successfully.',
                                                                      ansible_facts={
-                                                                         'icsp_server': DEFAULT_SERVER_UPDATED})
+                                                                         'icsp_server': DEFAULT_SERVER_UPDATED},
+                                                                     timings=mock.ANY)
 
     def test_should_deploy_server_with_server_ipAddress(self):
         task_os_deployment = dict(TASK_OS_DEPLOYMENT, server_id=None, server_ipAddress="16.124.135.239")
 
-        self.mock_connection.get.side_effect = [self.get_as_rest_collection([DEFAULT_BUILD_PLAN]),
-                                                self.get_as_rest_collection([DEFAULT_SERVER])]
+        self.mock_connection.get.side_effect = self.respond_with_finished_jobs([
+            self.get_as_rest_collection([DEFAULT_BUILD_PLAN]),
+            self.get_as_rest_collection([DEFAULT_SERVER]),
+            DEFAULT_SERVER])
 
         self.mock_server_service.get_server.side_effect = [DEFAULT_SERVER, DEFAULT_SERVER_UPDATED]
 
@@ -186,11 +221,13 @@ class TestIcspOsDeployment():
 
         self.mock_ansible_instance.exit_json.assert_called_once_with(changed=True, msg='OS Deployed Successfully.',
                                                                      ansible_facts={
-                                                                         'icsp_server': DEFAULT_SERVER_UPDATED})
+                                                                         'icsp_server': DEFAULT_SERVER_UPDATED},
+                                                                     timings=mock.ANY)
 
     def test_should_deploy_server(self):
-        self.mock_connection.get.side_effect = [self.get_as_rest_collection([DEFAULT_BUILD_PLAN]),
-                                                self.get_as_rest_collection([DEFAULT_SERVER])]
+        self.mock_connection.get.side_effect = self.respond_with_finished_jobs([
+            self.get_as_rest_collection([DEFAULT_BUILD_PLAN]),
+            self.get_as_rest_collection([DEFAULT_SERVER])])
 
         self.mock_server_service.get_server.side_effect = [DEFAULT_SERVER, DEFAULT_SERVER_UPDATED]
 
@@ -203,13 +240,15 @@ class TestIcspOsDeployment():
 
         self.mock_ansible_instance.exit_json.assert_called_once_with(changed=True, msg='OS Deployed Successfully.',
                                                                      ansible_facts={
-                                                                         'icsp_server': DEFAULT_SERVER_UPDATED})
+                                                                         'icsp_server': DEFAULT_SERVER_UPDATED},
+                                                                     timings=mock.ANY)
 
     def test_should_try_deploy_server_3_times(self):
-        self.mock_connection.get.side_effect = [self.get_as_rest_collection([DEFAULT_BUILD_PLAN]),
-                                                self.get_as_rest_collection([]),
-                                                self.get_as_rest_collection([]),
-                                                self.get_as_rest_collection([DEFAULT_SERVER])]
+        self.mock_connection.get.side_effect = self.respond_with_finished_jobs([
+            self.get_as_rest_collection([DEFAULT_BUILD_PLAN]),
+            self.get_as_rest_collection([]),
+            self.get_as_rest_collection([]),
+            self.get_as_rest_collection([DEFAULT_SERVER])])
 
         self.mock_server_service.get_server.side_effect = [DEFAULT_SERVER, DEFAULT_SERVER_UPDATED]
 
@@ -222,10 +261,12 @@ class TestIcspOsDeployment():
 
         self.mock_ansible_instance.exit_json.assert_called_once_with(changed=True, msg='OS Deployed Successfully.',
                                                                      ansible_facts={
-                                                                         'icsp_server': DEFAULT_SERVER_UPDATED})
+                                                                         'icsp_server': DEFAULT_SERVER_UPDATED},
+                                                                     timings=mock.ANY)
 
     def test_should_fail_when_os_build_plan_not_found(self):
-        self.mock_connection.get.side_effect = [self.get_as_rest_collection([])]
+        self.mock_connection.get.side_effect = self.respond_with_finished_jobs([
+            self.get_as_rest_collection([])])
 
         self.mock_ansible_instance.params = TASK_OS_DEPLOYMENT
 
@@ -234,12 +275,11 @@ class TestIcspOsDeployment():
         self.mock_ansible_instance.fail_json.assert_called_once_with(msg='Cannot find OS Build plan: RHEL 7.2 x64')
 
     def test_should_update_server_when_task_include_network_personalization(self):
-        self.mock_connection.get.side_effect = [self.get_as_rest_collection([DEFAULT_BUILD_PLAN]),
-                                                self.get_as_rest_collection([DEFAULT_SERVER])]
+        self.mock_connection.get.side_effect = self.respond_with_finished_jobs([
+            self.get_as_rest_collection([DEFAULT_BUILD_PLAN]),
+            self.get_as_rest_collection([DEFAULT_SERVER])])
 
         self.mock_server_service.get_server.side_effect = [DEFAULT_SERVER, DEFAULT_SERVER_UPDATED]
-        self.mock_icsp.common.monitor_execution.return_value = {}
-        self.mock_icsp_jobs.add_job.return_value = {"job mock return"}
 
         task_with_network_personalization = deepcopy(TASK_OS_DEPLOYMENT)
         network_config = {"network_config": {"hostname": "test-web.io.fc.hpe.com", "domain": "demo.com"}}
@@ -248,19 +288,84 @@ class TestIcspOsDeployment():
 
         hpe_icsp_os_deployment.main()
 
-        server_data = {"serverUri": DEFAULT_SERVER['uri'], "personalityData": None}
-        network_config = {"serverData": [server_data]}
+        server_data = {"serverUri": DEFAULT_SERVER['uri'], "personalityData": network_config}
         build_plan_body = {"osbpUris": [DEFAULT_BUILD_PLAN['uri']], "serverData": [server_data], "stepNo": 1}
 
-        monitor_build_plan = mock.call(self.mock_icsp_jobs.add_job(build_plan_body), self.mock_icsp_jobs)
-        monitor_update_server = mock.call(self.mock_icsp_jobs.add_job(network_config), self.mock_icsp_jobs)
-        calls = [monitor_build_plan, monitor_update_server]
+        self.mock_icsp_jobs.add_job.assert_has_calls([mock.call(build_plan_body),
+                                                      mock.call({"serverData": [server_data]})])
+        job_polls = [call for call in self.mock_connection.get.call_args_list if call == mock.call(JOB_RESOURCE['uri'])]
+        assert len(job_polls) == 2
+
+        timings = self.mock_ansible_instance.exit_json.call_args[1]['timings']
+        assert sorted(timings.keys()) == ['os_build_plan', 'personality_data', 'server_discovery']
+
+    def test_should_poll_the_job_with_backoff_until_it_finishes(self):
+        running = dict(JOB_FINISHED, running="true", state="STATUS_ACTIVE")
+        responses = iter([self.get_as_rest_collection([DEFAULT_BUILD_PLAN]),
+                          self.get_as_rest_collection([DEFAULT_SERVER]),
+                          running, running, running, JOB_FINISHED])
+        self.mock_connection.get.side_effect = lambda uri: next(responses)
+
+        self.mock_server_service.get_server.side_effect = [DEFAULT_SERVER, DEFAULT_SERVER_UPDATED]
+
+        self.mock_ansible_instance.params = TASK_OS_DEPLOYMENT
+
+        hpe_icsp_os_deployment.main()
+
+        assert self.mock_time_sleep.call_args_list == [mock.call(2), mock.call(4), mock.call(8)]
+        self.mock_ansible_instance.exit_json.assert_called_once_with(
+            changed=True, msg='OS Deployed Successfully.', ansible_facts={'icsp_server': DEFAULT_SERVER_UPDATED},
+            timings={'server_discovery': 0.0, 'os_build_plan': 14.0})
+
+    def test_should_raise_exception_when_the_job_does_not_finish_before_the_job_timeout(self):
+        running = dict(JOB_FINISHED, running="true", state="STATUS_ACTIVE")
+        self.mock_connection.get.side_effect = lambda uri: running if uri == JOB_RESOURCE['uri'] else next(responses)
+        responses = iter([self.get_as_rest_collection([DEFAULT_BUILD_PLAN]),
+                          self.get_as_rest_collection([DEFAULT_SERVER])])
+
+        self.mock_server_service.get_server.return_value = DEFAULT_SERVER
 
-        self.mock_icsp.common.monitor_execution.assert_has_calls(calls)
+        self.mock_ansible_instance.params = dict(TASK_OS_DEPLOYMENT, job_timeout=60)
+
+        with pytest.raises(HPICspException) as exception:
+            hpe_icsp_os_deployment.main()
+
+        assert exception.value.message == 'Timed out waiting for the jobs: ' + JOB_RESOURCE['uri']
+        assert self.clock[0] == 1060.0
+
+    def test_should_raise_exception_when_the_job_fails(self):
+        failed = dict(JOB_FINISHED, state="STATUS_FAILURE", jobResult=[{'jobResultLogDetails': 'Disk not found'}])
+        self.mock_connection.get.side_effect = lambda uri: failed if uri == JOB_RESOURCE['uri'] else next(responses)
+        responses = iter([self.get_as_rest_collection([DEFAULT_BUILD_PLAN]),
+                          self.get_as_rest_collection([DEFAULT_SERVER])])
+
+        self.mock_server_service.get_server.return_value = DEFAULT_SERVER
+
+        self.mock_ansible_instance.params = TASK_OS_DEPLOYMENT
+
+        with pytest.raises(HPICspException) as exception:
+            hpe_icsp_os_deployment.main()
+
+        assert exception.value.details == 'Disk not found'
+
+    def test_should_wait_for_the_server_until_the_discovery_timeout(self):
+        self.mock_connection.get.side_effect = self.respond_with_finished_jobs([
+            self.get_as_rest_collection([DEFAULT_BUILD_PLAN])])
+
+        self.mock_ansible_instance.params = dict(TASK_OS_DEPLOYMENT, discovery_timeout=10)
+
+        with mock.patch(MODULE_NAME + '.ICspHelper.get_server_by_serial') as mock_get_srv_ser:
+            mock_get_srv_ser.return_value = None
+            hpe_icsp_os_deployment.main()
+
+        assert self.mock_time_sleep.call_args_list == [mock.call(2), mock.call(4), mock.call(4)]
+        assert mock_get_srv_ser.call_count == 4
+        self.mock_ansible_instance.fail_json.assert_called_once_with(msg='Cannot find server in ICSP.')
 
     def test_should_update_server_when_task_include_custom_attributes(self):
-        self.mock_connection.get.side_effect = [self.get_as_rest_collection([DEFAULT_BUILD_PLAN]),
-                                                self.get_as_rest_collection([DEFAULT_SERVER])]
+        self.mock_connection.get.side_effect = self.respond_with_finished_jobs([
+            self.get_as_rest_collection([DEFAULT_BUILD_PLAN]),
+            self.get_as_rest_collection([DEFAULT_SERVER])])
 
         self.mock_server_service.get_server.side_effect = [DEFAULT_SERVER, DEFAULT_SERVER_UPDATED]
         self.mock_server_service.update_server.return_value = DEFAULT_SERVER_UPDATED
@@ -92,10 +92,31 @@ SERVERS = {
 }
 
 CONNECTION = {}
-ICSP_JOBS = {}
-
 JOB_RESOURCE = {"uri": "/rest/os-deployment-jobs/123456"}
 
+JOB_FINISHED = {"uri": "/rest/os-deployment-jobs/123456", "name": "Add Server", "running": "false",
+                "state": "STATUS_SUCCESS"}
+
+
+def search_servers(*results):
+    """
+    Builds a fake ICsp connection GET, which responds the index searches with each list of servers in turn, the
+    server documents by URI and the jobs as finished.
+    """
+    results = list(results)
+    servers_by_id = dict((server['uri'].split('/')[-1], server) for servers in results for server in servers)
+
+    def get(uri):
+        if uri.startswith('/rest/index/resources'):
+            servers = results.pop(0) if len(results) > 1 else results[0]
+            return {'members': [{'attributes': {'osdServerId': server['uri'].split('/')[-1]}} for server in servers],
+                    'count': len(servers)}
+        if uri.startswith('/rest/os-deployment-jobs/'):
+            return JOB_FINISHED
+        return servers_by_id[uri.split('/')[-1]]
+
+    return get
+
 
 class TestIcspServer():
     @pytest.fixture(autouse=True)
@@ -121,7 +142,7 @@ class TestIcspServer():
         self.patcher_icsp_service.stop()
 
     def test_should_not_add_server_when_already_present(self):
-        self.mock_connection.get.return_value = SERVERS
+        self.mock_connection.get.side_effect = search_servers(SERVERS['members'])
         self.mock_ansible_instance.params = yaml.load(YAML_SERVER_PRESENT)
 
         ICspServerModule().run()
@@ -133,12 +154,8 @@ class TestIcspServer():
         )
 
     def test_should_add_server(self):
-        self.mock_connection.get.side_effect = [{'members': []}, SERVERS]
+        self.mock_connection.get.side_effect = search_servers([], SERVERS['members'])
         self.mock_server_service.add_server.return_value = JOB_RESOURCE
-        self.mock_icsp.jobs.return_value = ICSP_JOBS
-
-        self.mock_icsp.common = mock.Mock()
-        self.mock_icsp.common.monitor_execution.return_value = {}
 
         self.mock_ansible_instance.params = yaml.load(YAML_SERVER_PRESENT)
 
@@ -149,7 +166,7 @@ class TestIcspServer():
                     'password': "serveradmin",
                     'port': 443}
         self.mock_server_service.add_server.assert_called_once_with(ilo_body)
-        self.mock_icsp.common.monitor_execution.assert_called_once_with(JOB_RESOURCE, ICSP_JOBS)
+        self.mock_connection.get.assert_any_call(JOB_RESOURCE['uri'])
 
         self.mock_ansible_instance.exit_json.assert_called_once_with(
             changed=True,
@@ -158,7 +175,7 @@ class TestIcspServer():
         )
 
     def test_expect_exception_not_caught_when_create_server_raise_exception(self):
-        self.mock_connection.get.side_effect = [{'members': []}, SERVERS]
+        self.mock_connection.get.side_effect = search_servers([], SERVERS['members'])
         self.mock_server_service.add_server.side_effect = Exception("message")
 
         self.mock_ansible_instance.params = yaml.load(YAML_SERVER_PRESENT)
@@ -185,7 +202,7 @@ class TestIcspServer():
         )
 
     def test_should_delete_server(self):
-        self.mock_connection.get.return_value = SERVERS
+        self.mock_connection.get.side_effect = search_servers(SERVERS['members'])
 
         self.mock_server_service.delete_server.return_value = {}
 
@@ -201,7 +218,7 @@ class TestIcspServer():
         )
 
     def test_should_fail_with_all_exe_attr_when_HPICspException_raised_on_delete(self):
-        self.mock_connection.get.return_value = SERVERS
+        self.mock_connection.get.side_effect = search_servers(SERVERS['members'])
         exeption_value = {"message": "Fake Message", "details": "Details", "errorCode": "INVALID_RESOURCE"}
         self.mock_server_service.delete_server.side_effect = HPICspInvalidResource(exeption_value)
 
@@ -215,7 +232,7 @@ class TestIcspServer():
         assert error_raised == exeption_value
 
     def test_should_fail_with_args_joined_when_common_exception_raised_on_delete(self):
-        self.mock_connection.get.return_value = SERVERS
+        self.mock_connection.get.side_effect = search_servers(SERVERS['members'])
         self.mock_server_service.delete_server.side_effect = Exception("Fake Message", "INVALID_RESOURCE")
 
         self.mock_ansible_instance.params = yaml.load(YAML_SERVER_ABSENT)
@@ -225,7 +242,7 @@ class TestIcspServer():
         self.mock_ansible_instance.fail_json.assert_called_once_with(msg='Fake Message; INVALID_RESOURCE')
 
     def test_should_configure_network(self):
-        self.mock_connection.get.side_effect = [SERVERS, SERVERS]
+        self.mock_connection.get.side_effect = search_servers(SERVERS['members'])
         self.mock_connection.post.return_value = JOB_RESOURCE
         self.mock_server_service.get_server.return_value = DEFAULT_SERVER
 
@@ -254,7 +271,7 @@ class TestIcspServer():
         )
 
     def test_should_fail_when_try_configure_network_without_inform_personality_data(self):
-        self.mock_connection.get.return_value = SERVERS
+        self.mock_connection.get.side_effect = search_servers(SERVERS['members'])
         self.mock_server_service.get_server.return_value = DEFAULT_SERVER
 
         params_config_network = yaml.load(YAML_NETWORK_CONFIGURED)
@@ -277,7 +294,7 @@ class TestIcspServer():
                                                                      msg=ICspServerModule.SERVER_NOT_FOUND)
 
     def test_expect_exception_not_caught_when_configure_network_raise_exception(self):
-        self.mock_connection.get.return_value = SERVERS
+        self.mock_connection.get.side_effect = search_servers(SERVERS['members'])
         self.mock_connection.post.side_effect = Exception("message")
 
         self.mock_ansible_instance.params = yaml.load(YAML_NETWORK_CONFIGURED)
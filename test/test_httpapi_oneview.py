@@ -0,0 +1,115 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+###
+# Copyright (2016-2017) Hewlett Packard Enterprise Development LP
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# You may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+###
+
+import json
+import os
+import mock
+import pytest
+
+from io import BytesIO
+from importlib.machinery import SourceFileLoader
+
+HTTPAPI_PLUGIN_PATH = os.path.join(os.path.dirname(__file__), '..', 'httpapi_plugins', 'oneview.py')
+
+oneview_httpapi = SourceFileLoader('oneview_httpapi', HTTPAPI_PLUGIN_PATH).load_module()
+
+SESSION_ID = 'LTE2NzA4NDQ1NjY1'
+
+
+class TestOneViewHttpApi():
+    @pytest.fixture(autouse=True)
+    def setUp(self):
+        self.connection = mock.Mock(_auth=None)
+        self.connection.send.side_effect = self.respond
+        self.requests = []
+        self.options = dict(oneview_api_version=None, oneview_auth_login_domain=None)
+
+        self.httpapi = oneview_httpapi.HttpApi(self.connection)
+        self.httpapi.get_option = self.options.get
+
+    def respond(self, path, data, method='GET', headers=None):
+        self.requests.append((method, path, data, headers))
+        response = mock.Mock()
+        response.getcode.return_value = 200
+        response.info.return_value = {'Content-Type': 'application/json'}
+        if path == '/rest/version':
+            body = dict(currentVersion=800, minimumVersion=120)
+        elif path == '/rest/login-sessions':
+            body = dict(sessionID=SESSION_ID)
+        else:
+            body = dict(uri=path)
+        return response, BytesIO(json.dumps(body).encode('utf-8'))
+
+    def test_should_negotiate_the_current_version_of_the_appliance(self):
+        assert self.httpapi.get_api_version() == 800
+
+    def test_should_not_exceed_the_current_version_of_the_appliance(self):
+        self.options['oneview_api_version'] = 1000
+
+        assert self.httpapi.get_api_version() == 800
+
+    def test_should_use_the_requested_version(self):
+        self.options['oneview_api_version'] = 600
+
+        assert self.httpapi.get_api_version() == 600
+
+    def test_should_negotiate_the_version_once(self):
+        self.httpapi.send_request(None, '/rest/server-profiles')
+        self.httpapi.send_request(None, '/rest/enclosures')
+
+        assert [request[1] for request in self.requests] == ['/rest/version', '/rest/server-profiles', '/rest/enclosures']
+
+    def test_should_keep_the_session_id_on_login(self):
+        self.options['oneview_auth_login_domain'] = 'LOCAL'
+
+        self.httpapi.login('administrator', 'secret')
+
+        method, path, data, headers = self.requests[-1]
+        assert (method, path) == ('POST', '/rest/login-sessions')
+        assert json.loads(data) == dict(userName='administrator', password='secret', authLoginDomain='LOCAL',
+                                        loginMsgAck=True)
+        assert headers['X-API-Version'] == '800'
+        assert self.connection._auth == {'auth': SESSION_ID}
+
+    def test_should_not_replace_the_session_id_by_cookies(self):
+        response = mock.Mock()
+        response.info.return_value = {'Set-Cookie': 'cookie'}
+
+        assert self.httpapi.update_auth(response, '') is None
+
+    def test_should_return_the_response_status_headers_and_body(self):
+        status, headers, body = self.httpapi.send_request('{"name": "Net"}', '/rest/ethernet-networks', method='POST',
+                                                          headers={'If-Match': '*'})
+
+        assert (status, headers, json.loads(body)) == (200, {'Content-Type': 'application/json'},
+                                                       dict(uri='/rest/ethernet-networks'))
+        assert self.requests[-1] == ('POST', '/rest/ethernet-networks', '{"name": "Net"}',
+                                     {'Content-Type': 'application/json', 'Accept': 'application/json',
+                                      'If-Match': '*', 'X-API-Version': '800'})
+
+    def test_should_logout_the_session(self):
+        self.connection._auth = {'auth': SESSION_ID}
+
+        self.httpapi.logout()
+
+        assert self.requests[-1][:2] == ('DELETE', '/rest/login-sessions')
+        assert self.connection._auth is None
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
@@ -19,7 +19,8 @@
 import mock
 import pytest
 
-from oneview_module_loader import ICspHelper
+from hpICsp.exceptions import HPICspException
+from oneview_module_loader import ICspHelper, ICspWaiter
 
 DEFAULT_SERVER = {
     "name": "SP-01",
@@ -41,6 +42,10 @@ DEFAULT_SERVER_NO_ILO = {
 
 DEFAULT_BUILD_PLAN = {"name": "RHEL 7.2 x64", "uri": "/rest/os-deployment-build-plans/222"}
 
+JOB_RUNNING = {"uri": "/rest/os-deployment-jobs/1", "name": "Add Server", "running": "true", "state": "STATUS_ACTIVE"}
+
+JOB_FINISHED = {"uri": "/rest/os-deployment-jobs/1", "name": "Add Server", "running": "false", "state": "STATUS_SUCCESS"}
+
 
 class TestICspHelper():
     """
@@ -93,36 +98,35 @@ class TestICspHelper():
         assert plan is None
 
     def test_get_server_by_ilo_address_with_matching_result(self):
-        self.mock_connection.get.side_effect = [self.get_as_rest_collection([DEFAULT_SERVER])]
+        self.mock_connection.get.side_effect = [self.get_as_rest_collection([DEFAULT_SERVER]), DEFAULT_SERVER]
 
         icsphelper = ICspHelper(self.mock_connection)
         server = icsphelper.get_server_by_ilo_address('16.124.135.239')
 
-        self.mock_connection.get.assert_called_once_with(
-            '/rest/os-deployment-servers/?count=-1')
+        assert self.mock_connection.get.call_args_list == [
+            mock.call('/rest/index/resources?category=osdserver&query=\'"16.124.135.239"\''),
+            mock.call('/rest/os-deployment-servers/123456')
+        ]
 
         assert server == DEFAULT_SERVER
 
     def test_get_server_by_ilo_address_with_non_matching_result(self):
-        self.mock_connection.get.side_effect = [self.get_as_rest_collection([DEFAULT_SERVER])]
+        self.mock_connection.get.side_effect = [self.get_as_rest_collection([DEFAULT_SERVER]), DEFAULT_SERVER]
 
         icsphelper = ICspHelper(self.mock_connection)
         server = icsphelper.get_server_by_ilo_address('16.124.135.255')
 
-        self.mock_connection.get.assert_called_once_with(
-            '/rest/os-deployment-servers/?count=-1')
+        self.mock_connection.get.assert_called_with('/rest/os-deployment-servers/123456')
 
         assert server is None
 
     def test_get_server_by_ilo_address_with_servers_with_no_ilo(self):
-        self.mock_connection.get.side_effect = [self.get_as_rest_collection([DEFAULT_SERVER_NO_ILO])]
+        self.mock_connection.get.side_effect = [self.get_as_rest_collection([DEFAULT_SERVER_NO_ILO]),
+                                                DEFAULT_SERVER_NO_ILO]
 
         icsphelper = ICspHelper(self.mock_connection)
         server = icsphelper.get_server_by_ilo_address('16.124.135.239')
 
-        self.mock_connection.get.assert_called_once_with(
-            '/rest/os-deployment-servers/?count=-1')
-
         assert server is None
 
     def test_get_server_by_ilo_address_with_no_registered_servers(self):
@@ -132,9 +136,45 @@ class TestICspHelper():
         server = icsphelper.get_server_by_ilo_address('16.124.135.239')
 
         self.mock_connection.get.assert_called_once_with(
-            '/rest/os-deployment-servers/?count=-1')
+            '/rest/index/resources?category=osdserver&query=\'"16.124.135.239"\'')
+
+        assert server is None
+
+    def test_get_server_by_ilo_address_should_reuse_the_uri_found(self):
+        self.mock_connection.get.side_effect = [self.get_as_rest_collection([DEFAULT_SERVER]), DEFAULT_SERVER,
+                                                DEFAULT_SERVER]
+
+        icsphelper = ICspHelper(self.mock_connection)
+        icsphelper.get_server_by_ilo_address('16.124.135.239')
+        server = icsphelper.get_server_by_ilo_address('16.124.135.239')
+
+        assert self.mock_connection.get.call_count == 3
+        self.mock_connection.get.assert_called_with('/rest/os-deployment-servers/123456')
+        assert server == DEFAULT_SERVER
+
+    def test_get_server_by_ilo_address_should_search_again_when_the_cached_server_is_gone(self):
+        not_found = HPICspException(dict(message='Not found', details='', errorCode='RESOURCE_NOT_FOUND'))
+        self.mock_connection.get.side_effect = [self.get_as_rest_collection([DEFAULT_SERVER]), DEFAULT_SERVER,
+                                                not_found, self.get_as_rest_collection([])]
+
+        icsphelper = ICspHelper(self.mock_connection)
+        icsphelper.get_server_by_ilo_address('16.124.135.239')
+        server = icsphelper.get_server_by_ilo_address('16.124.135.239')
 
+        self.mock_connection.get.assert_called_with(
+            '/rest/index/resources?category=osdserver&query=\'"16.124.135.239"\'')
         assert server is None
+        assert icsphelper.server_uris_by_ilo == {}
+
+    def test_get_server_by_ilo_address_should_raise_the_errors_other_than_not_found(self):
+        unauthorized = HPICspException(dict(message='Unauthorized', details='', errorCode='AUTHORIZATION'))
+        self.mock_connection.get.side_effect = [self.get_as_rest_collection([DEFAULT_SERVER]), unauthorized]
+
+        icsphelper = ICspHelper(self.mock_connection)
+
+        with pytest.raises(HPICspException) as exception:
+            icsphelper.get_server_by_ilo_address('16.124.135.239')
+        assert exception.value.errorCode == 'AUTHORIZATION'
 
     def test_get_server_by_serial_with_matching_result(self):
         self.mock_connection.get.side_effect = [self.get_as_rest_collection([DEFAULT_SERVER])]
@@ -171,5 +211,107 @@ class TestICspHelper():
         assert server is None
 
 
+class TestICspWaiter():
+    @pytest.fixture(autouse=True)
+    def setUp(self):
+        self.mock_connection = mock.Mock()
+
+        # The clock only moves forward when the waiter sleeps
+        self.clock = [1000.0]
+        with mock.patch('time.time', side_effect=lambda: self.clock[0]):
+            with mock.patch('time.sleep', side_effect=self.sleep) as self.mock_sleep:
+                yield
+
+    def sleep(self, seconds):
+        self.clock[0] += seconds
+
+    def test_should_poll_all_the_checks_in_each_round_until_they_are_done(self):
+        first = mock.Mock(side_effect=[None, 'first done'])
+        second = mock.Mock(side_effect=[None, None, None, 'second done'])
+
+        results = ICspWaiter().wait('discovery', {'first': first, 'second': second})
+
+        assert results == {'first': 'first done', 'second': 'second done'}
+        assert first.call_count == 2
+        assert second.call_count == 4
+        assert self.mock_sleep.call_args_list == [mock.call(2), mock.call(4), mock.call(8)]
+
+    def test_should_not_wait_longer_than_the_max_delay(self):
+        check = mock.Mock(side_effect=[None] * 5 + ['done'])
+
+        ICspWaiter(initial_delay=1, max_delay=5, factor=3).wait('discovery', {'key': check})
+
+        assert self.mock_sleep.call_args_list == [mock.call(1), mock.call(3), mock.call(5), mock.call(5), mock.call(5)]
+
+    def test_should_return_only_the_checks_done_when_the_timeout_expires(self):
+        done = mock.Mock(return_value='done')
+        pending = mock.Mock(return_value=None)
+
+        results = ICspWaiter().wait('discovery', {'done': done, 'pending': pending}, timeout=20)
+
+        assert results == {'done': 'done'}
+        assert done.call_count == 1
+        assert self.mock_sleep.call_args_list == [mock.call(2), mock.call(4), mock.call(8), mock.call(6)]
+        assert self.clock[0] == 1020.0
+
+    def test_should_record_the_time_of_each_phase(self):
+        waiter = ICspWaiter()
+        waiter.wait('discovery', {'key': mock.Mock(side_effect=[None, None, 'done'])})
+        waiter.wait('deployment', {'key': mock.Mock(return_value='done')})
+
+        assert waiter.timings == {'discovery': 6.0, 'deployment': 0.0}
+
+    def test_should_record_the_time_of_the_phase_when_a_check_raises_exception(self):
+        waiter = ICspWaiter()
+
+        with pytest.raises(ValueError):
+            waiter.wait('discovery', {'key': mock.Mock(side_effect=[None, ValueError()])})
+
+        assert waiter.timings == {'discovery': 2.0}
+
+    def test_wait_for_jobs_should_return_the_final_status_of_each_job(self):
+        other_job = dict(JOB_FINISHED, uri='/rest/os-deployment-jobs/2')
+        self.mock_connection.get.side_effect = [JOB_RUNNING, other_job, JOB_FINISHED]
+
+        statuses = ICspHelper(self.mock_connection).wait_for_jobs(ICspWaiter(), 'jobs', [JOB_RUNNING, other_job])
+
+        assert statuses == [JOB_FINISHED, other_job]
+        assert self.mock_sleep.call_count == 1
+
+    def test_wait_for_jobs_should_accept_the_scheduled_jobs(self):
+        scheduled = dict(JOB_FINISHED, state='STATUS_PENDING')
+        self.mock_connection.get.return_value = scheduled
+
+        statuses = ICspHelper(self.mock_connection).wait_for_jobs(ICspWaiter(), 'jobs', [JOB_RUNNING])
+
+        assert statuses == [scheduled]
+
+    def test_wait_for_jobs_should_raise_exception_when_a_job_fails(self):
+        failed = dict(JOB_FINISHED, state='STATUS_FAILURE', jobResult=[{'jobResultLogDetails': 'iLO unreachable'}])
+        self.mock_connection.get.return_value = failed
+
+        with pytest.raises(HPICspException) as exception:
+            ICspHelper(self.mock_connection).wait_for_jobs(ICspWaiter(), 'jobs', [JOB_RUNNING])
+
+        assert exception.value.message == 'Add Server failed to complete'
+        assert exception.value.details == 'iLO unreachable'
+
+    def test_wait_for_jobs_should_raise_exception_when_the_timeout_expires(self):
+        self.mock_connection.get.return_value = JOB_RUNNING
+
+        with pytest.raises(HPICspException) as exception:
+            ICspHelper(self.mock_connection).wait_for_jobs(ICspWaiter(), 'jobs', [JOB_RUNNING], timeout=30)
+
+        assert exception.value.message == 'Timed out waiting for the jobs: /rest/os-deployment-jobs/1'
+        assert exception.value.errorCode == 'TIMEOUT'
+
+    def test_wait_for_jobs_should_raise_exception_when_a_job_was_not_started(self):
+        with pytest.raises(HPICspException) as exception:
+            ICspHelper(self.mock_connection).wait_for_jobs(ICspWaiter(), 'jobs', [{}])
+
+        assert exception.value.message == 'Failed to Start Job'
+        self.mock_connection.get.assert_not_called()
+
+
 if __name__ == '__main__':
     pytest.main([__file__])
@@ -62,6 +62,10 @@ class TestArtifactBundleModule(ImageStreamerBaseTest):
             name="Deployment Group Name"
         )
 
+        with mock.patch('image_streamer_artifact_bundle.FileTransfer') as mock_file_transfer:
+            self.file_transfer = mock_file_transfer.return_value
+            yield
+
     def test_create_artifact_bundle(self):
         self.resource.get_by.return_value = []
         self.resource.create.return_value = self.ARTIFACT_BUNDLE
@@ -90,15 +94,32 @@ class TestArtifactBundleModule(ImageStreamerBaseTest):
         ArtifactBundleModule().run()
 
         download_file = self.TASK_DOWNLOAD['data']['destinationFilePath']
-        uri = artifact_bundle['uri']
-
-        self.resource.download_artifact_bundle.assert_called_once_with(uri, download_file)
+        self.file_transfer.download_resource.assert_called_once_with('/rest/artifact-bundles/download',
+                                                                     artifact_bundle, download_file)
 
         self.mock_ansible_module.exit_json.assert_called_once_with(
             changed=False,
             msg=ArtifactBundleModule.MSG_DOWNLOADED,
             ansible_facts={})
 
+    def test_should_not_download_artifact_bundle_when_already_downloaded(self):
+        artifact_bundle = dict(self.TASK_CREATE['data'], uri='/rest/artifact-bundles/1', eTag='2018-01-09T18:32:41')
+
+        self.resource.get_by.return_value = [artifact_bundle]
+        self.file_transfer.download_resource.return_value = False
+
+        self.mock_ansible_module.params = self.TASK_DOWNLOAD
+
+        ArtifactBundleModule().run()
+
+        self.file_transfer.download_resource.assert_called_once_with(
+            '/rest/artifact-bundles/download', artifact_bundle, self.TASK_DOWNLOAD['data']['destinationFilePath'])
+
+        self.mock_ansible_module.exit_json.assert_called_once_with(
+            changed=False,
+            msg=ArtifactBundleModule.MSG_ALREADY_DOWNLOADED,
+            ansible_facts={})
+
     def test_download_archives_artifact_bundle(self):
         artifact_bundle = self.TASK_CREATE['data']
         artifact_bundle['uri'] = '/rest/artifact-bundles/1'
@@ -110,9 +131,8 @@ class TestArtifactBundleModule(ImageStreamerBaseTest):
         ArtifactBundleModule().run()
 
         download_file = self.TASK_DOWNLOAD_ARCHIVE['data']['destinationFilePath']
-        uri = artifact_bundle['uri']
-
-        self.resource.download_archive_artifact_bundle.assert_called_once_with(uri, download_file)
+        self.file_transfer.download_resource.assert_called_once_with('/rest/artifact-bundles/backups/archive',
+                                                                     artifact_bundle, download_file)
 
         self.mock_ansible_module.exit_json.assert_called_once_with(
             changed=False,
@@ -121,14 +141,14 @@ class TestArtifactBundleModule(ImageStreamerBaseTest):
 
     def test_upload_artifact_bundle_should_upload_when_file_not_uploaded_yet(self):
         self.resource.get_by.return_value = []
-        self.resource.upload_bundle_from_file.return_value = self.ARTIFACT_BUNDLE
+        self.file_transfer.upload.return_value = self.ARTIFACT_BUNDLE
 
         self.mock_ansible_module.params = self.TASK_UPLOAD
 
         ArtifactBundleModule().run()
 
-        self.resource.upload_bundle_from_file.assert_called_once_with(
-            self.TASK_UPLOAD['data']['localArtifactBundleFilePath'])
+        self.file_transfer.upload.assert_called_once_with(
+            '/rest/artifact-bundles', self.TASK_UPLOAD['data']['localArtifactBundleFilePath'])
 
         self.mock_ansible_module.exit_json.assert_called_once_with(
             changed=True,
@@ -137,13 +157,13 @@ class TestArtifactBundleModule(ImageStreamerBaseTest):
 
     def test_upload_artifact_bundle_should_do_nothing_when_file_already_uploaded(self):
         self.resource.get_by.return_value = [self.ARTIFACT_BUNDLE]
-        self.resource.upload_bundle_from_file.return_value = self.ARTIFACT_BUNDLE
 
         self.mock_ansible_module.params = self.TASK_UPLOAD
 
         ArtifactBundleModule().run()
 
         self.resource.get_by.assert_called_once_with('name', 'uploaded_artifact')
+        self.file_transfer.upload.assert_not_called()
 
         self.mock_ansible_module.exit_json.assert_called_once_with(
             changed=False,
@@ -152,21 +172,35 @@ class TestArtifactBundleModule(ImageStreamerBaseTest):
 
     def test_upload_backup_artifact_bundle(self):
         self.resource.get_by.return_value = []
-        self.resource.upload_backup_bundle_from_file.return_value = self.DEPLOYMENT_GROUP
+        self.file_transfer.upload.return_value = self.DEPLOYMENT_GROUP
 
         self.mock_ansible_module.params = self.TASK_BACKUP_UPLOAD
 
         ArtifactBundleModule().run()
 
-        self.resource.upload_backup_bundle_from_file.assert_called_once_with(
-            self.TASK_BACKUP_UPLOAD['data']['localBackupArtifactBundleFilePath'],
-            self.TASK_BACKUP_UPLOAD['data']['deploymentGroupURI'])
+        self.file_transfer.upload.assert_called_once_with(
+            '/rest/artifact-bundles/backups/archive?deploymentGrpUri=' + self.TASK_BACKUP_UPLOAD['data']['deploymentGroupURI'],
+            self.TASK_BACKUP_UPLOAD['data']['localBackupArtifactBundleFilePath'])
 
         self.mock_ansible_module.exit_json.assert_called_once_with(
             changed=True,
             msg=ArtifactBundleModule.MSG_BACKUP_UPLOADED,
             ansible_facts=dict(artifact_bundle_deployment_group=self.DEPLOYMENT_GROUP))
 
+    def test_upload_backup_artifact_bundle_with_deployment_group_id(self):
+        self.resource.get_by.return_value = []
+        self.file_transfer.upload.return_value = self.DEPLOYMENT_GROUP
+
+        params = deepcopy(self.TASK_BACKUP_UPLOAD)
+        params['data']['deploymentGroupURI'] = '00000000-0000-0000-0000-000000000000'
+        self.mock_ansible_module.params = params
+
+        ArtifactBundleModule().run()
+
+        self.file_transfer.upload.assert_called_once_with(
+            '/rest/artifact-bundles/backups/archive?deploymentGrpUri=/rest/deployment-groups/00000000-0000-0000-0000-000000000000',
+            self.TASK_BACKUP_UPLOAD['data']['localBackupArtifactBundleFilePath'])
+
     def test_create_backup_artifact_bundle(self):
         artifact_bundle = self.TASK_CREATE['data']
         artifact_bundle['uri'] = '/rest/artifact-bundles/1'
@@ -72,7 +72,8 @@ class TestGoldenImageModule(ImageStreamerBaseTest):
             data=dict(
                 name='Demo Golden Image',
                 destination_file_path='~/downloaded_image.zip'
-            )
+            ),
+            download_connections=4
         )
 
         self.GOLDEN_IMAGE_ARCHIVE_DOWNLOAD = dict(
@@ -81,7 +82,8 @@ class TestGoldenImageModule(ImageStreamerBaseTest):
             data=dict(
                 name='Demo Golden Image',
                 destination_file_path='~/archive.log'
-            )
+            ),
+            download_connections=4
         )
 
         self.GOLDEN_IMAGE_DELETE = dict(
@@ -92,6 +94,13 @@ class TestGoldenImageModule(ImageStreamerBaseTest):
             )
         )
 
+        self.TRANSFER = dict(bytes=8000, seconds=0.5, bytes_per_second=16000)
+
+        with mock.patch('image_streamer_golden_image.FileTransfer') as mock_file_transfer:
+            self.file_transfer = mock_file_transfer.return_value
+            self.file_transfer.statistics = None
+            yield
+
     def test_create_new_golden_image(self):
         self.resource.get_by.return_value = []
         self.resource.create.return_value = {"name": "name"}
@@ -117,7 +126,8 @@ class TestGoldenImageModule(ImageStreamerBaseTest):
 
     def test_upload_a_golden_image(self):
         self.resource.get_by.return_value = []
-        self.resource.upload.return_value = {"name": "name"}
+        self.file_transfer.upload.return_value = {"name": "name"}
+        self.file_transfer.statistics = self.TRANSFER
 
         self.mock_ansible_module.params = self.GOLDEN_IMAGE_UPLOAD
 
@@ -125,14 +135,16 @@ class TestGoldenImageModule(ImageStreamerBaseTest):
 
         GoldenImageModule().run()
 
-        self.resource.upload.assert_called_once_with(
+        self.file_transfer.upload.assert_called_once_with(
+            '/rest/golden-images?name=Demo%20Golden%20Image%20upload&description=Test',
             file_path,
-            self.GOLDEN_IMAGE_UPLOAD['data'])
+            log=self.mock_ansible_module.log)
 
         self.mock_ansible_module.exit_json.assert_called_once_with(
             changed=True,
             msg=GoldenImageModule.MSG_UPLOADED,
-            ansible_facts=dict(golden_image={"name": "name"})
+            ansible_facts=dict(golden_image={"name": "name"}),
+            transfer=self.TRANSFER
         )
 
     def test_update_golden_image(self):
@@ -154,16 +166,45 @@ class TestGoldenImageModule(ImageStreamerBaseTest):
         golden_image['uri'] = '/rest/golden-images/1'
 
         self.resource.get_by.return_value = [golden_image]
+        self.file_transfer.download_resource.return_value = True
+        self.file_transfer.statistics = self.TRANSFER
         self.mock_ansible_module.params = self.GOLDEN_IMAGE_DOWNLOAD
 
         GoldenImageModule().run()
 
         download_file = self.GOLDEN_IMAGE_DOWNLOAD['data']['destination_file_path']
-        self.resource.download.assert_called_once_with('/rest/golden-images/1', download_file)
+        self.file_transfer.download_resource.assert_called_once_with('/rest/golden-images/download', golden_image,
+                                                                     download_file, connections=4)
 
         self.mock_ansible_module.exit_json.assert_called_once_with(
             changed=True,
             msg=GoldenImageModule.MSG_DOWNLOADED,
+            ansible_facts={},
+            transfer=self.TRANSFER)
+
+    def test_golden_image_download_over_the_connections_requested(self):
+        golden_image = dict(self.GOLDEN_IMAGE_CREATE['data'], uri='/rest/golden-images/1')
+
+        self.resource.get_by.return_value = [golden_image]
+        self.file_transfer.download_resource.return_value = True
+        self.mock_ansible_module.params = dict(self.GOLDEN_IMAGE_DOWNLOAD, download_connections=8)
+
+        GoldenImageModule().run()
+
+        assert self.file_transfer.download_resource.call_args[1]['connections'] == 8
+
+    def test_should_not_download_the_golden_image_again(self):
+        golden_image = dict(self.GOLDEN_IMAGE_CREATE['data'], uri='/rest/golden-images/1', eTag='1')
+
+        self.resource.get_by.return_value = [golden_image]
+        self.file_transfer.download_resource.return_value = False
+        self.mock_ansible_module.params = self.GOLDEN_IMAGE_DOWNLOAD
+
+        GoldenImageModule().run()
+
+        self.mock_ansible_module.exit_json.assert_called_once_with(
+            changed=False,
+            msg=GoldenImageModule.MSG_ALREADY_DOWNLOADED,
             ansible_facts={})
 
     def test_golden_image_download_nonexistent(self):
@@ -179,12 +220,14 @@ class TestGoldenImageModule(ImageStreamerBaseTest):
         golden_image['uri'] = '/rest/golden-images/1'
 
         self.resource.get_by.return_value = [golden_image]
+        self.file_transfer.download_resource.return_value = True
         self.mock_ansible_module.params = self.GOLDEN_IMAGE_ARCHIVE_DOWNLOAD
 
         GoldenImageModule().run()
 
         download_file = self.GOLDEN_IMAGE_ARCHIVE_DOWNLOAD['data']['destination_file_path']
-        self.resource.download_archive.assert_called_once_with('/rest/golden-images/1', download_file)
+        self.file_transfer.download_resource.assert_called_once_with('/rest/golden-images/archive', golden_image,
+                                                                     download_file, connections=4)
 
         self.mock_ansible_module.exit_json.assert_called_once_with(
             changed=True,
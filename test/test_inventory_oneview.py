@@ -0,0 +1,162 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+###
+# Copyright (2016-2017) Hewlett Packard Enterprise Development LP
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# You may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+###
+
+import os
+import mock
+import pytest
+
+from importlib.machinery import SourceFileLoader
+from ansible.inventory.data import InventoryData
+from ansible.module_utils.six.moves.urllib.parse import parse_qs, urlparse
+
+INVENTORY_PLUGIN_PATH = os.path.join(os.path.dirname(__file__), '..', 'inventory_plugins', 'oneview.py')
+
+oneview_inventory = SourceFileLoader('oneview_inventory', INVENTORY_PLUGIN_PATH).load_module()
+
+ENCLOSURE = dict(uri='/rest/enclosures/1', name='Encl1', modified='2017-01-01T00:00:00.000Z')
+BLADE_1 = dict(uri='/rest/server-hardware/1', name='Encl1, bay 1', locationUri=ENCLOSURE['uri'],
+               modified='2017-01-01T00:00:00.000Z')
+BLADE_2 = dict(uri='/rest/server-hardware/2', name='Encl1, bay 2', locationUri=ENCLOSURE['uri'],
+               modified='2017-01-02T00:00:00.000Z')
+RACK_SERVER = dict(uri='/rest/server-hardware/3', name='DL360', modified='2017-01-01T00:00:00.000Z')
+PROFILE = dict(uri='/rest/server-profiles/1', name='web-1', serverHardwareUri=BLADE_1['uri'],
+               modified='2017-01-03T00:00:00.000Z')
+RACK_1 = dict(uri='/rest/racks/1', name='Rack 1', rackMounts=[dict(mountUri=ENCLOSURE['uri'])],
+              modified='2017-01-01T00:00:00.000Z')
+RACK_2 = dict(uri='/rest/racks/2', name='Rack 2', rackMounts=[dict(mountUri=RACK_SERVER['uri'])],
+              modified='2017-01-01T00:00:00.000Z')
+SCOPE = dict(uri='/rest/scopes/1', name='Web', modified='2017-01-01T00:00:00.000Z')
+
+
+class FakeAppliance(object):
+    def __init__(self):
+        self.resources = {
+            '/rest/server-hardware': [BLADE_1, BLADE_2, RACK_SERVER],
+            '/rest/server-profiles': [PROFILE],
+            '/rest/enclosures': [ENCLOSURE],
+            '/rest/racks': [RACK_1, RACK_2],
+            '/rest/scopes': [SCOPE]
+        }
+        self.scope_members = {SCOPE['uri']: [PROFILE['uri']]}
+        self.requests = []
+
+    def get(self, uri):
+        self.requests.append(uri)
+        parsed_uri = urlparse(uri)
+        query = dict((key, values[0]) for key, values in parse_qs(parsed_uri.query).items())
+
+        members = self.resources[parsed_uri.path]
+        if 'filter' in query:
+            modified = query['filter'].split("'")[1]
+            members = [member for member in members if member['modified'] >= modified]
+        if 'scopeUris' in query:
+            members = [member for member in members if member['uri'] in self.scope_members[query['scopeUris']]]
+        if query.get('fields') == 'uri':
+            members = [dict(uri=member['uri']) for member in members]
+
+        return dict(members=members, nextPageUri=None)
+
+
+class TestOneViewInventory():
+    @pytest.fixture(autouse=True)
+    def setUp(self):
+        self.appliance = FakeAppliance()
+        self.options = dict(use_profile_names=True, strict=False, compose={}, groups={}, keyed_groups=[])
+
+        self.plugin = oneview_inventory.InventoryModule()
+        self.plugin.get_option = self.options.get
+        self.plugin.inventory = InventoryData()
+
+    def build(self, state=None):
+        state = self.plugin._sync(state or {}, self.appliance)
+        self.plugin._populate(state)
+        return state
+
+    def test_should_name_the_hosts_after_their_server_profiles(self):
+        self.build()
+
+        assert sorted(self.plugin.inventory.hosts) == ['DL360', 'Encl1, bay 2', 'web-1']
+        host_vars = self.plugin.inventory.get_host('web-1').vars
+        assert host_vars['oneview_server_hardware'] == BLADE_1
+        assert host_vars['oneview_server_profile'] == PROFILE
+
+    def test_should_name_the_host_after_the_hardware_when_the_profile_has_the_name_of_other_hardware(self):
+        self.appliance.resources['/rest/server-profiles'] = [dict(PROFILE, name='DL360')]
+
+        self.build()
+
+        assert sorted(self.plugin.inventory.hosts) == ['DL360', 'Encl1, bay 1', 'Encl1, bay 2']
+        assert self.plugin.inventory.get_host('DL360').vars['oneview_server_hardware'] == RACK_SERVER
+        assert self.plugin.inventory.get_host('Encl1, bay 1').vars['oneview_server_hardware'] == BLADE_1
+
+    def test_should_name_the_hosts_after_the_server_hardware(self):
+        self.options['use_profile_names'] = False
+
+        self.build()
+
+        assert sorted(self.plugin.inventory.hosts) == ['DL360', 'Encl1, bay 1', 'Encl1, bay 2']
+
+    def test_should_group_the_hosts_by_enclosure_rack_and_scope(self):
+        self.build()
+
+        groups = self.plugin.inventory.groups
+        assert sorted(host.name for host in groups['enclosure_Encl1'].get_hosts()) == ['Encl1, bay 2', 'web-1']
+        assert sorted(host.name for host in groups['rack_Rack_1'].get_hosts()) == ['Encl1, bay 2', 'web-1']
+        assert [host.name for host in groups['rack_Rack_2'].get_hosts()] == ['DL360']
+        assert [host.name for host in groups['scope_Web'].get_hosts()] == ['web-1']
+        assert sorted(host.name for host in groups['unassigned_server_hardware'].get_hosts()) == ['DL360', 'Encl1, bay 2']
+        assert self.plugin.inventory.get_host('DL360').vars['oneview_rack'] == RACK_2
+
+    def test_should_request_only_the_resources_modified_since_the_previous_sync(self):
+        state = self.plugin._sync({}, self.appliance)
+        assert state['collections']['server_hardware']['modified'] == '2017-01-02T00:00:00.000Z'
+
+        self.appliance.requests = []
+        self.plugin._sync(state, self.appliance)
+
+        assert '/rest/server-hardware?filter=modified%20%3E%3D%20%272017-01-02T00%3A00%3A00.000Z%27' in self.appliance.requests
+        assert '/rest/server-hardware' not in self.appliance.requests
+
+    def test_should_update_the_modified_resources_and_drop_the_removed_ones(self):
+        state = self.plugin._sync({}, self.appliance)
+        updated_blade = dict(BLADE_2, name='Encl1, bay 2 renamed', modified='2017-02-01T00:00:00.000Z')
+        self.appliance.resources['/rest/server-hardware'] = [BLADE_1, updated_blade]
+
+        self.build(state)
+
+        assert sorted(self.plugin.inventory.hosts) == ['Encl1, bay 2 renamed', 'web-1']
+
+    def test_should_reuse_the_cached_state(self):
+        cached_state = self.plugin._sync({}, self.appliance)
+        self.options['cache'] = True
+        self.plugin._cache = {'cache_key': cached_state}
+        self.plugin.get_cache_key = lambda path: 'cache_key'
+        self.plugin._read_config_data = mock.Mock()
+        self.plugin._create_client = mock.Mock()
+        self.plugin._create_client.return_value.connection = self.appliance
+        self.appliance.requests = []
+
+        self.plugin.parse(InventoryData(), mock.Mock(), 'oneview.yml')
+
+        assert '/rest/server-hardware' not in self.appliance.requests
+        assert sorted(self.plugin.inventory.hosts) == ['DL360', 'Encl1, bay 2', 'web-1']
+        assert self.plugin._cache['cache_key']['collections']['server_hardware']['modified'] == '2017-01-02T00:00:00.000Z'
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
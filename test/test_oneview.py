@@ -16,10 +16,17 @@
 # limitations under the License.
 ###
 
+import hashlib
+import json
 import mock
 import logging
+import multiprocessing
+import os
 import pytest
 import sys
+import threading
+import time
+import timeit
 
 from module_utils import oneview
 
@@ -28,24 +35,59 @@ ONEVIEW_MODULE_UTILS_PATH = 'module_utils.oneview'
 sys.modules['ansible.module_utils.oneview'] = oneview
 
 from copy import deepcopy
+from hpe_test_utils import LocalHttpServer, build_enclosure, build_server_profile
+from ansible.module_utils.basic import env_fallback
+from hpOneView.exceptions import HPOneViewException
+from hpOneView.resources.task_monitor import TaskMonitor
+from hpOneView.resources.uncategorized.unmanaged_devices import UnmanagedDevices
 from module_utils.oneview import (OneViewModuleBase,
+                                  FileDigestCache,
+                                  FileTransfer,
+                                  OneViewSessionCache,
+                                  OneViewResourceCache,
+                                  OneViewHttpApi,
                                   OneViewClient,
                                   OneViewModuleException,
                                   OneViewModuleValueError,
                                   OneViewModuleResourceNotFound,
+                                  ReservationLedger,
+                                  RetryScheduler,
                                   SPKeys,
                                   ServerProfileMerger,
                                   ServerProfileReplaceNamesByUris,
+                                  VlanIdSet,
                                   _str_sorted,
                                   merge_list_by_key,
                                   transform_list_to_dict,
                                   compare,
+                                  compare_list,
+                                  diff,
+                                  get_changed_paths,
+                                  build_fields_projection,
+                                  iterate_all_resources,
+                                  run_concurrently,
+                                  get_by_names,
                                   get_logger)
 
 MSG_GENERIC_ERROR = 'Generic error message'
 MSG_GENERIC = "Generic message"
 
 
+class FakeResourceClient(object):
+    """SDK client that starts the tasks informed, awaiting them with its own task monitor."""
+
+    def __init__(self):
+        self._task_monitor = TaskMonitor(mock.Mock())
+        self.created = []
+
+    def start(self, task):
+        return self._task_monitor.wait_for_task(task)
+
+    def create(self, data, task):
+        self.created.append(data)
+        return self.start(task)
+
+
 class TestOneViewModuleBase():
     """
     OneViewModuleBaseSpec provides the mocks used in this test case.
@@ -77,6 +119,11 @@ class TestOneViewModuleBase():
                          'hostname': {'type': 'str'},
                          'image_streamer_hostname': {'type': 'str'},
                          'password': {'type': 'str', 'no_log': True},
+                         'resource_cache_dir': {'type': 'path',
+                                                'fallback': (env_fallback, ['ONEVIEWSDK_RESOURCE_CACHE_DIR'])},
+                         'resource_cache_ttl': {'type': 'int', 'default': 300},
+                         'session_cache_dir': {'type': 'path',
+                                               'fallback': (env_fallback, ['ONEVIEWSDK_SESSION_CACHE_DIR'])},
                          'username': {'type': 'str'},
                          'validate_etag': {'type': 'bool', 'default': True}}
 
@@ -97,6 +144,7 @@ class TestOneViewModuleBase():
         patcher_ansible = mock.patch(OneViewModuleBase.__module__ + '.AnsibleModule')
         self.mock_ansible_module_init = patcher_ansible.start()
         self.mock_ansible_module = mock.Mock()
+        self.mock_ansible_module._socket_path = None
         self.mock_ansible_module_init.return_value = self.mock_ansible_module
 
         yield
@@ -180,6 +228,56 @@ class TestOneViewModuleBase():
         self.mock_ov_client_from_json_file.not_been_called()
         mock_ov_client_from_credentials.assert_called_once_with(params_for_expect)
 
+    def test_should_load_config_from_parameters_using_session_cache(self):
+        params = {'hostname': '172.16.1.1', 'username': 'admin', 'password': 'mypass', 'api_version': 500,
+                  'image_streamer_hostname': '172.16.1.2', 'session_cache_dir': '/tmp/oneview-sessions'}
+        params_for_expect = {'image_streamer_ip': '172.16.1.2', 'api_version': 500, 'ip': '172.16.1.1',
+                             'credentials': {'userName': 'admin', 'password': 'mypass'}}
+        self.mock_ansible_module.params = params
+
+        with mock.patch(ONEVIEW_MODULE_UTILS_PATH + '.OneViewSessionCache') as mock_session_cache:
+            base_mod = OneViewModuleBase()
+
+        mock_session_cache.assert_called_once_with('/tmp/oneview-sessions')
+        mock_session_cache.return_value.create_client.assert_called_once_with(params_for_expect)
+        assert base_mod.oneview_client == mock_session_cache.return_value.create_client.return_value
+
+    def test_should_load_config_from_file_using_session_cache(self, tmpdir):
+        config = {'ip': '172.16.1.1', 'credentials': {'userName': 'admin', 'password': 'mypass'}}
+        config_file = tmpdir.join('config.json')
+        config_file.write(json.dumps(config))
+        self.mock_ansible_module.params = {'config': str(config_file), 'session_cache_dir': str(tmpdir)}
+
+        with mock.patch(ONEVIEW_MODULE_UTILS_PATH + '.OneViewSessionCache') as mock_session_cache:
+            OneViewModuleBase()
+
+        mock_session_cache.return_value.create_client.assert_called_once_with(config)
+        self.mock_ov_client_from_json_file.assert_not_called()
+
+    def test_should_create_the_client_through_the_persistent_connection(self):
+        self.mock_ansible_module.params = {'config': 'config.json'}
+        self.mock_ansible_module._socket_path = '/tmp/ansible-socket'
+
+        with mock.patch(ONEVIEW_MODULE_UTILS_PATH + '.OneViewHttpApi') as mock_httpapi:
+            base_mod = OneViewModuleBase()
+
+        mock_httpapi.assert_called_once_with('/tmp/ansible-socket')
+        assert base_mod.oneview_client == mock_httpapi.return_value.create_client.return_value
+        self.mock_ov_client_from_json_file.assert_not_called()
+
+    def test_should_install_the_resource_cache_on_the_client_connection(self, tmpdir):
+        config = {'ip': '172.16.1.1', 'credentials': {'userName': 'admin', 'password': 'mypass'}}
+        config_file = tmpdir.join('config.json')
+        config_file.write(json.dumps(config))
+        self.mock_ansible_module.params = {'config': str(config_file), 'resource_cache_dir': str(tmpdir),
+                                           'resource_cache_ttl': 60}
+
+        with mock.patch(ONEVIEW_MODULE_UTILS_PATH + '.OneViewResourceCache') as mock_resource_cache:
+            base_mod = OneViewModuleBase()
+
+        mock_resource_cache.assert_called_once_with(str(tmpdir), 60)
+        mock_resource_cache.return_value.install.assert_called_once_with(base_mod.oneview_client.connection, config)
+
     def test_should_call_fail_json_when_oneview_sdk_not_installed(self):
         self.mock_ansible_module.params = {'config': 'config.json'}
 
@@ -222,6 +320,197 @@ class TestOneViewModuleBase():
         self.mock_ov_client.connection.enable_etag_validation.not_been_called()
         self.mock_ov_client.connection.disable_etag_validation.not_been_called()
 
+    def test_should_add_wait_argument_when_supported(self):
+        self.mock_ansible_module.params = self.PARAMS_FOR_PRESENT
+
+        OneViewModuleBase(validate_etag_support=True, wait_support=True)
+
+        expected_arg_spec = deepcopy(self.EXPECTED_ARG_SPEC)
+        expected_arg_spec['wait'] = {'type': 'bool', 'default': True}
+
+        self.mock_ansible_module_init.assert_called_once_with(argument_spec=expected_arg_spec,
+                                                              supports_check_mode=False)
+
+    def test_should_return_started_task_when_wait_is_false(self):
+        self.mock_ansible_module.params = dict(self.PARAMS_FOR_PRESENT, wait=False)
+        task = {'uri': '/rest/tasks/1', 'taskState': 'Running',
+                'associatedResource': {'resourceUri': '/rest/enclosures/1'}}
+        resource_client = FakeResourceClient()
+
+        base_mod = OneViewModuleBase(wait_support=True)
+
+        def execute_module():
+            with base_mod.asynchronous_tasks(resource_client):
+                resource_client.start(task)
+            raise AssertionError('The module should not continue after the task was started')
+
+        base_mod.execute_module = execute_module
+        base_mod.run()
+
+        self.mock_ansible_module.exit_json.assert_called_once_with(changed=True,
+                                                                   msg=OneViewModuleBase.MSG_TASK_STARTED,
+                                                                   task_uri='/rest/tasks/1',
+                                                                   resource_uri='/rest/enclosures/1')
+        assert 'wait_for_task' not in vars(resource_client._task_monitor)
+        assert 'get_completed_task' not in vars(resource_client._task_monitor)
+
+    def test_should_return_started_task_without_associated_resource(self):
+        self.mock_ansible_module.params = dict(self.PARAMS_FOR_PRESENT, wait=False)
+
+        base_mod = OneViewModuleBase(wait_support=True)
+        base_mod.resource_client = FakeResourceClient()
+
+        def execute_module():
+            with base_mod.asynchronous_tasks():
+                base_mod.resource_client._task_monitor.get_completed_task({'uri': '/rest/tasks/2'}, timeout=60)
+
+        base_mod.execute_module = execute_module
+        base_mod.run()
+
+        self.mock_ansible_module.exit_json.assert_called_once_with(changed=True,
+                                                                   msg=OneViewModuleBase.MSG_TASK_STARTED,
+                                                                   task_uri='/rest/tasks/2',
+                                                                   resource_uri=None)
+
+    def test_should_return_started_task_of_a_client_wrapping_a_resource_client(self):
+        self.mock_ansible_module.params = dict(self.PARAMS_FOR_PRESENT, wait=False)
+        task = {'uri': '/rest/tasks/1', 'taskState': 'Running',
+                'associatedResource': {'resourceUri': '/rest/unmanaged-devices/1'}}
+        connection = mock.Mock()
+        connection.post.return_value = (task, None)
+        # Like the clients of the SDK 4.x, it keeps the TaskMonitor in the ResourceClient of its _client
+        unmanaged_devices = UnmanagedDevices(connection)
+
+        base_mod = OneViewModuleBase(wait_support=True)
+
+        def execute_module():
+            with base_mod.asynchronous_tasks(unmanaged_devices):
+                unmanaged_devices.add({'name': 'name'})
+            raise AssertionError('The module should not continue after the task was started')
+
+        base_mod.execute_module = execute_module
+        base_mod.run()
+
+        self.mock_ansible_module.exit_json.assert_called_once_with(changed=True,
+                                                                   msg=OneViewModuleBase.MSG_TASK_STARTED,
+                                                                   task_uri='/rest/tasks/1',
+                                                                   resource_uri='/rest/unmanaged-devices/1')
+        connection.get.assert_not_called()
+        assert 'wait_for_task' not in vars(unmanaged_devices._client._task_monitor)
+
+    def test_should_wait_for_tasks_when_wait_is_true(self):
+        self.mock_ansible_module.params = dict(self.PARAMS_FOR_PRESENT, wait=True)
+        resource_client = FakeResourceClient()
+
+        base_mod = OneViewModuleBase(wait_support=True)
+
+        with base_mod.asynchronous_tasks(resource_client):
+            assert 'wait_for_task' not in vars(resource_client._task_monitor)
+
+    def test_should_restore_task_monitor_when_block_fails(self):
+        self.mock_ansible_module.params = dict(self.PARAMS_FOR_PRESENT, wait=False)
+        resource_client = FakeResourceClient()
+
+        base_mod = OneViewModuleBase(wait_support=True)
+
+        with pytest.raises(OneViewModuleException):
+            with base_mod.asynchronous_tasks(resource_client):
+                assert 'wait_for_task' in vars(resource_client._task_monitor)
+                raise OneViewModuleException(MSG_GENERIC_ERROR)
+
+        assert 'wait_for_task' not in vars(resource_client._task_monitor)
+        assert 'get_completed_task' not in vars(resource_client._task_monitor)
+
+    def test_should_not_intercept_the_tasks_of_other_task_monitors(self):
+        self.mock_ansible_module.params = dict(self.PARAMS_FOR_PRESENT, wait=False)
+        resource_client = FakeResourceClient()
+        other_task_monitor = TaskMonitor(mock.Mock())
+        task = {'uri': '/rest/tasks/1', 'taskState': 'Running'}
+
+        base_mod = OneViewModuleBase(wait_support=True)
+
+        with mock.patch.object(TaskMonitor, 'wait_for_task', return_value='awaited'):
+            with base_mod.asynchronous_tasks(resource_client):
+                assert other_task_monitor.wait_for_task(task) == 'awaited'
+
+    def test_should_not_intercept_the_tasks_awaited_by_other_threads(self):
+        self.mock_ansible_module.params = self.PARAMS_FOR_PRESENT
+        task = {'uri': '/rest/tasks/1', 'taskState': 'Running'}
+        started = threading.Event()
+        resumed = threading.Event()
+        awaited = []
+
+        def await_task():
+            started.wait()
+            awaited.append(TaskMonitor(mock.Mock()).wait_for_task(task))
+            resumed.set()
+
+        def start_task(client):
+            started.set()
+            resumed.wait()
+            client.start(task)
+
+        resource_client = FakeResourceClient()
+        thread = threading.Thread(target=await_task)
+        thread.start()
+        with mock.patch.object(TaskMonitor, 'wait_for_task', return_value='awaited'):
+            assert OneViewModuleBase().start_task(start_task.__get__(resource_client)) == task
+            thread.join()
+
+        assert awaited == ['awaited']
+
+    def test_start_task_should_return_task_without_waiting(self):
+        self.mock_ansible_module.params = self.PARAMS_FOR_PRESENT
+        task = {'uri': '/rest/tasks/1', 'taskState': 'Running'}
+        resource_client = FakeResourceClient()
+
+        base_mod = OneViewModuleBase()
+
+        assert base_mod.start_task(resource_client.create, {'name': 'name'}, task) == task
+        assert resource_client.created == [{'name': 'name'}]
+        assert 'wait_for_task' not in vars(resource_client._task_monitor)
+
+    def test_start_task_should_return_task_of_a_client_wrapping_a_resource_client(self):
+        self.mock_ansible_module.params = self.PARAMS_FOR_PRESENT
+        task = {'uri': '/rest/tasks/1', 'taskState': 'Running'}
+        connection = mock.Mock()
+        connection.post.return_value = (task, None)
+        unmanaged_devices = UnmanagedDevices(connection)
+
+        base_mod = OneViewModuleBase()
+
+        assert base_mod.start_task(unmanaged_devices.add, {'name': 'name'}) == task
+        connection.post.assert_called_once_with('/rest/unmanaged-devices', {'name': 'name'}, custom_headers=None)
+        connection.get.assert_not_called()
+
+    def test_start_task_should_return_none_when_no_task_is_started(self):
+        self.mock_ansible_module.params = self.PARAMS_FOR_PRESENT
+
+        base_mod = OneViewModuleBase()
+
+        assert base_mod.start_task(mock.Mock(return_value={'name': 'name'})) is None
+
+    def test_gather_facts_by_name_should_keep_the_facts_and_errors_of_each_resource(self):
+        self.mock_ansible_module.params = self.PARAMS_FOR_PRESENT
+        resources = [dict(name='Res 1', uri='/rest/res/1'), dict(name='Res 2', uri='/rest/res/2')]
+
+        def fail():
+            raise OneViewModuleException('Fake error')
+
+        def build_requests(resource):
+            return [('res_uri', lambda: resource['uri']),
+                    ('res_detail', fail if resource['name'] == 'Res 1' else lambda: 'detail')]
+
+        base_mod = OneViewModuleBase()
+        facts_by_name = base_mod.gather_facts_by_name(resources, build_requests, 'res')
+
+        assert facts_by_name == {
+            'Res 1': dict(res=resources[0], res_uri='/rest/res/1', errors=dict(res_detail='Fake error')),
+            'Res 2': dict(res=resources[1], res_uri='/rest/res/2', res_detail='detail')
+        }
+        assert list(facts_by_name) == ['Res 1', 'Res 2']
+        self.mock_ansible_module.log.assert_called_with(msg=OneViewModuleBase.MSG_FACTS_PROGRESS.format(4, 4))
+
     def test_additional_argument_spec_construction(self):
         self.mock_ansible_module.params = self.PARAMS_FOR_PRESENT
 
@@ -452,6 +741,138 @@ class TestOneViewModuleBase():
 
         assert res is None
 
+    def test_get_all_resources_should_use_the_facts_params(self):
+        self.mock_ansible_module.params = dict(config='config.json', params=dict(count=2, sort='name:ascending'))
+        resource_client = mock.Mock()
+        resource_client.get_all.return_value = [{'name': 'name1'}, {'name': 'name2'}]
+
+        res = OneViewModuleBase().get_all_resources(resource_client)
+
+        resource_client.get_all.assert_called_once_with(count=2, sort='name:ascending')
+        assert res == [{'name': 'name1'}, {'name': 'name2'}]
+
+    def test_get_all_resources_should_select_the_matched_resources(self):
+        self.mock_ansible_module.params = dict(config='config.json', params=dict(match={'status.value': ['Critical', 'Warning']}))
+        resource_client = mock.Mock()
+        resource_client.get_all.return_value = [dict(name='name1', status=dict(value='OK')),
+                                                dict(name='name2', status=dict(value='Warning')),
+                                                dict(name='name3')]
+
+        res = OneViewModuleBase().get_all_resources(resource_client)
+
+        resource_client.get_all.assert_called_once_with()
+        assert res == [dict(name='name2', status=dict(value='Warning'))]
+
+    def test_get_all_resources_should_request_pages_when_page_size_informed(self):
+        self.mock_ansible_module.params = dict(config='config.json', params=dict(page_size=2, filter="status='OK'", match=dict(id=3)))
+        resource_client = mock.Mock()
+        resource_client.get_all.side_effect = [[dict(id=1), dict(id=2)], [dict(id=3), dict(id=4)], []]
+
+        res = OneViewModuleBase().get_all_resources(resource_client)
+
+        assert resource_client.get_all.call_args_list == [mock.call(start=0, count=2, filter="status='OK'"),
+                                                          mock.call(start=2, count=2, filter="status='OK'"),
+                                                          mock.call(start=4, count=2, filter="status='OK'")]
+        assert res == [dict(id=3)]
+
+    def test_get_all_resources_should_request_the_first_level_fields_when_supported(self):
+        self.mock_ansible_module.params = dict(config='config.json', params=dict(count=2),
+                                               fields=['status', 'bios.manageBios'])
+        resource_client = mock.Mock()
+        resource_client.get_all.return_value = [dict(name='name1', status='OK', bios=dict(manageBios=True))]
+
+        res = OneViewModuleBase().get_all_resources(resource_client)
+
+        resource_client.get_all.assert_called_once_with(count=2, fields='bios,name,status,uri')
+        assert res == [dict(name='name1', status='OK', bios=dict(manageBios=True))]
+
+    def test_get_all_resources_should_request_the_attributes_selected_by_the_match(self):
+        self.mock_ansible_module.params = dict(config='config.json', fields=['name'],
+                                               params=dict(match={'taskState': 'Error', 'owner.name': 'admin'}))
+        resource_client = mock.Mock()
+        resource_client.get_all.return_value = [dict(name='task1', uri='/rest/tasks/1', taskState='Error',
+                                                     owner=dict(name='admin')),
+                                                dict(name='task2', uri='/rest/tasks/2', taskState='Completed',
+                                                     owner=dict(name='admin'))]
+
+        res = OneViewModuleBase().get_all_resources(resource_client)
+
+        resource_client.get_all.assert_called_once_with(fields='name,owner,taskState,uri')
+        assert [resource['name'] for resource in res] == ['task1']
+
+    def test_get_all_resources_should_not_request_fields_when_not_supported(self):
+        self.mock_ansible_module.params = dict(config='config.json', params=dict(page_size=10), fields=['name'])
+        resources = [dict(name='name1', status='OK'), dict(name='name2', status='OK')]
+        calls = []
+
+        class ResourceClient(object):
+            def get_all(self, start=0, count=-1, filter='', sort=''):
+                calls.append(dict(start=start, count=count))
+                return resources
+
+        res = OneViewModuleBase().get_all_resources(ResourceClient())
+
+        assert calls == [dict(start=0, count=10)]
+        assert res == [dict(name='name1'), dict(name='name2')]
+
+    def test_should_project_the_lists_of_resources_when_fields_informed(self):
+        self.mock_ansible_module.params = dict(config='config.json', fields=['name', 'connections.id'])
+
+        base_mod = OneViewModuleBase()
+        base_mod.RESOURCE_LIST_FACTS = ['server_profiles']
+        base_mod.execute_module = mock.Mock(return_value=dict(ansible_facts=dict(
+            server_profiles=[dict(name='name1', status='OK', connections=[dict(id=1, mac='mac1'), dict(id=2)])],
+            server_profile_schema=dict(name='schema'),
+            server_profile_profile_ports=[dict(name='port1', type='Ethernet')],
+            names=['name1'])))
+        base_mod.run()
+
+        self.mock_ansible_module.exit_json.assert_called_once_with(changed=False, ansible_facts=dict(
+            server_profiles=[dict(name='name1', connections=[dict(id=1), dict(id=2)])],
+            server_profile_schema=dict(name='schema'),
+            server_profile_profile_ports=[dict(name='port1', type='Ethernet')],
+            names=['name1']))
+
+    def test_fields_projection_should_select_nested_fields(self):
+        project = build_fields_projection(['name', 'bios', 'bios.manageBios', 'boot.order', 'boot.manageBoot',
+                                           'sanStorage.volumeAttachments.id', 'missing.field'])
+        resource = build_server_profile(connections=2, volumes=2)
+
+        assert project(resource) == dict(name=resource['name'],
+                                         bios=resource['bios'],
+                                         boot=resource['boot'],
+                                         sanStorage=dict(volumeAttachments=[dict(id=1), dict(id=2)]))
+
+    def test_iterate_all_resources_should_respect_start_and_count(self):
+        resource_client = mock.Mock()
+        resource_client.get_all.side_effect = [[dict(id=i) for i in range(10, 14)], [dict(id=14)]]
+
+        res = list(iterate_all_resources(resource_client, 4, start=10, count=5))
+
+        assert resource_client.get_all.call_args_list == [mock.call(start=10, count=4), mock.call(start=14, count=1)]
+        assert res == [dict(id=i) for i in range(10, 15)]
+
+    def test_iterate_all_resources_should_stop_on_a_partial_page(self):
+        resource_client = mock.Mock()
+        resource_client.get_all.side_effect = [[dict(id=1), dict(id=2)], [dict(id=3)]]
+
+        res = list(iterate_all_resources(resource_client, 2, projection=lambda resource: resource['id']))
+
+        assert resource_client.get_all.call_count == 2
+        assert res == [1, 2, 3]
+
+    def test_iterate_all_resources_should_request_the_next_page_only_when_needed(self):
+        resource_client = mock.Mock()
+        resource_client.get_all.side_effect = [[dict(id=1), dict(id=2)], [dict(id=3), dict(id=4)], []]
+
+        iterator = iterate_all_resources(resource_client, 2)
+
+        assert next(iterator) == dict(id=1)
+        assert next(iterator) == dict(id=2)
+        assert resource_client.get_all.call_count == 1
+        assert next(iterator) == dict(id=3)
+        assert resource_client.get_all.call_count == 2
+
     def test_transform_list_to_dict(self):
         list_ = ['one', 'two', {'tree': 3}, 'four', 5]
 
@@ -1113,6 +1534,119 @@ class TestOneViewModuleBase():
         }
         assert not compare(dict1, dict2)
 
+    def test_comparison_should_be_true_for_equal_copies_of_large_resources(self):
+        resource1 = build_server_profile(connections=100, volumes=50, custom_attributes=50)
+        resource2 = deepcopy(resource1)
+        resource2['connections'].reverse()
+        resource2['sanStorage']['volumeAttachments'].reverse()
+
+        assert compare(resource1, resource2)
+
+    def test_comparison_should_be_false_for_one_change_in_large_resources(self):
+        resource1 = build_server_profile(connections=100, volumes=50, custom_attributes=50)
+        resource2 = deepcopy(resource1)
+        resource2['connections'][42]['requestedMbps'] = '1'
+
+        assert not compare(resource1, resource2)
+
+    def test_comparison_should_be_true_for_the_same_object(self):
+        resource = build_enclosure()
+
+        assert compare(resource, resource)
+
+    def test_comparison_list_should_ignore_the_order_of_nested_lists_of_dicts(self):
+        list1 = [dict(id=1, paths=[dict(name='a', wwpn=None), dict(name='b', targets=[1, '2'])]),
+                 dict(id=2, paths=[])]
+        list2 = [dict(id='2', paths=None),
+                 dict(id=1.0, paths=[dict(name='b', targets=[2, 1]), dict(name='a')])]
+
+        assert compare_list(list1, list2)
+
+    def test_comparison_list_should_count_repeated_elements(self):
+        assert not compare_list([1, 1, 2], [1, 2, 2])
+        assert not compare_list([dict(id=1), dict(id=1)], [dict(id=1), dict(id=1, name='name')])
+
+    def test_comparison_list_should_not_sort_elements(self):
+        list1 = [dict(id=i) for i in range(10)]
+        list2 = list(reversed(list1))
+
+        with mock.patch(ONEVIEW_MODULE_UTILS_PATH + '._str_sorted') as mock_str_sorted:
+            assert compare_list(list1, list2)
+
+        mock_str_sorted.assert_not_called()
+
+    def test_comparison_list_should_be_false_when_second_list_is_empty(self):
+        assert not compare_list([], [])
+        assert not compare_list([1], None)
+
+    @mock.patch.object(oneview.logger, 'debug')
+    @mock.patch.object(oneview.logger, 'isEnabledFor', return_value=False)
+    def test_comparison_should_not_render_resources_when_debug_is_disabled(self, mock_is_enabled, mock_debug):
+        dict1 = dict(name='name', value=[dict(id=1)])
+        dict2 = dict(name='name', value=[dict(id=2)])
+
+        assert not compare(dict1, dict2)
+        mock_debug.assert_not_called()
+
+    @mock.patch.object(oneview.logger, 'debug')
+    @mock.patch.object(oneview.logger, 'isEnabledFor', return_value=True)
+    def test_comparison_should_log_the_difference_when_debug_is_enabled(self, mock_is_enabled, mock_debug):
+        dict1 = dict(name='name1')
+        dict2 = dict(name='name2')
+
+        assert not compare(dict1, dict2)
+        message = OneViewModuleBase.MSG_DIFF_AT_KEY.format('name') + "resource1 = {0}, resource2 = {1}".format(dict1, dict2)
+        mock_debug.assert_called_once_with(message)
+
+    def test_diff_should_be_empty_for_equivalent_resources(self):
+        assert diff(self.DICT_ORIGINAL, self.DICT_EQUAL_ORIGINAL) == []
+        assert diff(self.DICT_EMPTY_NONE1, self.DICT_EMPTY_NONE2) == []
+
+    def test_diff_should_ignore_types_empty_values_and_list_order(self):
+        dict1 = dict(name='name', vlanId=201, description=None, scopeUris=[], list=[1, 2, '3'])
+        dict2 = dict(name='name', vlanId='201', description='', scopeUris=None, list=['3', 2, 1], other=None)
+
+        assert diff(dict1, dict2) == []
+
+    def test_diff_should_return_the_json_patch_operations(self):
+        dict1 = dict(name='name', description='desc', sub=dict(level3=dict(value=1), list=[1, 2]))
+        dict2 = dict(name='new name', sub=dict(level3=dict(value=1, new='new'), list=[2, 3]))
+
+        assert diff(dict1, dict2) == [
+            dict(op='remove', path='/description'),
+            dict(op='replace', path='/name', value='new name'),
+            dict(op='add', path='/sub/level3/new', value='new'),
+            dict(op='replace', path='/sub/list', value=[2, 3])
+        ]
+
+    def test_diff_should_replace_values_with_different_types(self):
+        dict1 = dict(sub=dict(value=1), list=[1], value='1')
+        dict2 = dict(sub='1', list='1', value=[1])
+
+        assert diff(dict1, dict2) == [
+            dict(op='replace', path='/list', value='1'),
+            dict(op='replace', path='/sub', value='1'),
+            dict(op='replace', path='/value', value=[1])
+        ]
+
+    def test_diff_should_escape_the_json_pointer_tokens(self):
+        assert diff({'a/b': 1, 'c~d': 1}, {'a/b': 2, 'c~d': 2}) == [
+            dict(op='replace', path='/a~1b', value=2),
+            dict(op='replace', path='/c~0d', value=2)
+        ]
+
+    def test_diff_should_agree_with_compare(self):
+        resource1 = build_server_profile(connections=20, volumes=10, custom_attributes=10)
+        resource2 = deepcopy(resource1)
+        resource2['connections'].reverse()
+        assert compare(resource1, resource2)
+        assert diff(resource1, resource2) == []
+
+        resource2['connections'][3]['requestedMbps'] = '1'
+        resource2['bios'] = dict(manageBios=True)
+        assert not compare(resource1, resource2)
+        assert get_changed_paths(resource1, resource2) == ['/bios/overriddenSettings', '/connections']
+
     def test_merge_list_by_key_when_original_list_is_empty(self):
         original_list = []
         list_with_changes = [dict(id=1, value="123")]
@@ -1206,6 +1740,785 @@ class TestOneViewModuleBase():
 
         assert merged_list == expected_list
 
+    def test_merge_list_by_key_should_copy_only_the_changed_items(self):
+        original_list = [dict(id=1, value="123"), dict(id=2, value="345")]
+        list_with_changes = [dict(id=1), dict(id=2, value="345-changed")]
+
+        merged_list = merge_list_by_key(original_list, list_with_changes, key="id")
+
+        assert merged_list == [dict(id=1, value="123"), dict(id=2, value="345-changed")]
+        assert merged_list[0] is original_list[0]
+        assert original_list == [dict(id=1, value="123"), dict(id=2, value="345")]
+
+
+class TestRetryScheduler():
+    @pytest.fixture(autouse=True)
+    def setUp(self):
+        self.clock = dict(now=0)
+
+        def sleep(seconds):
+            self.clock['now'] += seconds
+
+        with mock.patch.object(oneview.time, 'sleep') as self.mock_sleep, \
+                mock.patch.object(oneview.time, 'time') as mock_time, \
+                mock.patch.object(oneview.random, 'random') as self.mock_random:
+            self.mock_sleep.side_effect = sleep
+            mock_time.side_effect = lambda: self.clock['now']
+            self.mock_random.return_value = 0
+            yield
+
+    def get_delays(self):
+        return [delay for ((delay,), _) in self.mock_sleep.call_args_list]
+
+    def test_should_back_off_exponentially_up_to_max_delay(self):
+        scheduler = RetryScheduler(initial_delay=0.05, max_delay=0.3, factor=2, max_attempts=6)
+
+        assert list(scheduler.attempts()) == [1, 2, 3, 4, 5, 6]
+        assert self.get_delays() == [0.05, 0.1, 0.2, 0.3, 0.3]
+
+    def test_should_apply_jitter_to_delays(self):
+        self.mock_random.return_value = 0.5
+        scheduler = RetryScheduler(initial_delay=1, max_delay=10, factor=2, jitter=0.5, max_attempts=3)
+
+        list(scheduler.attempts())
+
+        assert self.get_delays() == [0.75, 1.5]
+
+    def test_should_stop_when_timeout_expires(self):
+        scheduler = RetryScheduler(initial_delay=1, max_delay=10, factor=2, timeout=5)
+
+        assert list(scheduler.attempts()) == [1, 2, 3, 4]
+        assert self.get_delays() == [1, 2, 2]
+
+    def test_should_not_sleep_after_break(self):
+        scheduler = RetryScheduler(max_attempts=5)
+
+        for attempt in scheduler.attempts():
+            break
+
+        self.mock_sleep.assert_not_called()
+
+    def test_call_should_retry_until_success(self):
+        function = mock.Mock(side_effect=[OneViewModuleException('busy'), OneViewModuleException('busy'), 'done'])
+
+        result = RetryScheduler(max_attempts=5).call(function, retry_if=lambda e: e.msg == 'busy')
+
+        assert result == 'done'
+        assert function.call_count == 3
+
+    def test_call_should_raise_errors_not_retried(self):
+        function = mock.Mock(side_effect=[OneViewModuleException('busy'), ValueError('other')])
+
+        with pytest.raises(ValueError):
+            RetryScheduler(max_attempts=5).call(function, retry_if=lambda e: isinstance(e, OneViewModuleException))
+
+        assert function.call_count == 2
+
+    def test_call_should_raise_last_error_when_attempts_are_over(self):
+        errors = [OneViewModuleException('busy 1'), OneViewModuleException('busy 2')]
+        function = mock.Mock(side_effect=errors)
+
+        with pytest.raises(OneViewModuleException) as exception_info:
+            RetryScheduler(max_attempts=2).call(function, retry_if=lambda e: True)
+
+        assert exception_info.value is errors[1]
+
+
+class TestRunConcurrently():
+    def test_should_return_results_in_the_informed_order(self):
+        functions = [lambda index=index: time.sleep(0.01 * (5 - index)) or index for index in range(5)]
+
+        assert run_concurrently(functions, max_workers=5) == [0, 1, 2, 3, 4]
+
+    def test_should_bound_the_functions_running_at_a_time(self):
+        running = dict(now=0, max=0)
+        lock = threading.Lock()
+
+        def function():
+            with lock:
+                running['now'] += 1
+                running['max'] = max(running['max'], running['now'])
+            time.sleep(0.01)
+            with lock:
+                running['now'] -= 1
+
+        run_concurrently([function] * 10, max_workers=3)
+
+        assert 1 < running['max'] <= 3
+
+    def test_should_raise_first_error_after_all_functions_finish(self):
+        finished = []
+
+        def fail(message):
+            raise OneViewModuleException(message)
+
+        functions = [lambda: finished.append(1),
+                     lambda: fail('first'),
+                     lambda: fail('second'),
+                     lambda: time.sleep(0.02) or finished.append(2)]
+
+        with pytest.raises(OneViewModuleException) as exception_info:
+            run_concurrently(functions)
+
+        assert exception_info.value.msg == 'first'
+        assert sorted(finished) == [1, 2]
+
+    def test_should_report_the_progress_of_the_functions(self):
+        progress = []
+
+        run_concurrently([lambda: 1] * 4, progress=lambda finished, total: progress.append((finished, total)))
+
+        assert progress == [(1, 4), (2, 4), (3, 4), (4, 4)]
+
+    def test_should_run_a_single_function_inline(self):
+        with mock.patch.object(oneview, 'ThreadPool') as mock_thread_pool:
+            assert run_concurrently([lambda: 'result']) == ['result']
+
+        mock_thread_pool.assert_not_called()
+
+
+class TestOneViewHttpApi():
+    @pytest.fixture(autouse=True)
+    def setUp(self):
+        patcher_connection = mock.patch(ONEVIEW_MODULE_UTILS_PATH + '.Connection')
+        self.mock_connection = patcher_connection.start().return_value
+        self.mock_connection.get_option.return_value = '172.16.1.1'
+        self.mock_connection.get_api_version.return_value = 600
+
+        patcher_do_http = mock.patch.object(oneview.OneViewConnection, 'do_http')
+        self.mock_do_http = patcher_do_http.start()
+
+        yield
+        patcher_connection.stop()
+        patcher_do_http.stop()
+
+    def test_should_create_the_client_without_login(self):
+        oneview_client = OneViewHttpApi('/tmp/ansible-socket').create_client()
+
+        self.mock_connection.get_option.assert_called_once_with('host')
+        assert oneview_client.api_version == 600
+        self.mock_do_http.assert_not_called()
+
+    def test_should_not_change_the_login_of_the_other_sdk_connections(self):
+        login = oneview.OneViewConnection.login
+        oneview_client = OneViewHttpApi('/tmp/ansible-socket').create_client()
+
+        assert oneview.OneViewConnection.login == login
+        assert isinstance(oneview_client, OneViewClient)
+
+    def test_should_send_the_sdk_requests_through_the_persistent_connection(self):
+        self.mock_connection.send_request.return_value = (200, {'ETag': '"1"'}, '{"name": "Net"}')
+        oneview_client = OneViewHttpApi('/tmp/ansible-socket').create_client()
+        oneview_client.connection.disable_etag_validation()
+
+        assert oneview_client.connection.get('/rest/ethernet-networks/1') == {'name': 'Net'}
+
+        self.mock_connection.send_request.assert_called_once_with(
+            None, path='/rest/ethernet-networks/1', method='GET',
+            headers={'Accept': 'application/json', 'Content-Type': 'application/json', 'If-Match': '*'})
+
+    def test_should_return_the_error_responses_the_same_way_as_the_sdk(self):
+        self.mock_connection.send_request.return_value = (404, {}, '{"errorCode": "RESOURCE_NOT_FOUND"}')
+        oneview_client = OneViewHttpApi('/tmp/ansible-socket').create_client()
+
+        with pytest.raises(HPOneViewException) as exception_info:
+            oneview_client.connection.put('/rest/ethernet-networks/1', {'name': 'Net'})
+
+        assert exception_info.value.oneview_response == {'errorCode': 'RESOURCE_NOT_FOUND'}
+        assert self.mock_connection.send_request.call_args[0] == ('{"name": "Net"}',)
+
+
+class TestOneViewResourceCache():
+    CONFIG = {'ip': '172.16.1.1',
+              'api_version': 600,
+              'credentials': {'userName': 'admin', 'password': 'mypass'}}
+
+    NETWORK_URI = '/rest/ethernet-networks/1'
+
+    @pytest.fixture(autouse=True)
+    def setUp(self, tmpdir):
+        self.cache_dir = str(tmpdir.join('resources'))
+        self.connection = self.create_connection()
+
+    def create_connection(self):
+        connection = mock.Mock()
+        connection.do_http.side_effect = lambda method, uri, body, custom_headers=None: self.respond(custom_headers)
+        connection.put.return_value = (None, {})
+        self.etag = '1'
+        return connection
+
+    def respond(self, custom_headers):
+        response = mock.Mock()
+        response.getheader.return_value = self.etag
+        if custom_headers and custom_headers.get('If-None-Match') == self.etag:
+            response.status = 304
+            return response, ''
+        response.status = 200
+        return response, {'uri': self.NETWORK_URI, 'eTag': self.etag}
+
+    def install(self, ttl=300, connection=None):
+        connection = connection or self.connection
+        OneViewResourceCache(self.cache_dir, ttl).install(connection, self.CONFIG)
+        return connection
+
+    def test_should_reuse_the_cached_response_across_connections(self):
+        first_connection = self.install()
+        assert first_connection.get(self.NETWORK_URI) == {'uri': self.NETWORK_URI, 'eTag': '1'}
+
+        other_connection = self.install(connection=self.create_connection())
+
+        assert other_connection.get(self.NETWORK_URI) == {'uri': self.NETWORK_URI, 'eTag': '1'}
+        other_connection.do_http.assert_not_called()
+        entry_files = [f for f in os.listdir(self.cache_dir) if f.endswith('.json')]
+        assert os.stat(os.path.join(self.cache_dir, entry_files[0])).st_mode & 0o777 == 0o600
+
+    def test_should_revalidate_the_response_with_the_etag_when_the_ttl_expires(self):
+        connection = self.install(ttl=0)
+        connection.get(self.NETWORK_URI)
+
+        assert connection.get(self.NETWORK_URI) == {'uri': self.NETWORK_URI, 'eTag': '1'}
+        connection.do_http.assert_called_with('GET', self.NETWORK_URI, '', custom_headers={'If-None-Match': '1'})
+
+        self.etag = '2'
+        assert connection.get(self.NETWORK_URI) == {'uri': self.NETWORK_URI, 'eTag': '2'}
+
+    def test_should_not_cache_other_collections(self):
+        original_get = self.connection.get
+        connection = self.install()
+
+        connection.get('/rest/tasks/1')
+
+        original_get.assert_called_once_with('/rest/tasks/1')
+        connection.do_http.assert_not_called()
+
+    def test_should_raise_the_errors_of_the_appliance(self):
+        response = mock.Mock(status=404)
+        connection = self.install()
+        connection.do_http.side_effect = None
+        connection.do_http.return_value = (response, {'errorCode': 'RESOURCE_NOT_FOUND'})
+
+        with pytest.raises(HPOneViewException):
+            connection.get(self.NETWORK_URI)
+
+    def test_should_discard_the_collection_written_through_the_connection(self):
+        connection = self.install()
+        connection.get(self.NETWORK_URI)
+        connection.get('/rest/ethernet-networks?filter="name=\'net\'"')
+        connection.get('/rest/network-sets/1')
+        connection.get('/rest/storage-pools/1')
+
+        connection.put(self.NETWORK_URI, {'name': 'net'})
+
+        remaining = [f for f in os.listdir(self.cache_dir) if f.endswith('.json')]
+        assert len(remaining) == 1
+
+        connection.do_http.reset_mock()
+        connection.get(self.NETWORK_URI)
+        assert connection.do_http.call_count == 1
+
+    def test_should_not_cache_a_response_requested_before_a_write(self):
+        connection = self.install()
+        other_cache = OneViewResourceCache(self.cache_dir)
+
+        def write_while_requesting(method, uri, body, custom_headers=None):
+            other_cache.invalidate(other_cache._get_appliance_key(self.CONFIG), self.NETWORK_URI)
+            return self.respond(custom_headers)
+
+        connection.do_http.side_effect = write_while_requesting
+        connection.get(self.NETWORK_URI)
+
+        assert [f for f in os.listdir(self.cache_dir) if f.endswith('.json')] == []
+
+    def test_should_let_the_other_writes_discard_the_collection_written(self):
+        connection = self.install()
+        connection.get('/rest/firmware-drivers/1')
+
+        connection.invalidate_resource_cache('/rest/firmware-bundles')
+
+        assert [f for f in os.listdir(self.cache_dir) if f.endswith('.json')] == []
+
+
+class TestGetByNames():
+    def test_should_combine_the_names_in_chunked_filters(self):
+        resource_client = mock.Mock()
+        resource_client.get_all.side_effect = [[dict(name='C'), dict(name='a')], [dict(name='D')]]
+
+        resources = get_by_names(resource_client, ['A', 'B', 'C', 'A', 'D'], names_per_query=3)
+
+        assert resource_client.get_all.call_args_list == [
+            mock.call(filter="\"name='A' OR name='B' OR name='C'\""),
+            mock.call(filter="\"name='D'\"")
+        ]
+        assert resources == [dict(name='a'), dict(name='C'), dict(name='D')]
+
+
+class TestOneViewSessionCache():
+    CONFIG = {'ip': '172.16.1.1',
+              'api_version': 600,
+              'credentials': {'userName': 'admin', 'password': 'mypass'}}
+
+    @pytest.fixture(autouse=True)
+    def setUp(self, tmpdir):
+        self.cache_dir = str(tmpdir.join('sessions'))
+        self.session_cache = OneViewSessionCache(self.cache_dir)
+
+        patcher_ov_client = mock.patch(ONEVIEW_MODULE_UTILS_PATH + '.OneViewClient')
+        self.mock_ov_client_class = patcher_ov_client.start()
+
+        yield
+        patcher_ov_client.stop()
+
+    def test_should_store_session_in_owner_only_file(self):
+        self.session_cache.store(self.CONFIG, 'session-1')
+
+        session_files = [f for f in os.listdir(self.cache_dir) if f.endswith('.json')]
+        assert len(session_files) == 1
+        assert os.stat(os.path.join(self.cache_dir, session_files[0])).st_mode & 0o777 == 0o600
+        assert os.stat(self.cache_dir).st_mode & 0o777 == 0o700
+        assert self.session_cache.load(self.CONFIG) == 'session-1'
+
+    def test_should_key_sessions_by_host_user_and_api_version(self):
+        other_config = deepcopy(self.CONFIG)
+        other_config['api_version'] = 500
+
+        self.session_cache.store(self.CONFIG, 'session-1')
+
+        assert self.session_cache.load(other_config) is None
+
+    def test_should_login_and_store_session_when_not_cached(self):
+        self.mock_ov_client_class.return_value.connection.get_session_id.return_value = 'session-1'
+
+        client = self.session_cache.create_client(self.CONFIG)
+
+        assert client == self.mock_ov_client_class.return_value
+        self.mock_ov_client_class.assert_called_once_with(self.CONFIG)
+        assert self.session_cache.load(self.CONFIG) == 'session-1'
+
+    def test_should_reuse_cached_session(self):
+        self.session_cache.store(self.CONFIG, 'session-1')
+
+        self.session_cache.create_client(self.CONFIG)
+
+        expected_config = deepcopy(self.CONFIG)
+        expected_config['credentials']['sessionID'] = 'session-1'
+        self.mock_ov_client_class.assert_called_once_with(expected_config)
+        assert 'sessionID' not in self.CONFIG['credentials']
+
+    def test_should_login_again_when_cached_session_is_rejected(self):
+        self.session_cache.store(self.CONFIG, 'expired-session')
+        new_client = mock.Mock()
+        new_client.connection.get_session_id.return_value = 'session-2'
+        self.mock_ov_client_class.side_effect = [HPOneViewException({'errorCode': 'AUTHORIZATION'}), new_client]
+
+        client = self.session_cache.create_client(self.CONFIG)
+
+        assert client == new_client
+        assert self.mock_ov_client_class.call_count == 2
+        self.mock_ov_client_class.assert_called_with(self.CONFIG)
+        assert self.session_cache.load(self.CONFIG) == 'session-2'
+
+    def test_should_invalidate_session(self):
+        self.session_cache.store(self.CONFIG, 'session-1')
+
+        self.session_cache.invalidate(self.CONFIG)
+
+        assert self.session_cache.load(self.CONFIG) is None
+
+
+def reserve_in_ledger(path, candidates, owner, connection):
+    connection.send(ReservationLedger(path).reserve(candidates, owner))
+    connection.close()
+
+
+class TestFileTransfer():
+    BUNDLE_PATH = '/rest/artifact-bundles/download/1'
+    CONTENTS = os.urandom(1024 * 1024)
+
+    @pytest.fixture(autouse=True)
+    def setUp(self, tmpdir):
+        self.file_path = str(tmpdir.join('bundle.zip'))
+        with LocalHttpServer() as self.server:
+            self.server.files[self.BUNDLE_PATH] = self.CONTENTS
+            self.transfer = FileTransfer(self.server.connection(), chunk_size=64 * 1024,
+                                         retry_scheduler=RetryScheduler(initial_delay=0, max_attempts=3))
+            yield
+
+    def get_requests(self, method='GET'):
+        return [request for request in self.server.requests if request[0] == method]
+
+    def read_file(self):
+        with open(self.file_path, 'rb') as file_object:
+            return file_object.read()
+
+    def test_should_download_the_file_and_write_its_manifest(self):
+        assert self.transfer.download(self.BUNDLE_PATH, self.file_path, source='v1')
+
+        assert self.read_file() == self.CONTENTS
+        assert self.transfer.read_manifest(self.file_path) == dict(size=len(self.CONTENTS), source='v1',
+                                                                   sha256=hashlib.sha256(self.CONTENTS).hexdigest())
+        assert not os.path.exists(self.file_path + '.part')
+        assert not os.path.exists(self.file_path + '.part.manifest.json')
+
+    def test_should_resume_the_download_from_the_bytes_received(self):
+        self.server.drops = [300000, 200000]
+
+        self.transfer.download(self.BUNDLE_PATH, self.file_path)
+
+        assert self.read_file() == self.CONTENTS
+        requests = self.get_requests()
+        assert len(requests) == 3
+        assert 'Range' not in requests[0][2]
+        assert requests[1][2]['Range'] == 'bytes=300000-'
+        assert requests[1][2]['If-Range'] == self.server.etag(self.BUNDLE_PATH)
+        assert requests[2][2]['Range'] == 'bytes=500000-'
+
+    def test_should_resume_the_download_left_by_a_previous_run(self):
+        self.transfer.retry_scheduler = RetryScheduler(initial_delay=0, max_attempts=1)
+        self.server.drops = [300000]
+        with pytest.raises(oneview.six.moves.http_client.IncompleteRead):
+            self.transfer.download(self.BUNDLE_PATH, self.file_path)
+
+        self.transfer.download(self.BUNDLE_PATH, self.file_path)
+
+        assert self.read_file() == self.CONTENTS
+        assert self.get_requests()[1][2]['Range'] == 'bytes=300000-'
+
+    def test_should_resume_the_redirected_download_left_by_a_previous_run(self):
+        redirected_path = '/rest/artifact-bundles/download/1/contents'
+        self.server.files[redirected_path] = self.CONTENTS
+        self.server.redirects[self.BUNDLE_PATH] = redirected_path
+        self.transfer.retry_scheduler = RetryScheduler(initial_delay=0, max_attempts=1)
+        self.server.drops = [300000]
+        with pytest.raises(oneview.six.moves.http_client.IncompleteRead):
+            self.transfer.download(self.BUNDLE_PATH, self.file_path)
+
+        self.transfer.download(self.BUNDLE_PATH, self.file_path)
+
+        assert self.read_file() == self.CONTENTS
+        assert self.get_requests()[-1][1:] == (redirected_path, mock.ANY)
+        assert self.get_requests()[-1][2]['Range'] == 'bytes=300000-'
+
+    def test_should_download_again_from_the_start_when_the_contents_changed_meanwhile(self):
+        self.transfer.retry_scheduler = RetryScheduler(initial_delay=0, max_attempts=1)
+        self.server.drops = [300000]
+        with pytest.raises(oneview.six.moves.http_client.IncompleteRead):
+            self.transfer.download(self.BUNDLE_PATH, self.file_path)
+
+        new_contents = os.urandom(500000)
+        self.server.files[self.BUNDLE_PATH] = new_contents
+        self.transfer.download(self.BUNDLE_PATH, self.file_path)
+
+        assert self.read_file() == new_contents
+
+    def test_should_skip_the_download_when_the_file_matches_the_manifest_of_the_same_source(self):
+        self.transfer.download(self.BUNDLE_PATH, self.file_path, source='v1')
+
+        assert not self.transfer.download(self.BUNDLE_PATH, self.file_path, source='v1')
+        assert len(self.get_requests()) == 1
+
+    def test_should_download_again_when_the_source_changed(self):
+        self.transfer.download(self.BUNDLE_PATH, self.file_path, source='v1')
+
+        assert self.transfer.download(self.BUNDLE_PATH, self.file_path, source='v2')
+        assert len(self.get_requests()) == 2
+
+    def test_should_download_again_when_the_file_does_not_match_the_manifest(self):
+        self.transfer.download(self.BUNDLE_PATH, self.file_path, source='v1')
+        with open(self.file_path, 'r+b') as file_object:
+            file_object.write(b'corrupted')
+
+        assert self.transfer.download(self.BUNDLE_PATH, self.file_path, source='v1')
+        assert self.read_file() == self.CONTENTS
+
+    def test_should_raise_exception_when_the_contents_are_not_found(self):
+        with pytest.raises(OneViewModuleException) as exception:
+            self.transfer.download('/rest/artifact-bundles/download/2', self.file_path)
+
+        assert exception.value.msg == 'Not found'
+        assert not os.path.exists(self.file_path)
+
+    def test_should_report_the_bytes_downloaded(self):
+        self.transfer.download(self.BUNDLE_PATH, self.file_path)
+
+        assert self.transfer.statistics['bytes'] == len(self.CONTENTS)
+        assert self.transfer.statistics['seconds'] >= 0
+
+    def test_should_download_the_ranges_over_several_connections(self):
+        self.transfer.MIN_RANGE_SIZE = 256 * 1024
+
+        assert self.transfer.download(self.BUNDLE_PATH, self.file_path, source='v1', connections=4)
+
+        assert self.read_file() == self.CONTENTS
+        assert self.transfer.verify(self.file_path, source='v1')
+        assert self.transfer.statistics['bytes'] == len(self.CONTENTS)
+        requests = self.get_requests()
+        assert requests[0][2]['Range'] == 'bytes=0-0'
+        assert sorted(request[2]['Range'] for request in requests[1:]) == ['bytes=0-262143',
+                                                                           'bytes=262144-524287',
+                                                                           'bytes=524288-786431',
+                                                                           'bytes=786432-1048575']
+        assert all(request[2]['If-Range'] == self.server.etag(self.BUNDLE_PATH) for request in requests[1:])
+
+    def test_should_write_the_ranges_without_pwrite(self, monkeypatch):
+        monkeypatch.delattr(os, 'pwrite', raising=False)
+        self.transfer.MIN_RANGE_SIZE = 256 * 1024
+
+        self.transfer.download(self.BUNDLE_PATH, self.file_path, connections=4)
+
+        assert self.read_file() == self.CONTENTS
+
+    def test_should_resume_a_range_from_the_bytes_received(self):
+        self.transfer.MIN_RANGE_SIZE = 512 * 1024
+        self.server.drops = [None, 100000]
+
+        self.transfer.download(self.BUNDLE_PATH, self.file_path, connections=2)
+
+        assert self.read_file() == self.CONTENTS
+        ranges = sorted(request[2]['Range'] for request in self.get_requests()[1:])
+        assert len(ranges) == 3
+        assert 'bytes=100000-524287' in ranges or 'bytes=624288-1048575' in ranges
+
+    def test_should_download_over_a_single_connection_when_ranges_are_not_served(self):
+        self.server.serve_ranges = False
+        self.transfer.MIN_RANGE_SIZE = 256 * 1024
+
+        self.transfer.download(self.BUNDLE_PATH, self.file_path, connections=4)
+
+        assert self.read_file() == self.CONTENTS
+        assert len(self.get_requests()) == 2
+
+    def test_should_download_over_a_single_connection_when_no_connections_are_requested(self):
+        self.transfer.MIN_RANGE_SIZE = 256 * 1024
+
+        self.transfer.download(self.BUNDLE_PATH, self.file_path, connections=0)
+
+        assert self.read_file() == self.CONTENTS
+        assert 'Range' not in self.get_requests()[0][2]
+
+    def test_should_download_the_contents_of_the_resource_by_its_id(self):
+        resource = dict(uri='/rest/artifact-bundles/1', eTag='1')
+
+        assert self.transfer.download_resource('/rest/artifact-bundles/download', resource, self.file_path)
+
+        assert self.read_file() == self.CONTENTS
+        source = self.transfer.read_manifest(self.file_path)['source']
+        assert source == dict(uri=self.BUNDLE_PATH, eTag='1', modified=None)
+
+    def test_should_download_the_resource_again_when_its_etag_changed(self):
+        resource = dict(uri='/rest/artifact-bundles/1', eTag='1')
+        self.transfer.download_resource('/rest/artifact-bundles/download', resource, self.file_path)
+
+        assert not self.transfer.download_resource('/rest/artifact-bundles/download', resource, self.file_path)
+        assert self.transfer.download_resource('/rest/artifact-bundles/download', dict(resource, eTag='2'),
+                                               self.file_path)
+
+    def test_should_download_over_a_single_connection_when_the_contents_are_small(self):
+        self.transfer.download(self.BUNDLE_PATH, self.file_path, connections=4)
+
+        assert self.read_file() == self.CONTENTS
+        requests = self.get_requests()
+        assert len(requests) == 2
+        assert 'Range' not in requests[1][2]
+
+    def test_should_resume_a_partial_download_over_a_single_connection(self):
+        self.server.drops = [300000]
+        with pytest.raises(Exception):
+            FileTransfer(self.server.connection(), retry_scheduler=RetryScheduler(max_attempts=1)).download(
+                self.BUNDLE_PATH, self.file_path)
+        self.transfer.MIN_RANGE_SIZE = 256 * 1024
+
+        self.transfer.download(self.BUNDLE_PATH, self.file_path, connections=4)
+
+        assert self.read_file() == self.CONTENTS
+        assert self.get_requests()[-1][2]['Range'] == 'bytes=300000-'
+
+    def test_should_upload_the_file_in_a_multipart_request(self):
+        with open(self.file_path, 'wb') as file_object:
+            file_object.write(self.CONTENTS)
+        self.server.upload_response = (200, {}, dict(name='bundle'))
+
+        result = self.transfer.upload('/rest/artifact-bundles', self.file_path)
+
+        assert result == dict(name='bundle')
+        assert self.server.uploads['/rest/artifact-bundles'] == self.CONTENTS
+        assert self.transfer.statistics['bytes'] == len(self.CONTENTS)
+        headers = self.get_requests('POST')[0][2]
+        assert headers['uploadfilename'] == 'bundle.zip'
+        assert headers['auth'] == 'session-id'
+
+    def test_should_log_the_upload_progress_about_every_tenth_of_the_file(self):
+        with open(self.file_path, 'wb') as file_object:
+            file_object.write(self.CONTENTS)
+        log = mock.Mock()
+
+        self.transfer.upload('/rest/artifact-bundles', self.file_path, log=log)
+
+        # Chunks of 1/16 of the file, so some tenths are reached by the same chunk
+        chunk_size = 64 * 1024
+        assert log.call_args_list == [mock.call(FileTransfer.MSG_UPLOAD_PROGRESS.format(sent, len(self.CONTENTS)))
+                                      for sent in [chunk * chunk_size for chunk in (2, 4, 5, 7, 8, 10, 12, 13, 15, 16)]]
+
+    def test_should_discard_the_cached_responses_of_the_collection_uploaded_to(self):
+        with open(self.file_path, 'wb') as file_object:
+            file_object.write(self.CONTENTS)
+        self.transfer.connection.invalidate_resource_cache = mock.Mock()
+
+        self.transfer.upload('/rest/firmware-bundles', self.file_path)
+
+        self.transfer.connection.invalidate_resource_cache.assert_called_once_with('/rest/firmware-bundles')
+
+    def test_should_wait_for_the_task_started_by_the_upload(self):
+        with open(self.file_path, 'wb') as file_object:
+            file_object.write(self.CONTENTS)
+        bundle = dict(name='bundle', uri='/rest/artifact-bundles/1')
+        task = dict(uri='/rest/tasks/1', category='tasks', type='TaskResourceV2', taskState='Completed',
+                    associatedResource=dict(resourceUri=bundle['uri']))
+        self.server.files[task['uri']] = json.dumps(task).encode('utf-8')
+        self.server.files[bundle['uri']] = json.dumps(bundle).encode('utf-8')
+        self.server.upload_response = (202, {'Location': task['uri']}, {})
+
+        assert self.transfer.upload('/rest/artifact-bundles', self.file_path) == bundle
+
+    def test_should_not_upload_the_file_when_it_does_not_match_its_manifest(self):
+        with open(self.file_path, 'wb') as file_object:
+            file_object.write(self.CONTENTS)
+        self.transfer.write_manifest(self.file_path, dict(sha256=hashlib.sha256(b'other').hexdigest()))
+
+        with pytest.raises(OneViewModuleValueError) as exception:
+            self.transfer.upload('/rest/artifact-bundles', self.file_path)
+
+        assert exception.value.msg == FileTransfer.MSG_DIGEST_MISMATCH.format(self.file_path)
+        assert not self.server.requests
+
+
+class TestFileDigestCache():
+    @pytest.fixture(autouse=True)
+    def setUp(self, tmpdir):
+        self.cache = FileDigestCache(str(tmpdir.join('cache', 'digests.json')))
+        self.file_path = str(tmpdir.join('SPP2017.iso'))
+        with open(self.file_path, 'wb') as file_object:
+            file_object.write(b'spp')
+
+    def test_should_compute_the_digest_only_once_while_the_file_is_unchanged(self):
+        with mock.patch.object(oneview, 'get_file_digest', wraps=oneview.get_file_digest) as get_file_digest:
+            assert self.cache.get_digest(self.file_path) == hashlib.sha256(b'spp').hexdigest()
+            assert self.cache.get_digest(self.file_path) == hashlib.sha256(b'spp').hexdigest()
+
+        assert get_file_digest.call_count == 1
+
+    def test_should_compute_the_digest_again_when_the_file_changes(self):
+        self.cache.get_digest(self.file_path)
+
+        with open(self.file_path, 'ab') as file_object:
+            file_object.write(b'2')
+
+        assert self.cache.get_digest(self.file_path) == hashlib.sha256(b'spp2').hexdigest()
+
+    def test_should_keep_the_uri_by_digest(self):
+        digest = self.cache.get_digest(self.file_path)
+        assert self.cache.get_uri(digest) is None
+
+        self.cache.set_uri(digest, '/rest/firmware-drivers/1')
+
+        assert FileDigestCache(self.cache.path).get_uri(digest) == '/rest/firmware-drivers/1'
+
+
+class TestReservationLedger():
+    CANDIDATES = ['/rest/server-hardware/1', '/rest/server-hardware/2', '/rest/server-hardware/3']
+
+    @pytest.fixture(autouse=True)
+    def setUp(self, tmpdir):
+        self.path = str(tmpdir.join('ledger', 'reservations.json'))
+        self.ledger = ReservationLedger(self.path)
+
+    def test_should_reserve_first_candidate_not_reserved(self):
+        assert self.ledger.reserve(self.CANDIDATES, 'profile-1') == '/rest/server-hardware/1'
+        assert self.ledger.reserve(self.CANDIDATES, 'profile-2') == '/rest/server-hardware/2'
+        assert self.ledger.reserve(list(reversed(self.CANDIDATES)), 'profile-3') == '/rest/server-hardware/3'
+        assert self.ledger.reserve(self.CANDIDATES, 'profile-4') is None
+
+    def test_should_reserve_again_after_expiration(self):
+        self.ledger.reserve(self.CANDIDATES, 'profile-1')
+
+        with mock.patch.object(oneview.time, 'time', return_value=time.time() + self.ledger.ttl + 1):
+            assert self.ledger.reserve(self.CANDIDATES, 'profile-2') == '/rest/server-hardware/1'
+
+    def test_should_release_only_the_reservations_of_the_owner(self):
+        self.ledger.reserve(self.CANDIDATES, 'profile-1')
+        self.ledger.reserve(self.CANDIDATES, 'profile-2')
+        self.ledger.reserve(self.CANDIDATES, 'profile-1')
+
+        self.ledger.release('profile-1')
+
+        assert self.ledger.reserve(self.CANDIDATES, 'profile-3') == '/rest/server-hardware/1'
+        assert self.ledger.reserve(self.CANDIDATES, 'profile-4') == '/rest/server-hardware/3'
+
+    def test_should_reserve_distinct_candidates_from_concurrent_processes(self):
+        candidates = ['/rest/server-hardware/{}'.format(index) for index in range(8)]
+        pipes = [multiprocessing.Pipe(duplex=False) for index in range(8)]
+        processes = [multiprocessing.Process(target=reserve_in_ledger,
+                                             args=(self.path, candidates, 'profile-{}'.format(index), sender))
+                     for index, (receiver, sender) in enumerate(pipes)]
+        for process in processes:
+            process.start()
+        reserved = [receiver.recv() for receiver, sender in pipes]
+        for process in processes:
+            process.join()
+
+        assert sorted(reserved) == sorted(candidates)
+
+
+class TestVlanIdSet():
+    def test_should_parse_values_and_ranges_into_merged_intervals(self):
+        assert VlanIdSet.parse('9-10, 1-2,5,3,11').intervals == [(1, 3), (5, 5), (9, 11)]
+
+    def test_should_parse_a_single_value_as_the_range_from_one(self):
+        assert VlanIdSet.parse('5').intervals == [(1, 5)]
+        assert VlanIdSet.parse('5-5').intervals == [(5, 5)]
+
+    def test_should_build_the_intervals_from_single_ids(self):
+        assert VlanIdSet.from_ids([10, 2, 3, 1, 7, 3]).intervals == [(1, 3), (7, 7), (10, 10)]
+
+    def test_should_check_membership(self):
+        vlan_ids = VlanIdSet.parse('1-2,5,9-10')
+
+        assert [vlan_id for vlan_id in range(12) if vlan_id in vlan_ids] == [1, 2, 5, 9, 10]
+        assert list(vlan_ids) == [1, 2, 5, 9, 10]
+        assert len(vlan_ids) == 5
+
+    def test_should_subtract_the_intervals_of_another_set(self):
+        vlan_ids = VlanIdSet.parse('1-100,200-300')
+        existing = VlanIdSet.from_ids([1, 2, 50, 100, 150, 250, 301])
+
+        assert (vlan_ids - existing).intervals == [(3, 49), (51, 99), (200, 249), (251, 300)]
+        assert not (vlan_ids - VlanIdSet.parse('1-4094'))
+        assert vlan_ids - VlanIdSet() == vlan_ids
+
+    def test_should_subtract_intervals_spanning_several_others(self):
+        vlan_ids = VlanIdSet.parse('1-10,20-30,40-50')
+
+        assert (vlan_ids - VlanIdSet.parse('5-45')).intervals == [(1, 4), (46, 50)]
+
+    def test_should_write_the_fewest_values_and_ranges(self):
+        assert VlanIdSet.from_ids([1, 2, 3, 5, 7, 8]).to_range() == '1-3,5,7-8'
+
+    def test_should_write_a_single_value_as_a_range(self):
+        assert VlanIdSet.from_ids([5]).to_range() == '5-5'
+
+    def test_should_split_into_sets_of_the_given_size(self):
+        chunks = VlanIdSet.parse('1-5,10,20-23').split(4)
+
+        assert [chunk.to_range() for chunk in chunks] == ['1-4', '5,10,20-21', '22-23']
+
+    def test_should_subtract_large_sets_quickly(self):
+        vlan_ids = VlanIdSet.parse('1-4094')
+        existing = VlanIdSet.from_ids(range(1, 4095, 2))
+
+        elapsed = timeit.timeit(lambda: (vlan_ids - existing).to_range(), number=10)
+
+        assert len(vlan_ids - existing) == 2047
+        assert elapsed < 1
+
 
 class TestServerProfileReplaceNamesByUris():
     SERVER_PROFILE_NAME = "Profile101"
@@ -1294,12 +2607,17 @@ class TestServerProfileReplaceNamesByUris():
         sp_data = deepcopy(self.BASIC_PROFILE)
         sp_data[SPKeys.CONNECTIONS] = [conn_1, conn_2, conn_3, conn_4]
 
-        self.mock_ov_client.fc_networks.get_by.side_effect = [[dict(uri='/rest/fc-networks/14')], [], []]
-        self.mock_ov_client.fcoe_networks.get_by.side_effect = [[dict(uri='/rest/fcoe-networks/16')], []]
-        self.mock_ov_client.ethernet_networks.get_by.return_value = [dict(uri='/rest/ethernet-networks/18')]
+        self.mock_ov_client.index_resources.get_all.return_value = [
+            dict(name='FC Network', category='fc-networks', uri='/rest/fc-networks/14'),
+            dict(name='FCoE Network', category='fcoe-networks', uri='/rest/fcoe-networks/16'),
+            dict(name='Ethernet Network', category='ethernet-networks', uri='/rest/ethernet-networks/18')]
 
         ServerProfileReplaceNamesByUris().replace(self.mock_ov_client, sp_data)
 
+        self.mock_ov_client.index_resources.get_all.assert_called_once_with(
+            category=['ethernet-networks', 'fc-networks', 'fcoe-networks'],
+            filter="\"name='FC Network' OR name='FCoE Network' OR name='Ethernet Network'\"")
+
         expected_connections = [dict(name="connection-1", networkUri='/rest/fc-networks/98'),
                                 dict(name="connection-2", networkUri='/rest/fc-networks/14'),
                                 dict(name="connection-3", networkUri='/rest/fcoe-networks/16'),
@@ -1326,6 +2644,78 @@ class TestServerProfileReplaceNamesByUris():
         else:
             pytest.fail(msg="Expected Exception was not raised")
 
+    def test_should_query_each_network_name_once(self):
+        sp_data = deepcopy(self.BASIC_PROFILE)
+        sp_data[SPKeys.CONNECTIONS] = [dict(id=1, networkName='Ethernet Network'),
+                                       dict(id=2, networkName='Ethernet Network')]
+
+        self.mock_ov_client.index_resources.get_all.return_value = [
+            dict(name='Ethernet Network', category='ethernet-networks', uri='/rest/ethernet-networks/18')]
+
+        replace_names_by_uris = ServerProfileReplaceNamesByUris()
+        replace_names_by_uris.replace(self.mock_ov_client, sp_data)
+
+        assert sp_data[SPKeys.CONNECTIONS] == [dict(id=1, networkUri='/rest/ethernet-networks/18'),
+                                               dict(id=2, networkUri='/rest/ethernet-networks/18')]
+
+        sp_data[SPKeys.CONNECTIONS] = [dict(id=3, networkName='Ethernet Network')]
+        replace_names_by_uris.replace(self.mock_ov_client, sp_data)
+
+        assert sp_data[SPKeys.CONNECTIONS] == [dict(id=3, networkUri='/rest/ethernet-networks/18')]
+        self.mock_ov_client.index_resources.get_all.assert_called_once_with(
+            category=['ethernet-networks', 'fc-networks', 'fcoe-networks'], filter="\"name='Ethernet Network'\"")
+
+    def test_should_give_precedence_to_fc_networks_when_network_names_are_duplicated(self):
+        sp_data = deepcopy(self.BASIC_PROFILE)
+        sp_data[SPKeys.CONNECTIONS] = [dict(id=1, networkName='Network')]
+
+        self.mock_ov_client.index_resources.get_all.return_value = [
+            dict(name='Network', category='ethernet-networks', uri='/rest/ethernet-networks/18'),
+            dict(name='Network', category='fcoe-networks', uri='/rest/fcoe-networks/16'),
+            dict(name='Network', category='fc-networks', uri='/rest/fc-networks/14')]
+
+        ServerProfileReplaceNamesByUris().replace(self.mock_ov_client, sp_data)
+
+        assert sp_data[SPKeys.CONNECTIONS] == [dict(id=1, networkUri='/rest/fc-networks/14')]
+
+    def test_should_memoize_resolved_names_between_calls(self):
+        replace_names_by_uris = ServerProfileReplaceNamesByUris()
+        self.mock_ov_client.enclosure_groups.get_by.return_value = [dict(uri=self.ENCLOSURE_GROUP_URI)]
+
+        for _ in range(3):
+            sp_data = deepcopy(self.BASIC_PROFILE)
+            sp_data['enclosureGroupName'] = "Enclosure Group Name"
+            replace_names_by_uris.replace(self.mock_ov_client, sp_data)
+            assert sp_data['enclosureGroupUri'] == self.ENCLOSURE_GROUP_URI
+
+        self.mock_ov_client.enclosure_groups.get_by.assert_called_once_with('name', 'Enclosure Group Name')
+
+    def test_should_match_names_ignoring_case(self):
+        sp_data = deepcopy(self.BASIC_PROFILE)
+        sp_data['connections'] = [{"id": 1, "interconnectName": "Interconnect1"},
+                                  {"id": 2, "interconnectName": "interconnect2"}]
+
+        self.mock_ov_client.interconnects.get_all.return_value = [
+            {"name": "interconnect1", "uri": "/rest/interconnects/1"},
+            {"name": "Interconnect2", "uri": "/rest/interconnects/2"}]
+
+        ServerProfileReplaceNamesByUris().replace(self.mock_ov_client, sp_data)
+
+        assert sp_data['connections'] == [{"id": 1, "interconnectUri": "/rest/interconnects/1"},
+                                          {"id": 2, "interconnectUri": "/rest/interconnects/2"}]
+
+    def test_should_split_names_in_chunks(self):
+        volumes = [{"name": "volume{0}".format(i), "uri": "/rest/storage-volumes/{0}".format(i)} for i in range(120)]
+        sp_data = deepcopy(self.BASIC_PROFILE)
+        sp_data['sanStorage'] = {"volumeAttachments": [{"id": i, "volumeName": v['name']} for i, v in enumerate(volumes)]}
+
+        self.mock_ov_client.volumes.get_all.side_effect = [volumes[0:50], volumes[50:100], volumes[100:120]]
+
+        ServerProfileReplaceNamesByUris().replace(self.mock_ov_client, sp_data)
+
+        assert self.mock_ov_client.volumes.get_all.call_count == 3
+        assert [a['volumeUri'] for a in sp_data['sanStorage']['volumeAttachments']] == [v['uri'] for v in volumes]
+
     def test_should_replace_server_hardware_type_name_by_uri(self):
         sht_uri = "/rest/server-hardware-types/BCAB376E-DA2E-450D-B053-0A9AE7E5114C"
         sht = {"name": "SY 480 Gen9 1", "uri": sht_uri}
@@ -1368,10 +2758,13 @@ class TestServerProfileReplaceNamesByUris():
         expected_dict['sanStorage']['volumeAttachments'][0] = {"id": 1, "volumeUri": "/rest/storage-volumes/1"}
         expected_dict['sanStorage']['volumeAttachments'][1] = {"id": 2, "volumeUri": "/rest/storage-volumes/2"}
 
-        self.mock_ov_client.volumes.get_by.side_effect = [[volume1], [volume2]]
+        self.mock_ov_client.volumes.get_all.return_value = [volume1, volume2]
 
         ServerProfileReplaceNamesByUris().replace(self.mock_ov_client, sp_data)
 
+        self.mock_ov_client.volumes.get_all.assert_called_once_with(
+            filter="\"name='{0}' OR name='{1}'\"".format(volume1['name'], volume2['name']))
+
         assert sp_data == expected_dict
 
     def test_should_not_replace_volume_names_when_volume_uri_is_none(self):
@@ -1461,10 +2854,13 @@ class TestServerProfileReplaceNamesByUris():
         expected_dict['sanStorage']['volumeAttachments'][0] = {"id": 1, "volumeStoragePoolUri": "/rest/storage-pools/1"}
         expected_dict['sanStorage']['volumeAttachments'][1] = {"id": 2, "volumeStoragePoolUri": "/rest/storage-pools/2"}
 
-        self.mock_ov_client.storage_pools.get_by.side_effect = [[pool1], [pool2]]
+        self.mock_ov_client.storage_pools.get_all.return_value = [pool1, pool2]
 
         ServerProfileReplaceNamesByUris().replace(self.mock_ov_client, sp_data)
 
+        self.mock_ov_client.storage_pools.get_all.assert_called_once_with(
+            filter="\"name='{0}' OR name='{1}'\"".format(pool1['name'], pool2['name']))
+
         assert sp_data == expected_dict
 
     def test_should_not_replace_when_inform_storage_pool_uri(self):
@@ -1537,10 +2933,13 @@ class TestServerProfileReplaceNamesByUris():
         expected['sanStorage']['volumeAttachments'][0] = {"id": 1, "volumeStorageSystemUri": "/rest/storage-systems/1"}
         expected['sanStorage']['volumeAttachments'][1] = {"id": 2, "volumeStorageSystemUri": "/rest/storage-systems/2"}
 
-        self.mock_ov_client.storage_systems.get_by.side_effect = [[storage_system1], [storage_system2]]
+        self.mock_ov_client.storage_systems.get_all.return_value = [storage_system1, storage_system2]
 
         ServerProfileReplaceNamesByUris().replace(self.mock_ov_client, sp_data)
 
+        self.mock_ov_client.storage_systems.get_all.assert_called_once_with(
+            filter="\"name='{0}' OR name='{1}'\"".format(storage_system1['name'], storage_system2['name']))
+
         assert sp_data == expected
 
     def test_should_not_replace_when_inform_storage_system_uri(self):
@@ -1640,10 +3039,13 @@ class TestServerProfileReplaceNamesByUris():
         expected['connections'][0] = {"id": 1, "interconnectUri": "/rest/interconnects/1"}
         expected['connections'][1] = {"id": 2, "interconnectUri": "/rest/interconnects/2"}
 
-        self.mock_ov_client.interconnects.get_by.side_effect = [[interconnect1], [interconnect2]]
+        self.mock_ov_client.interconnects.get_all.return_value = [interconnect1, interconnect2]
 
         ServerProfileReplaceNamesByUris().replace(self.mock_ov_client, sp_data)
 
+        self.mock_ov_client.interconnects.get_all.assert_called_once_with(
+            filter="\"name='{0}' OR name='{1}'\"".format(interconnect1['name'], interconnect2['name']))
+
         assert sp_data == expected
 
     def test_should_not_replace_when_inform_interconnect_uri(self):
@@ -1748,10 +3150,13 @@ class TestServerProfileReplaceNamesByUris():
         expected['localStorage']['sasLogicalJBODs'][0] = {"id": 1, "sasLogicalJBODUri": "/rest/sas-logical-jbods/1"}
         expected['localStorage']['sasLogicalJBODs'][1] = {"id": 2, "sasLogicalJBODUri": "/rest/sas-logical-jbods/2"}
 
-        self.mock_ov_client.sas_logical_jbods.get_by.side_effect = [[sas_logical_jbod1], [sas_logical_jbod2]]
+        self.mock_ov_client.sas_logical_jbods.get_all.return_value = [sas_logical_jbod1, sas_logical_jbod2]
 
         ServerProfileReplaceNamesByUris().replace(self.mock_ov_client, sp_data)
 
+        self.mock_ov_client.sas_logical_jbods.get_all.assert_called_once_with(
+            filter="\"name='{0}' OR name='{1}'\"".format(sas_logical_jbod1['name'], sas_logical_jbod2['name']))
+
         assert sp_data == expected
 
     def test_should_not_replace_when_inform_sas_logical_jbod_uris(self):
@@ -2616,6 +4021,73 @@ class TestServerProfileMerger():
 
         assert not merged_data[SPKeys.LOCAL_STORAGE][SPKeys.CONTROLLERS][self.INDEX_MEZZ][SPKeys.LOGICAL_DRIVES]
 
+    def _build_large_profile_and_changes(self):
+        resource = build_server_profile(connections=500, volumes=200, custom_attributes=200)
+
+        data = dict(name=resource['name'],
+                    bios=dict(manageBios=False),
+                    connections=deepcopy(resource[SPKeys.CONNECTIONS]),
+                    sanStorage=deepcopy(resource[SPKeys.SAN]),
+                    localStorage=deepcopy(resource[SPKeys.LOCAL_STORAGE]))
+        data[SPKeys.CONNECTIONS][41]['requestedMbps'] = 5000
+        data[SPKeys.CONNECTIONS][42][SPKeys.BOOT] = dict(priority='Primary')
+        data[SPKeys.SAN][SPKeys.VOLUMES][7][SPKeys.PATHS] = [dict(connectionId=1, isEnabled=False)]
+        data[SPKeys.LOCAL_STORAGE][SPKeys.CONTROLLERS][0][SPKeys.LOGICAL_DRIVES][1]['raidLevel'] = 'RAID0'
+
+        return resource, data
+
+    def test_merge_large_profile_should_not_modify_the_resource(self):
+        resource, data = self._build_large_profile_and_changes()
+        original_resource = deepcopy(resource)
+
+        merged_data = ServerProfileMerger().merge_data(resource, data)
+
+        assert resource == original_resource
+        assert merged_data[SPKeys.CONNECTIONS][41]['requestedMbps'] == 5000
+        assert merged_data[SPKeys.CONNECTIONS][42][SPKeys.BOOT] == dict(original_resource[SPKeys.CONNECTIONS][42][SPKeys.BOOT],
+                                                                        priority='Primary')
+        assert merged_data[SPKeys.SAN][SPKeys.VOLUMES][7][SPKeys.PATHS][0] == dict(original_resource[SPKeys.SAN][SPKeys.VOLUMES][7][SPKeys.PATHS][0],
+                                                                                   isEnabled=False)
+        assert merged_data[SPKeys.LOCAL_STORAGE][SPKeys.CONTROLLERS][0][SPKeys.LOGICAL_DRIVES][1]['raidLevel'] == 'RAID0'
+
+    def test_merge_large_profile_should_copy_only_the_changed_items(self):
+        resource, data = self._build_large_profile_and_changes()
+
+        merged_data = ServerProfileMerger().merge_data(resource, data)
+
+        copied_connections = [i for i, c in enumerate(merged_data[SPKeys.CONNECTIONS]) if c is not resource[SPKeys.CONNECTIONS][i]]
+        copied_volumes = [i for i, v in enumerate(merged_data[SPKeys.SAN][SPKeys.VOLUMES]) if v is not resource[SPKeys.SAN][SPKeys.VOLUMES][i]]
+        assert copied_connections == [41, 42]
+        assert copied_volumes == [7]
+        assert merged_data[SPKeys.OS_DEPLOYMENT] is resource[SPKeys.OS_DEPLOYMENT]
+        assert merged_data[SPKeys.BIOS]['overriddenSettings'] is resource[SPKeys.BIOS]['overriddenSettings']
+
+    def test_merge_large_profile_should_use_less_memory_than_a_copy(self):
+        tracemalloc = pytest.importorskip('tracemalloc')
+        resource, data = self._build_large_profile_and_changes()
+
+        def get_peak_memory(function):
+            tracemalloc.start()
+            try:
+                function()
+                return tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+
+        copy_peak = get_peak_memory(lambda: deepcopy(resource))
+        merge_peak = get_peak_memory(lambda: ServerProfileMerger().merge_data(resource, data))
+
+        assert merge_peak * 4 < copy_peak
+
+    def test_merge_large_profile_should_be_faster_than_a_copy(self):
+        resource, data = self._build_large_profile_and_changes()
+        changes = [deepcopy(data) for _ in range(5)]
+
+        copy_time = min(timeit.repeat(lambda: deepcopy(resource), number=1, repeat=5))
+        merge_time = min(timeit.repeat(lambda: ServerProfileMerger().merge_data(resource, changes.pop()), number=1, repeat=5))
+
+        assert merge_time * 2 < copy_time
+
     @mock.patch.dict('os.environ', dict(LOGFILE='/path/log.txt'))
     @mock.patch.object(logging, 'getLogger')
     @mock.patch.object(logging, 'basicConfig')
@@ -22,6 +22,7 @@ import yaml
 
 from copy import deepcopy
 from hpe_test_utils import OneViewBaseTest
+from hpOneView.resources.task_monitor import TaskMonitor
 from oneview_module_loader import EnclosureModule
 
 FAKE_MSG_ERROR = 'Fake message error'
@@ -487,6 +488,25 @@ class TestEnclosureModule(OneViewBaseTest):
             msg=EnclosureModule.MSG_REFRESHED
         )
 
+    def test_should_return_refresh_task_when_wait_is_false(self):
+        task = dict(uri='/rest/tasks/1', taskState='Running',
+                    associatedResource=dict(resourceUri=ENCLOSURE_FROM_ONEVIEW['uri']))
+        self.resource.get_by.return_value = [ENCLOSURE_FROM_ONEVIEW]
+        self.resource._task_monitor = TaskMonitor(mock.Mock())
+        self.resource.refresh_state.side_effect = lambda uri, config: self.resource._task_monitor.wait_for_task(task)
+
+        self.mock_ansible_module.params = dict(PARAMS_FOR_REFRESH, wait=False)
+
+        EnclosureModule().run()
+
+        self.resource.get.assert_not_called()
+        self.mock_ansible_module.exit_json.assert_called_once_with(
+            changed=True,
+            msg=EnclosureModule.MSG_TASK_STARTED,
+            task_uri='/rest/tasks/1',
+            resource_uri=ENCLOSURE_FROM_ONEVIEW['uri']
+        )
+
     def test_should_power_on_appliance_bays(self):
         self.resource.get_by.return_value = [ENCLOSURE_FROM_ONEVIEW]
         self.resource.patch.return_value = ENCLOSURE_FROM_ONEVIEW
@@ -87,6 +87,14 @@ PARAMS_FOR_BULK_CREATED = dict(
     data=dict(namePrefix="TestNetwork", vlanIdRange="1-2,5,9-10")
 )
 
+PARAMS_FOR_BULK_ABSENT = dict(
+    config='config.json',
+    state='absent',
+    data=dict(namePrefix="TestNetwork", vlanIdRange="1-2,5,9-10")
+)
+
+BULK_NAME_FILTER = "\"'name' matches 'TestNetwork\\_%'\""
+
 DEFAULT_BULK_ENET_TEMPLATE = [
     {'name': 'TestNetwork_1', 'vlanId': 1},
     {'name': 'TestNetwork_2', 'vlanId': 2},
@@ -252,13 +260,14 @@ class TestEthernetNetworkModule(OneViewBaseTest):
         )
 
     def test_should_create_all_ethernet_networks(self):
-        self.resource.get_range.return_value = []
+        self.resource.get_all.return_value = []
         self.resource.create_bulk.return_value = DEFAULT_BULK_ENET_TEMPLATE
 
         self.mock_ansible_module.params = PARAMS_FOR_BULK_CREATED
 
         EthernetNetworkModule().run()
 
+        self.resource.get_all.assert_called_once_with(filter=BULK_NAME_FILTER, sort='vlanId:ascending')
         self.resource.create_bulk.assert_called_once_with(
             dict(namePrefix="TestNetwork", vlanIdRange="1-2,5,9-10"))
         self.mock_ansible_module.exit_json.assert_called_once_with(
@@ -267,32 +276,31 @@ class TestEthernetNetworkModule(OneViewBaseTest):
             ansible_facts=dict(ethernet_network_bulk=DEFAULT_BULK_ENET_TEMPLATE))
 
     def test_should_create_missing_ethernet_networks(self):
-        enet_get_range_return = [
+        self.resource.get_all.return_value = [
             {'name': 'TestNetwork_1', 'vlanId': 1},
             {'name': 'TestNetwork_2', 'vlanId': 2},
+            {'name': 'TestNetwork_3', 'vlanId': 3},
         ]
-
-        self.resource.get_range.side_effect = [enet_get_range_return, DEFAULT_BULK_ENET_TEMPLATE]
-        self.resource.dissociate_values_or_ranges.return_value = [1, 2, 5, 9, 10]
+        self.resource.create_bulk.return_value = DEFAULT_BULK_ENET_TEMPLATE[2:]
 
         self.mock_ansible_module.params = PARAMS_FOR_BULK_CREATED
 
         EthernetNetworkModule().run()
 
         self.resource.create_bulk.assert_called_once_with(
-            dict(namePrefix="TestNetwork", vlanIdRange="5,9,10"))
+            dict(namePrefix="TestNetwork", vlanIdRange="5,9-10"))
         self.mock_ansible_module.exit_json.assert_called_once_with(
             changed=True, msg=EthernetNetworkModule.MSG_MISSING_BULK_CREATED,
             ansible_facts=dict(ethernet_network_bulk=DEFAULT_BULK_ENET_TEMPLATE))
 
     def test_should_create_missing_ethernet_networks_with_just_one_difference(self):
-        enet_get_range_return = [
+        self.resource.get_all.return_value = [
             {'name': 'TestNetwork_1', 'vlanId': 1},
             {'name': 'TestNetwork_2', 'vlanId': 2},
+            {'name': 'TestNetwork_9', 'vlanId': 9},
+            {'name': 'TestNetwork_10', 'vlanId': 10},
         ]
-
-        self.resource.get_range.side_effect = [enet_get_range_return, DEFAULT_BULK_ENET_TEMPLATE]
-        self.resource.dissociate_values_or_ranges.return_value = [1, 2, 5]
+        self.resource.create_bulk.return_value = [{'name': 'TestNetwork_5', 'vlanId': 5}]
 
         self.mock_ansible_module.params = PARAMS_FOR_BULK_CREATED
 
@@ -305,9 +313,39 @@ class TestEthernetNetworkModule(OneViewBaseTest):
             msg=EthernetNetworkModule.MSG_MISSING_BULK_CREATED,
             ansible_facts=dict(ethernet_network_bulk=DEFAULT_BULK_ENET_TEMPLATE))
 
+    def test_should_create_the_ethernet_networks_in_chunks(self):
+        self.resource.get_all.return_value = [{'name': 'TestNetwork_1', 'vlanId': 1}]
+        self.resource.create_bulk.side_effect = lambda data: [
+            {'name': 'TestNetwork_{0}'.format(vlan_id), 'vlanId': vlan_id}
+            for vlan_id in range(int(data['vlanIdRange'].split('-')[0]), int(data['vlanIdRange'].split('-')[1]) + 1)]
+
+        self.mock_ansible_module.params = dict(PARAMS_FOR_BULK_CREATED,
+                                               data=dict(namePrefix="TestNetwork", vlanIdRange="1-2500"))
+
+        EthernetNetworkModule().run()
+
+        assert self.resource.create_bulk.call_args_list == [
+            mock.call(dict(namePrefix="TestNetwork", vlanIdRange="2-1001")),
+            mock.call(dict(namePrefix="TestNetwork", vlanIdRange="1002-2001")),
+            mock.call(dict(namePrefix="TestNetwork", vlanIdRange="2002-2500")),
+        ]
+        ethernet_networks = self.mock_ansible_module.exit_json.call_args[1]['ansible_facts']['ethernet_network_bulk']
+        assert [net['vlanId'] for net in ethernet_networks] == list(range(1, 2501))
+
+    def test_should_not_consider_ethernet_networks_out_of_the_range(self):
+        self.resource.get_all.return_value = DEFAULT_BULK_ENET_TEMPLATE + [{'name': 'TestNetwork_11', 'vlanId': 11}]
+
+        self.mock_ansible_module.params = PARAMS_FOR_BULK_CREATED
+
+        EthernetNetworkModule().run()
+
+        self.resource.create_bulk.assert_not_called()
+        self.mock_ansible_module.exit_json.assert_called_once_with(
+            changed=False, msg=EthernetNetworkModule.MSG_BULK_ALREADY_EXIST,
+            ansible_facts=dict(ethernet_network_bulk=DEFAULT_BULK_ENET_TEMPLATE))
+
     def test_should_do_nothing_when_ethernet_networks_already_exist(self):
-        self.resource.get_range.return_value = DEFAULT_BULK_ENET_TEMPLATE
-        self.resource.dissociate_values_or_ranges.return_value = [1, 2, 5, 9, 10]
+        self.resource.get_all.return_value = DEFAULT_BULK_ENET_TEMPLATE
 
         self.mock_ansible_module.params = PARAMS_FOR_BULK_CREATED
 
@@ -317,6 +355,158 @@ class TestEthernetNetworkModule(OneViewBaseTest):
             changed=False, msg=EthernetNetworkModule.MSG_BULK_ALREADY_EXIST,
             ansible_facts=dict(ethernet_network_bulk=DEFAULT_BULK_ENET_TEMPLATE))
 
+    def test_should_update_only_the_ethernet_networks_of_the_range_that_differ(self):
+        self.resource.get_all.return_value = [
+            {'name': 'TestNetwork_1', 'vlanId': 1, 'uri': '/rest/ethernet-networks/1', 'purpose': 'General',
+             'connectionTemplateUri': '/rest/connection-templates/1', 'scopeUris': ['/rest/scopes/1']},
+            {'name': 'TestNetwork_2', 'vlanId': 2, 'uri': '/rest/ethernet-networks/2', 'purpose': 'Management',
+             'connectionTemplateUri': '/rest/connection-templates/2', 'scopeUris': ['/rest/scopes/1']},
+            {'name': 'TestNetwork_5', 'vlanId': 5, 'uri': '/rest/ethernet-networks/5', 'purpose': 'General',
+             'connectionTemplateUri': '/rest/connection-templates/5', 'scopeUris': []},
+            {'name': 'TestNetwork_9', 'vlanId': 9, 'uri': '/rest/ethernet-networks/9', 'purpose': 'General',
+             'connectionTemplateUri': '/rest/connection-templates/9', 'scopeUris': ['/rest/scopes/1']},
+        ]
+        bandwidth = dict(maximumBandwidth=10000, typicalBandwidth=2000)
+        self.mock_ov_client.connection_templates.get_all.return_value = [
+            dict(uri='/rest/connection-templates/1', bandwidth=bandwidth),
+            dict(uri='/rest/connection-templates/2', bandwidth=bandwidth),
+            dict(uri='/rest/connection-templates/5', bandwidth=bandwidth),
+            dict(uri='/rest/connection-templates/9', bandwidth=dict(maximumBandwidth=3000, typicalBandwidth=2000)),
+        ]
+        self.resource.update.side_effect = lambda data: dict(data, eTag='updated')
+        self.resource.patch.side_effect = lambda uri, **operation: dict(uri=uri, scopeUris=operation['value'])
+
+        self.mock_ansible_module.params = dict(PARAMS_FOR_BULK_CREATED, data=dict(
+            namePrefix="TestNetwork", vlanIdRange="1-2,5,9", purpose='General', bandwidth=bandwidth,
+            scopeUris=['/rest/scopes/1']))
+
+        EthernetNetworkModule().run()
+
+        self.resource.create_bulk.assert_not_called()
+        self.mock_ov_client.connection_templates.get.assert_not_called()
+        self.resource.update.assert_called_once_with(dict(self.resource.get_all.return_value[1], purpose='General'))
+        self.mock_ov_client.connection_templates.update.assert_called_once_with(
+            dict(uri='/rest/connection-templates/9', bandwidth=bandwidth))
+        self.resource.patch.assert_called_once_with('/rest/ethernet-networks/5', operation='replace',
+                                                    path='/scopeUris', value=['/rest/scopes/1'])
+
+        ethernet_networks = self.mock_ansible_module.exit_json.call_args[1]['ansible_facts']['ethernet_network_bulk']
+        assert ethernet_networks[0] == self.resource.get_all.return_value[0]
+        assert ethernet_networks[1]['eTag'] == 'updated'
+        assert ethernet_networks[2] == dict(uri='/rest/ethernet-networks/5', scopeUris=['/rest/scopes/1'])
+        assert self.mock_ansible_module.exit_json.call_args[1]['changed']
+        assert self.mock_ansible_module.exit_json.call_args[1]['msg'] == EthernetNetworkModule.MSG_BULK_UPDATED
+
+    def test_should_set_the_scopes_of_the_created_ethernet_networks(self):
+        self.resource.get_all.return_value = []
+        self.resource.create_bulk.return_value = [{'name': 'TestNetwork_1', 'vlanId': 1, 'uri': '/rest/ethernet-networks/1'}]
+        self.resource.patch.return_value = {'name': 'TestNetwork_1', 'vlanId': 1, 'scopeUris': ['/rest/scopes/1']}
+
+        self.mock_ansible_module.params = dict(PARAMS_FOR_BULK_CREATED, data=dict(
+            namePrefix="TestNetwork", vlanIdRange="1-1", scopeUris=['/rest/scopes/1']))
+
+        EthernetNetworkModule().run()
+
+        self.resource.create_bulk.assert_called_once_with(dict(namePrefix="TestNetwork", vlanIdRange="1-1"))
+        self.resource.patch.assert_called_once_with('/rest/ethernet-networks/1', operation='replace',
+                                                    path='/scopeUris', value=['/rest/scopes/1'])
+        self.mock_ansible_module.exit_json.assert_called_once_with(
+            changed=True, msg=EthernetNetworkModule.MSG_BULK_CREATED,
+            ansible_facts=dict(ethernet_network_bulk=[self.resource.patch.return_value]))
+
+    def test_should_update_the_ethernet_networks_selected_by_the_filter(self):
+        self.resource.get_all.return_value = [
+            {'name': 'Network A', 'vlanId': 10, 'uri': '/rest/ethernet-networks/10', 'smartLink': False},
+            {'name': 'Network B', 'vlanId': 20, 'uri': '/rest/ethernet-networks/20', 'smartLink': True},
+        ]
+        self.resource.update.return_value = dict(self.resource.get_all.return_value[0], smartLink=True)
+
+        self.mock_ansible_module.params = dict(PARAMS_FOR_BULK_CREATED,
+                                               data=dict(filter="purpose='General'", smartLink=True))
+
+        EthernetNetworkModule().run()
+
+        self.resource.get_all.assert_called_once_with(filter="purpose='General'", sort='vlanId:ascending')
+        self.resource.update.assert_called_once_with(dict(self.resource.get_all.return_value[0], smartLink=True))
+        self.mock_ansible_module.exit_json.assert_called_once_with(
+            changed=True, msg=EthernetNetworkModule.MSG_BULK_UPDATED,
+            ansible_facts=dict(ethernet_network_bulk=[self.resource.update.return_value,
+                                                      self.resource.get_all.return_value[1]]))
+
+    def test_should_not_update_the_ethernet_networks_selected_by_the_filter_when_equal(self):
+        self.resource.get_all.return_value = [
+            {'name': 'Network B', 'vlanId': 20, 'uri': '/rest/ethernet-networks/20', 'smartLink': True},
+        ]
+
+        self.mock_ansible_module.params = dict(PARAMS_FOR_BULK_CREATED,
+                                               data=dict(filter="purpose='General'", smartLink=True))
+
+        EthernetNetworkModule().run()
+
+        self.resource.update.assert_not_called()
+        self.mock_ansible_module.exit_json.assert_called_once_with(
+            changed=False, msg=EthernetNetworkModule.MSG_BULK_ALREADY_EXIST,
+            ansible_facts=dict(ethernet_network_bulk=self.resource.get_all.return_value))
+
+    def test_should_delete_the_ethernet_networks_of_the_range(self):
+        self.mock_ov_client.api_version = 1600
+        self.resource.get_all.return_value = [
+            {'name': 'TestNetwork_1', 'vlanId': 1, 'uri': '/rest/ethernet-networks/1'},
+            {'name': 'TestNetwork_5', 'vlanId': 5, 'uri': '/rest/ethernet-networks/5'},
+            {'name': 'TestNetwork_6', 'vlanId': 6, 'uri': '/rest/ethernet-networks/6'},
+        ]
+
+        self.mock_ansible_module.params = PARAMS_FOR_BULK_ABSENT
+
+        EthernetNetworkModule().run()
+
+        self.resource.delete_bulk.assert_called_once_with(
+            dict(networkUris=['/rest/ethernet-networks/1', '/rest/ethernet-networks/5']))
+        self.mock_ansible_module.exit_json.assert_called_once_with(
+            changed=True, msg=EthernetNetworkModule.MSG_BULK_DELETED, ansible_facts={})
+
+    def test_should_delete_the_ethernet_networks_one_by_one_before_the_bulk_delete_api(self):
+        self.mock_ov_client.api_version = 1200
+        networks = [
+            {'name': 'TestNetwork_1', 'vlanId': 1, 'uri': '/rest/ethernet-networks/1'},
+            {'name': 'TestNetwork_5', 'vlanId': 5, 'uri': '/rest/ethernet-networks/5'},
+        ]
+        self.resource.get_all.return_value = networks
+
+        self.mock_ansible_module.params = PARAMS_FOR_BULK_ABSENT
+
+        EthernetNetworkModule().run()
+
+        self.resource.delete_bulk.assert_not_called()
+        assert sorted(call[0][0]['uri'] for call in self.resource.delete.call_args_list) == [
+            '/rest/ethernet-networks/1', '/rest/ethernet-networks/5']
+        self.mock_ansible_module.exit_json.assert_called_once_with(
+            changed=True, msg=EthernetNetworkModule.MSG_BULK_DELETED, ansible_facts={})
+
+    def test_should_delete_the_ethernet_networks_in_chunks(self):
+        self.mock_ov_client.api_version = 1600
+        self.resource.get_all.return_value = [
+            {'name': 'TestNetwork_{0}'.format(vlan_id), 'vlanId': vlan_id, 'uri': '/rest/ethernet-networks/{0}'.format(vlan_id)}
+            for vlan_id in range(1, 2101)]
+
+        self.mock_ansible_module.params = dict(PARAMS_FOR_BULK_ABSENT,
+                                               data=dict(namePrefix="TestNetwork", vlanIdRange="1-4094"))
+
+        EthernetNetworkModule().run()
+
+        assert [len(call[0][0]['networkUris']) for call in self.resource.delete_bulk.call_args_list] == [1000, 1000, 100]
+
+    def test_should_do_nothing_when_the_ethernet_networks_of_the_range_are_absent(self):
+        self.resource.get_all.return_value = [{'name': 'TestNetwork_11', 'vlanId': 11, 'uri': '/rest/ethernet-networks/11'}]
+
+        self.mock_ansible_module.params = PARAMS_FOR_BULK_ABSENT
+
+        EthernetNetworkModule().run()
+
+        self.resource.delete_bulk.assert_not_called()
+        self.mock_ansible_module.exit_json.assert_called_once_with(
+            changed=False, msg=EthernetNetworkModule.MSG_BULK_ALREADY_ABSENT, ansible_facts={})
+
     def test_reset_successfully(self):
         self.resource.get_by.return_value = [DICT_PARAMS_WITH_CHANGES]
         self.mock_ov_client.connection_templates.update.return_value = {'result': 'success'}
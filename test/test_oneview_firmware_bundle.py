@@ -16,6 +16,7 @@
 # limitations under the License.
 ###
 
+import mock
 import pytest
 
 from hpe_test_utils import OneViewBaseTest
@@ -44,20 +45,99 @@ PARAMS_FOR_PRESENT = dict(
 
 @pytest.mark.resource(TestFirmwareBundleModule='firmware_bundles')
 class TestFirmwareBundleModule(OneViewBaseTest):
+    @pytest.fixture(autouse=True)
+    def specific_set_up(self, tmpdir):
+        self.file_path = str(tmpdir.join('hp-firmware-hdd-a1b08f8a6b-HPGH-1.1.x86_64.rpm'))
+        with open(self.file_path, 'wb') as file_object:
+            file_object.write(b'firmware' * 1000)
+        self.digest_cache_path = str(tmpdir.join('digests.json'))
+
+        self.params = dict(PARAMS_FOR_PRESENT, file_path=self.file_path)
+        self.mock_ov_client.firmware_drivers.get_all.return_value = []
+
+        with mock.patch('oneview_firmware_bundle.FileTransfer') as mock_file_transfer:
+            self.file_transfer = mock_file_transfer.return_value
+            yield
+
     def test_should_upload(self):
-        self.mock_ov_client.firmware_drivers.get_by_file_name.return_value = None
-        self.resource.upload.side_effect = [DEFAULT_FIRMWARE_TEMPLATE]
+        self.file_transfer.upload.return_value = DEFAULT_FIRMWARE_TEMPLATE
+        self.file_transfer.statistics = dict(bytes=8000, seconds=0.5, bytes_per_second=16000)
 
-        self.mock_ansible_module.params = PARAMS_FOR_PRESENT
+        self.mock_ansible_module.params = self.params
 
         FirmwareBundleModule().run()
 
+        self.file_transfer.upload.assert_called_once_with('/rest/firmware-bundles', self.file_path,
+                                                          log=self.mock_ansible_module.log)
         self.mock_ansible_module.exit_json.assert_called_once_with(
             changed=True,
             msg=FirmwareBundleModule.MSG_FIRMWARE_BUNDLE_UPLOADED,
-            ansible_facts=dict(firmware_bundle=DEFAULT_FIRMWARE_TEMPLATE)
+            ansible_facts=dict(firmware_bundle=DEFAULT_FIRMWARE_TEMPLATE),
+            transfer=dict(bytes=8000, seconds=0.5, bytes_per_second=16000)
         )
 
+    def test_should_not_upload_when_a_firmware_driver_has_the_same_file_name_and_size(self):
+        firmware = dict(DEFAULT_FIRMWARE_TEMPLATE, bundleSize='8000', uri='/rest/firmware-drivers/1')
+        self.mock_ov_client.firmware_drivers.get_all.return_value = [firmware]
+
+        self.mock_ansible_module.params = self.params
+
+        FirmwareBundleModule().run()
+
+        self.file_transfer.upload.assert_not_called()
+        self.mock_ansible_module.exit_json.assert_called_once_with(
+            changed=False,
+            msg=FirmwareBundleModule.MSG_FIRMWARE_BUNDLE_ALREADY_PRESENT,
+            ansible_facts=dict(firmware_bundle=firmware)
+        )
+
+    def test_should_upload_when_the_firmware_driver_with_the_same_file_name_has_another_size(self):
+        firmware = dict(DEFAULT_FIRMWARE_TEMPLATE, bundleSize='4000', uri='/rest/firmware-drivers/1')
+        self.mock_ov_client.firmware_drivers.get_all.return_value = [firmware]
+        self.file_transfer.upload.return_value = DEFAULT_FIRMWARE_TEMPLATE
+
+        self.mock_ansible_module.params = self.params
+
+        FirmwareBundleModule().run()
+
+        self.file_transfer.upload.assert_called_once_with('/rest/firmware-bundles', self.file_path,
+                                                          log=self.mock_ansible_module.log)
+
+    def test_should_not_upload_the_same_contents_uploaded_before_under_another_name(self):
+        firmware = dict(DEFAULT_FIRMWARE_TEMPLATE, uri='/rest/firmware-drivers/1')
+        self.mock_ov_client.firmware_drivers.get_all.return_value = [firmware]
+        self.file_transfer.upload.return_value = firmware
+
+        self.mock_ansible_module.params = dict(self.params, digest_cache=self.digest_cache_path)
+        FirmwareBundleModule().run()
+
+        renamed_file_path = self.file_path.replace('.rpm', '-copy.rpm')
+        with open(self.file_path, 'rb') as file_object:
+            with open(renamed_file_path, 'wb') as renamed_file:
+                renamed_file.write(file_object.read())
+
+        self.mock_ansible_module.exit_json.reset_mock()
+        self.mock_ansible_module.params = dict(self.params, file_path=renamed_file_path,
+                                               digest_cache=self.digest_cache_path)
+        FirmwareBundleModule().run()
+
+        assert self.file_transfer.upload.call_count == 1
+        self.mock_ansible_module.exit_json.assert_called_once_with(
+            changed=False,
+            msg=FirmwareBundleModule.MSG_FIRMWARE_BUNDLE_ALREADY_PRESENT,
+            ansible_facts=dict(firmware_bundle=firmware)
+        )
+
+    def test_should_upload_again_when_the_firmware_driver_uploaded_before_was_removed(self):
+        firmware = dict(DEFAULT_FIRMWARE_TEMPLATE, uri='/rest/firmware-drivers/1')
+        self.file_transfer.upload.return_value = firmware
+
+        self.mock_ansible_module.params = dict(self.params, digest_cache=self.digest_cache_path)
+        FirmwareBundleModule().run()
+        FirmwareBundleModule().run()
+
+        assert self.file_transfer.upload.call_count == 2
+
 
 if __name__ == '__main__':
     pytest.main([__file__])
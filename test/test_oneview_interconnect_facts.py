@@ -258,6 +258,27 @@ class TestInterconnectFactsModule(OneViewBaseFactsTest):
                                interconnect_pluggable_module_information=fake_sfp_info)
         )
 
+    def test_should_get_the_statistics_of_many_interconnects_by_names(self):
+        interconnects = [dict(name='IC 1', uri='/rest/interconnects/1'), dict(name='IC 2', uri='/rest/interconnects/2')]
+        self.resource.get_all.return_value = interconnects
+        self.resource.get_statistics.side_effect = lambda uri: dict(uri=uri)
+        self.mock_ansible_module.params = dict(config='config.json', name=None, names=['IC 1', 'IC 2'],
+                                               options=['statistics'])
+
+        InterconnectFactsModule().run()
+
+        self.resource.get_all.assert_called_once_with(filter="\"name='IC 1' OR name='IC 2'\"")
+        self.mock_ansible_module.exit_json.assert_called_once_with(
+            changed=False,
+            ansible_facts=dict(
+                interconnects=interconnects,
+                interconnects_by_name={
+                    'IC 1': dict(interconnect=interconnects[0], interconnect_statistics=dict(uri='/rest/interconnects/1')),
+                    'IC 2': dict(interconnect=interconnects[1], interconnect_statistics=dict(uri='/rest/interconnects/2'))
+                }
+            )
+        )
+
 
 if __name__ == '__main__':
     pytest.main([__file__])
@@ -73,8 +73,9 @@ class TestOsDeploymentServerModule(OneViewBaseTest):
     def test_should_replace_names_by_uris_before_add(self):
         self.resource.get_by.return_value = []
         self.resource.add.return_value = {"name": "name"}
-        self.mock_ov_client.ethernet_networks.get_by.return_value = [
-            {"name": "Deployment", "uri": "/rest/ethernet-networks/1b96d2b3-bc12-4757-ac72-e4cd0ef20535"}]
+        self.mock_ov_client.index_resources.get_all.return_value = [
+            {"name": "Deployment", "category": "ethernet-networks",
+             "uri": "/rest/ethernet-networks/1b96d2b3-bc12-4757-ac72-e4cd0ef20535"}]
         self.mock_ov_client.os_deployment_servers.get_appliance_by_name.return_value = {
             "name": "0000A66103, appliance 2",
             "uri": "/rest/deployment-servers/image-streamer-appliances/aca554e2-09c2-4b14-891d-e51c0058efab"}
@@ -99,9 +100,9 @@ class TestOsDeploymentServerModule(OneViewBaseTest):
         self.resource.get_by.return_value = []
         self.resource.add.return_value = {"name": "name"}
 
-        self.mock_ov_client.ethernet_networks.get_by.return_value = []
-        self.mock_ov_client.fc_networks.get_by.return_value = [
-            {"name": "Deployment", "uri": "/rest/fc-networks/1b96d2b3-bc12-4757-ac72-e4cd0ef20535"}]
+        self.mock_ov_client.index_resources.get_all.return_value = [
+            {"name": "Deployment", "category": "fc-networks",
+             "uri": "/rest/fc-networks/1b96d2b3-bc12-4757-ac72-e4cd0ef20535"}]
         self.mock_ov_client.os_deployment_servers.get_appliance_by_name.return_value = {
             "name": "0000A66103, appliance 2",
             "uri": "/rest/deployment-servers/image-streamer-appliances/aca554e2-09c2-4b14-891d-e51c0058efab"}
@@ -126,10 +127,9 @@ class TestOsDeploymentServerModule(OneViewBaseTest):
         self.resource.get_by.return_value = []
         self.resource.add.return_value = {"name": "name"}
 
-        self.mock_ov_client.ethernet_networks.get_by.return_value = []
-        self.mock_ov_client.fc_networks.get_by.return_value = []
-        self.mock_ov_client.fcoe_networks.get_by.return_value = [
-            {"name": "Deployment", "uri": "/rest/fcoe-networks/1b96d2b3-bc12-4757-ac72-e4cd0ef20535"}]
+        self.mock_ov_client.index_resources.get_all.return_value = [
+            {"name": "Deployment", "category": "fcoe-networks",
+             "uri": "/rest/fcoe-networks/1b96d2b3-bc12-4757-ac72-e4cd0ef20535"}]
         self.mock_ov_client.os_deployment_servers.get_appliance_by_name.return_value = {
             "name": "0000A66103, appliance 2",
             "uri": "/rest/deployment-servers/image-streamer-appliances/aca554e2-09c2-4b14-891d-e51c0058efab"}
@@ -150,10 +150,31 @@ class TestOsDeploymentServerModule(OneViewBaseTest):
             ansible_facts=dict(os_deployment_server={"name": "name"})
         )
 
+    def test_replace_net_names_by_uris_should_give_precedence_to_ethernet(self):
+        self.resource.get_by.return_value = []
+        self.resource.add.return_value = {"name": "name"}
+
+        self.mock_ov_client.index_resources.get_all.return_value = [
+            {"name": "Deployment", "category": "fc-networks", "uri": "/rest/fc-networks/1"},
+            {"name": "Deployment", "category": "ethernet-networks", "uri": "/rest/ethernet-networks/2"}]
+        self.mock_ov_client.os_deployment_servers.get_appliance_by_name.return_value = {
+            "name": "0000A66103, appliance 2",
+            "uri": "/rest/deployment-servers/image-streamer-appliances/aca554e2-09c2-4b14-891d-e51c0058efab"}
+
+        self.mock_ansible_module.params = self.DEPLOYMENT_SERVER_CREATE_WITH_NAMES
+
+        OsDeploymentServerModule().run()
+
+        self.mock_ov_client.index_resources.get_all.assert_called_once_with(
+            category=['ethernet-networks', 'fc-networks', 'fcoe-networks'], filter="\"name='Deployment'\"")
+        args, _ = self.resource.add.call_args
+        assert args[0]['mgmtNetworkUri'] == "/rest/ethernet-networks/2"
+
     def test_should_fail_when_appliance_name_not_found(self):
         self.resource.get_by.return_value = []
         self.resource.add.return_value = {"name": "name"}
-        self.mock_ov_client.ethernet_networks.get_by.return_value = [{"uri": "/rest/ethernet-networks/123"}]
+        self.mock_ov_client.index_resources.get_all.return_value = [
+            {"name": "Deployment", "category": "ethernet-networks", "uri": "/rest/ethernet-networks/123"}]
         self.mock_ov_client.os_deployment_servers.get_appliance_by_name.return_value = None
 
         self.mock_ansible_module.params = self.DEPLOYMENT_SERVER_CREATE_WITH_NAMES
@@ -165,9 +186,7 @@ class TestOsDeploymentServerModule(OneViewBaseTest):
     def test_should_fail_when_network_name_not_found(self):
         self.resource.get_by.return_value = []
         self.resource.add.return_value = {"name": "name"}
-        self.mock_ov_client.ethernet_networks.get_by.return_value = []
-        self.mock_ov_client.fc_networks.get_by.return_value = []
-        self.mock_ov_client.fcoe_networks.get_by.return_value = []
+        self.mock_ov_client.index_resources.get_all.return_value = []
         self.mock_ov_client.os_deployment_servers.get_appliances.return_value = [
             {"name": "0000A66103, appliance 2",
              "uri": "/rest/deployment-servers/image-streamer-appliances/123"}]
@@ -181,8 +200,9 @@ class TestOsDeploymentServerModule(OneViewBaseTest):
     def test_should_replace_names_by_uris_before_update(self):
         self.resource.get_by.return_value = [{"name": "name"}]
         self.resource.update.return_value = {"name": "name"}
-        self.mock_ov_client.ethernet_networks.get_by.return_value = [
-            {"name": "Deployment", "uri": "/rest/ethernet-networks/1b96d2b3-bc12-4757-ac72-e4cd0ef20535"}]
+        self.mock_ov_client.index_resources.get_all.return_value = [
+            {"name": "Deployment", "category": "ethernet-networks",
+             "uri": "/rest/ethernet-networks/1b96d2b3-bc12-4757-ac72-e4cd0ef20535"}]
         self.mock_ov_client.os_deployment_servers.get_appliance_by_name.return_value = {
             "name": "0000A66103, appliance 2",
             "uri": "/rest/deployment-servers/image-streamer-appliances/aca554e2-09c2-4b14-891d-e51c0058efab"}
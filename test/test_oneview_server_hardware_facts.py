@@ -16,10 +16,12 @@
 # limitations under the License.
 ###
 
+import mock
 import pytest
+import threading
 
 from hpe_test_utils import OneViewBaseFactsTest
-from oneview_module_loader import ServerHardwareFactsModule
+from oneview_module_loader import OneViewModuleException, ServerHardwareFactsModule
 
 ERROR_MSG = 'Fake message error'
 
@@ -28,6 +30,12 @@ PARAMS_GET_ALL = dict(
     name=None
 )
 
+PARAMS_GET_ALL_WITH_FIELDS = dict(
+    config='config.json',
+    name=None,
+    fields=['name', 'status', 'portMap.deviceSlots.slotNumber']
+)
+
 PARAMS_GET_BY_NAME = dict(
     config='config.json',
     name="Test Server Hardware"
@@ -43,6 +51,15 @@ PARAMS_WITH_OPTIONS = dict(
                                                          "view": 'day'}}]
 )
 
+PARAMS_WITH_NAMES = dict(
+    config='config.json',
+    names=['SH 1', 'SH 2', 'SH 3'],
+    options=['bios', 'firmware']
+)
+
+SERVER_HARDWARE_1 = dict(name='SH 1', uri='/rest/server-hardware/1')
+SERVER_HARDWARE_2 = dict(name='SH 2', uri='/rest/server-hardware/2')
+
 PARAMS_WITH_ALL_FIRMWARES_WITHOUT_FILTER = dict(
     config='config.json',
     options=['firmwares']
@@ -72,6 +89,33 @@ class TestServerHardwareFactsModule(OneViewBaseFactsTest):
             ansible_facts=dict(server_hardwares=({"name": "Server Hardware Name"}))
         )
 
+    def test_should_get_all_server_hardware_with_fields(self):
+        self.resource.get_all.return_value = [{"name": "Server Hardware Name", "status": "OK", "powerState": "On",
+                                               "portMap": {"deviceSlots": [{"slotNumber": 1, "location": "Flb"}]}}]
+        self.mock_ansible_module.params = PARAMS_GET_ALL_WITH_FIELDS
+
+        ServerHardwareFactsModule().run()
+
+        self.resource.get_all.assert_called_once_with(fields='name,portMap,status,uri')
+        self.mock_ansible_module.exit_json.assert_called_once_with(
+            changed=False,
+            ansible_facts=dict(server_hardwares=[{"name": "Server Hardware Name", "status": "OK",
+                                                  "portMap": {"deviceSlots": [{"slotNumber": 1}]}}])
+        )
+
+    def test_should_not_project_the_results_of_the_options_with_fields(self):
+        self.resource.get_all.return_value = [{"name": "Server Hardware Name", "status": "OK"}]
+        self.resource.get_all_firmwares.return_value = [{'name': 'firmware', 'components': []}]
+        self.mock_ansible_module.params = dict(PARAMS_WITH_ALL_FIRMWARES_WITHOUT_FILTER, fields=['status'])
+
+        ServerHardwareFactsModule().run()
+
+        self.mock_ansible_module.exit_json.assert_called_once_with(
+            changed=False,
+            ansible_facts=dict(server_hardwares=[{"status": "OK"}],
+                               server_hardware_firmwares=[{'name': 'firmware', 'components': []}])
+        )
+
     def test_should_get_server_hardware_by_name(self):
         self.resource.get_by.return_value = {"name": "Server Hardware Name"}
         self.mock_ansible_module.params = PARAMS_GET_BY_NAME
@@ -110,6 +154,44 @@ class TestServerHardwareFactsModule(OneViewBaseFactsTest):
                            'server_hardware_firmware': {'subresource': 'firmware'}}
         )
 
+    def test_should_request_the_options_concurrently(self):
+        # Each option only returns once all of them were requested, which requires them to run at once
+        barrier = threading.Barrier(8, timeout=5)
+
+        def wait_for_all_options(*args, **kwargs):
+            barrier.wait()
+            return {'subresource': 'value'}
+
+        self.resource.get_by.return_value = [{"name": "Server Hardware Name", "uri": "res_uri"}]
+        for getter in ['get_bios', 'get_environmental_configuration', 'get_java_remote_console_url',
+                       'get_ilo_sso_url', 'get_physical_server_hardware', 'get_remote_console_url',
+                       'get_utilization', 'get_firmware']:
+            getattr(self.resource, getter).side_effect = wait_for_all_options
+        self.mock_ansible_module.params = PARAMS_WITH_OPTIONS
+
+        ServerHardwareFactsModule().run()
+
+        ansible_facts = self.mock_ansible_module.exit_json.call_args[1]['ansible_facts']
+        assert len(ansible_facts) == 9
+        self.resource.get_utilization.assert_called_once_with('res_uri',
+                                                              fields='AveragePower',
+                                                              filter='startDate=2016-05-30T03:29:42.000Z',
+                                                              refresh=None,
+                                                              view='day')
+
+    def test_should_fail_with_the_error_of_the_first_failed_option(self):
+        self.resource.get_by.return_value = [{"name": "Server Hardware Name", "uri": "res_uri"}]
+        self.resource.get_environmental_configuration.side_effect = OneViewModuleException(ERROR_MSG)
+        self.resource.get_firmware.side_effect = OneViewModuleException('Another error')
+        self.mock_ansible_module.params = PARAMS_WITH_OPTIONS
+
+        ServerHardwareFactsModule().run()
+
+        self.resource.get_bios.assert_called_once_with('res_uri')
+        self.resource.get_remote_console_url.assert_called_once_with('res_uri')
+        self.mock_ansible_module.exit_json.assert_not_called()
+        self.mock_ansible_module.fail_json.assert_called_once_with(exception=mock.ANY, msg=ERROR_MSG)
+
     def test_should_get_all_firmwares_across_the_servers(self):
         self.resource.get_all.return_value = []
         self.resource.get_all_firmwares.return_value = [{'subresource': 'firmware'}]
@@ -142,6 +224,60 @@ class TestServerHardwareFactsModule(OneViewBaseFactsTest):
             }
         )
 
+    def test_should_get_many_server_hardware_by_names_with_options(self):
+        self.resource.get_all.return_value = [SERVER_HARDWARE_2, SERVER_HARDWARE_1]
+        self.resource.get_bios.side_effect = lambda uri: {'bios': uri}
+        self.resource.get_firmware.side_effect = lambda uri: {'firmware': uri}
+        self.mock_ansible_module.params = PARAMS_WITH_NAMES
+
+        ServerHardwareFactsModule().run()
+
+        self.resource.get_all.assert_called_once_with(filter="\"name='SH 1' OR name='SH 2' OR name='SH 3'\"")
+        self.mock_ansible_module.exit_json.assert_called_once_with(
+            changed=False,
+            ansible_facts=dict(
+                server_hardwares=[SERVER_HARDWARE_1, SERVER_HARDWARE_2],
+                server_hardwares_by_name={
+                    'SH 1': dict(server_hardware=SERVER_HARDWARE_1,
+                                 server_hardware_bios={'bios': '/rest/server-hardware/1'},
+                                 server_hardware_firmware={'firmware': '/rest/server-hardware/1'}),
+                    'SH 2': dict(server_hardware=SERVER_HARDWARE_2,
+                                 server_hardware_bios={'bios': '/rest/server-hardware/2'},
+                                 server_hardware_firmware={'firmware': '/rest/server-hardware/2'})
+                }
+            )
+        )
+
+    def test_should_keep_the_errors_of_each_server_hardware_by_name(self):
+        def get_firmware(uri):
+            if uri == SERVER_HARDWARE_1['uri']:
+                raise OneViewModuleException(ERROR_MSG)
+            return {'firmware': uri}
+
+        self.resource.get_all.return_value = [SERVER_HARDWARE_1, SERVER_HARDWARE_2]
+        self.resource.get_firmware.side_effect = get_firmware
+        self.mock_ansible_module.params = dict(PARAMS_WITH_NAMES, options=['firmware'])
+
+        ServerHardwareFactsModule().run()
+
+        facts_by_name = self.mock_ansible_module.exit_json.call_args[1]['ansible_facts']['server_hardwares_by_name']
+        assert facts_by_name['SH 1'] == dict(server_hardware=SERVER_HARDWARE_1,
+                                             errors=dict(server_hardware_firmware=ERROR_MSG))
+        assert facts_by_name['SH 2'] == dict(server_hardware=SERVER_HARDWARE_2,
+                                             server_hardware_firmware={'firmware': '/rest/server-hardware/2'})
+
+    def test_should_gather_the_options_of_the_server_hardware_matched_by_a_filter(self):
+        self.resource.get_all.return_value = [SERVER_HARDWARE_1, SERVER_HARDWARE_2]
+        self.resource.get_bios.side_effect = lambda uri: {'bios': uri}
+        self.mock_ansible_module.params = dict(config='config.json', options=['bios'], params=dict(filter="state='NoProfileApplied'"))
+
+        ServerHardwareFactsModule().run()
+
+        self.resource.get_all.assert_called_once_with(filter="state='NoProfileApplied'")
+        facts_by_name = self.mock_ansible_module.exit_json.call_args[1]['ansible_facts']['server_hardwares_by_name']
+        assert list(facts_by_name) == ['SH 1', 'SH 2']
+        assert facts_by_name['SH 2']['server_hardware_bios'] == {'bios': '/rest/server-hardware/2'}
+
 
 if __name__ == '__main__':
     pytest.main([__file__])
@@ -23,6 +23,8 @@ from hpe_test_utils import OneViewBaseTest
 from oneview_module_loader import (ServerProfileModule,
                                    OneViewModuleException,
                                    OneViewModuleTaskError,
+                                   ReservationLedger,
+                                   RetryScheduler,
                                    SPKeys,
                                    ServerProfileMerger,
                                    ServerProfileReplaceNamesByUris)
@@ -119,6 +121,9 @@ AVAILABLE_TARGETS = dict(
     ]
 )
 
+# Server hardware picked among the AVAILABLE_TARGETS for SERVER_PROFILE_NAME by the spread allocation
+SPREAD_SERVER_HARDWARE_URI = '/rest/server-hardware/37333036-3831-6776-gdfd-3037583rewr0'
+
 BOOT_CONN = dict(priority="NotBootable", chapLevel="none")
 
 CONNECTION_1 = dict(id=1, name="connection-1", mac="E2:4B:0D:30:00:29", boot=BOOT_CONN)
@@ -276,7 +281,7 @@ class TestServerProfileModule(OneViewBaseTest):
 
     def test_should_create_with_automatically_selected_hardware_when_not_exists(self):
         profile_data = deepcopy(BASIC_PROFILE)
-        profile_data['serverHardwareUri'] = '/rest/server-hardware/31393736-3831-4753-567h-30335837524E'
+        profile_data['serverHardwareUri'] = SPREAD_SERVER_HARDWARE_URI
 
         self.resource.get_by_name.return_value = None
         self.resource.create.return_value = CREATED_BASIC_PROFILE
@@ -295,6 +300,64 @@ class TestServerProfileModule(OneViewBaseTest):
             ansible_facts=mock_facts
         )
 
+    def test_should_create_with_first_available_hardware_when_allocation_is_first(self):
+        profile_data = deepcopy(BASIC_PROFILE)
+        profile_data['serverHardwareUri'] = '/rest/server-hardware/31393736-3831-4753-567h-30335837524E'
+
+        self.resource.get_by_name.return_value = None
+        self.resource.create.return_value = CREATED_BASIC_PROFILE
+        self.resource.get_available_targets.return_value = AVAILABLE_TARGETS
+        self.mock_ansible_module.params = dict(deepcopy(PARAMS_FOR_PRESENT), server_hardware_allocation='first')
+
+        ServerProfileModule().run()
+
+        self.resource.create.assert_called_once_with(profile_data)
+
+    def test_should_spread_profiles_over_the_available_hardware(self):
+        self.resource.get_by_name.return_value = None
+        self.resource.create.return_value = CREATED_BASIC_PROFILE
+        self.resource.get_available_targets.return_value = AVAILABLE_TARGETS
+
+        for index in range(30):
+            params = deepcopy(PARAMS_FOR_PRESENT)
+            params['data']['name'] = 'Profile-{}'.format(index)
+            self.mock_ansible_module.params = params
+            ServerProfileModule().run()
+
+        picked = set(create_call[0][0]['serverHardwareUri'] for create_call in self.resource.create.call_args_list)
+        assert len(picked) == 3
+
+    def test_should_reserve_distinct_hardware_when_reservation_ledger_is_set(self, tmpdir):
+        ledger_path = str(tmpdir.join('reservations.json'))
+        self.resource.get_by_name.return_value = None
+        self.resource.create.side_effect = TASK_ERROR
+        self.resource.get_available_targets.return_value = AVAILABLE_TARGETS
+
+        picked = []
+        for index in range(3):
+            params = deepcopy(PARAMS_FOR_PRESENT)
+            params['data']['name'] = 'Profile-{}'.format(index)
+            params['reservation_ledger'] = ledger_path
+            self.mock_ansible_module.params = params
+            with mock.patch.object(ServerProfileModule, 'CONCURRENCY_FAILOVER_SCHEDULER', RetryScheduler(max_attempts=1)):
+                ServerProfileModule().run()
+            picked.append(self.resource.create.call_args[0][0]['serverHardwareUri'])
+
+        assert sorted(picked) == sorted(target['serverHardwareUri'] for target in AVAILABLE_TARGETS['targets'][1:])
+
+    def test_should_release_reservations_when_profile_is_created(self, tmpdir):
+        ledger_path = str(tmpdir.join('reservations.json'))
+        self.resource.get_by_name.return_value = None
+        self.resource.create.return_value = CREATED_BASIC_PROFILE
+        self.resource.get_available_targets.return_value = AVAILABLE_TARGETS
+        params = deepcopy(PARAMS_FOR_PRESENT)
+        params['reservation_ledger'] = ledger_path
+        self.mock_ansible_module.params = params
+
+        ServerProfileModule().run()
+
+        assert ReservationLedger(ledger_path).reserve([SPREAD_SERVER_HARDWARE_URI], 'another') == SPREAD_SERVER_HARDWARE_URI
+
     def test_should_create_from_template_with_automatically_selected_hardware_when_not_exists(self):
         template = deepcopy(BASIC_TEMPLATE)
         profile_from_template = deepcopy(BASIC_PROFILE)
@@ -315,7 +378,7 @@ class TestServerProfileModule(OneViewBaseTest):
 
         expected_profile_data = deepcopy(BASIC_PROFILE)
         expected_profile_data.update(PARAMS_FOR_PRESENT['data'])
-        expected_profile_data['serverHardwareUri'] = '/rest/server-hardware/31393736-3831-4753-567h-30335837524E'
+        expected_profile_data['serverHardwareUri'] = SPREAD_SERVER_HARDWARE_URI
         expected_profile_data['serverProfileTemplateUri'] \
             = '/rest/server-profile-templates/9a156b04-fce8-40b0-b0cd-92ced1311dda'
 
@@ -348,7 +411,7 @@ class TestServerProfileModule(OneViewBaseTest):
 
         expected_profile_data = deepcopy(BASIC_PROFILE)
         expected_profile_data.update(param_for_present['data'])
-        expected_profile_data['serverHardwareUri'] = '/rest/server-hardware/31393736-3831-4753-567h-30335837524E'
+        expected_profile_data['serverHardwareUri'] = SPREAD_SERVER_HARDWARE_URI
 
         self.resource.create.assert_called_once_with(expected_profile_data)
 
@@ -433,6 +496,22 @@ class TestServerProfileModule(OneViewBaseTest):
 
         self.mock_ansible_module.fail_json.assert_called_once_with(exception=mock.ANY, msg=ServerProfileModule.MSG_ERROR_ALLOCATE_SERVER_HARDWARE)
 
+    def test_should_back_off_from_milliseconds_when_hardware_assignment_collides(self):
+        self.resource.get_by_name.return_value = None
+        self.resource.create.side_effect = TASK_ERROR
+        self.resource.get_available_targets.return_value = AVAILABLE_TARGETS
+        self.mock_ov_client.server_hardware.get_by.return_value = [FAKE_SERVER_HARDWARE]
+        self.mock_ansible_module.params = deepcopy(PARAMS_FOR_PRESENT)
+
+        with mock.patch('time.sleep') as mock_sleep:
+            ServerProfileModule().run()
+
+        delays = [delay for ((delay,), _) in mock_sleep.call_args_list]
+        assert len(delays) == 24
+        assert delays[0] <= 0.05
+        assert max(delays) <= 10
+        assert sum(delays) < 24 * 10
+
     def test_should_try_create_with_informed_hardware_2_times_when_not_exists(self):
         profile_data = deepcopy(BASIC_PROFILE)
         profile_data['serverHardwareUri'] = '/rest/server-hardware/31393736-3831-4753-567h-30335837524E'
@@ -486,7 +565,7 @@ class TestServerProfileModule(OneViewBaseTest):
         self.mock_ansible_module.params = deepcopy(PARAMS_FOR_PRESENT)
 
         create_params = deepcopy(PARAMS_FOR_PRESENT['data'])
-        create_params['serverHardwareUri'] = FAKE_SERVER_HARDWARE['uri']
+        create_params['serverHardwareUri'] = SPREAD_SERVER_HARDWARE_URI
 
         ServerProfileModule().run()
 
@@ -631,9 +710,10 @@ class TestServerProfileModule(OneViewBaseTest):
         params['data'][SPKeys.CONNECTIONS] = [conn_1, conn_2, conn_3, conn_4]
 
         self.resource.get_by_name.return_value = None
-        self.mock_ov_client.fc_networks.get_by.side_effect = [[dict(uri='/rest/fc-networks/14')], [], []]
-        self.mock_ov_client.fcoe_networks.get_by.side_effect = [[dict(uri='/rest/fcoe-networks/16')], []]
-        self.mock_ov_client.ethernet_networks.get_by.return_value = [dict(uri='/rest/ethernet-networks/18')]
+        self.mock_ov_client.index_resources.get_all.return_value = [
+            dict(name='FC Network', category='fc-networks', uri='/rest/fc-networks/14'),
+            dict(name='FCoE Network', category='fcoe-networks', uri='/rest/fcoe-networks/16'),
+            dict(name='Ethernet Network', category='ethernet-networks', uri='/rest/ethernet-networks/18')]
         self.mock_ansible_module.params = deepcopy(params)
 
         ServerProfileModule().run()
@@ -707,7 +787,7 @@ class TestServerProfileModule(OneViewBaseTest):
         expected_dict['sanStorage']['volumeAttachments'][1] = {"id": 2, "volumeUri": "/rest/storage-volumes/2"}
 
         self.resource.get_by_name.return_value = None
-        self.mock_ov_client.volumes.get_by.side_effect = [[volume1], [volume2]]
+        self.mock_ov_client.volumes.get_all.return_value = [volume1, volume2]
 
         self.mock_ansible_module.params = params
 
@@ -798,7 +878,7 @@ class TestServerProfileModule(OneViewBaseTest):
                                                                "volumeStoragePoolUri": "/rest/storage-pools/2"}
 
         self.resource.get_by_name.return_value = None
-        self.mock_ov_client.storage_pools.get_by.side_effect = [[pool1], [pool2]]
+        self.mock_ov_client.storage_pools.get_all.return_value = [pool1, pool2]
 
         self.mock_ansible_module.params = params
 
@@ -890,7 +970,7 @@ class TestServerProfileModule(OneViewBaseTest):
                                                           "volumeStorageSystemUri": "/rest/storage-systems/2"}
 
         self.resource.get_by_name.return_value = None
-        self.mock_ov_client.storage_systems.get_by.side_effect = [[storage_system1], [storage_system2]]
+        self.mock_ov_client.storage_systems.get_all.return_value = [storage_system1, storage_system2]
 
         self.mock_ansible_module.params = params
 
@@ -1009,7 +1089,7 @@ class TestServerProfileModule(OneViewBaseTest):
         expected['connections'][1] = {"id": 2, "interconnectUri": "/rest/interconnects/2"}
 
         self.resource.get_by_name.return_value = None
-        self.mock_ov_client.interconnects.get_by.side_effect = [[interconnect1], [interconnect2]]
+        self.mock_ov_client.interconnects.get_all.return_value = [interconnect1, interconnect2]
 
         self.mock_ansible_module.params = params
 
@@ -1138,7 +1218,7 @@ class TestServerProfileModule(OneViewBaseTest):
         expected['localStorage']['sasLogicalJBODs'][1] = {"id": 2, "sasLogicalJBODUri": "/rest/sas-logical-jbods/2"}
 
         self.resource.get_by_name.return_value = None
-        self.mock_ov_client.sas_logical_jbods.get_by.side_effect = [[sas_logical_jbod1], [sas_logical_jbod2]]
+        self.mock_ov_client.sas_logical_jbods.get_all.return_value = [sas_logical_jbod1, sas_logical_jbod2]
 
         self.mock_ansible_module.params = params
 
@@ -1407,6 +1487,33 @@ class TestServerProfileModule(OneViewBaseTest):
             ansible_facts=mock_facts
         )
 
+    @mock.patch('oneview_server_profile.compare')
+    def test_should_retry_update_while_server_hardware_is_reported_powered_on(self, mock_resource_compare):
+        fake_profile_data = deepcopy(BASIC_PROFILE)
+        fake_profile_data['serverHardwareUri'] = SERVER_HARDWARE_TEMPLATE_URI
+        power_on_error = OneViewModuleException(ServerProfileModule.MSG_POWERED_ON_UPDATE_ERROR)
+
+        mock_resource_compare.return_value = False
+
+        self.resource.get_by_name.return_value = fake_profile_data
+        self.resource.update.side_effect = [power_on_error, power_on_error, power_on_error, CREATED_BASIC_PROFILE]
+        self.mock_ov_client.server_hardware.update_power_state.return_value = {}
+        self.mock_ansible_module.params = deepcopy(PARAMS_FOR_PRESENT)
+
+        with mock.patch('time.sleep') as mock_sleep:
+            ServerProfileModule().run()
+
+        assert self.resource.update.call_count == 4
+        assert mock_sleep.call_count == 2
+        assert all(delay < 1 for ((delay,), _) in mock_sleep.call_args_list)
+        assert self.mock_ov_client.server_hardware.update_power_state.call_count == 3
+
+        self.mock_ansible_module.exit_json.assert_called_once_with(
+            changed=True,
+            msg=ServerProfileModule.MSG_UPDATED,
+            ansible_facts=mock.ANY
+        )
+
     @mock.patch('oneview_server_profile.compare')
     def test_should_return_error_during_update_when_unrelated_to_power(self, mock_resource_compare):
         fake_profile_data = deepcopy(BASIC_PROFILE)
@@ -1594,9 +1701,10 @@ class TestServerProfileModule(OneViewBaseTest):
         params['data'][SPKeys.CONNECTIONS] = [conn_1, conn_2, conn_3, conn_4]
 
         self.resource.get_by_name.return_value = deepcopy(BASIC_PROFILE)
-        self.mock_ov_client.fc_networks.get_by.side_effect = [[dict(uri='/rest/fc-networks/14')], [], []]
-        self.mock_ov_client.fcoe_networks.get_by.side_effect = [[dict(uri='/rest/fcoe-networks/16')], []]
-        self.mock_ov_client.ethernet_networks.get_by.return_value = [dict(uri='/rest/ethernet-networks/18')]
+        self.mock_ov_client.index_resources.get_all.return_value = [
+            dict(name='FC Network', category='fc-networks', uri='/rest/fc-networks/14'),
+            dict(name='FCoE Network', category='fcoe-networks', uri='/rest/fcoe-networks/16'),
+            dict(name='Ethernet Network', category='ethernet-networks', uri='/rest/ethernet-networks/18')]
         self.mock_ansible_module.params = deepcopy(params)
 
         ServerProfileModule().run()
@@ -0,0 +1,340 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+###
+# Copyright (2016-2017) Hewlett Packard Enterprise Development LP
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# You may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+###
+
+import mock
+import pytest
+
+from copy import deepcopy
+from hpe_test_utils import OneViewBaseTest
+from hpOneView.resources.task_monitor import TaskMonitor
+from hpOneView.resources.networking.logical_switches import LogicalSwitches
+from oneview_module_loader import ServerProfileBulkModule
+
+TEMPLATE_NAME = 'Compute-node-template'
+ENCLOSURE_GROUP_URI = '/rest/enclosure-groups/ad5e9e88-b858-4935-ba58-017d60a17c89'
+SERVER_HARDWARE_TYPE_URI = '/rest/server-hardware-types/94B55683-173F-4B36-8FA6-EC250BA2328B'
+
+SERVER_TEMPLATE = dict(name=TEMPLATE_NAME,
+                       uri='/rest/server-profile-templates/9a156b04-fce8-40b0-b0cd-92ced1311dda',
+                       enclosureGroupUri=ENCLOSURE_GROUP_URI,
+                       serverHardwareTypeUri=SERVER_HARDWARE_TYPE_URI)
+
+NEW_PROFILE_FROM_TEMPLATE = dict(type='ServerProfileV8',
+                                 serverProfileTemplateUri=SERVER_TEMPLATE['uri'],
+                                 enclosureGroupUri=ENCLOSURE_GROUP_URI,
+                                 serverHardwareTypeUri=SERVER_HARDWARE_TYPE_URI)
+
+AVAILABLE_TARGETS = dict(
+    category='available-targets',
+    targets=[
+        dict(enclosureBay=1, serverHardwareUri=''),
+        dict(enclosureBay=2, serverHardwareUri='/rest/server-hardware/2'),
+        dict(enclosureBay=3, serverHardwareUri='/rest/server-hardware/3'),
+        dict(enclosureBay=4, serverHardwareUri='/rest/server-hardware/4'),
+    ]
+)
+
+EXISTING_PROFILE = dict(name='compute-node-01',
+                        uri='/rest/server-profiles/1',
+                        description='Compute node',
+                        serverHardwareUri='/rest/server-hardware/1',
+                        serverProfileTemplateUri=SERVER_TEMPLATE['uri'])
+
+PARAMS_FOR_PRESENT = dict(
+    config='config.json',
+    state='present',
+    server_template=TEMPLATE_NAME,
+    profiles=[dict(name='compute-node-01', description='Compute node'),
+              dict(name='compute-node-02'),
+              dict(name='compute-node-03')],
+    auto_assign_server_hardware=True,
+    max_concurrency=10,
+    timeout=3600,
+    poll_interval=5
+)
+
+PARAMS_FOR_ABSENT = dict(PARAMS_FOR_PRESENT, state='absent', server_template=None)
+
+
+def build_task(index, state, resource_uri=None):
+    task = dict(uri='/rest/tasks/{}'.format(index), taskState=state)
+    if resource_uri:
+        task['associatedResource'] = dict(resourceUri=resource_uri)
+    return task
+
+
+def start_tasks(resource, tasks):
+    """Returns a side effect for the SDK calls of the resource that start each one of the tasks, in order."""
+    resource._task_monitor = TaskMonitor(mock.Mock())
+    tasks = list(tasks)
+
+    def start_task(*args, **kwargs):
+        resource._task_monitor.wait_for_task(tasks.pop(0))
+
+    return start_task
+
+
+@pytest.mark.resource(TestServerProfileBulkModule='server_profiles')
+class TestServerProfileBulkModule(OneViewBaseTest):
+    @pytest.fixture(autouse=True)
+    def specific_set_up(self):
+        self.sleep_patch = mock.patch('time.sleep')
+        self.mock_sleep = self.sleep_patch.start()
+        self.mock_ov_client.server_profile_templates.get_by_name.return_value = SERVER_TEMPLATE
+        self.mock_ov_client.server_profile_templates.get_new_profile.return_value = NEW_PROFILE_FROM_TEMPLATE
+        self.mock_ov_client.server_hardware.get_all.return_value = []
+        self.resource.get_available_targets.return_value = AVAILABLE_TARGETS
+        yield
+        self.sleep_patch.stop()
+
+    def test_should_create_missing_profiles_with_distinct_hardware(self):
+        self.resource.get_all.return_value = [EXISTING_PROFILE]
+        self.mock_ansible_module.params = deepcopy(PARAMS_FOR_PRESENT)
+
+        ServerProfileBulkModule().run()
+
+        self.resource.get_all.assert_called_once_with(
+            filter="\"name='compute-node-01' OR name='compute-node-02' OR name='compute-node-03'\"")
+        self.mock_ov_client.server_profile_templates.get_by_name.assert_called_once_with(TEMPLATE_NAME)
+        self.mock_ov_client.server_profile_templates.get_new_profile.assert_called_once_with(SERVER_TEMPLATE['uri'])
+        self.resource.get_available_targets.assert_called_once_with(
+            enclosureGroupUri=ENCLOSURE_GROUP_URI, serverHardwareTypeUri=SERVER_HARDWARE_TYPE_URI)
+        self.resource.update.assert_not_called()
+
+        expected_profile_2 = dict(NEW_PROFILE_FROM_TEMPLATE, name='compute-node-02',
+                                  serverHardwareUri='/rest/server-hardware/2')
+        expected_profile_3 = dict(NEW_PROFILE_FROM_TEMPLATE, name='compute-node-03',
+                                  serverHardwareUri='/rest/server-hardware/3')
+        assert self.resource.create.call_args_list == [mock.call(expected_profile_2), mock.call(expected_profile_3)]
+        assert self.mock_ov_client.server_hardware.update_power_state.call_args_list == [
+            mock.call(dict(powerState='Off', powerControl='PressAndHold'), '/rest/server-hardware/2'),
+            mock.call(dict(powerState='Off', powerControl='PressAndHold'), '/rest/server-hardware/3')]
+
+        self.mock_ansible_module.exit_json.assert_called_once_with(
+            changed=True,
+            failed=False,
+            msg=ServerProfileBulkModule.MSG_COMPLETED,
+            ansible_facts=dict(server_profiles=[
+                dict(name='compute-node-01', changed=False, uri=EXISTING_PROFILE['uri'],
+                     msg=ServerProfileBulkModule.MSG_ALREADY_PRESENT),
+                dict(name='compute-node-02', changed=True, msg=ServerProfileBulkModule.MSG_CREATED),
+                dict(name='compute-node-03', changed=True, msg=ServerProfileBulkModule.MSG_CREATED)])
+        )
+
+    def test_should_update_profiles_with_changes(self):
+        self.resource.get_all.return_value = [EXISTING_PROFILE]
+        params = deepcopy(PARAMS_FOR_PRESENT)
+        params['profiles'] = [dict(name='compute-node-01', description='Updated compute node')]
+        self.mock_ansible_module.params = params
+
+        ServerProfileBulkModule().run()
+
+        self.resource.update.assert_called_once_with(dict(EXISTING_PROFILE, description='Updated compute node'),
+                                                     EXISTING_PROFILE['uri'])
+        self.resource.create.assert_not_called()
+        self.mock_ov_client.server_profile_templates.get_new_profile.assert_not_called()
+
+        self.mock_ansible_module.exit_json.assert_called_once_with(
+            changed=True,
+            failed=False,
+            msg=ServerProfileBulkModule.MSG_COMPLETED,
+            ansible_facts=dict(server_profiles=[
+                dict(name='compute-node-01', changed=True, uri=EXISTING_PROFILE['uri'],
+                     msg=ServerProfileBulkModule.MSG_UPDATED)])
+        )
+
+    def test_should_match_the_existing_profiles_by_name_case_insensitively(self):
+        self.resource.get_all.return_value = [dict(EXISTING_PROFILE, name='Compute-Node-01')]
+        params = deepcopy(PARAMS_FOR_PRESENT)
+        params['profiles'] = [dict(name='compute-node-01', description='Compute node')]
+        self.mock_ansible_module.params = params
+
+        ServerProfileBulkModule().run()
+
+        self.resource.create.assert_not_called()
+        self.resource.update.assert_called_once_with(EXISTING_PROFILE, EXISTING_PROFILE['uri'])
+
+    def test_should_remove_the_values_generated_by_the_appliance_before_creating(self):
+        self.resource.get_all.return_value = []
+        params = deepcopy(PARAMS_FOR_PRESENT)
+        params['profiles'] = [dict(name='compute-node-02', macType='Virtual', serialNumberType='Virtual',
+                                   uuid='b6e9fa5e-f6ee-4a5d-a6c4-bbc6ea4d7d1c', serialNumber='VCGE9KB041',
+                                   connections=[dict(id=1, mac='16:2A:E5:A0:00:01')])]
+        self.mock_ansible_module.params = params
+
+        ServerProfileBulkModule().run()
+
+        expected_profile = dict(NEW_PROFILE_FROM_TEMPLATE, name='compute-node-02', macType='Virtual',
+                                serialNumberType='Virtual', connections=[dict(id=1)],
+                                serverHardwareUri='/rest/server-hardware/2')
+        self.resource.create.assert_called_once_with(expected_profile)
+
+    def test_should_fail_the_new_profiles_left_without_available_hardware(self):
+        self.resource.get_all.return_value = []
+        self.resource.get_available_targets.return_value = dict(
+            AVAILABLE_TARGETS, targets=[dict(enclosureBay=2, serverHardwareUri='/rest/server-hardware/2')])
+        self.mock_ansible_module.params = deepcopy(PARAMS_FOR_PRESENT)
+
+        ServerProfileBulkModule().run()
+
+        assert [create_call[0][0]['name'] for create_call in self.resource.create.call_args_list] == ['compute-node-01']
+        result = self.mock_ansible_module.exit_json.call_args[1]
+        assert result['failed']
+        assert result['ansible_facts']['server_profiles'][1:] == [
+            dict(name=name, changed=False, failed=True, msg=ServerProfileBulkModule.MSG_NO_HARDWARE_AVAILABLE)
+            for name in ['compute-node-02', 'compute-node-03']]
+
+    def test_should_start_the_tasks_of_a_client_wrapping_a_resource_client_without_waiting(self):
+        profiles = [dict(EXISTING_PROFILE, name='compute-node-0{0}'.format(index), uri='/rest/server-profiles/{0}'.format(index))
+                    for index in range(1, 3)]
+        connection = mock.Mock()
+        connection.get.return_value = dict(members=profiles, nextPageUri=None)
+        connection.delete.side_effect = [(build_task(index, 'Running'), None) for index in range(1, 3)]
+        # Like the clients of the SDK 4.x, it keeps the TaskMonitor in the ResourceClient of its _client
+        self.mock_ov_client.server_profiles = LogicalSwitches(connection)
+        self.mock_ov_client.connection.get.side_effect = lambda uri: dict(uri=uri, taskState='Completed')
+        params = deepcopy(PARAMS_FOR_ABSENT)
+        params['profiles'] = [dict(name='compute-node-01'), dict(name='compute-node-02')]
+        self.mock_ansible_module.params = params
+
+        ServerProfileBulkModule().run()
+
+        # Only the GET of the profiles, since the tasks are polled together through the OneView connection
+        assert connection.get.call_count == 1
+        assert [delete_call[0][0] for delete_call in connection.delete.call_args_list] == [
+            '/rest/server-profiles/1', '/rest/server-profiles/2']
+        assert self.mock_ov_client.connection.get.call_args_list == [mock.call('/rest/tasks/1'),
+                                                                     mock.call('/rest/tasks/2')]
+        results = self.mock_ansible_module.exit_json.call_args[1]['ansible_facts']['server_profiles']
+        assert [result['msg'] for result in results] == [ServerProfileBulkModule.MSG_DELETED] * 2
+
+    def test_should_limit_the_tasks_running_at_a_time(self):
+        self.resource.get_all.return_value = []
+        params = deepcopy(PARAMS_FOR_PRESENT)
+        params['profiles'] = [dict(name='compute-node-0{}'.format(index)) for index in range(1, 4)]
+        params['max_concurrency'] = 2
+        self.mock_ansible_module.params = params
+
+        self.resource.create.side_effect = start_tasks(self.resource, [build_task(index, 'Running') for index in range(1, 4)])
+        self.mock_ov_client.connection.get.side_effect = [
+            build_task(1, 'Completed', '/rest/server-profiles/1'),
+            build_task(2, 'Running'),
+            build_task(2, 'Completed', '/rest/server-profiles/2'),
+            build_task(3, 'Completed', '/rest/server-profiles/3')]
+
+        ServerProfileBulkModule().run()
+
+        polled = [get_call[0][0] for get_call in self.mock_ov_client.connection.get.call_args_list]
+        assert polled == ['/rest/tasks/1', '/rest/tasks/2', '/rest/tasks/2', '/rest/tasks/3']
+
+        results = self.mock_ansible_module.exit_json.call_args[1]['ansible_facts']['server_profiles']
+        assert [result['uri'] for result in results] == ['/rest/server-profiles/1', '/rest/server-profiles/2',
+                                                         '/rest/server-profiles/3']
+        assert all(result['task_state'] == 'Completed' and result['changed'] for result in results)
+
+    def test_should_report_failed_profiles_and_continue_with_the_others(self):
+        self.resource.get_all.return_value = []
+        params = deepcopy(PARAMS_FOR_PRESENT)
+        params['profiles'] = [dict(name='compute-node-02'), dict(name='compute-node-03')]
+        self.mock_ansible_module.params = params
+
+        self.resource.create.side_effect = start_tasks(self.resource, [build_task(1, 'Running'), build_task(2, 'Running')])
+        failed_task = build_task(1, 'Error')
+        failed_task['taskErrors'] = [dict(message='Server hardware is already assigned')]
+        self.mock_ov_client.connection.get.side_effect = [failed_task, build_task(2, 'Completed')]
+
+        ServerProfileBulkModule().run()
+
+        result = self.mock_ansible_module.exit_json.call_args[1]
+        assert result['failed'] is True
+        assert result['msg'] == ServerProfileBulkModule.MSG_FAILED.format('compute-node-02')
+        assert result['ansible_facts']['server_profiles'][0] == dict(
+            name='compute-node-02', changed=False, failed=True, task_uri='/rest/tasks/1', task_state='Error',
+            msg=ServerProfileBulkModule.MSG_TASK_FAILED.format('Error', 'Server hardware is already assigned'))
+        assert result['ansible_facts']['server_profiles'][1]['changed'] is True
+
+    def test_should_fail_the_tasks_still_running_when_the_timeout_expires(self):
+        self.resource.get_all.return_value = []
+        params = deepcopy(PARAMS_FOR_PRESENT)
+        params['profiles'] = [dict(name='compute-node-02')]
+        params['timeout'] = 0
+        self.mock_ansible_module.params = params
+
+        self.resource.create.side_effect = start_tasks(self.resource, [build_task(1, 'Running')])
+        self.mock_ov_client.connection.get.return_value = build_task(1, 'Running')
+
+        ServerProfileBulkModule().run()
+
+        result = self.mock_ansible_module.exit_json.call_args[1]
+        assert result['ansible_facts']['server_profiles'] == [
+            dict(name='compute-node-02', changed=False, failed=True, msg=ServerProfileBulkModule.MSG_TIMEOUT)]
+
+    def test_should_resolve_server_hardware_names_at_once(self):
+        self.resource.get_all.return_value = []
+        self.mock_ov_client.server_hardware.get_all.return_value = [
+            dict(name='Encl1, bay 7', uri='/rest/server-hardware/7'),
+            dict(name='Encl1, bay 8', uri='/rest/server-hardware/8')]
+        params = deepcopy(PARAMS_FOR_PRESENT)
+        params['profiles'] = [dict(name='compute-node-07', serverHardwareName='Encl1, bay 7'),
+                              dict(name='compute-node-08', serverHardwareName='Encl1, bay 8')]
+        self.mock_ansible_module.params = params
+
+        ServerProfileBulkModule().run()
+
+        self.mock_ov_client.server_hardware.get_all.assert_called_once_with(
+            filter="\"name='Encl1, bay 7' OR name='Encl1, bay 8'\"")
+        self.resource.get_available_targets.assert_not_called()
+        created_hardware = [create_call[0][0]['serverHardwareUri'] for create_call in self.resource.create.call_args_list]
+        assert created_hardware == ['/rest/server-hardware/7', '/rest/server-hardware/8']
+
+    def test_should_fail_when_server_hardware_not_found(self):
+        self.resource.get_all.return_value = []
+        params = deepcopy(PARAMS_FOR_PRESENT)
+        params['profiles'] = [dict(name='compute-node-07', serverHardwareName='Encl1, bay 7')]
+        self.mock_ansible_module.params = params
+
+        ServerProfileBulkModule().run()
+
+        self.mock_ansible_module.fail_json.assert_called_once_with(
+            exception=mock.ANY, msg=ServerProfileBulkModule.MSG_HARDWARE_NOT_FOUND.format('Encl1, bay 7'))
+
+    def test_should_fail_when_a_profile_has_no_name(self):
+        params = deepcopy(PARAMS_FOR_PRESENT)
+        params['profiles'] = [dict(description='No name')]
+        self.mock_ansible_module.params = params
+
+        ServerProfileBulkModule().run()
+
+        self.mock_ansible_module.fail_json.assert_called_once_with(
+            exception=mock.ANY, msg=ServerProfileBulkModule.MSG_NAME_REQUIRED)
+
+    def test_should_delete_existing_profiles(self):
+        self.resource.get_all.return_value = [EXISTING_PROFILE]
+        self.mock_ansible_module.params = deepcopy(PARAMS_FOR_ABSENT)
+
+        ServerProfileBulkModule().run()
+
+        self.resource.delete.assert_called_once_with(EXISTING_PROFILE)
+        results = self.mock_ansible_module.exit_json.call_args[1]['ansible_facts']['server_profiles']
+        assert [result['msg'] for result in results] == [ServerProfileBulkModule.MSG_DELETED,
+                                                         ServerProfileBulkModule.MSG_ALREADY_ABSENT,
+                                                         ServerProfileBulkModule.MSG_ALREADY_ABSENT]
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
@@ -270,6 +270,31 @@ class TestServerProfileFactsModule(OneViewBaseFactsTest):
                            }
         )
 
+    def test_should_get_many_server_profiles_by_names_with_options(self):
+        profiles = [dict(name='SP 1', uri='/rest/server-profiles/1'), dict(name='SP 2', uri='/rest/server-profiles/2')]
+        self.resource.get_all.return_value = profiles
+        self.resource.get_compliance_preview.side_effect = lambda uri: dict(uri=uri)
+        self.resource.get_schema.return_value = {'schema': 'value'}
+        self.mock_ansible_module.params = dict(config='config.json', names=['SP 1', 'SP 2'],
+                                               options=['schema', 'compliancePreview'])
+
+        ServerProfileFactsModule().run()
+
+        self.resource.get_schema.assert_called_once_with()
+        self.mock_ansible_module.exit_json.assert_called_once_with(
+            changed=False,
+            ansible_facts=dict(
+                server_profiles=profiles,
+                server_profile_schema={'schema': 'value'},
+                server_profiles_by_name={
+                    'SP 1': dict(server_profile=profiles[0],
+                                 server_profile_compliance_preview=dict(uri='/rest/server-profiles/1')),
+                    'SP 2': dict(server_profile=profiles[1],
+                                 server_profile_compliance_preview=dict(uri='/rest/server-profiles/2'))
+                }
+            )
+        )
+
 
 if __name__ == '__main__':
     pytest.main([__file__])
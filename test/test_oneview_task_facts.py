@@ -16,6 +16,7 @@
 # limitations under the License.
 ###
 
+import mock
 import pytest
 
 from hpe_test_utils import OneViewBaseFactsTest
@@ -65,6 +66,15 @@ TASK = {
 
 ALL_TASKS = [TASK]
 
+PARAMS_GET_ALL_PAGED = dict(
+    config='config.json',
+    params=dict(
+        page_size=2,
+        filter=FILTER_BY_ASSOCIATED_RESOURCE_NAME,
+        match={'taskState': 'Error', 'associatedResource.resourceCategory': 'server-profile-templates'}
+    )
+)
+
 
 @pytest.mark.resource(TestTaskFactsModule='tasks')
 class TestTaskFactsModule(OneViewBaseFactsTest):
@@ -110,6 +120,23 @@ class TestTaskFactsModule(OneViewBaseFactsTest):
             ansible_facts=dict(tasks=ALL_TASKS)
         )
 
+    def test_get_all_paged_with_match(self):
+        failed_task = dict(TASK, taskState='Error')
+        self.mock_ov_client.tasks.get_all.side_effect = [[TASK, failed_task], [failed_task]]
+        self.mock_ansible_module.params = PARAMS_GET_ALL_PAGED
+
+        TaskFactsModule().run()
+
+        assert self.mock_ov_client.tasks.get_all.call_args_list == [
+            mock.call(start=0, count=2, filter=FILTER_BY_ASSOCIATED_RESOURCE_NAME),
+            mock.call(start=2, count=2, filter=FILTER_BY_ASSOCIATED_RESOURCE_NAME)
+        ]
+
+        self.mock_ansible_module.exit_json.assert_called_once_with(
+            changed=False,
+            ansible_facts=dict(tasks=[failed_task, failed_task])
+        )
+
 
 if __name__ == '__main__':
     pytest.main([__file__])
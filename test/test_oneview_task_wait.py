@@ -0,0 +1,124 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+###
+# Copyright (2016-2017) Hewlett Packard Enterprise Development LP
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# You may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+###
+
+import mock
+import pytest
+
+from hpe_test_utils import OneViewBaseTest
+from oneview_module_loader import TaskWaitModule
+
+TASK_URI_1 = '/rest/tasks/1'
+TASK_URI_2 = '/rest/tasks/2'
+
+PARAMS = dict(
+    config='config.json',
+    task_uris=[TASK_URI_1, TASK_URI_2],
+    timeout=60,
+    poll_interval=5,
+    fail_on_error=True
+)
+
+
+def build_task(uri, state):
+    return dict(uri=uri, taskState=state)
+
+
+@pytest.mark.resource(TestTaskWaitModule='connection')
+class TestTaskWaitModule(OneViewBaseTest):
+    @pytest.fixture(autouse=True)
+    def mock_time(self):
+        clock = dict(now=0)
+
+        def sleep(seconds):
+            clock['now'] += seconds
+
+        with mock.patch('oneview_task_wait.time') as mock_time:
+            mock_time.time.side_effect = lambda: clock['now']
+            mock_time.sleep.side_effect = sleep
+            self.mock_time = mock_time
+            yield
+
+    def test_should_return_tasks_already_finished(self):
+        self.resource.get.side_effect = [build_task(TASK_URI_1, 'Completed'), build_task(TASK_URI_2, 'Warning')]
+        self.mock_ansible_module.params = PARAMS
+
+        TaskWaitModule().run()
+
+        self.mock_time.sleep.assert_not_called()
+        self.mock_ansible_module.exit_json.assert_called_once_with(
+            changed=False,
+            msg=TaskWaitModule.MSG_COMPLETED,
+            ansible_facts=dict(tasks=[build_task(TASK_URI_1, 'Completed'), build_task(TASK_URI_2, 'Warning')])
+        )
+
+    def test_should_poll_only_the_pending_tasks(self):
+        self.resource.get.side_effect = [build_task(TASK_URI_1, 'Running'),
+                                         build_task(TASK_URI_2, 'Completed'),
+                                         build_task(TASK_URI_1, 'Running'),
+                                         build_task(TASK_URI_1, 'Completed')]
+        self.mock_ansible_module.params = PARAMS
+
+        TaskWaitModule().run()
+
+        assert self.resource.get.call_args_list == [mock.call(TASK_URI_1), mock.call(TASK_URI_2),
+                                                    mock.call(TASK_URI_1), mock.call(TASK_URI_1)]
+        assert self.mock_time.sleep.call_count == 2
+        self.mock_ansible_module.exit_json.assert_called_once_with(
+            changed=False,
+            msg=TaskWaitModule.MSG_COMPLETED,
+            ansible_facts=dict(tasks=[build_task(TASK_URI_1, 'Completed'), build_task(TASK_URI_2, 'Completed')])
+        )
+
+    def test_should_fail_when_the_deadline_passes(self):
+        self.resource.get.side_effect = lambda uri: build_task(uri, 'Running')
+        self.mock_ansible_module.params = dict(PARAMS, timeout=12)
+
+        TaskWaitModule().run()
+
+        assert self.mock_time.sleep.call_args_list == [mock.call(5), mock.call(5), mock.call(2)]
+        self.mock_ansible_module.fail_json.assert_called_once_with(
+            exception=mock.ANY,
+            msg=TaskWaitModule.MSG_TIMEOUT.format(TASK_URI_1 + ', ' + TASK_URI_2)
+        )
+
+    def test_should_fail_when_a_task_finishes_with_error(self):
+        self.resource.get.side_effect = [build_task(TASK_URI_1, 'Error'), build_task(TASK_URI_2, 'Completed')]
+        self.mock_ansible_module.params = PARAMS
+
+        TaskWaitModule().run()
+
+        self.mock_ansible_module.fail_json.assert_called_once_with(
+            exception=mock.ANY,
+            msg=TaskWaitModule.MSG_TASK_ERROR.format(TASK_URI_1)
+        )
+
+    def test_should_return_failed_tasks_when_fail_on_error_is_false(self):
+        self.resource.get.side_effect = [build_task(TASK_URI_1, 'Error'), build_task(TASK_URI_2, 'Completed')]
+        self.mock_ansible_module.params = dict(PARAMS, fail_on_error=False)
+
+        TaskWaitModule().run()
+
+        self.mock_ansible_module.exit_json.assert_called_once_with(
+            changed=False,
+            msg=TaskWaitModule.MSG_COMPLETED,
+            ansible_facts=dict(tasks=[build_task(TASK_URI_1, 'Error'), build_task(TASK_URI_2, 'Completed')])
+        )
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])